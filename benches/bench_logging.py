@@ -0,0 +1,57 @@
+import logging
+import time
+import uuid
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.logging.handlers import APILogHandler, APILogWorker
+
+
+@pytest.mark.parametrize("num_records", [1000, 10000])
+def bench_api_log_handler_throughput(
+    benchmark: BenchmarkFixture, num_records: int, monkeypatch
+):
+    """
+    Measures the throughput of log records from `APILogHandler.emit` to
+    `APILogWorker._handle_batch`, without sending them to the API.
+
+    The throughput is reported as `records_per_second` in the benchmark's extra info.
+    """
+    handled = []
+
+    async def handle_batch(self, items):
+        handled.extend(items)
+
+    monkeypatch.setattr(APILogWorker, "_handle_batch", handle_batch)
+
+    handler = APILogHandler()
+    flow_run_id = uuid.uuid4()
+    records = [
+        logging.LogRecord(
+            name="bench",
+            level=logging.INFO,
+            pathname=__file__,
+            lineno=0,
+            msg="Log record %s",
+            args=(i,),
+            exc_info=None,
+        )
+        for i in range(num_records)
+    ]
+    for record in records:
+        record.flow_run_id = flow_run_id
+
+    def emit_records():
+        handled.clear()
+        start = time.perf_counter()
+
+        for record in records:
+            handler.emit(record)
+        APILogWorker.drain_all()
+
+        elapsed = time.perf_counter() - start
+        assert len(handled) == num_records
+        benchmark.extra_info["records_per_second"] = num_records / elapsed
+
+    benchmark.pedantic(emit_records, rounds=3)
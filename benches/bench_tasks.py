@@ -2,6 +2,7 @@ import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
 
 from prefect import flow, task
+from prefect.client.base import PrefectHttpxClient
 
 
 def noop_function():
@@ -34,3 +35,41 @@ def bench_task_submit(benchmark: BenchmarkFixture, num_task_runs: int):
         benchmark.pedantic(noop_task.submit, rounds=num_task_runs)
 
     benchmark_flow()
+
+
+@pytest.mark.parametrize("num_task_runs", [10, 50])
+def bench_task_run_api_requests(
+    benchmark: BenchmarkFixture, num_task_runs: int, monkeypatch
+):
+    """
+    Measures the number of API requests made per task run.
+
+    The count is reported as `requests_per_task_run` in the benchmark's extra info.
+    """
+    noop_task = task(noop_function)
+    requests = []
+    send = PrefectHttpxClient.send
+
+    async def counting_send(self, request, *args, **kwargs):
+        requests.append(request.url.path)
+        return await send(self, request, *args, **kwargs)
+
+    monkeypatch.setattr(PrefectHttpxClient, "send", counting_send)
+
+    @flow
+    def benchmark_flow(num_task_runs: int):
+        for _ in range(num_task_runs):
+            noop_task.submit()
+
+    def run_flows():
+        requests.clear()
+        benchmark_flow(0)
+        baseline = len(requests)
+
+        requests.clear()
+        benchmark_flow(num_task_runs)
+        benchmark.extra_info["requests_per_task_run"] = (
+            len(requests) - baseline
+        ) / num_task_runs
+
+    benchmark.pedantic(run_flows)
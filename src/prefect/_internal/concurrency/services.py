@@ -6,8 +6,17 @@ import contextlib
 import queue
 import sys
 import threading
-from functools import partial
-from typing import Awaitable, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Awaitable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import anyio
 from typing_extensions import Self
@@ -282,28 +291,31 @@ class BatchedQueueService(QueueService[T]):
             deadline = get_deadline(self._min_interval)
             while batch_size < self._max_batch_size:
                 try:
-                    item = await anyio.to_thread.run_sync(
-                        partial(self._queue.get, timeout=get_timeout(deadline))
-                    )
-
-                    if item is None:
-                        done = True
-                        break
-
-                    batch.append(item)
-                    batch_size += self._get_size(item)
-                    logger.debug(
-                        "Service %r added item %r to batch (size %s/%s)",
-                        self,
-                        item,
-                        batch_size,
-                        self._max_batch_size,
+                    # Collect all available items in a single hop to the worker thread
+                    # instead of a hop per item
+                    items, items_size, done = await anyio.to_thread.run_sync(
+                        self._get_items,
+                        get_timeout(deadline),
+                        self._max_batch_size - batch_size,
                     )
                 except queue.Empty:
                     # Process the batch after `min_interval` even if it is smaller than
                     # the batch size
                     break
 
+                batch.extend(items)
+                batch_size += items_size
+                logger.debug(
+                    "Service %r added %s items to batch (size %s/%s)",
+                    self,
+                    len(items),
+                    batch_size,
+                    self._max_batch_size,
+                )
+
+                if done:
+                    break
+
             if not batch:
                 continue
 
@@ -321,6 +333,35 @@ class BatchedQueueService(QueueService[T]):
                     batch_size,
                 )
 
+    def _get_items(
+        self, timeout: Optional[float], max_size: int
+    ) -> Tuple[List[T], int, bool]:
+        """
+        Get items from the queue, blocking for up to `timeout` seconds for the first
+        item and then taking items that are already available until their total size
+        reaches `max_size`.
+
+        Returns the items, their total size, and a flag indicating if the service has
+        been stopped. Raises `queue.Empty` if no item is received before the timeout.
+        """
+        items = []
+        size = 0
+
+        item = self._queue.get(timeout=timeout)
+        while True:
+            if item is None:
+                return items, size, True
+
+            items.append(item)
+            size += self._get_size(item)
+            if size >= max_size:
+                return items, size, False
+
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items, size, False
+
     @abc.abstractmethod
     async def _handle_batch(self, items: List[T]):
         """
@@ -4,7 +4,7 @@ their execution.
 """
 import inspect
 from typing import AsyncIterator, List, Optional, Set, Union
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import anyio
 import anyio.abc
@@ -36,7 +36,11 @@ from prefect.exceptions import (
 )
 from prefect.infrastructure import Infrastructure, InfrastructureResult, Process
 from prefect.logging import get_logger
-from prefect.settings import PREFECT_AGENT_PREFETCH_SECONDS
+from prefect.settings import (
+    PREFECT_AGENT_LONG_POLL_ENABLED,
+    PREFECT_AGENT_PREFETCH_SECONDS,
+    PREFECT_AGENT_QUERY_INTERVAL,
+)
 from prefect.states import Crashed, Pending, StateType, exception_to_failed_state
 
 
@@ -67,6 +71,7 @@ class PrefectAgent:
         self.cancelling_flow_run_ids = set()
         self.scheduled_task_scopes = set()
         self.started = False
+        self.name = f"{self.__class__.__name__} {uuid4()}"
         self.logger = get_logger("agent")
         self.task_group: Optional[anyio.abc.TaskGroup] = None
         self.limit: Optional[int] = limit
@@ -190,12 +195,33 @@ class PrefectAgent:
 
         submittable_runs: List[FlowRun] = []
 
+        # flow runs are claimed as they are retrieved, so only retrieve as many flow
+        # runs as the agent has capacity to submit
+        capacity = int(self.limiter.available_tokens) if self.limiter else None
+
         if self.work_pool_name:
-            responses = await self.client.get_scheduled_flow_runs_for_work_pool(
-                work_pool_name=self.work_pool_name,
-                work_queue_names=[wq.name async for wq in self.get_work_queues()],
-                scheduled_before=before,
+            # when long polling, the server waits for flow runs to become available
+            wait_seconds = (
+                PREFECT_AGENT_QUERY_INTERVAL.value()
+                if PREFECT_AGENT_LONG_POLL_ENABLED.value()
+                else None
             )
+            query_started = anyio.current_time()
+            try:
+                responses = await self.client.get_scheduled_flow_runs_for_work_pool(
+                    work_pool_name=self.work_pool_name,
+                    work_queue_names=[wq.name async for wq in self.get_work_queues()],
+                    scheduled_before=before,
+                    limit=capacity,
+                    claim=True,
+                    worker_name=self.name,
+                    wait_seconds=wait_seconds,
+                )
+            except Exception:
+                await self._pace_long_poll(query_started, wait_seconds)
+                raise
+            if not responses:
+                await self._pace_long_poll(query_started, wait_seconds)
             submittable_runs.extend([response.flow_run for response in responses])
 
         else:
@@ -210,9 +236,15 @@ class PrefectAgent:
                 else:
                     try:
                         queue_runs = await self.client.get_runs_in_work_queue(
-                            id=work_queue.id, limit=10, scheduled_before=before
+                            id=work_queue.id,
+                            limit=10 if capacity is None else min(10, capacity),
+                            scheduled_before=before,
+                            claim=True,
+                            claimed_by=self.name,
                         )
                         submittable_runs.extend(queue_runs)
+                        if capacity is not None:
+                            capacity -= len(queue_runs)
                     except ObjectNotFound:
                         self.logger.error(
                             f"Work queue {work_queue.name!r} ({work_queue.id}) not"
@@ -221,7 +253,10 @@ class PrefectAgent:
                     except Exception as exc:
                         self.logger.exception(exc)
 
-            submittable_runs.sort(key=lambda run: run.next_scheduled_start_time)
+            # claimed flow runs are pending and no longer have a next scheduled start time
+            submittable_runs.sort(
+                key=lambda run: run.next_scheduled_start_time or run.expected_start_time
+            )
 
         for flow_run in submittable_runs:
             # don't resubmit a run
@@ -249,6 +284,17 @@ class PrefectAgent:
             filter(lambda run: run.id in self.submitting_flow_run_ids, submittable_runs)
         )
 
+    async def _pace_long_poll(
+        self, query_started: float, wait_seconds: Optional[float]
+    ) -> None:
+        """
+        Wait out the rest of a long poll that returned early without flow runs, so the
+        agent does not poll in a tight loop.
+        """
+        if wait_seconds:
+            elapsed = anyio.current_time() - query_started
+            await anyio.sleep(max(wait_seconds - elapsed, 0))
+
     async def check_for_cancelled_flow_runs(self):
         if not self.started:
             raise RuntimeError(
@@ -539,7 +585,19 @@ class PrefectAgent:
 
         return result
 
+    def _is_claimed(self, flow_run: FlowRun) -> bool:
+        """
+        Whether the flow run was claimed by this agent when it was retrieved.
+        """
+        state = flow_run.state
+        return bool(
+            state and state.is_pending() and state.state_details.claimed_by == self.name
+        )
+
     async def _propose_pending_state(self, flow_run: FlowRun) -> bool:
+        if self._is_claimed(flow_run):
+            return True
+
         state = flow_run.state
         try:
             state = await propose_state(self.client, Pending(), flow_run_id=flow_run.id)
@@ -641,6 +699,9 @@ class PrefectAgent:
             anyio.CapacityLimiter(self.limit) if self.limit is not None else None
         )
         self.client = get_client()
+        # Runs of the same deployment share their deployment, flow, and
+        # infrastructure block reads
+        self.client.enable_response_cache()
         await self.client.__aenter__()
         await self.task_group.__aenter__()
 
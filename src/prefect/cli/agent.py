@@ -17,6 +17,7 @@ from prefect.cli.root import app
 from prefect.client import get_client
 from prefect.exceptions import ObjectNotFound
 from prefect.settings import (
+    PREFECT_AGENT_LONG_POLL_ENABLED,
     PREFECT_AGENT_PREFETCH_SECONDS,
     PREFECT_AGENT_QUERY_INTERVAL,
     PREFECT_API_URL,
@@ -193,15 +194,19 @@ async def start(
                     f"queue(s): {', '.join(work_queues)}..."
                 )
 
+        # long polling is only supported for work pools; each query waits on the
+        # server so the agent queries again immediately
+        long_poll = bool(work_pool_name) and PREFECT_AGENT_LONG_POLL_ENABLED.value()
+
         async with anyio.create_task_group() as tg:
             tg.start_soon(
                 partial(
                     critical_service_loop,
                     agent.get_and_submit_flow_runs,
-                    PREFECT_AGENT_QUERY_INTERVAL.value(),
+                    0 if long_poll else PREFECT_AGENT_QUERY_INTERVAL.value(),
                     printer=app.console.print,
                     run_once=run_once,
-                    jitter_range=0.3,
+                    jitter_range=None if long_poll else 0.3,
                     backoff=4,  # Up to ~1 minute interval during backoff
                 )
             )
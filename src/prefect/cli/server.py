@@ -311,3 +311,34 @@ async def stamp(revision: str):
     app.console.print("Stamping database with revision ...")
     await run_sync_in_worker_thread(alembic_stamp, revision=revision)
     exit_with_success("Stamping database with revision succeeded!")
+
+
+@database_app.command()
+async def partition_logs(yes: bool = typer.Option(False, "--yes", "-y")):
+    """
+    Partition the log table by day so expired logs can be dropped by partition.
+    Only supported on PostgreSQL, on a database upgraded to the latest revision.
+    """
+    from prefect.server.database.dependencies import provide_database_interface
+    from prefect.server.database.partitions import partition_log_table
+
+    db = provide_database_interface()
+    engine = await db.engine()
+
+    if not yes:
+        confirm = typer.confirm(
+            "Are you sure you want to partition the log table of the Prefect database"
+            f" at {engine.url!r}? The table will be locked while it is converted."
+        )
+        if not confirm:
+            exit_with_error("Log table partitioning aborted!")
+
+    app.console.print("Partitioning the log table ...")
+    try:
+        async with db.session_context(begin_transaction=True) as session:
+            await partition_log_table(session, db)
+    except ValueError as exc:
+        exit_with_error(str(exc))
+    exit_with_success(
+        f"Log table of the Prefect database at {engine.url!r} partitioned!"
+    )
@@ -13,6 +13,7 @@ from prefect.client.orchestration import get_client
 from prefect.exceptions import ObjectNotFound
 from prefect.settings import (
     PREFECT_WORKER_HEARTBEAT_SECONDS,
+    PREFECT_WORKER_LONG_POLL_ENABLED,
     PREFECT_WORKER_PREFETCH_SECONDS,
     PREFECT_WORKER_QUERY_SECONDS,
 )
@@ -127,15 +128,17 @@ async def start(
         async with anyio.create_task_group() as tg:
             # wait for an initial heartbeat to configure the worker
             await worker.sync_with_backend()
-            # schedule the scheduled flow run polling loop
+            # schedule the scheduled flow run polling loop; when long polling, each
+            # query waits on the server so the worker queries again immediately
+            long_poll = PREFECT_WORKER_LONG_POLL_ENABLED.value()
             tg.start_soon(
                 partial(
                     critical_service_loop,
                     workload=worker.get_and_submit_flow_runs,
-                    interval=PREFECT_WORKER_QUERY_SECONDS.value(),
+                    interval=0 if long_poll else PREFECT_WORKER_QUERY_SECONDS.value(),
                     run_once=run_once,
                     printer=app.console.print,
-                    jitter_range=0.3,
+                    jitter_range=None if long_poll else 0.3,
                 )
             )
             # schedule the sync loop
@@ -1,10 +1,11 @@
 import copy
 import sys
 import threading
+import time
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from functools import partial
-from typing import Callable, ContextManager, Dict, Set, Tuple, Type
+from typing import Any, Callable, ContextManager, Dict, Optional, Set, Tuple, Type
 
 import anyio
 import httpx
@@ -274,9 +275,77 @@ class PrefectHttpxClient(httpx.AsyncClient):
         # Convert to a Prefect response to add nicer errors messages
         response = PrefectResponse.from_httpx_response(response)
 
-        # Always raise bad responses
+        # Always raise bad responses, except for `304 Not Modified` responses to
+        # conditional requests which are handled by the `ResponseCache`
         # NOTE: We may want to remove this and handle responses per route in the
         #       `PrefectClient`
-        response.raise_for_status()
+        if response.status_code != status.HTTP_304_NOT_MODIFIED:
+            response.raise_for_status()
 
         return response
+
+
+class ResponseCache:
+    """
+    A cache of responses to `GET` requests for objects which rarely change.
+
+    Cached responses are reused without a request for `ttl` seconds. After that, they
+    are revalidated with a conditional request using their `ETag`, and the server only
+    sends the object again if it has changed. Concurrent requests for the same object
+    share a single request.
+
+    Args:
+        ttl: The number of seconds to reuse a response before revalidating it
+        max_size: The maximum number of responses to keep; the least recently used
+            responses are evicted first
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        # Responses and the time they were last validated, keyed by path and query
+        # parameters in order of least to most recently used
+        self._responses: Dict[Tuple, Tuple[httpx.Response, float]] = {}
+        self._locks: Dict[Tuple, anyio.Lock] = defaultdict(anyio.Lock)
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Send a `GET` request for `path` with `client`, unless a fresh response to it is
+        cached.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        async with self._locks[key]:
+            # Responses are removed while they are revalidated, so that errors such as
+            # a deleted object evict them
+            response, validated_at = self._responses.pop(key, (None, None))
+            now = time.monotonic()
+
+            if response is None or now - validated_at >= self.ttl:
+                etag = response.headers.get("ETag") if response is not None else None
+                new_response = await client.get(
+                    path,
+                    params=params,
+                    headers={"If-None-Match": etag} if etag else None,
+                )
+                if new_response.status_code != status.HTTP_304_NOT_MODIFIED:
+                    response = new_response
+                validated_at = now
+
+            self._responses[key] = (response, validated_at)
+            while len(self._responses) > self.max_size:
+                evicted = next(iter(self._responses))
+                del self._responses[evicted]
+                self._locks.pop(evicted, None)
+
+            return response
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        self._responses.clear()
@@ -1,7 +1,18 @@
 import datetime
 import warnings
 from contextlib import AsyncExitStack
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 import httpcore
@@ -34,6 +45,7 @@ from prefect.client.schemas.actions import (
     FlowRunUpdate,
     LogCreate,
     TaskRunCreate,
+    TaskRunSetState,
     TaskRunUpdate,
     WorkPoolCreate,
     WorkPoolUpdate,
@@ -96,6 +108,7 @@ from prefect.settings import (
     PREFECT_API_REQUEST_TIMEOUT,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
+    PREFECT_CLIENT_RESPONSE_CACHE_TTL,
     PREFECT_CLOUD_API_URL,
 )
 from prefect.utilities.collections import AutoEnum
@@ -104,7 +117,14 @@ if TYPE_CHECKING:
     from prefect.flows import Flow as FlowObject
     from prefect.tasks import Task as TaskObject
 
-from prefect.client.base import PrefectHttpxClient, app_lifespan_context
+from prefect.client.base import (
+    PrefectHttpxClient,
+    ResponseCache,
+    app_lifespan_context,
+)
+
+# The response header holding the cursor of the next page of a filter request
+NEXT_CURSOR_HEADER = "x-prefect-next-cursor"
 
 
 class ServerType(AutoEnum):
@@ -139,6 +159,43 @@ def get_client(httpx_settings: Optional[dict] = None) -> "PrefectClient":
     )
 
 
+def build_task_run_create(
+    task: "TaskObject",
+    flow_run_id: UUID,
+    dynamic_key: str,
+    name: str = None,
+    extra_tags: Iterable[str] = None,
+    state: prefect.states.State = None,
+    task_inputs: Dict[str, List[Union[TaskRunResult, Parameter, Constant]]] = None,
+) -> TaskRunCreate:
+    """
+    Build the request to create a run of a task, as used by
+    `PrefectClient.create_task_run` and `PrefectClient.create_task_runs`.
+
+    See `PrefectClient.create_task_run` for a description of the arguments.
+    """
+    tags = set(task.tags).union(extra_tags or [])
+
+    if state is None:
+        state = prefect.states.Pending()
+
+    return TaskRunCreate(
+        name=name,
+        flow_run_id=flow_run_id,
+        task_key=task.task_key,
+        dynamic_key=dynamic_key,
+        tags=list(tags),
+        task_version=task.version,
+        empirical_policy=TaskRunPolicy(
+            retries=task.retries,
+            retry_delay=task.retry_delay_seconds,
+            retry_jitter_factor=task.retry_jitter_factor,
+        ),
+        state=state.to_state_create(),
+        task_inputs=task_inputs or {},
+    )
+
+
 class PrefectClient:
     """
     An asynchronous client for interacting with the [Prefect REST API](/api-ref/rest-api/).
@@ -200,6 +257,9 @@ class PrefectClient:
         self._closed = False
         self._started = False
 
+        # Only set if the client caches reads of rarely changing objects
+        self._response_cache: Optional[ResponseCache] = None
+
         # Connect to an external application
         if isinstance(api, str):
             if httpx_settings.get("app"):
@@ -309,6 +369,32 @@ class PrefectClient:
         """
         return self._client.base_url
 
+    def enable_response_cache(self, ttl: Optional[float] = None) -> None:
+        """
+        Cache reads of deployments, flows, and block documents.
+
+        Cached objects are reused for `ttl` seconds, then revalidated with conditional
+        requests which only download objects that have changed. Useful for clients
+        that read the same objects for many flow runs, such as workers and agents.
+
+        Args:
+            ttl: The number of seconds to reuse cached objects before revalidating
+                them. Defaults to `PREFECT_CLIENT_RESPONSE_CACHE_TTL`.
+        """
+        if ttl is None:
+            ttl = PREFECT_CLIENT_RESPONSE_CACHE_TTL.value()
+        self._response_cache = ResponseCache(ttl=ttl)
+
+    async def _get_cacheable(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Send a `GET` request which may be served by the response cache, if enabled.
+        """
+        if self._response_cache is None:
+            return await self._client.get(path, params=params)
+        return await self._response_cache.get(self._client, path, params=params)
+
     # API methods ----------------------------------------------------------------------
 
     async def api_healthcheck(self) -> Optional[Exception]:
@@ -380,7 +466,7 @@ class PrefectClient:
         Returns:
             a [Flow model][prefect.client.schemas.objects.Flow] representation of the flow
         """
-        response = await self._client.get(f"/flows/{flow_id}")
+        response = await self._get_cacheable(f"/flows/{flow_id}")
         return Flow.parse_obj(response.json())
 
     async def read_flows(
@@ -945,6 +1031,8 @@ class PrefectClient:
         id: UUID,
         limit: int = 10,
         scheduled_before: datetime.datetime = None,
+        claim: bool = False,
+        claimed_by: Optional[str] = None,
     ) -> List[FlowRun]:
         """
         Read flow runs off a work queue.
@@ -954,6 +1042,10 @@ class PrefectClient:
             limit: a limit on the number of runs to return
             scheduled_before: a timestamp; only runs scheduled before this time will be returned.
                 Defaults to now.
+            claim: if True, the returned flow runs are moved to a Pending state claimed
+                by `claimed_by` in the same request, so that no other agent or worker
+                can submit them
+            claimed_by: the name of the agent or worker claiming the flow runs
 
         Raises:
             prefect.exceptions.ObjectNotFound: If request returns 404
@@ -965,14 +1057,12 @@ class PrefectClient:
         if scheduled_before is None:
             scheduled_before = pendulum.now()
 
+        body = {"limit": limit, "scheduled_before": scheduled_before.isoformat()}
+        if claim:
+            body.update(claim=True, claimed_by=claimed_by)
+
         try:
-            response = await self._client.post(
-                f"/work_queues/{id}/get_runs",
-                json={
-                    "limit": limit,
-                    "scheduled_before": scheduled_before.isoformat(),
-                },
-            )
+            response = await self._client.post(f"/work_queues/{id}/get_runs", json=body)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == status.HTTP_404_NOT_FOUND:
                 raise prefect.exceptions.ObjectNotFound(http_exc=e) from e
@@ -1298,7 +1388,7 @@ class PrefectClient:
             A block document or None.
         """
         try:
-            response = await self._client.get(
+            response = await self._get_cacheable(
                 f"/block_documents/{block_document_id}",
                 params=dict(include_secrets=include_secrets),
             )
@@ -1533,7 +1623,7 @@ class PrefectClient:
             a [Deployment model][prefect.client.schemas.objects.Deployment] representation of the deployment
         """
         try:
-            response = await self._client.get(f"/deployments/{deployment_id}")
+            response = await self._get_cacheable(f"/deployments/{deployment_id}")
         except httpx.HTTPStatusError as e:
             if e.response.status_code == status.HTTP_404_NOT_FOUND:
                 raise prefect.exceptions.ObjectNotFound(http_exc=e) from e
@@ -1721,7 +1811,75 @@ class PrefectClient:
             a list of Flow Run model representations
                 of the flow runs
         """
-        body = {
+        body = self._flow_run_filter_body(
+            flow_filter=flow_filter,
+            flow_run_filter=flow_run_filter,
+            task_run_filter=task_run_filter,
+            deployment_filter=deployment_filter,
+            work_pool_filter=work_pool_filter,
+            work_queue_filter=work_queue_filter,
+            sort=sort,
+        )
+        body.update({"limit": limit, "offset": offset})
+
+        response = await self._client.post("/flow_runs/filter", json=body)
+        return pydantic.parse_obj_as(List[FlowRun], response.json())
+
+    async def iter_flow_runs(
+        self,
+        *,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        work_pool_filter: WorkPoolFilter = None,
+        work_queue_filter: WorkQueueFilter = None,
+        sort: FlowRunSort = None,
+        page_size: int = None,
+    ) -> AsyncIterator[FlowRun]:
+        """
+        Iterate over every flow run matching all criteria. Flow runs are read from
+        the Prefect API a page at a time with keyset pagination, so the cost of
+        reading each page does not grow with the number of flow runs already read.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            page_size: the number of flow runs to read per request
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        body = self._flow_run_filter_body(
+            flow_filter=flow_filter,
+            flow_run_filter=flow_run_filter,
+            task_run_filter=task_run_filter,
+            deployment_filter=deployment_filter,
+            work_pool_filter=work_pool_filter,
+            work_queue_filter=work_queue_filter,
+            sort=sort,
+        )
+        async for flow_run in self._iter_pages(
+            "/flow_runs/filter", body, FlowRun, page_size
+        ):
+            yield flow_run
+
+    def _flow_run_filter_body(
+        self,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        work_pool_filter: WorkPoolFilter = None,
+        work_queue_filter: WorkQueueFilter = None,
+        sort: FlowRunSort = None,
+    ) -> Dict[str, Any]:
+        return {
             "flows": flow_filter.dict(json_compatible=True) if flow_filter else None,
             "flow_runs": (
                 flow_run_filter.dict(json_compatible=True, exclude_unset=True)
@@ -1747,12 +1905,27 @@ class PrefectClient:
                 else None
             ),
             "sort": sort,
-            "limit": limit,
-            "offset": offset,
         }
 
-        response = await self._client.post("/flow_runs/filter", json=body)
-        return pydantic.parse_obj_as(List[FlowRun], response.json())
+    async def _iter_pages(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        model: Type[pydantic.BaseModel],
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[pydantic.BaseModel]:
+        """
+        Iterate over every object matching a filter request by following the cursor
+        of each page.
+        """
+        cursor = ""
+        while cursor is not None:
+            response = await self._client.post(
+                path, json={**body, "limit": page_size, "cursor": cursor}
+            )
+            for obj in pydantic.parse_obj_as(List[model], response.json()):
+                yield obj
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
 
     async def set_flow_run_state(
         self,
@@ -1848,25 +2021,14 @@ class PrefectClient:
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
-
-        if state is None:
-            state = prefect.states.Pending()
-
-        task_run_data = TaskRunCreate(
-            name=name,
+        task_run_data = build_task_run_create(
+            task=task,
             flow_run_id=flow_run_id,
-            task_key=task.task_key,
             dynamic_key=dynamic_key,
-            tags=list(tags),
-            task_version=task.version,
-            empirical_policy=TaskRunPolicy(
-                retries=task.retries,
-                retry_delay=task.retry_delay_seconds,
-                retry_jitter_factor=task.retry_jitter_factor,
-            ),
-            state=state.to_state_create(),
-            task_inputs=task_inputs or {},
+            name=name,
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
         )
 
         response = await self._client.post(
@@ -1874,6 +2036,24 @@ class PrefectClient:
         )
         return TaskRun.parse_obj(response.json())
 
+    async def create_task_runs(
+        self, task_runs: Iterable[TaskRunCreate]
+    ) -> List[TaskRun]:
+        """
+        Create many task runs in a single request.
+
+        Args:
+            task_runs: the task runs to create
+
+        Returns:
+            The created task runs, in the order they were provided.
+        """
+        response = await self._client.post(
+            "/task_runs/bulk",
+            json=[task_run.dict(json_compatible=True) for task_run in task_runs],
+        )
+        return pydantic.parse_obj_as(List[TaskRun], response.json())
+
     async def read_task_run(self, task_run_id: UUID) -> TaskRun:
         """
         Query the Prefect API for a task run by id.
@@ -1915,7 +2095,63 @@ class PrefectClient:
             a list of Task Run model representations
                 of the task runs
         """
-        body = {
+        body = self._task_run_filter_body(
+            flow_filter=flow_filter,
+            flow_run_filter=flow_run_filter,
+            task_run_filter=task_run_filter,
+            deployment_filter=deployment_filter,
+            sort=sort,
+        )
+        body.update({"limit": limit, "offset": offset})
+        response = await self._client.post("/task_runs/filter", json=body)
+        return pydantic.parse_obj_as(List[TaskRun], response.json())
+
+    async def iter_task_runs(
+        self,
+        *,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        sort: TaskRunSort = None,
+        page_size: int = None,
+    ) -> AsyncIterator[TaskRun]:
+        """
+        Iterate over every task run matching all criteria. Task runs are read from
+        the Prefect API a page at a time with keyset pagination.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            page_size: the number of task runs to read per request
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+        body = self._task_run_filter_body(
+            flow_filter=flow_filter,
+            flow_run_filter=flow_run_filter,
+            task_run_filter=task_run_filter,
+            deployment_filter=deployment_filter,
+            sort=sort,
+        )
+        async for task_run in self._iter_pages(
+            "/task_runs/filter", body, TaskRun, page_size
+        ):
+            yield task_run
+
+    def _task_run_filter_body(
+        self,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        sort: TaskRunSort = None,
+    ) -> Dict[str, Any]:
+        return {
             "flows": flow_filter.dict(json_compatible=True) if flow_filter else None,
             "flow_runs": (
                 flow_run_filter.dict(json_compatible=True, exclude_unset=True)
@@ -1931,11 +2167,7 @@ class PrefectClient:
                 else None
             ),
             "sort": sort,
-            "limit": limit,
-            "offset": offset,
         }
-        response = await self._client.post("/task_runs/filter", json=body)
-        return pydantic.parse_obj_as(List[TaskRun], response.json())
 
     async def set_task_run_state(
         self,
@@ -1963,6 +2195,41 @@ class PrefectClient:
         )
         return OrchestrationResult.parse_obj(response.json())
 
+    async def set_task_run_states(
+        self,
+        task_run_states: Iterable[Tuple[UUID, prefect.states.State]],
+        force: bool = False,
+    ) -> List[OrchestrationResult]:
+        """
+        Set the states of many task runs in a single request.
+
+        Orchestration rules are applied to each proposed state independently and all
+        accepted transitions are committed together.
+
+        Args:
+            task_run_states: pairs of task run ids and the state to set
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept the states
+
+        Returns:
+            a list of OrchestrationResult models, in the order the states were
+                provided
+        """
+        states = []
+        for task_run_id, state in task_run_states:
+            state_create = state.to_state_create()
+            state_create.state_details.task_run_id = task_run_id
+            states.append(TaskRunSetState(task_run_id=task_run_id, state=state_create))
+
+        response = await self._client.post(
+            "/task_runs/bulk/set_state",
+            json=dict(
+                states=[state.dict(json_compatible=True) for state in states],
+                force=force,
+            ),
+        )
+        return pydantic.parse_obj_as(List[OrchestrationResult], response.json())
+
     async def read_task_run_states(
         self, task_run_id: UUID
     ) -> List[prefect.states.State]:
@@ -2087,6 +2354,23 @@ class PrefectClient:
         response = await self._client.post("/logs/filter", json=body)
         return pydantic.parse_obj_as(List[Log], response.json())
 
+    async def iter_logs(
+        self,
+        log_filter: LogFilter = None,
+        sort: LogSort = LogSort.TIMESTAMP_ASC,
+        page_size: int = None,
+    ) -> AsyncIterator[Log]:
+        """
+        Iterate over every flow and task run log matching the filter. Logs are read
+        from the Prefect API a page at a time with keyset pagination.
+        """
+        body = {
+            "logs": log_filter.dict(json_compatible=True) if log_filter else None,
+            "sort": sort,
+        }
+        async for log in self._iter_pages("/logs/filter", body, Log, page_size):
+            yield log
+
     async def resolve_datadoc(self, datadoc: DataDocument) -> Any:
         """
         Recursively decode possibly nested data documents.
@@ -2317,6 +2601,10 @@ class PrefectClient:
         work_pool_name: str,
         work_queue_names: Optional[List[str]] = None,
         scheduled_before: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        claim: bool = False,
+        worker_name: Optional[str] = None,
+        wait_seconds: Optional[float] = None,
     ) -> List[WorkerFlowRunResponse]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -2328,6 +2616,13 @@ class PrefectClient:
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            limit: The maximum number of flow runs to return.
+            claim: If True, the returned flow runs are moved to a Pending state
+                claimed by `worker_name` in the same request, so that no other
+                worker can submit them.
+            worker_name: The name of the worker claiming the flow runs.
+            wait_seconds: If no flow runs are available, the number of seconds the
+                server may wait for flow runs to become available before responding.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -2338,10 +2633,26 @@ class PrefectClient:
             body["work_queue_names"] = list(work_queue_names)
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
+        if limit is not None:
+            body["limit"] = limit
+        if claim:
+            body.update(claim=True, worker_name=worker_name)
+
+        timeout = self._client.timeout
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
+            # allow for the time the server may wait before responding
+            timeout = httpx.Timeout(
+                connect=timeout.connect,
+                read=timeout.read + wait_seconds if timeout.read else None,
+                write=timeout.write,
+                pool=timeout.pool,
+            )
 
         response = await self._client.post(
             f"/work_pools/{work_pool_name}/get_scheduled_flow_runs",
             json=body,
+            timeout=timeout,
         )
 
         return pydantic.parse_obj_as(List[WorkerFlowRunResponse], response.json())
@@ -293,6 +293,13 @@ class TaskRunUpdate(ActionBaseModel):
     name: str = FieldFrom(objects.TaskRun)
 
 
+class TaskRunSetState(ActionBaseModel):
+    """Data used by the Prefect REST API to set the state of a task run in bulk"""
+
+    task_run_id: UUID = Field(default=..., description="The task run id")
+    state: StateCreate = Field(default=..., description="The intended state.")
+
+
 @copy_model_fields
 class FlowRunCreate(ActionBaseModel):
     """Data used by the Prefect REST API to create a flow run."""
@@ -79,6 +79,9 @@ class StateDetails(PrefectBaseModel):
     pause_reschedule: bool = False
     pause_key: str = None
     refresh_cache: bool = None
+    # for flow runs claimed by a worker or agent when it polled for them
+    claimed_by: str = None
+    claim_expiration: DateTimeTZ = None
 
 
 class State(ObjectBaseModel, Generic[R]):
@@ -26,7 +26,18 @@ import sys
 import time
 from contextlib import AsyncExitStack, asynccontextmanager
 from functools import partial
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, TypeVar, Union
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 import anyio
@@ -39,10 +50,14 @@ import prefect.context
 import prefect.plugins
 from prefect.states import is_state
 from prefect._internal.concurrency.api import create_call, from_async, from_sync
-from prefect._internal.concurrency.calls import get_current_call
+from prefect._internal.concurrency.calls import Call, get_current_call
 from prefect._internal.concurrency.threads import wait_for_global_loop_exit
 from prefect._internal.concurrency.cancellation import CancelledError, get_deadline
-from prefect.client.orchestration import PrefectClient, get_client
+from prefect.client.orchestration import (
+    PrefectClient,
+    build_task_run_create,
+    get_client,
+)
 from prefect.client.schemas import FlowRun, OrchestrationResult, TaskRun
 from prefect.client.schemas.filters import FlowRunFilter
 from prefect.client.schemas.objects import (
@@ -89,6 +104,8 @@ from prefect.results import BaseResult, ResultFactory
 from prefect.settings import (
     PREFECT_DEBUG_MODE,
     PREFECT_LOGGING_LOG_PRINTS,
+    PREFECT_TASKS_FLOW_RUN_CACHE_TTL_SECONDS,
+    PREFECT_TASKS_PIPELINED_ORCHESTRATION,
     PREFECT_TASKS_REFRESH_CACHE,
     PREFECT_UI_URL,
 )
@@ -105,6 +122,7 @@ from prefect.states import (
 from prefect.task_runners import (
     CONCURRENCY_MESSAGES,
     BaseTaskRunner,
+    ProcessPoolTaskRunner,
     TaskConcurrencyType,
 )
 from prefect.tasks import Task
@@ -121,7 +139,12 @@ from prefect.utilities.callables import (
     get_parameter_defaults,
     parameters_to_args_kwargs,
 )
-from prefect.utilities.collections import StopVisiting, isiterable, visit_collection
+from prefect.utilities.collections import (
+    StopVisiting,
+    batched_iterable,
+    isiterable,
+    visit_collection,
+)
 from prefect.utilities.pydantic import PartialModel
 from prefect.utilities.text import truncated_to
 
@@ -130,6 +153,10 @@ EngineReturnType = Literal["future", "state", "result"]
 
 
 API_HEALTHCHECKS = {}
+# Parent flow runs read by task runs without a flow run snapshot, with their expiration
+FLOW_RUN_CACHE: Dict[UUID, Tuple[float, FlowRun]] = {}
+# The number of mapped task runs to create with each request to the API
+TASK_RUN_CREATION_BATCH_SIZE = 100
 UNTRACKABLE_TYPES = {bool, type(None), type(...), type(NotImplemented)}
 engine_logger = get_logger("engine")
 
@@ -487,6 +514,7 @@ async def begin_flow_run(
         level=logging.INFO if terminal_state.is_completed() else logging.ERROR,
         msg=f"Finished in state {display_state}",
     )
+    APILogHandler.report_suppressed_logs(flow_run.id, logger)
 
     # When a "root" flow run finishes, flush logs so we do not have to rely on handling
     # during interpreter shutdown
@@ -643,6 +671,7 @@ async def create_and_begin_subflow_run(
         level=logging.INFO if terminal_state.is_completed() else logging.ERROR,
         msg=f"Finished in state {display_state}",
     )
+    APILogHandler.report_suppressed_logs(flow_run.id, logger)
 
     # Track the subflow state so the parent flow can use it to determine its final state
     parent_flow_run_context.flow_run_states.append(terminal_state)
@@ -1130,7 +1159,7 @@ async def begin_task_map(
 
     map_length = list(lengths)[0]
 
-    task_runs = []
+    parameters_list = []
     for i in range(map_length):
         call_parameters = {key: value[i] for key, value in iterable_parameters.items()}
         call_parameters.update({key: value for key, value in static_parameters.items()})
@@ -1147,9 +1176,13 @@ async def begin_task_map(
         # Collapse any previously exploded kwargs
         call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
 
-        task_runs.append(
-            partial(
-                get_task_call_return_value,
+        parameters_list.append(call_parameters)
+
+    # Maintain the order of the task runs when using the sequential task runner
+    runner = task_runner if task_runner else flow_run_context.task_runner
+    if runner.concurrency_type == TaskConcurrencyType.SEQUENTIAL:
+        return [
+            await get_task_call_return_value(
                 task=task,
                 flow_run_context=flow_run_context,
                 parameters=call_parameters,
@@ -1158,14 +1191,25 @@ async def begin_task_map(
                 task_runner=task_runner,
                 extra_task_inputs=task_inputs,
             )
-        )
+            for call_parameters in parameters_list
+        ]
 
-    # Maintain the order of the task runs when using the sequential task runner
-    runner = task_runner if task_runner else flow_run_context.task_runner
-    if runner.concurrency_type == TaskConcurrencyType.SEQUENTIAL:
-        return [await task_run() for task_run in task_runs]
+    # Otherwise, create the mapped task runs in batches instead of one at a time
+    futures = await create_task_run_futures(
+        task=task,
+        flow_run_context=flow_run_context,
+        parameters_list=parameters_list,
+        wait_for=wait_for,
+        task_runner=task_runner,
+        extra_task_inputs=task_inputs,
+    )
 
-    return await gather(*task_runs)
+    return await gather(
+        *(
+            partial(get_return_value_for_future, future, return_type)
+            for future in futures
+        )
+    )
 
 
 async def collect_task_run_inputs(expr: Any, max_depth: int = -1) -> Set[TaskRunInput]:
@@ -1230,6 +1274,12 @@ async def get_task_call_return_value(
         task_runner=task_runner,
         extra_task_inputs=extra_task_inputs,
     )
+    return await get_return_value_for_future(future, return_type)
+
+
+async def get_return_value_for_future(
+    future: PrefectFuture, return_type: EngineReturnType
+):
     if return_type == "future":
         return future
     elif return_type == "state":
@@ -1289,6 +1339,105 @@ async def create_task_run_future(
     return future
 
 
+async def create_task_run_futures(
+    task: Task,
+    flow_run_context: FlowRunContext,
+    parameters_list: List[Dict[str, Any]],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    task_runner: Optional[BaseTaskRunner],
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> List[PrefectFuture]:
+    """
+    Create a future for each set of parameters, e.g. for each child of a mapped task.
+
+    The task runs are created in batches with a single API request per batch and
+    then submitted in the background.
+    """
+    # Default to the flow run's task runner
+    task_runner = task_runner or flow_run_context.task_runner
+
+    futures = []
+    dynamic_keys = []
+    for _ in parameters_list:
+        # Generate a name for each future
+        dynamic_key = _dynamic_key_for_task_run(flow_run_context, task)
+        dynamic_keys.append(dynamic_key)
+        futures.append(
+            PrefectFuture(
+                name=f"{task.name}-{dynamic_key}",
+                key=uuid4(),
+                task_runner=task_runner,
+                asynchronous=task.isasync and flow_run_context.flow.isasync,
+            )
+        )
+
+    # Create and submit the task runs in the background
+    flow_run_context.background_tasks.start_soon(
+        partial(
+            create_task_runs_then_submit,
+            task=task,
+            task_run_dynamic_keys=dynamic_keys,
+            futures=futures,
+            flow_run_context=flow_run_context,
+            parameters_list=parameters_list,
+            wait_for=wait_for,
+            task_runner=task_runner,
+            extra_task_inputs=extra_task_inputs,
+        )
+    )
+
+    # Track the task run futures in the flow run context
+    flow_run_context.task_run_futures.extend(futures)
+
+    # Return the futures without waiting for task run creation or submission
+    return futures
+
+
+async def create_task_runs_then_submit(
+    task: Task,
+    task_run_dynamic_keys: List[str],
+    futures: List[PrefectFuture],
+    flow_run_context: FlowRunContext,
+    parameters_list: List[Dict[str, Any]],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    task_runner: BaseTaskRunner,
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> None:
+    for batch in batched_iterable(
+        zip(futures, task_run_dynamic_keys, parameters_list),
+        TASK_RUN_CREATION_BATCH_SIZE,
+    ):
+        batch_futures, batch_dynamic_keys, batch_parameters = zip(*batch)
+
+        task_runs = await create_task_runs(
+            task=task,
+            names=[future.name for future in batch_futures],
+            flow_run_context=flow_run_context,
+            parameters_list=batch_parameters,
+            dynamic_keys=batch_dynamic_keys,
+            wait_for=wait_for,
+            extra_task_inputs=extra_task_inputs,
+        )
+
+        for future, task_run, parameters in zip(
+            batch_futures, task_runs, batch_parameters
+        ):
+            # Attach the task run to the future to support `get_state` operations
+            future.task_run = task_run
+
+            await submit_task_run(
+                task=task,
+                future=future,
+                flow_run_context=flow_run_context,
+                parameters=parameters,
+                task_run=task_run,
+                wait_for=wait_for,
+                task_runner=task_runner,
+            )
+
+            future._submitted.set()
+
+
 async def create_task_run_then_submit(
     task: Task,
     task_run_name: str,
@@ -1326,15 +1475,11 @@ async def create_task_run_then_submit(
     future._submitted.set()
 
 
-async def create_task_run(
-    task: Task,
-    name: str,
-    flow_run_context: FlowRunContext,
+async def _collect_task_run_inputs_for_call(
     parameters: Dict[str, Any],
-    dynamic_key: str,
     wait_for: Optional[Iterable[PrefectFuture]],
     extra_task_inputs: Dict[str, Set[TaskRunInput]],
-) -> TaskRun:
+) -> Dict[str, Set[TaskRunInput]]:
     task_inputs = {k: await collect_task_run_inputs(v) for k, v in parameters.items()}
     if wait_for:
         task_inputs["wait_for"] = await collect_task_run_inputs(wait_for)
@@ -1343,6 +1488,22 @@ async def create_task_run(
     for k, extras in extra_task_inputs.items():
         task_inputs[k] = task_inputs[k].union(extras)
 
+    return task_inputs
+
+
+async def create_task_run(
+    task: Task,
+    name: str,
+    flow_run_context: FlowRunContext,
+    parameters: Dict[str, Any],
+    dynamic_key: str,
+    wait_for: Optional[Iterable[PrefectFuture]],
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> TaskRun:
+    task_inputs = await _collect_task_run_inputs_for_call(
+        parameters, wait_for, extra_task_inputs
+    )
+
     logger = get_run_logger(flow_run_context)
 
     task_run = await flow_run_context.client.create_task_run(
@@ -1360,6 +1521,43 @@ async def create_task_run(
     return task_run
 
 
+async def create_task_runs(
+    task: Task,
+    names: List[str],
+    flow_run_context: FlowRunContext,
+    parameters_list: List[Dict[str, Any]],
+    dynamic_keys: List[str],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> List[TaskRun]:
+    extra_tags = TagsContext.get().current_tags
+
+    task_run_creates = []
+    for name, parameters, dynamic_key in zip(names, parameters_list, dynamic_keys):
+        task_run_creates.append(
+            build_task_run_create(
+                task=task,
+                flow_run_id=flow_run_context.flow_run.id,
+                dynamic_key=dynamic_key,
+                name=name,
+                extra_tags=extra_tags,
+                state=Pending(),
+                task_inputs=await _collect_task_run_inputs_for_call(
+                    parameters, wait_for, extra_task_inputs
+                ),
+            )
+        )
+
+    logger = get_run_logger(flow_run_context)
+
+    task_runs = await flow_run_context.client.create_task_runs(task_run_creates)
+
+    for task_run in task_runs:
+        logger.info(f"Created task run {task_run.name!r} for task {task.name!r}")
+
+    return task_runs
+
+
 async def submit_task_run(
     task: Task,
     future: PrefectFuture,
@@ -1387,6 +1585,7 @@ async def submit_task_run(
             ),
             log_prints=should_log_prints(task),
             settings=prefect.context.SettingsContext.get().copy(),
+            flow_run=flow_run_context.flow_run,
         ),
     )
 
@@ -1404,12 +1603,17 @@ async def begin_task_run(
     result_factory: ResultFactory,
     log_prints: bool,
     settings: prefect.context.SettingsContext,
+    flow_run: Optional[FlowRun] = None,
 ):
     """
     Entrypoint for task run execution.
 
     This function is intended for submission to the task runner.
 
+    The submitting flow run's `FlowRun` may be passed so the task run does not need
+    to read its parent flow run from the API. If it is not provided, it will be read
+    using `read_flow_run_for_task_run`.
+
     This method may be called from a worker so we ensure the settings context has been
     entered. For example, with a runner that is executing tasks in the same event loop,
     we will likely not enter the context again because the current context already
@@ -1474,6 +1678,7 @@ async def begin_task_run(
                 log_prints=log_prints,
                 interruptible=interruptible,
                 client=client,
+                flow_run=flow_run,
             )
 
             if not maybe_flow_run_context:
@@ -1507,6 +1712,22 @@ async def begin_task_run(
         return state
 
 
+def _create_task_function_call(task: Task, args: tuple, kwargs: dict) -> Call:
+    """
+    Create a call for the user's task function.
+
+    Synchronous functions are sent to a worker process if the current flow run uses a
+    `ProcessPoolTaskRunner`.
+    """
+    flow_run_context = FlowRunContext.get()
+    task_runner = flow_run_context.task_runner if flow_run_context else None
+
+    if isinstance(task_runner, ProcessPoolTaskRunner) and not is_async_fn(task.fn):
+        return create_call(task_runner.run_in_process, task.fn, *args, **kwargs)
+
+    return create_call(task.fn, *args, **kwargs)
+
+
 async def orchestrate_task_run(
     task: Task,
     task_run: TaskRun,
@@ -1516,6 +1737,7 @@ async def orchestrate_task_run(
     log_prints: bool,
     interruptible: bool,
     client: PrefectClient,
+    flow_run: Optional[FlowRun] = None,
 ) -> State:
     """
     Execute a task run
@@ -1542,7 +1764,8 @@ async def orchestrate_task_run(
     Returns:
         The final state of the run
     """
-    flow_run = await client.read_flow_run(task_run.flow_run_id)
+    if flow_run is None:
+        flow_run = await read_flow_run_for_task_run(client, task_run)
     logger = task_run_logger(task_run, task=task, flow_run=flow_run)
 
     partial_task_run_context = PartialModel(
@@ -1597,65 +1820,128 @@ async def orchestrate_task_run(
     last_state = task_run.state
 
     # Transition from `PENDING` -> `RUNNING`
-    state = await propose_state(
-        client,
-        Running(
-            state_details=StateDetails(cache_key=cache_key, refresh_cache=refresh_cache)
-        ),
-        task_run_id=task_run.id,
+    state = Running(
+        state_details=StateDetails(cache_key=cache_key, refresh_cache=refresh_cache)
     )
+    running_proposal = None
+    if _can_pipeline_running_state(task_run, cache_key):
+        # Propose the `RUNNING` state in the background and optimistically begin
+        # running the user's function; the proposal is awaited after the call starts
+        running_proposal = asyncio.ensure_future(
+            propose_state(client, state, task_run_id=task_run.id)
+        )
+    else:
+        state = await propose_state(client, state, task_run_id=task_run.id)
 
-    # Emit an event to capture the result of proposing a `RUNNING` state.
-    last_event = _emit_task_run_state_change_event(
-        task_run=task_run,
-        initial_state=last_state,
-        validated_state=state,
-        follows=last_event,
-    )
-    last_state = state
+        # Emit an event to capture the result of proposing a `RUNNING` state.
+        last_event = _emit_task_run_state_change_event(
+            task_run=task_run,
+            initial_state=last_state,
+            validated_state=state,
+            follows=last_event,
+        )
+        last_state = state
 
     # flag to ensure we only update the task run name once
     run_name_set = False
 
     # Only run the task if we enter a `RUNNING` state
     while state.is_running():
-        # Retrieve the latest metadata for the task run context
-        task_run = await client.read_task_run(task_run.id)
+        if running_proposal:
+            # Apply the updates the API makes when entering a `RUNNING` state
+            # locally instead of retrieving them
+            task_run = task_run.copy(
+                update={
+                    "state": state,
+                    "state_type": state.type,
+                    "state_name": state.name,
+                    "run_count": task_run.run_count + 1,
+                    "start_time": task_run.start_time or pendulum.now("UTC"),
+                }
+            )
+        else:
+            # Retrieve the latest metadata for the task run context
+            task_run = await client.read_task_run(task_run.id)
 
+        call = None
+        running_proposal_exc = None
         with task_run_context.copy(
             update={"task_run": task_run, "start_time": pendulum.now("UTC")}
         ):
             try:
-                args, kwargs = parameters_to_args_kwargs(task.fn, resolved_parameters)
-                # update task run name
-                if not run_name_set and task.task_run_name:
-                    task_run_name = _resolve_custom_task_run_name(
-                        task=task, parameters=resolved_parameters
+                try:
+                    args, kwargs = parameters_to_args_kwargs(
+                        task.fn, resolved_parameters
                     )
-                    await client.set_task_run_name(
-                        task_run_id=task_run.id, name=task_run_name
+                    # update task run name
+                    if not run_name_set and task.task_run_name:
+                        task_run_name = _resolve_custom_task_run_name(
+                            task=task, parameters=resolved_parameters
+                        )
+                        await client.set_task_run_name(
+                            task_run_id=task_run.id, name=task_run_name
+                        )
+                        logger.extra["task_run_name"] = task_run_name
+                        logger.debug(
+                            f"Renamed task run {task_run.name!r} to {task_run_name!r}"
+                        )
+                        task_run.name = task_run_name
+                        run_name_set = True
+
+                    if PREFECT_DEBUG_MODE.value():
+                        logger.debug(f"Executing {call_repr(task.fn, *args, **kwargs)}")
+                    else:
+                        logger.debug(
+                            "Beginning execution...", extra={"state_message": True}
+                        )
+
+                    call = from_async.call_soon_in_new_thread(
+                        _create_task_function_call(task, args, kwargs),
+                        timeout=task.timeout_seconds,
                     )
-                    logger.extra["task_run_name"] = task_run_name
-                    logger.debug(
-                        f"Renamed task run {task_run.name!r} to {task_run_name!r}"
-                    )
-                    task_run.name = task_run_name
-                    run_name_set = True
+                finally:
+                    if running_proposal:
+                        # Wait for the optimistic `RUNNING` state to be validated
+                        # while the user's function runs. This also happens if
+                        # starting the call failed, so the `RUNNING` state is always
+                        # written before any state proposed for the failure.
+                        try:
+                            state = await running_proposal
+                        except BaseException as exc:
+                            # Failures to orchestrate the run are not failures of
+                            # the task; they are re-raised below instead of being
+                            # captured
+                            if call is not None:
+                                call.cancel()
+                            running_proposal_exc = exc
+                            raise
+                        finally:
+                            running_proposal = None
+
+                        last_event = _emit_task_run_state_change_event(
+                            task_run=task_run,
+                            initial_state=last_state,
+                            validated_state=state,
+                            follows=last_event,
+                        )
+                        last_state = state
+
+                        if not state.is_running() and call is not None:
+                            # The run was not allowed to start; stop the user's
+                            # function and discard any result it produces
+                            call.cancel()
+                            logger.debug(
+                                f"Cancelled execution after receiving state {state!r}"
+                                " when proposing a `RUNNING` state"
+                            )
+
+                if not state.is_running():
+                    break
 
-                if PREFECT_DEBUG_MODE.value():
-                    logger.debug(f"Executing {call_repr(task.fn, *args, **kwargs)}")
-                else:
-                    logger.debug(
-                        "Beginning execution...", extra={"state_message": True}
-                    )
-
-                call = from_async.call_soon_in_new_thread(
-                    create_call(task.fn, *args, **kwargs), timeout=task.timeout_seconds
-                )
                 result = await call.aresult()
 
             except (CancelledError, asyncio.CancelledError) as exc:
-                if not call.timedout():
+                if call is None or not call.timedout():
                     # If the task call was not cancelled by us; this is a crash
                     raise
                 # Construct a new exception as `TimeoutError`
@@ -1672,6 +1958,12 @@ async def orchestrate_task_run(
                     name="TimedOut",
                 )
             except Exception as exc:
+                if exc is running_proposal_exc:
+                    raise
+                if not state.is_running():
+                    # The run was not allowed to start, so errors starting it are
+                    # not failures of the task
+                    break
                 logger.exception("Encountered exception during execution:")
                 terminal_state = await exception_to_failed_state(
                     exc,
@@ -1747,10 +2039,57 @@ async def orchestrate_task_run(
     return state
 
 
+def _can_pipeline_running_state(task_run: TaskRun, cache_key: Optional[str]) -> bool:
+    """
+    Determine if the `RUNNING` state for a task run can be proposed while the task's
+    function begins to run instead of beforehand.
+
+    This is only enabled by `PREFECT_TASKS_PIPELINED_ORCHESTRATION` and for task runs
+    which are practically never rejected: pending runs without tags, which could have
+    concurrency limits, and without a cache key, which could return a cached state.
+    """
+    return (
+        PREFECT_TASKS_PIPELINED_ORCHESTRATION.value()
+        and task_run.state is not None
+        and task_run.state.is_pending()
+        and not task_run.tags
+        and cache_key is None
+    )
+
+
+async def read_flow_run_for_task_run(
+    client: PrefectClient, task_run: TaskRun
+) -> FlowRun:
+    """
+    Read the parent flow run of a task run.
+
+    Flow runs are cached in the process for `PREFECT_TASKS_FLOW_RUN_CACHE_TTL_SECONDS`
+    so that task runs executed outside of their flow run's process, e.g. on a remote
+    task runner worker, read each parent flow run at most once per interval.
+    """
+    now = time.monotonic()
+    cached = FLOW_RUN_CACHE.get(task_run.flow_run_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    flow_run = await client.read_flow_run(task_run.flow_run_id)
+
+    ttl = PREFECT_TASKS_FLOW_RUN_CACHE_TTL_SECONDS.value()
+    if ttl > 0:
+        # Drop expired entries to keep the cache from growing without bound
+        for flow_run_id, (expiration, _) in list(FLOW_RUN_CACHE.items()):
+            if expiration <= now:
+                FLOW_RUN_CACHE.pop(flow_run_id, None)
+        FLOW_RUN_CACHE[flow_run.id] = (now + ttl, flow_run)
+
+    return flow_run
+
+
 async def wait_for_task_runs_and_report_crashes(
     task_run_futures: Iterable[PrefectFuture], client: PrefectClient
 ) -> Literal[True]:
     crash_exceptions = []
+    unreported_crashes = []
 
     # Gather states concurrently first
     states = await gather(*(future._wait for future in task_run_futures))
@@ -1768,11 +2107,20 @@ async def wait_for_task_runs_and_report_crashes(
         if not task_run.state.is_crashed():
             logger.info(f"Crash detected! {state.message}")
             logger.debug("Crash details:", exc_info=exception)
+            unreported_crashes.append((future, state))
+        else:
+            # Populate the state details on the local state
+            future._final_state.state_details = task_run.state.state_details
 
-            # Update the state of the task run
-            result = await client.set_task_run_state(
-                task_run_id=future.task_run.id, state=state, force=True
-            )
+        crash_exceptions.append(exception)
+
+    if unreported_crashes:
+        # Update the states of the task runs with a single request
+        results = await client.set_task_run_states(
+            [(future.task_run.id, state) for future, state in unreported_crashes],
+            force=True,
+        )
+        for (future, _), result in zip(unreported_crashes, results):
             if result.status == SetStateStatus.ACCEPT:
                 engine_logger.debug(
                     f"Reported crashed task run {future.name!r} successfully."
@@ -1782,11 +2130,6 @@ async def wait_for_task_runs_and_report_crashes(
                     f"Failed to report crashed task run {future.name!r}. "
                     f"Orchestrator did not accept state: {result!r}"
                 )
-        else:
-            # Populate the state details on the local state
-            future._final_state.state_details = task_run.state.state_details
-
-        crash_exceptions.append(exception)
 
     # Now that we've finished reporting crashed tasks, reraise any exit exceptions
     for exception in crash_exceptions:
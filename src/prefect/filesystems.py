@@ -1,11 +1,13 @@
 import abc
 import io
 import json
+import mmap
+import os
 import urllib.parse
 from pathlib import Path
 from shutil import ignore_patterns
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 import anyio
 import fsspec
@@ -19,6 +21,14 @@ from prefect.utilities.filesystem import filter_files
 from prefect.utilities.processutils import run_process
 
 
+def _mmap_file(path: Path) -> Union[bytes, mmap.mmap]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        # The map remains valid after the file is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 class ReadableFileSystem(Block, abc.ABC):
     _block_schema_capabilities = ["read-path"]
 
@@ -26,6 +36,18 @@ class ReadableFileSystem(Block, abc.ABC):
     async def read_path(self, path: str) -> bytes:
         pass
 
+    @sync_compatible
+    async def read_path_buffer(self, path: str) -> Union[bytes, mmap.mmap]:
+        """
+        Read a path into an object supporting the buffer protocol.
+
+        File systems that can expose content without reading it into memory, e.g. by
+        memory-mapping it, should override this. The caller should close the returned
+        object if it has a `close` method. By default, the content is read with
+        `read_path`.
+        """
+        return await self.read_path(path)
+
 
 class WritableFileSystem(Block, abc.ABC):
     _block_schema_capabilities = ["read-path", "write-path"]
@@ -34,10 +56,33 @@ class WritableFileSystem(Block, abc.ABC):
     async def read_path(self, path: str) -> bytes:
         pass
 
+    @sync_compatible
+    async def read_path_buffer(self, path: str) -> Union[bytes, mmap.mmap]:
+        """
+        Read a path into an object supporting the buffer protocol.
+
+        File systems that can expose content without reading it into memory, e.g. by
+        memory-mapping it, should override this. The caller should close the returned
+        object if it has a `close` method. By default, the content is read with
+        `read_path`.
+        """
+        return await self.read_path(path)
+
     @abc.abstractmethod
     async def write_path(self, path: str, content: bytes) -> None:
         pass
 
+    @sync_compatible
+    async def write_path_chunks(self, path: str, chunks: Iterable[bytes]) -> Any:
+        """
+        Write a sequence of byte chunks to a path as a single file.
+
+        File systems that can write incrementally should override this to avoid
+        joining the chunks in memory. By default, the chunks are joined and passed to
+        `write_path`.
+        """
+        return await self.write_path(path, content=b"".join(chunks))
+
 
 class ReadableDeploymentStorage(Block, abc.ABC):
     _block_schema_capabilities = ["get-directory"]
@@ -210,6 +255,26 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
 
         return content
 
+    @sync_compatible
+    async def read_path_buffer(self, path: str) -> Union[bytes, mmap.mmap]:
+        """
+        Read a path as a read-only memory map instead of copying it into memory.
+
+        The returned map should be closed by the caller. Empty files cannot be mapped
+        and are returned as empty bytes.
+        """
+        path: Path = self._resolve_path(path)
+
+        # Check if the path exists
+        if not path.exists():
+            raise ValueError(f"Path {path} does not exist.")
+
+        # Validate that its a file
+        if not path.is_file():
+            raise ValueError(f"Path {path} is not a file.")
+
+        return await run_sync_in_worker_thread(_mmap_file, path)
+
     @sync_compatible
     async def write_path(self, path: str, content: bytes) -> str:
         path: Path = self._resolve_path(path)
@@ -226,6 +291,23 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         # Leave path stringify to the OS
         return str(path)
 
+    @sync_compatible
+    async def write_path_chunks(self, path: str, chunks: Iterable[bytes]) -> str:
+        path: Path = self._resolve_path(path)
+
+        # Construct the path if it does not exist
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        # Check if the file already exists
+        if path.exists() and not path.is_file():
+            raise ValueError(f"Path {path} already exists and is not a file.")
+
+        async with await anyio.open_file(path, mode="wb") as f:
+            for chunk in chunks:
+                await f.write(chunk)
+        # Leave path stringify to the OS
+        return str(path)
+
 
 class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
     """
@@ -401,6 +483,18 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
             await run_sync_in_worker_thread(file.write, content)
         return path
 
+    @sync_compatible
+    async def write_path_chunks(self, path: str, chunks: Iterable[bytes]) -> str:
+        path = self._resolve_path(path)
+        dirpath = path[: path.rindex("/")]
+
+        self.filesystem.makedirs(dirpath, exist_ok=True)
+
+        with self.filesystem.open(path, "wb") as file:
+            for chunk in chunks:
+                await run_sync_in_worker_thread(file.write, chunk)
+        return path
+
     @property
     def filesystem(self) -> fsspec.AbstractFileSystem:
         if not self._filesystem:
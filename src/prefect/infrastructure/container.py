@@ -1,10 +1,31 @@
+import asyncio
 import json
+import queue
 import re
+import selectors
+import socket
+import struct
 import sys
+import threading
+import time
 import urllib.parse
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple, Union
+from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import anyio.abc
 import packaging.version
@@ -15,7 +36,8 @@ import prefect
 from prefect.blocks.core import Block, SecretStr
 from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFound
 from prefect.infrastructure.base import Infrastructure, InfrastructureResult
-from prefect.settings import PREFECT_API_URL
+from prefect.logging import get_logger
+from prefect.settings import PREFECT_API_URL, PREFECT_DOCKER_SHARED_EVENTS_ENABLED
 from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from prefect.utilities.collections import AutoEnum
 from prefect.utilities.dockerutils import (
@@ -28,6 +50,7 @@ from prefect.utilities.slugify import slugify
 
 if TYPE_CHECKING:
     import docker
+    import docker.utils.socket
     from docker import DockerClient
     from docker.models.containers import Container
 else:
@@ -162,6 +185,423 @@ class DockerContainerResult(InfrastructureResult):
     """Contains information about a completed Docker container"""
 
 
+class DockerEventWatcher:
+    """
+    Watches the container events of a Docker daemon on a single daemon thread, waking
+    the tasks waiting for containers to exit.
+
+    If the event stream fails, it is reopened from the time of the last event seen so
+    that events are not missed.
+
+    Use `shared_docker_event_watcher` to share a watcher between the containers run by
+    a process.
+
+    Args:
+        docker_client: The Docker client to watch with, which is closed when the
+            watcher stops
+    """
+
+    def __init__(self, docker_client: "DockerClient"):
+        self.logger = get_logger("prefect.infrastructure.docker-container")
+
+        self._docker_client = docker_client
+        self._events = None
+        self._since: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        # The event loop and future of each waiting task, by container id
+        self._waiters: Dict[
+            str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+        ] = defaultdict(list)
+
+    def start(self) -> None:
+        """
+        Subscribe to container events and start watching them on a background thread.
+        """
+        # Subscribe before returning so that waiters do not miss any events
+        self._events = self._subscribe()
+        threading.Thread(
+            target=self._watch, name="DockerEventWatcher", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        """
+        Stop watching. Closing the event stream interrupts the watch.
+        """
+        self._stopped.set()
+        if self._events is not None:
+            self._events.close()
+        self._docker_client.close()
+
+    async def wait_for_exit(self, container_id: str) -> Optional[int]:
+        """
+        Wait for a container to exit and return its exit code.
+
+        Returns `None` if the container is removed before its exit code is seen.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        with self._lock:
+            self._waiters[container_id].append(waiter)
+        try:
+            # The container may have exited before the waiter was registered
+            state = await run_sync_in_worker_thread(
+                self._get_container_state, container_id
+            )
+            if state is None:
+                return None
+            if state.get("Status") in ("exited", "dead"):
+                return state.get("ExitCode")
+            return await waiter[1]
+        finally:
+            with self._lock:
+                self._waiters[container_id].remove(waiter)
+                if not self._waiters[container_id]:
+                    del self._waiters[container_id]
+
+    def _get_container_state(self, container_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self._docker_client.containers.get(container_id).attrs["State"]
+        except docker.errors.NotFound:
+            return None
+
+    def _subscribe(self):
+        subscribed_at = int(time.time())
+        events = self._docker_client.events(
+            since=self._since,
+            filters={"type": "container", "event": ["die", "destroy"]},
+            decode=True,
+        )
+        # If the stream fails before any event is seen, reopen it from here
+        if self._since is None:
+            self._since = subscribed_at
+        return events
+
+    def _watch(self) -> None:
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                if self._events is None:
+                    self._events = self._subscribe()
+                    # Containers may have exited while the stream was closed
+                    self._check_waiting_containers()
+                for event in self._events:
+                    self._since = event.get("time", self._since)
+                    self._dispatch(event)
+                    backoff = 1
+            except Exception:
+                if self._stopped.is_set():
+                    break
+                self.logger.warning(
+                    f"Error watching Docker events. Retrying in {backoff}s...",
+                    exc_info=True,
+                )
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+            # The stream ended or failed; reopen it from the last event seen
+            self._events = None
+
+    def _check_waiting_containers(self) -> None:
+        with self._lock:
+            container_ids = list(self._waiters)
+        for container_id in container_ids:
+            state = self._get_container_state(container_id)
+            if state is None:
+                self._resolve(container_id, None)
+            elif state.get("Status") in ("exited", "dead"):
+                self._resolve(container_id, state.get("ExitCode"))
+
+    def _dispatch(self, event: Dict[str, Any]) -> None:
+        actor = event.get("Actor", {})
+        container_id = actor.get("ID") or event.get("id")
+        exit_code = None
+        if event.get("Action") == "die":
+            exit_code = actor.get("Attributes", {}).get("exitCode")
+            exit_code = int(exit_code) if exit_code is not None else None
+        self._resolve(container_id, exit_code)
+
+    def _resolve(self, container_id: str, exit_code: Optional[int]) -> None:
+        with self._lock:
+            for loop, future in self._waiters.get(container_id, []):
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(_set_result_if_pending, future, exit_code)
+
+
+class DockerLogMultiplexer:
+    """
+    Streams the output of many containers to standard output on a single daemon
+    thread.
+
+    Output is read from each container's attach socket as it becomes available and
+    written in batches of complete lines at most every `flush_interval` seconds.
+
+    Use `shared_docker_log_multiplexer` to share a multiplexer between the containers
+    run by a process.
+
+    Args:
+        flush_interval: The number of seconds between writes to standard output
+    """
+
+    def __init__(self, flush_interval: float = 0.1):
+        self.flush_interval = flush_interval
+        self.logger = get_logger("prefect.infrastructure.docker-container")
+
+        # The selector is only used by the streaming thread, so sockets are handed to
+        # it on a queue and the thread is woken by writing to a socket pair
+        self._selector = selectors.DefaultSelector()
+        self._added: "queue.SimpleQueue[Tuple[Any, _OutputStream]]" = (
+            queue.SimpleQueue()
+        )
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ)
+        self._output: List[str] = []
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """
+        Start streaming output on a background thread.
+        """
+        threading.Thread(
+            target=self._run, name="DockerLogMultiplexer", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        """
+        Stop streaming output, closing any remaining sockets.
+        """
+        self._stopped.set()
+        self._wake()
+
+    def add(self, sock: Any) -> asyncio.Future:
+        """
+        Stream the multiplexed output read from a container's attach socket.
+
+        Returns a future that is done once all of the output has been written.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._added.put((sock, _OutputStream(loop=loop, future=future)))
+        self._wake()
+        return future
+
+    def _wake(self) -> None:
+        try:
+            self._wakeup_writer.send(b"\0")
+        except OSError:
+            # The thread is already due to wake, or has stopped
+            pass
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while not self._stopped.is_set():
+            for key, _ in self._selector.select(timeout=self.flush_interval):
+                if key.fileobj is self._wakeup_reader:
+                    self._register_added()
+                else:
+                    self._read(key)
+
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self._flush()
+                last_flush = time.monotonic()
+
+        self._register_added()
+        for key in list(self._selector.get_map().values()):
+            if key.fileobj is not self._wakeup_reader:
+                self._close(key)
+        self._selector.close()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+    def _register_added(self) -> None:
+        # Drain the wakeups before the queue so that no added socket is missed
+        try:
+            while self._wakeup_reader.recv(4096):
+                pass
+        except OSError:
+            pass
+        while True:
+            try:
+                sock, stream = self._added.get_nowait()
+            except queue.Empty:
+                break
+            self._selector.register(sock, selectors.EVENT_READ, stream)
+
+    def _read(self, key: selectors.SelectorKey) -> None:
+        stream: _OutputStream = key.data
+        try:
+            data = docker.utils.socket.read(key.fileobj, 65536)
+            # TLS sockets may have decrypted data pending without being readable
+            while getattr(key.fileobj, "pending", lambda: 0)():
+                data += docker.utils.socket.read(key.fileobj, 65536)
+        except OSError:
+            self.logger.debug("Error reading Docker container output.", exc_info=True)
+            data = b""
+
+        if not data:
+            self._close(key)
+            return
+
+        # Output is a series of frames, each with an 8 byte header ending in its size
+        stream.frames += data
+        while len(stream.frames) >= 8:
+            _, size = struct.unpack(">BxxxL", stream.frames[:8])
+            if len(stream.frames) < 8 + size:
+                break
+            stream.text += stream.frames[8 : 8 + size]
+            stream.frames = stream.frames[8 + size :]
+
+        lines, newline, stream.text = stream.text.rpartition(b"\n")
+        if newline:
+            self._write(lines + newline)
+
+    def _close(self, key: selectors.SelectorKey) -> None:
+        stream: _OutputStream = key.data
+        self._selector.unregister(key.fileobj)
+        key.fileobj.close()
+
+        if stream.text:
+            self._write(stream.text + b"\n")
+        self._flush()
+        if not stream.loop.is_closed():
+            stream.loop.call_soon_threadsafe(
+                _set_result_if_pending, stream.future, None
+            )
+
+    def _write(self, output: bytes) -> None:
+        self._output.append(output.decode(errors="replace"))
+
+    def _flush(self) -> None:
+        if self._output:
+            sys.stdout.write("".join(self._output))
+            sys.stdout.flush()
+            self._output.clear()
+
+
+@dataclass
+class _OutputStream:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    # Bytes read from the socket that do not form a full frame yet
+    frames: bytes = b""
+    # Output that does not end with a newline yet
+    text: bytes = b""
+
+
+def _set_result_if_pending(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+# The number of seconds an event watcher is kept after its last user is done, so that
+# containers started one after another do not each subscribe to events again
+EVENT_WATCHER_GRACE_PERIOD_SECONDS = 30
+
+# Datastores for sharing event watchers, keyed by Docker API base URL
+_EVENT_WATCHERS: Dict[str, DockerEventWatcher] = {}
+_EVENT_WATCHER_USERS: Dict[str, int] = defaultdict(int)
+_LOG_MULTIPLEXER: Optional[DockerLogMultiplexer] = None
+_LOG_MULTIPLEXER_USERS = 0
+_SHARED_LOCK = threading.Lock()
+
+
+@asynccontextmanager
+async def shared_docker_event_watcher(
+    get_client: Callable[[], "DockerClient"]
+) -> AsyncGenerator[DockerEventWatcher, None]:
+    """
+    Get the event watcher for the Docker daemon that `get_client` connects to.
+
+    If there is no watcher for the daemon yet, one is started with a client from
+    `get_client`. The watcher is stopped once it has had no users for
+    `EVENT_WATCHER_GRACE_PERIOD_SECONDS`. Calls to the Docker daemon are made in a
+    worker thread.
+    """
+    # Shielded so that the watcher is always released once it has been acquired
+    with anyio.CancelScope(shield=True):
+        key, watcher = await run_sync_in_worker_thread(
+            _acquire_docker_event_watcher, get_client
+        )
+    try:
+        yield watcher
+    finally:
+        with anyio.CancelScope(shield=True):
+            await run_sync_in_worker_thread(_release_docker_event_watcher, key, watcher)
+
+
+def _acquire_docker_event_watcher(
+    get_client: Callable[[], "DockerClient"]
+) -> Tuple[str, DockerEventWatcher]:
+    docker_client = get_client()
+    key = docker_client.api.base_url
+    with _SHARED_LOCK:
+        watcher = _EVENT_WATCHERS.get(key)
+        if watcher is None:
+            watcher = DockerEventWatcher(docker_client)
+            watcher.start()
+            _EVENT_WATCHERS[key] = watcher
+            docker_client = None
+        _EVENT_WATCHER_USERS[key] += 1
+
+    if docker_client is not None:
+        docker_client.close()
+    return key, watcher
+
+
+def _release_docker_event_watcher(key: str, watcher: DockerEventWatcher) -> None:
+    with _SHARED_LOCK:
+        _EVENT_WATCHER_USERS[key] -= 1
+        unused = not _EVENT_WATCHER_USERS[key]
+    if unused:
+        if EVENT_WATCHER_GRACE_PERIOD_SECONDS > 0:
+            timer = threading.Timer(
+                EVENT_WATCHER_GRACE_PERIOD_SECONDS,
+                _stop_unused_docker_event_watcher,
+                args=(key, watcher),
+            )
+            timer.daemon = True
+            timer.start()
+        else:
+            _stop_unused_docker_event_watcher(key, watcher)
+
+
+def _stop_unused_docker_event_watcher(key: str, watcher: DockerEventWatcher) -> None:
+    with _SHARED_LOCK:
+        # The watcher may have been used again during its grace period
+        if _EVENT_WATCHER_USERS.get(key) or _EVENT_WATCHERS.get(key) is not watcher:
+            return
+        del _EVENT_WATCHER_USERS[key]
+        del _EVENT_WATCHERS[key]
+    watcher.stop()
+
+
+@contextmanager
+def shared_docker_log_multiplexer() -> Generator[DockerLogMultiplexer, None, None]:
+    """
+    Get the log multiplexer for this process, starting it if this is its first user.
+    The multiplexer is stopped once it has no users.
+    """
+    global _LOG_MULTIPLEXER, _LOG_MULTIPLEXER_USERS
+
+    with _SHARED_LOCK:
+        if _LOG_MULTIPLEXER is None:
+            _LOG_MULTIPLEXER = DockerLogMultiplexer()
+            _LOG_MULTIPLEXER.start()
+        multiplexer = _LOG_MULTIPLEXER
+        _LOG_MULTIPLEXER_USERS += 1
+
+    try:
+        yield multiplexer
+    finally:
+        with _SHARED_LOCK:
+            _LOG_MULTIPLEXER_USERS -= 1
+            if not _LOG_MULTIPLEXER_USERS:
+                _LOG_MULTIPLEXER.stop()
+                _LOG_MULTIPLEXER = None
+
+
 class DockerContainer(Infrastructure):
     """
     Runs a command in a container.
@@ -327,11 +767,14 @@ class DockerContainer(Infrastructure):
             task_status.started(container_pid)
 
         # Monitor the container
-        container = await run_sync_in_worker_thread(
-            self._watch_container_safe, container
-        )
+        if PREFECT_DOCKER_SHARED_EVENTS_ENABLED.value():
+            exit_code = await self._wait_for_container_exit(container)
+        else:
+            container = await run_sync_in_worker_thread(
+                self._watch_container_safe, container
+            )
+            exit_code = container.attrs["State"].get("ExitCode")
 
-        exit_code = container.attrs["State"].get("ExitCode")
         return DockerContainerResult(
             status_code=exit_code if exit_code is not None else -1,
             identifier=container_pid,
@@ -636,6 +1079,64 @@ class DockerContainer(Infrastructure):
         )
         yield container
 
+    async def _wait_for_container_exit(self, container: "Container") -> Optional[int]:
+        """
+        Wait for a container to exit using the Docker event watcher shared by the
+        containers run in this process, streaming its output with the shared log
+        multiplexer.
+
+        Returns the exit code of the container, or `None` if it is not known.
+        """
+        async with AsyncExitStack() as stack:
+            watcher = await stack.enter_async_context(
+                shared_docker_event_watcher(self._get_client)
+            )
+
+            output_written = None
+            if self.stream_output:
+                # The client owns the attached socket, so it is closed only after the
+                # multiplexer is done with the socket
+                docker_client = await run_sync_in_worker_thread(self._get_client)
+                stack.callback(docker_client.close)
+                multiplexer = stack.enter_context(shared_docker_log_multiplexer())
+                try:
+                    sock = await run_sync_in_worker_thread(
+                        self._attach_container_output, docker_client, container
+                    )
+                except docker.errors.APIError:
+                    self.logger.exception(
+                        "An unexpected Docker API error occured while streaming output "
+                        f"from container {container.name}."
+                    )
+                else:
+                    output_written = multiplexer.add(sock)
+
+            exit_code = await watcher.wait_for_exit(container.id)
+            if output_written is not None:
+                await output_written
+
+        if exit_code is None:
+            self.logger.warning(
+                f"Docker container {container.name} was removed before we could wait "
+                "for its completion."
+            )
+        else:
+            self.logger.info(
+                f"Docker container {container.name!r} exited with code {exit_code}."
+            )
+        return exit_code
+
+    def _attach_container_output(
+        self, docker_client: "DockerClient", container: "Container"
+    ):
+        """
+        Attach to the output of a container, including any output written before
+        attaching. Returns the attached socket, which is owned by `docker_client`.
+        """
+        return docker_client.api.attach_socket(
+            container.id, params={"stdout": 1, "stderr": 1, "stream": 1, "logs": 1}
+        )
+
     def _get_client(self):
         try:
             with warnings.catch_warnings():
@@ -1,12 +1,30 @@
+import asyncio
 import copy
 import enum
+import functools
 import json
 import math
 import os
+import socket
+import threading
 import time
+from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple, Union
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import anyio
 import anyio.abc
 import yaml
 from pydantic import Field, root_validator, validator
@@ -15,6 +33,8 @@ from typing_extensions import Literal
 from prefect.blocks.kubernetes import KubernetesClusterConfig
 from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFound
 from prefect.infrastructure.base import Infrastructure, InfrastructureResult
+from prefect.logging import get_logger
+from prefect.settings import PREFECT_KUBERNETES_SHARED_INFORMER_ENABLED
 from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from prefect.utilities.dockerutils import get_prefect_image_name
 from prefect.utilities.hashing import stable_hash
@@ -27,10 +47,13 @@ if TYPE_CHECKING:
     import kubernetes.client
     import kubernetes.client.exceptions
     import kubernetes.config
+    import kubernetes.watch
     from kubernetes.client import BatchV1Api, CoreV1Api, V1Job, V1Pod
 else:
     kubernetes = lazy_import("kubernetes")
 
+T = TypeVar("T")
+
 
 class KubernetesImagePullPolicy(enum.Enum):
     IF_NOT_PRESENT = "IfNotPresent"
@@ -50,6 +73,318 @@ class KubernetesJobResult(InfrastructureResult):
     """Contains information about the final state of a completed Kubernetes Job"""
 
 
+class KubernetesJobInformer:
+    """
+    Watches the jobs and job pods in a namespace, keeping their latest state in memory.
+
+    Jobs and pods labelled by `KubernetesJob` are each listed, then watched from the
+    listed resource version on a daemon thread, so a namespace is watched by two
+    threads however many jobs run in it. If a watch fails, or its resource version
+    expires, the objects are listed again before watching resumes. Tasks waiting on a
+    job are woken whenever the job or one of its pods changes.
+
+    Use `shared_job_informer` to share an informer between the jobs run by a process.
+
+    Args:
+        namespace: The namespace to watch
+        api_client: The Kubernetes API client to watch with
+        watch_timeout_seconds: The number of seconds after which watches are restarted
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        api_client: "kubernetes.client.ApiClient",
+        watch_timeout_seconds: int = 300,
+    ):
+        self.namespace = namespace
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.logger = get_logger("prefect.infrastructure.kubernetes-job")
+
+        self._api_client = api_client
+        self._jobs: Dict[str, "V1Job"] = {}
+        self._pods: Dict[str, "V1Pod"] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+        # the response of each watch in progress, by kind
+        self._responses: Dict[str, Any] = {}
+        # the event loop and event of each waiting task, by job name
+        self._waiters: Dict[
+            str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = defaultdict(list)
+
+    def start(self) -> None:
+        """
+        Start watching jobs and pods on background threads.
+        """
+        batch_client = kubernetes.client.BatchV1Api(api_client=self._api_client)
+        core_client = kubernetes.client.CoreV1Api(api_client=self._api_client)
+        watches = [
+            ("job", batch_client.list_namespaced_job, self._jobs, _job_name_of_job),
+            ("pod", core_client.list_namespaced_pod, self._pods, _job_name_of_pod),
+        ]
+        for kind, list_func, objects, job_name_of in watches:
+            thread = threading.Thread(
+                target=self._list_and_watch,
+                args=(kind, list_func, objects, job_name_of),
+                name=f"KubernetesJobInformer-{kind}-{self.namespace}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5) -> None:
+        """
+        Stop watching, interrupting any watch in progress, and wait up to `timeout`
+        seconds for the watch threads to exit.
+        """
+        with self._lock:
+            self._stopped.set()
+            responses = list(self._responses.values())
+        for response in responses:
+            _interrupt_response(response)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._api_client.rest_client.pool_manager.clear()
+
+    def get_job(self, job_name: str) -> Optional["V1Job"]:
+        """
+        Get the latest state of a job, if it has been seen.
+        """
+        with self._lock:
+            return self._jobs.get(job_name)
+
+    def get_job_pods(self, job_name: str) -> List["V1Pod"]:
+        """
+        Get the latest state of the pods created for a job.
+        """
+        with self._lock:
+            return [
+                pod for pod in self._pods.values() if _job_name_of_pod(pod) == job_name
+            ]
+
+    async def wait_for(
+        self, job_name: str, check: Callable[[], T], timeout: Optional[float] = None
+    ) -> Optional[T]:
+        """
+        Wait until `check` returns a truthy value and return it. `check` is called
+        immediately, then again whenever the job or its pods change.
+
+        Returns `None` if `timeout` seconds pass first.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters[job_name].append(waiter)
+        try:
+            with anyio.move_on_after(timeout):
+                while True:
+                    result = check()
+                    if result:
+                        return result
+                    await waiter[1].wait()
+                    waiter[1].clear()
+        finally:
+            with self._lock:
+                self._waiters[job_name].remove(waiter)
+                if not self._waiters[job_name]:
+                    del self._waiters[job_name]
+        return None
+
+    def _list_and_watch(
+        self,
+        kind: str,
+        list_func: Callable,
+        objects: Dict[str, Any],
+        job_name_of: Callable[[Any], str],
+    ) -> None:
+        # Only objects created by `KubernetesJob` are watched
+        kwargs = {"label_selector": INFORMER_LABEL_SELECTOR}
+
+        # `Watch` deserializes events using the return type in the docstring
+        @functools.wraps(list_func)
+        def watch_func(*args: Any, **kwargs: Any) -> Any:
+            response = list_func(*args, **kwargs)
+            with self._lock:
+                self._responses[kind] = response
+                stopped = self._stopped.is_set()
+            if stopped:
+                _interrupt_response(response)
+            return response
+
+        resource_version = None
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    listed = list_func(namespace=self.namespace, **kwargs)
+                    self._replace(objects, listed.items, job_name_of)
+                    resource_version = listed.metadata.resource_version
+
+                watch = kubernetes.watch.Watch()
+                for event in watch.stream(
+                    func=watch_func,
+                    namespace=self.namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=self.watch_timeout_seconds,
+                    **kwargs,
+                ):
+                    if self._stopped.is_set():
+                        watch.stop()
+                        break
+                    resource_version = event["object"].metadata.resource_version
+                    self._update(objects, event["type"], event["object"], job_name_of)
+                backoff = 1
+            except Exception as exc:
+                # The resource version expired, which is expected after long watches
+                gone = (
+                    isinstance(exc, kubernetes.client.exceptions.ApiException)
+                    and exc.status == 410
+                )
+                resource_version = None
+                if not gone and not self._stopped.is_set():
+                    self.logger.warning(
+                        (
+                            f"Namespace {self.namespace!r}: Error watching Kubernetes"
+                            f" {kind}s. Retrying in {backoff}s..."
+                        ),
+                        exc_info=True,
+                    )
+                    self._stopped.wait(backoff)
+                    backoff = min(backoff * 2, 30)
+            finally:
+                with self._lock:
+                    self._responses.pop(kind, None)
+
+    def _replace(
+        self,
+        objects: Dict[str, Any],
+        items: List[Any],
+        job_name_of: Callable[[Any], str],
+    ) -> None:
+        with self._lock:
+            changed = [*objects.values(), *items]
+            objects.clear()
+            objects.update({item.metadata.name: item for item in items})
+            self._wake({job_name_of(obj) for obj in changed})
+
+    def _update(
+        self,
+        objects: Dict[str, Any],
+        event_type: str,
+        obj: Any,
+        job_name_of: Callable[[Any], str],
+    ) -> None:
+        with self._lock:
+            if event_type == "DELETED":
+                objects.pop(obj.metadata.name, None)
+            else:
+                objects[obj.metadata.name] = obj
+            self._wake({job_name_of(obj)})
+
+    def _wake(self, job_names: Iterable[str]) -> None:
+        for job_name in job_names:
+            for loop, event in self._waiters.get(job_name, []):
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(event.set)
+
+
+def _job_name_of_job(job: "V1Job") -> str:
+    return job.metadata.name
+
+
+def _job_name_of_pod(pod: "V1Pod") -> Optional[str]:
+    return (pod.metadata.labels or {}).get("job-name")
+
+
+def _interrupt_response(response: Any) -> None:
+    """
+    Wake a thread blocked reading a streaming response by shutting down its socket.
+    """
+    sock = getattr(response.connection, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+# The label `KubernetesJob` sets on jobs and their pods when the informer is enabled
+INFORMER_LABEL_KEY = "prefect.io/infrastructure"
+INFORMER_LABEL_VALUE = "kubernetes-job"
+INFORMER_LABEL_SELECTOR = f"{INFORMER_LABEL_KEY}={INFORMER_LABEL_VALUE}"
+
+# The number of seconds an informer keeps watching after its last user leaves, so
+# that jobs started shortly after do not need to list and watch the namespace again
+JOB_INFORMER_GRACE_PERIOD_SECONDS = 30
+
+# Datastores for sharing informers, keyed by API server host and namespace
+_JOB_INFORMERS: Dict[Tuple[str, str], KubernetesJobInformer] = {}
+_JOB_INFORMER_USERS: Dict[Tuple[str, str], int] = defaultdict(int)
+_JOB_INFORMERS_LOCK = threading.Lock()
+
+
+@contextmanager
+def shared_job_informer(namespace: str) -> Generator[KubernetesJobInformer, None, None]:
+    """
+    Get the informer for a namespace of the currently configured cluster, starting it
+    if this is its first user. The informer is stopped once it has had no users for
+    `JOB_INFORMER_GRACE_PERIOD_SECONDS`.
+    """
+    configuration = kubernetes.client.Configuration.get_default_copy()
+    key = (configuration.host, namespace)
+    with _JOB_INFORMERS_LOCK:
+        informer = _JOB_INFORMERS.get(key)
+        if informer is None:
+            informer = _JOB_INFORMERS[key] = KubernetesJobInformer(
+                namespace, kubernetes.client.ApiClient(configuration=configuration)
+            )
+            informer.start()
+        _JOB_INFORMER_USERS[key] += 1
+    try:
+        yield informer
+    finally:
+        with _JOB_INFORMERS_LOCK:
+            _JOB_INFORMER_USERS[key] -= 1
+            unused = not _JOB_INFORMER_USERS[key]
+        if unused:
+            if JOB_INFORMER_GRACE_PERIOD_SECONDS > 0:
+                timer = threading.Timer(
+                    JOB_INFORMER_GRACE_PERIOD_SECONDS,
+                    _stop_unused_job_informer,
+                    args=(key, informer),
+                )
+                timer.daemon = True
+                timer.start()
+            else:
+                _stop_unused_job_informer(key, informer)
+
+
+def _stop_unused_job_informer(
+    key: Tuple[str, str], informer: KubernetesJobInformer
+) -> None:
+    with _JOB_INFORMERS_LOCK:
+        # The informer may have been used again during its grace period
+        if _JOB_INFORMER_USERS.get(key) or _JOB_INFORMERS.get(key) is not informer:
+            return
+        del _JOB_INFORMER_USERS[key]
+        del _JOB_INFORMERS[key]
+    informer.stop()
+
+
+def _add_informer_labels(manifest: KubernetesManifest) -> None:
+    """
+    Label a job and the pods it creates so that they are seen by the job informer.
+    """
+    for metadata in (
+        manifest.setdefault("metadata", {}),
+        manifest["spec"]["template"].setdefault("metadata", {}),
+    ):
+        labels = metadata.get("labels") or {}
+        labels[INFORMER_LABEL_KEY] = INFORMER_LABEL_VALUE
+        metadata["labels"] = labels
+
+
 class KubernetesJob(Infrastructure):
     """
     Runs a command as a Kubernetes Job.
@@ -297,6 +632,8 @@ class KubernetesJob(Infrastructure):
 
         self._configure_kubernetes_library_client()
         manifest = self.build_job()
+        if PREFECT_KUBERNETES_SHARED_INFORMER_ENABLED.value():
+            _add_informer_labels(manifest)
         job = await run_sync_in_worker_thread(self._create_job, manifest)
 
         pid = await run_sync_in_worker_thread(self._get_infrastructure_pid, job)
@@ -305,9 +642,12 @@ class KubernetesJob(Infrastructure):
             task_status.started(pid)
 
         # Monitor the job until completion
-        status_code = await run_sync_in_worker_thread(
-            self._watch_job, job.metadata.name
-        )
+        if PREFECT_KUBERNETES_SHARED_INFORMER_ENABLED.value():
+            status_code = await self._watch_job_with_informer(job.metadata.name)
+        else:
+            status_code = await run_sync_in_worker_thread(
+                self._watch_job, job.metadata.name
+            )
         return KubernetesJobResult(identifier=pid, status_code=status_code)
 
     async def kill(self, infrastructure_pid: str, grace_seconds: int = 30):
@@ -613,35 +953,7 @@ class KubernetesJob(Infrastructure):
         )
 
         if self.stream_output:
-            with self.get_client() as client:
-                logs = client.read_namespaced_pod_log(
-                    pod.metadata.name,
-                    self.namespace,
-                    follow=True,
-                    _preload_content=False,
-                    container="prefect-job",
-                )
-                try:
-                    for log in logs.stream():
-                        print(log.decode().rstrip())
-
-                        # Check if we have passed the deadline and should stop streaming
-                        # logs
-                        remaining_time = (
-                            deadline - time.monotonic() if deadline else None
-                        )
-                        if deadline and remaining_time <= 0:
-                            break
-
-                except Exception:
-                    self.logger.warning(
-                        (
-                            "Error occurred while streaming logs - "
-                            "Job will continue to run but logs will "
-                            "no longer be streamed to stdout."
-                        ),
-                        exc_info=True,
-                    )
+            self._stream_pod_logs(pod, deadline)
 
         with self.get_batch_client() as batch_client:
             # Check if the job is completed before beginning a watch
@@ -683,6 +995,108 @@ class KubernetesJob(Infrastructure):
                         watch.stop()
                         break
 
+        return self._get_pod_exit_code(pod)
+
+    async def _watch_job_with_informer(self, job_name: str) -> int:
+        """
+        Watch a job using the informer shared by the jobs run in this process.
+
+        Return the final status code of the first container.
+        """
+        self.logger.debug(f"Job {job_name!r}: Monitoring job...")
+
+        job = await run_sync_in_worker_thread(self._get_job, job_name)
+        if not job:
+            return -1
+
+        with shared_job_informer(self.namespace) as informer:
+            last_phase = None
+
+            def get_started_pod() -> Optional["V1Pod"]:
+                nonlocal last_phase
+                for pod in informer.get_job_pods(job_name):
+                    phase = pod.status.phase
+                    if phase != last_phase:
+                        self.logger.info(f"Job {job_name!r}: Pod has status {phase!r}.")
+                        last_phase = phase
+                    if phase != "Pending":
+                        return pod
+
+            self.logger.debug(f"Job {job_name!r}: Waiting for pod start...")
+            pod = await informer.wait_for(
+                job_name, get_started_pod, timeout=self.pod_watch_timeout_seconds
+            )
+            if not pod:
+                self.logger.error(f"Job {job_name!r}: Pod never started.")
+                return -1
+
+            # Calculate the deadline before streaming output
+            deadline = (
+                (time.monotonic() + self.job_watch_timeout_seconds)
+                if self.job_watch_timeout_seconds is not None
+                else None
+            )
+
+            if self.stream_output:
+                await run_sync_in_worker_thread(self._stream_pod_logs, pod, deadline)
+
+            def get_completed_job() -> Optional["V1Job"]:
+                job = informer.get_job(job_name)
+                if job and job.status.completion_time:
+                    return job
+
+            job = await informer.wait_for(
+                job_name,
+                get_completed_job,
+                timeout=max(deadline - time.monotonic(), 0) if deadline else None,
+            )
+            if not job:
+                self.logger.error(
+                    f"Job {job_name!r}: Job did not complete within "
+                    f"timeout of {self.job_watch_timeout_seconds}s."
+                )
+                return -1
+            if not job.status.succeeded:
+                self.logger.error(f"Job {job_name!r}: Job failed.")
+
+        return await run_sync_in_worker_thread(self._get_pod_exit_code, pod)
+
+    def _stream_pod_logs(self, pod: "V1Pod", deadline: Optional[float]) -> None:
+        """
+        Print the logs of a job's pod until it exits or the deadline passes.
+        """
+        with self.get_client() as client:
+            logs = client.read_namespaced_pod_log(
+                pod.metadata.name,
+                self.namespace,
+                follow=True,
+                _preload_content=False,
+                container="prefect-job",
+            )
+            try:
+                for log in logs.stream():
+                    print(log.decode().rstrip())
+
+                    # Check if we have passed the deadline and should stop streaming
+                    # logs
+                    remaining_time = deadline - time.monotonic() if deadline else None
+                    if deadline and remaining_time <= 0:
+                        break
+
+            except Exception:
+                self.logger.warning(
+                    (
+                        "Error occurred while streaming logs - "
+                        "Job will continue to run but logs will "
+                        "no longer be streamed to stdout."
+                    ),
+                    exc_info=True,
+                )
+
+    def _get_pod_exit_code(self, pod: "V1Pod") -> int:
+        """
+        Get the exit code of the first container of a job's pod.
+        """
         with self.get_client() as client:
             pod_status = client.read_namespaced_pod_status(
                 namespace=self.namespace, name=pod.metadata.name
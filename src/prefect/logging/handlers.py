@@ -1,13 +1,19 @@
+import datetime
 import json
 import logging
+import random
 import sys
+import threading
 import time
 import traceback
 import warnings
+from collections import Counter
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Type, Union
+from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from uuid import UUID
 
-import pendulum
 from rich.console import Console
 from rich.highlighter import Highlighter, NullHighlighter
 from rich.theme import Theme
@@ -20,7 +26,6 @@ from prefect._internal.concurrency.event_loop import get_running_loop
 from prefect._internal.concurrency.services import BatchedQueueService
 from prefect._internal.concurrency.threads import in_global_loop
 from prefect.client.orchestration import get_client
-from prefect.client.schemas.actions import LogCreate
 from prefect.exceptions import MissingContextError
 from prefect.logging.highlighters import PrefectConsoleHighlighter
 from prefect.settings import (
@@ -29,12 +34,33 @@ from prefect.settings import (
     PREFECT_LOGGING_MARKUP,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_DEDUPE_WINDOW,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_RATE_LIMIT,
+    PREFECT_LOGGING_TO_API_SAMPLE_RATIOS,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
+    Settings,
 )
 
 
+def _uuid_to_str(value: Union[UUID, str]) -> str:
+    if isinstance(value, UUID):
+        return str(value)
+    # Validate identifiers that were not provided as UUIDs
+    return str(UUID(str(value)))
+
+
+# The JSON encoded size of a log payload without its values
+_LOG_PAYLOAD_BASE_SIZE = len(
+    json.dumps(
+        dict.fromkeys(
+            ["name", "level", "message", "timestamp", "flow_run_id", "task_run_id"]
+        )
+    )
+) - 6 * len("null")
+
+
 class APILogWorker(BatchedQueueService[Dict[str, Any]]):
     @property
     def _max_batch_size(self):
@@ -77,14 +103,173 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
 
 
+@dataclass
+class _PreviousLog:
+    log: Dict[str, Any]
+    first_seen: float
+    repeats: int = 0
+    last_timestamp: Optional[str] = None
+
+
+class APILogThrottle:
+    """
+    Samples, rate limits and deduplicates logs before they are sent to the API.
+
+    State is tracked per flow run and the number of logs suppressed for each flow run is
+    counted. Use `finish_flow_run` to retrieve the counts and release the state once a
+    flow run is finished.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Flow run id to the available tokens and the time they were last refilled
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        # Flow run id, task run id and logger name to the previous log sent, in the
+        # order they were first seen so that expired entries can be evicted from the
+        # front
+        self._previous_logs: Dict[Tuple[str, Optional[str], str], _PreviousLog] = {}
+        self._suppressed: Dict[str, Counter] = {}
+
+    def filter(self, log: Dict[str, Any], settings: Settings) -> List[Dict[str, Any]]:
+        """
+        Determine which logs to send to the API for a log created by
+        `APILogHandler.prepare`.
+
+        Returns an empty list if the log is suppressed. If the log ends a series of
+        repeated logs, a log reporting the number of repeats is returned before it.
+        """
+        rate_limit = PREFECT_LOGGING_TO_API_RATE_LIMIT.value_from(settings)
+        sample_ratios = PREFECT_LOGGING_TO_API_SAMPLE_RATIOS.value_from(settings)
+        dedupe_window = PREFECT_LOGGING_TO_API_DEDUPE_WINDOW.value_from(settings)
+
+        if rate_limit is None and not sample_ratios and not dedupe_window:
+            return [log]
+
+        flow_run_id = log["flow_run_id"]
+        logs = []
+        with self._lock:
+            if sample_ratios and log["level"] < logging.WARNING:
+                ratio = self._get_sample_ratio(log["name"], sample_ratios)
+                if ratio is not None and random.random() >= ratio:
+                    self._count_suppressed(flow_run_id, "sampled")
+                    return []
+
+            if dedupe_window:
+                now = time.monotonic()
+                logs.extend(self._evict_previous_logs(now - dedupe_window))
+
+                key = (flow_run_id, log["task_run_id"], log["name"])
+                previous = self._previous_logs.get(key)
+                if previous is not None:
+                    if (
+                        previous.log["level"] == log["level"]
+                        and previous.log["message"] == log["message"]
+                    ):
+                        previous.repeats += 1
+                        previous.last_timestamp = log["timestamp"]
+                        self._count_suppressed(flow_run_id, "repeated")
+                        return logs
+                    del self._previous_logs[key]
+                    if previous.repeats:
+                        logs.append(self._get_repeated_log(previous))
+
+                # Store a copy since the log sent to the worker is modified by it
+                self._previous_logs[key] = _PreviousLog(log=dict(log), first_seen=now)
+
+            if rate_limit is not None and not self._take_token(flow_run_id, rate_limit):
+                self._count_suppressed(flow_run_id, "rate_limited")
+                return logs
+
+        logs.append(log)
+        return logs
+
+    def finish_flow_run(
+        self, flow_run_id: Union[UUID, str]
+    ) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+        """
+        Release the state for a finished flow run.
+
+        Returns the number of suppressed logs for each reason and logs reporting any
+        repeats that have not been sent yet.
+        """
+        flow_run_id = _uuid_to_str(flow_run_id)
+        with self._lock:
+            self._buckets.pop(flow_run_id, None)
+            suppressed = self._suppressed.pop(flow_run_id, Counter())
+            repeated_logs = []
+            for key in [key for key in self._previous_logs if key[0] == flow_run_id]:
+                previous = self._previous_logs.pop(key)
+                if previous.repeats:
+                    repeated_logs.append(self._get_repeated_log(previous))
+
+        return dict(suppressed), repeated_logs
+
+    def _evict_previous_logs(self, seen_before: float) -> List[Dict[str, Any]]:
+        """
+        Drop previous logs first seen before the given time, since repeats of them are
+        no longer deduplicated. Returns logs reporting any of their repeats.
+        """
+        repeated_logs = []
+        while self._previous_logs:
+            key, previous = next(iter(self._previous_logs.items()))
+            if previous.first_seen > seen_before:
+                break
+            del self._previous_logs[key]
+            if previous.repeats:
+                repeated_logs.append(self._get_repeated_log(previous))
+        return repeated_logs
+
+    def _count_suppressed(self, flow_run_id: str, reason: str) -> None:
+        self._suppressed.setdefault(flow_run_id, Counter())[reason] += 1
+
+    def _take_token(self, flow_run_id: str, rate_limit: float) -> bool:
+        # A token bucket that holds up to one second's worth of logs
+        capacity = max(rate_limit, 1.0)
+        now = time.monotonic()
+        tokens, last_refill = self._buckets.get(flow_run_id, (capacity, now))
+        tokens = min(capacity, tokens + (now - last_refill) * rate_limit)
+        if tokens < 1:
+            self._buckets[flow_run_id] = (tokens, now)
+            return False
+        self._buckets[flow_run_id] = (tokens - 1, now)
+        return True
+
+    @staticmethod
+    def _get_sample_ratio(name: str, ratios: Dict[str, float]) -> Optional[float]:
+        # Use the ratio of the closest configured ancestor of the logger
+        while True:
+            if name in ratios:
+                return ratios[name]
+            if "." not in name:
+                return None
+            name = name.rpartition(".")[0]
+
+    @staticmethod
+    def _get_repeated_log(previous: _PreviousLog) -> Dict[str, Any]:
+        log = {
+            **previous.log,
+            "message": f"Previous message repeated {previous.repeats} times",
+            "timestamp": previous.last_timestamp,
+        }
+        # The size of the original message does not apply to the report
+        log.pop("__payload_size__", None)
+        return log
+
+
 class APILogHandler(logging.Handler):
     """
     A logging handler that sends logs to the Prefect API.
 
     Sends log records to the `APILogWorker` which manages sending batches of logs in
     the background.
+
+    Logs may be sampled, rate limited and deduplicated by the process-wide
+    `APILogThrottle` before they are sent. Records with a `throttle_api_log` attribute
+    set to `False` bypass the throttle.
     """
 
+    throttle = APILogThrottle()
+
     @classmethod
     def flush(cls):
         """
@@ -130,6 +315,32 @@ class APILogHandler(logging.Handler):
 
         return APILogWorker.drain_all()
 
+    @classmethod
+    def report_suppressed_logs(
+        cls, flow_run_id: Union[UUID, str], logger: logging.LoggerAdapter
+    ) -> None:
+        """
+        Release the throttle state for a finished flow run, sending any pending
+        reports of repeated logs and logging the number of logs that were suppressed.
+        """
+        suppressed, repeated_logs = cls.throttle.finish_flow_run(flow_run_id)
+
+        if repeated_logs and PREFECT_LOGGING_TO_API_ENABLED.value():
+            worker = APILogWorker.instance()
+            for log in repeated_logs:
+                worker.send(log)
+
+        if suppressed:
+            logger.warning(
+                "%d log(s) were not sent to the API: %s",
+                sum(suppressed.values()),
+                ", ".join(
+                    f"{count} {reason.replace('_', ' ')}"
+                    for reason, count in sorted(suppressed.items())
+                ),
+                extra={"throttle_api_log": False},
+            )
+
     def emit(self, record: logging.LogRecord):
         """
         Send a log to the `APILogWorker`
@@ -145,7 +356,14 @@ class APILogHandler(logging.Handler):
                 return  # Backwards compatibility
 
             log = self.prepare(record)
-            APILogWorker.instance().send(log)
+            if getattr(record, "throttle_api_log", True):
+                logs = self.throttle.filter(log, profile.settings)
+            else:
+                logs = [log]
+
+            worker = APILogWorker.instance()
+            for log in logs:
+                worker.send(log)
 
         except Exception:
             self.handleError(record)
@@ -205,21 +423,22 @@ class APILogHandler(logging.Handler):
                     "run information."
                 )
 
-        # Parsing to a `LogCreate` object here gives us nice parsing error messages
-        # from the standard lib `handleError` method if something goes wrong and
-        # prevents malformed logs from entering the queue
-        log = LogCreate(
-            flow_run_id=flow_run_id,
-            task_run_id=task_run_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=pendulum.from_timestamp(
-                getattr(record, "created", None) or time.time()
-            ),
-            message=self.format(record),
-        ).dict(json_compatible=True)
-
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
+        # The payload is built directly instead of through a `LogCreate` model since
+        # this runs on the logging caller's thread for every record; the values are
+        # converted to the model's JSON-compatible representation here
+        created = getattr(record, "created", None) or time.time()
+        log = {
+            "name": str(record.name),
+            "level": int(record.levelno),
+            "message": self.format(record),
+            "timestamp": datetime.datetime.fromtimestamp(
+                created, datetime.timezone.utc
+            ).isoformat(),
+            "flow_run_id": _uuid_to_str(flow_run_id),
+            "task_run_id": _uuid_to_str(task_run_id) if task_run_id else None,
+        }
+
+        log_size = log["__payload_size__"] = self._get_prepared_payload_size(log)
         if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
             raise ValueError(
                 f"Log of size {log_size} is greater than the max size of "
@@ -228,6 +447,27 @@ class APILogHandler(logging.Handler):
 
         return log
 
+    def _get_prepared_payload_size(self, log: Dict[str, Any]) -> int:
+        """
+        Calculate the JSON encoded size of a log created by `prepare` without encoding
+        the entire payload.
+
+        Only the name and message may need escaping; the other values have a known
+        encoded length.
+        """
+        return (
+            _LOG_PAYLOAD_BASE_SIZE
+            + len(encode_basestring_ascii(log["name"]))
+            + len(encode_basestring_ascii(log["message"]))
+            + len(str(log["level"]))
+            # Quoted values that never need escaping
+            + len(log["timestamp"])
+            + 2
+            + len(log["flow_run_id"])
+            + 2
+            + (len(log["task_run_id"]) + 2 if log["task_run_id"] else len("null"))
+        )
+
     def _get_payload_size(self, log: Dict[str, Any]) -> int:
         return len(json.dumps(log).encode())
 
@@ -1,11 +1,22 @@
 import abc
+import asyncio
+import concurrent.futures
+import json
+import mmap
+import struct
+import threading
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
+    Dict,
     Generic,
+    List,
     Optional,
     Tuple,
     Type,
@@ -25,6 +36,8 @@ from prefect.logging import get_logger
 from prefect.serializers import Serializer
 from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
+    PREFECT_RESULTS_BINARY_BLOBS,
+    PREFECT_RESULTS_CACHE_MAX_BYTES,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
 )
@@ -41,6 +54,10 @@ ResultStorage = Union[WritableFileSystem, str]
 ResultSerializer = Union[Serializer, str]
 LITERAL_TYPES = {type(None), bool}
 
+BINARY_BLOB_MAGIC = b"\x00PREFECT"
+BINARY_BLOB_VERSION = 1
+_BINARY_BLOB_PREFIX = struct.Struct(">BI")
+
 
 def DEFAULT_STORAGE_KEY_FN():
     return uuid.uuid4().hex
@@ -50,6 +67,21 @@ logger = get_logger("results")
 R = TypeVar("R")
 
 
+def _release_buffer(content: Union[bytes, memoryview, mmap.mmap]) -> None:
+    """
+    Close a buffer returned by `ReadableFileSystem.read_path_buffer`.
+
+    If views on the buffer are still referenced, e.g. by a deserialized object, the
+    buffer is left to be closed when it is garbage collected.
+    """
+    if not hasattr(content, "close"):
+        return
+    try:
+        content.close()
+    except BufferError:
+        pass
+
+
 def get_default_result_storage() -> ResultStorage:
     """
     Generate a default file system for result storage.
@@ -103,6 +135,12 @@ def task_features_require_result_persistence(task: "Task") -> bool:
     return False
 
 
+def _task_runner_spills_results(task_runner) -> bool:
+    from prefect.task_runners import ConcurrentTaskRunner
+
+    return isinstance(task_runner, ConcurrentTaskRunner) and task_runner.spill_results
+
+
 def _format_user_supplied_storage_key(key):
     # Note here we are pinning to task runs since flow runs do not support storage keys
     # yet; we'll need to split logic in the future or have two separate functions
@@ -233,6 +271,13 @@ class ResultFactory(pydantic.BaseModel):
         )
         cache_result_in_memory = task.cache_result_in_memory
 
+        if task.persist_result is not False and _task_runner_spills_results(
+            ctx.task_runner
+        ):
+            # Results are read back from storage instead of being held in memory
+            persist_result = True
+            cache_result_in_memory = False
+
         return await cls.from_settings(
             result_storage=result_storage,
             result_serializer=result_serializer,
@@ -448,6 +493,183 @@ class LiteralResult(BaseResult):
         return cls(value=obj, artifact_type="result", artifact_description=description)
 
 
+@dataclass
+class ResultCacheStats:
+    """
+    Statistics for the process-wide result cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class ResultCache:
+    """
+    A process-wide cache of deserialized persisted results.
+
+    Entries are keyed by storage block and storage key. The size of an entry is the
+    size of its persisted content. The least recently used entries are evicted once the
+    total size exceeds `PREFECT_RESULTS_CACHE_MAX_BYTES`. A budget of zero disables
+    the cache.
+
+    Cached objects are shared between every consumer of the result in the process, so
+    consumers should not mutate them. Concurrent misses for the same key share a single
+    load with `get_or_load`.
+    """
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Tuple[uuid.UUID, str], Tuple[Any, int]]" = (
+            OrderedDict()
+        )
+        # Loads in progress, which may be awaited from any thread or event loop
+        self._loading: Dict[Tuple[uuid.UUID, str], concurrent.futures.Future] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return PREFECT_RESULTS_CACHE_MAX_BYTES.value() > 0
+
+    def get(self, key: Tuple[uuid.UUID, str]) -> Any:
+        """
+        Retrieve a cached object, marking it as recently used.
+
+        Returns `NotSet` if the object is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return NotSet
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    async def get_or_load(
+        self,
+        key: Tuple[uuid.UUID, str],
+        load: Callable[[], Awaitable[Tuple[Any, int]]],
+        store: bool = True,
+    ) -> Any:
+        """
+        Retrieve a cached object, loading it with `load` on a miss.
+
+        `load` must return the object and its size in bytes. If another caller is
+        already loading the key, its load is awaited instead of starting another one.
+        The loaded object is only cached if `store` is set.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+
+                loading = self._loading.get(key)
+                if loading is None:
+                    self._misses += 1
+                    loading = self._loading[key] = concurrent.futures.Future()
+                    # Running futures cannot be cancelled by the callers awaiting them
+                    loading.set_running_or_notify_cancel()
+                    break
+                self._hits += 1
+
+            obj = await asyncio.wrap_future(loading)
+            if obj is not NotSet:
+                return obj
+            # The caller loading the object was cancelled; try again
+
+        try:
+            obj, size_bytes = await load()
+        except Exception as exc:
+            self._finish_loading(key, loading, exception=exc)
+            raise
+        except BaseException:
+            self._finish_loading(key, loading, result=NotSet)
+            raise
+
+        if store:
+            self.put(key, obj, size_bytes=size_bytes)
+        self._finish_loading(key, loading, result=obj)
+        return obj
+
+    def _finish_loading(
+        self,
+        key: Tuple[uuid.UUID, str],
+        loading: concurrent.futures.Future,
+        result: Any = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            self._loading.pop(key, None)
+        if exception is not None:
+            loading.set_exception(exception)
+        else:
+            loading.set_result(result)
+
+    def put(self, key: Tuple[uuid.UUID, str], obj: Any, size_bytes: int) -> None:
+        """
+        Cache an object, evicting the least recently used entries to stay in budget.
+
+        Objects larger than the entire budget are not cached.
+        """
+        max_bytes = PREFECT_RESULTS_CACHE_MAX_BYTES.value()
+        if size_bytes > max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+
+            self._entries[key] = (obj, size_bytes)
+            self._size_bytes += size_bytes
+
+            while self._size_bytes > max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+
+_RESULT_CACHE = ResultCache()
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Get the process-wide result cache.
+    """
+    return _RESULT_CACHE
+
+
 class PersistedResult(BaseResult):
     """
     Result type which stores a reference to a persisted result.
@@ -476,22 +698,57 @@ class PersistedResult(BaseResult):
         if self.has_cached_object():
             return self._cache
 
-        blob = await self._read_blob(client=client)
-        obj = blob.serializer.loads(blob.data)
+        result_cache = get_result_cache()
+        if result_cache.enabled:
+            obj = await result_cache.get_or_load(
+                self._result_cache_key,
+                partial(self._load, client=client),
+                store=self._should_cache_object,
+            )
+        else:
+            obj, _ = await self._load(client=client)
 
         if self._should_cache_object:
             self._cache_object(obj)
 
         return obj
 
+    async def _load(self, client: "PrefectClient") -> Tuple[R, int]:
+        """
+        Read and deserialize the object, returning it with the size of its content.
+        """
+        content = await self._read_content(client=client)
+        try:
+            return PersistedResultBlob.from_bytes(content).load(), len(content)
+        finally:
+            _release_buffer(content)
+
+    @property
+    def _result_cache_key(self) -> Tuple[uuid.UUID, str]:
+        return (self.storage_block_id, self.storage_key)
+
     @inject_client
     async def _read_blob(self, client: "PrefectClient") -> "PersistedResultBlob":
         block_document = await client.read_block_document(self.storage_block_id)
         storage_block: ReadableFileSystem = Block._from_block_document(block_document)
         content = await storage_block.read_path(self.storage_key)
-        blob = PersistedResultBlob.parse_raw(content)
+        blob = PersistedResultBlob.from_bytes(content)
         return blob
 
+    @inject_client
+    async def _read_content(
+        self, client: "PrefectClient"
+    ) -> Union[bytes, memoryview, mmap.mmap]:
+        """
+        Read the stored content without copying it where the storage block allows.
+
+        The returned buffer must be released with `_release_buffer` once the result
+        has been deserialized.
+        """
+        block_document = await client.read_block_document(self.storage_block_id)
+        storage_block: ReadableFileSystem = Block._from_block_document(block_document)
+        return await storage_block.read_path_buffer(self.storage_key)
+
     @staticmethod
     def _infer_path(storage_block, key) -> str:
         """
@@ -521,8 +778,9 @@ class PersistedResult(BaseResult):
         The object will be serialized and written to the storage block under a unique
         key. It will then be cached on the returned result.
         """
-        data = serializer.dumps(obj)
-        blob = PersistedResultBlob(serializer=serializer, data=data)
+        binary = PREFECT_RESULTS_BINARY_BLOBS.value()
+        data = serializer.dumps_binary(obj) if binary else serializer.dumps(obj)
+        blob = PersistedResultBlob(serializer=serializer, data=data, binary=binary)
 
         key = storage_key_fn()
         if not isinstance(key, str):
@@ -530,7 +788,11 @@ class PersistedResult(BaseResult):
                 f"Expected type 'str' for result storage key; got value {key!r}"
             )
 
-        await storage_block.write_path(key, content=blob.to_bytes())
+        if binary:
+            # Write the header and payload separately to avoid copying the payload
+            await storage_block.write_path_chunks(key, chunks=blob.to_chunks())
+        else:
+            await storage_block.write_path(key, content=blob.to_bytes())
 
         description = f"Result of type `{type(obj).__name__}`"
         uri = cls._infer_path(storage_block, key)
@@ -554,6 +816,13 @@ class PersistedResult(BaseResult):
             # Attach the object to the result so it's available without deserialization
             result._cache_object(obj)
 
+            result_cache = get_result_cache()
+            if result_cache.enabled:
+                # Share the object with other references to this result in the process
+                result_cache.put(
+                    result._result_cache_key, obj, size_bytes=len(blob.data)
+                )
+
         object.__setattr__(result, "_should_cache_object", cache_object)
 
         return result
@@ -563,12 +832,86 @@ class PersistedResultBlob(pydantic.BaseModel):
     """
     The format of the content stored by a persisted result.
 
-    Typically, this is written to a file as bytes.
+    Typically, this is written to a file as bytes. Blobs are stored either as a JSON
+    document with the data base64 encoded or, if `binary` is set, in a binary format:
+
+    - The magic bytes `BINARY_BLOB_MAGIC`
+    - A big-endian unsigned byte with the format version
+    - A big-endian unsigned int with the length of the header
+    - A JSON header with the serializer and Prefect version
+    - The raw data created by `Serializer.dumps_binary`
     """
 
     serializer: Serializer
     data: bytes
     prefect_version: str = pydantic.Field(default=prefect.__version__)
+    binary: bool = pydantic.Field(default=False, exclude=True)
 
     def to_bytes(self) -> bytes:
+        if self.binary:
+            return b"".join(self.to_chunks())
         return self.json().encode()
+
+    def to_chunks(self) -> List[bytes]:
+        """
+        Generate the content of this blob as a sequence of chunks that can be written
+        without joining them in memory.
+        """
+        if not self.binary:
+            return [self.to_bytes()]
+
+        header = json.dumps(
+            {
+                "serializer": self.serializer.dict(),
+                "prefect_version": self.prefect_version,
+            }
+        ).encode()
+        return [
+            BINARY_BLOB_MAGIC,
+            _BINARY_BLOB_PREFIX.pack(BINARY_BLOB_VERSION, len(header)),
+            header,
+            self.data,
+        ]
+
+    @classmethod
+    def from_bytes(
+        cls, content: Union[bytes, memoryview, mmap.mmap]
+    ) -> "PersistedResultBlob":
+        """
+        Load a blob from content in either the JSON or the binary format.
+
+        The content may be any object supporting the buffer protocol. The data of
+        binary blobs is a view on the given content and is not copied.
+        """
+        if content[: len(BINARY_BLOB_MAGIC)] != BINARY_BLOB_MAGIC:
+            return cls.parse_raw(bytes(content))
+
+        view = memoryview(content)
+        offset = len(BINARY_BLOB_MAGIC)
+        version, header_length = _BINARY_BLOB_PREFIX.unpack_from(view, offset)
+        if version > BINARY_BLOB_VERSION:
+            raise ValueError(
+                f"Persisted result blob has format version {version} but only versions"
+                f" up to {BINARY_BLOB_VERSION} are supported. The result may have been"
+                " written by a newer version of Prefect."
+            )
+
+        offset += _BINARY_BLOB_PREFIX.size
+        header = json.loads(bytes(view[offset : offset + header_length]))
+        serializer = Serializer.parse_obj(header["serializer"])
+
+        # Skip validation so the data is not copied into a new `bytes` object
+        return cls.construct(
+            serializer=serializer,
+            data=view[offset + header_length :],
+            prefect_version=header["prefect_version"],
+            binary=True,
+        )
+
+    def load(self) -> Any:
+        """
+        Deserialize the data in this blob.
+        """
+        if self.binary:
+            return self.serializer.loads_binary(self.data)
+        return self.serializer.loads(self.data)
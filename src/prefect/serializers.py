@@ -8,12 +8,14 @@ support additional settings for configuration of serialization. These are stored
 the instance so the same settings can be used to load saved objects.
 
 All serializers must implement `dumps` and `loads` which convert objects to bytes and
-bytes to an object respectively.
+bytes to an object respectively. Serializers may additionally implement `dumps_binary`
+and `loads_binary` to skip any text-safe encoding when the output is written to a
+binary destination.
 """
 import abc
 import base64
 import warnings
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar, Union
 
 import pydantic
 from pydantic import BaseModel
@@ -72,6 +74,22 @@ class Serializer(BaseModel, Generic[D], abc.ABC):
     def loads(self, blob: bytes) -> D:
         """Decode the blob of bytes into an object."""
 
+    def dumps_binary(self, obj: D) -> bytes:
+        """
+        Encode the object into a blob of bytes that does not need to be text-safe.
+
+        Defaults to `dumps`.
+        """
+        return self.dumps(obj)
+
+    def loads_binary(self, blob: Union[bytes, memoryview]) -> D:
+        """
+        Decode a blob of bytes created by `dumps_binary` into an object.
+
+        Defaults to `loads`.
+        """
+        return self.loads(bytes(blob))
+
     class Config:
         extra = "forbid"
 
@@ -154,6 +172,14 @@ class PickleSerializer(Serializer):
         pickler = from_qualified_name(self.picklelib)
         return pickler.loads(base64.decodebytes(blob))
 
+    def dumps_binary(self, obj: Any) -> bytes:
+        pickler = from_qualified_name(self.picklelib)
+        return pickler.dumps(obj)
+
+    def loads_binary(self, blob: Union[bytes, memoryview]) -> Any:
+        pickler = from_qualified_name(self.picklelib)
+        return pickler.loads(blob)
+
 
 class JSONSerializer(Serializer):
     """
@@ -283,6 +309,15 @@ class CompressedSerializer(Serializer):
         uncompressed = compresser.decompress(base64.decodebytes(blob))
         return self.serializer.loads(uncompressed)
 
+    def dumps_binary(self, obj: Any) -> bytes:
+        blob = self.serializer.dumps_binary(obj)
+        compresser = from_qualified_name(self.compressionlib)
+        return compresser.compress(blob)
+
+    def loads_binary(self, blob: Union[bytes, memoryview]) -> Any:
+        compresser = from_qualified_name(self.compressionlib)
+        return self.serializer.loads_binary(compresser.decompress(blob))
+
 
 class CompressedPickleSerializer(CompressedSerializer):
     """
@@ -4,13 +4,13 @@ Routes for interacting with block objects.
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import Body, Depends, HTTPException, Path, Query, status
+from fastapi import Body, Depends, HTTPException, Path, Query, Request, Response, status
 
 from prefect.server import models, schemas
 from prefect.server.api import dependencies
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import PrefectRouter, conditional_response
 
 router = PrefectRouter(prefix="/block_documents", tags=["Block documents"])
 
@@ -74,6 +74,8 @@ async def read_block_documents(
 
 @router.get("/{id:uuid}")
 async def read_block_document_by_id(
+    request: Request,
+    response: Response,
     block_document_id: UUID = Path(
         ..., description="The block document id", alias="id"
     ),
@@ -90,7 +92,7 @@ async def read_block_document_by_id(
         )
     if not block_document:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Block document not found")
-    return block_document
+    return conditional_response(request, response, block_document)
 
 
 @router.delete("/{id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
@@ -8,7 +8,7 @@ from uuid import UUID
 
 import jsonschema.exceptions
 import pendulum
-from fastapi import Body, Depends, HTTPException, Path, Response, status
+from fastapi import Body, Depends, HTTPException, Path, Request, Response, status
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
@@ -19,7 +19,7 @@ from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import MissingVariableError, ObjectNotFoundError
 from prefect.server.models.workers import DEFAULT_AGENT_WORK_POOL_NAME
 from prefect.server.utilities.schemas import DateTimeTZ
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import PrefectRouter, conditional_response
 
 router = PrefectRouter(prefix="/deployments", tags=["Deployments"])
 
@@ -190,11 +190,16 @@ async def read_deployment_by_name(
 
 @router.get("/{id}")
 async def read_deployment(
+    request: Request,
+    response: Response,
     deployment_id: UUID = Path(..., description="The deployment id", alias="id"),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> schemas.responses.DeploymentResponse:
     """
     Get a deployment by id.
+
+    Responds with `304 Not Modified` if the deployment matches the request's
+    `If-None-Match` header.
     """
     async with db.session_context() as session:
         deployment = await models.deployments.read_deployment(
@@ -204,7 +209,11 @@ async def read_deployment(
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Deployment not found"
             )
-        return schemas.responses.DeploymentResponse.from_orm(deployment)
+        return conditional_response(
+            request,
+            response,
+            schemas.responses.DeploymentResponse.from_orm(deployment),
+        )
 
 
 @router.post("/filter")
@@ -7,7 +7,16 @@ from typing import List
 from uuid import UUID
 
 import pendulum
-from fastapi import Body, Depends, HTTPException, Path, Response, status
+from fastapi import (
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.responses import ORJSONResponse
 
 import prefect.server.api.dependencies as dependencies
@@ -21,6 +30,11 @@ from prefect.server.models.flow_runs import DependencyResult
 from prefect.server.orchestration import dependencies as orchestration_dependencies
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities.pagination import (
+    accepts_ndjson,
+    cursor_paginated_response,
+    get_next_cursor,
+)
 from prefect.server.utilities.schemas import DateTimeTZ
 from prefect.server.utilities.server import PrefectRouter
 
@@ -171,19 +185,34 @@ async def read_flow_run(
         return schemas.responses.FlowRunResponse.from_orm(flow_run)
 
 
-@router.get("/{id}/graph")
+@router.get("/{id}/graph", response_class=ORJSONResponse)
 async def read_flow_run_graph(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
+    since: DateTimeTZ = Query(
+        None,
+        description=(
+            "Only return task runs updated at or after this time, to poll for"
+            " changes to a graph that has already been read."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[DependencyResult]:
     """
     Get a task run dependency map for a given flow run.
     """
     async with db.session_context() as session:
-        return await models.flow_runs.read_task_run_dependencies(
-            session=session, flow_run_id=flow_run_id
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run_id, since=since
         )
 
+    # The nodes were validated as they were read, so skip FastAPI's slow encoder
+    return ORJSONResponse(
+        content=[
+            DependencyResult.construct(**node).dict(json_compatible=True)
+            for node in dependencies
+        ]
+    )
+
 
 @router.post("/{id}/resume")
 async def resume_flow_run(
@@ -258,11 +287,48 @@ async def read_flow_runs(
     deployments: schemas.filters.DeploymentFilter = None,
     work_pools: schemas.filters.WorkPoolFilter = None,
     work_pool_queues: schemas.filters.WorkQueueFilter = None,
+    cursor: str = Body(
+        None,
+        description=(
+            "Read the page after this cursor, taken from the `x-prefect-next-cursor`"
+            " header of the previous page. Use an empty string for the first page."
+        ),
+    ),
+    request: Request = None,
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.FlowRunResponse]:
     """
     Query for flow runs.
+
+    If a cursor is provided, or newline-delimited JSON is accepted, flow runs are
+    read with keyset pagination and the offset is ignored.
     """
+    if cursor is not None or accepts_ndjson(request):
+
+        async def read_page(cursor: str):
+            async with db.session_context() as session:
+                db_flow_runs = await models.flow_runs.read_flow_runs(
+                    session=session,
+                    flow_filter=flows,
+                    flow_run_filter=flow_runs,
+                    task_run_filter=task_runs,
+                    deployment_filter=deployments,
+                    work_pool_filter=work_pools,
+                    work_queue_filter=work_pool_queues,
+                    limit=limit,
+                    sort=sort,
+                    cursor=cursor,
+                )
+                encoded = [
+                    schemas.responses.FlowRunResponse.from_orm(fr).dict(
+                        json_compatible=True
+                    )
+                    for fr in db_flow_runs
+                ]
+            return encoded, get_next_cursor(sort.as_sql_sort(db), db_flow_runs, limit)
+
+        return await cursor_paginated_response(request, read_page, cursor or "")
+
     async with db.session_context() as session:
         db_flow_runs = await models.flow_runs.read_flow_runs(
             session=session,
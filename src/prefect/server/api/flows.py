@@ -6,7 +6,7 @@ from typing import List
 from uuid import UUID
 
 import pendulum
-from fastapi import Depends, HTTPException, Path, Response, status
+from fastapi import Depends, HTTPException, Path, Request, Response, status
 from fastapi.param_functions import Body
 
 import prefect.server.api.dependencies as dependencies
@@ -14,7 +14,7 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import PrefectRouter, conditional_response
 
 router = PrefectRouter(prefix="/flows", tags=["Flows"])
 
@@ -102,11 +102,16 @@ async def read_flow_by_name(
 
 @router.get("/{id}")
 async def read_flow(
+    request: Request,
+    response: Response,
     flow_id: UUID = Path(..., description="The flow id", alias="id"),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> schemas.core.Flow:
     """
     Get a flow by id.
+
+    Responds with `304 Not Modified` if the flow matches the request's
+    `If-None-Match` header.
     """
     async with db.session_context() as session:
         flow = await models.flows.read_flow(session=session, flow_id=flow_id)
@@ -114,7 +119,7 @@ async def read_flow(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Flow not found"
         )
-    return flow
+    return conditional_response(request, response, schemas.core.Flow.from_orm(flow))
 
 
 @router.post("/filter")
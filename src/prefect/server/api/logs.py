@@ -4,13 +4,18 @@ Routes for interacting with log objects.
 
 from typing import List
 
-from fastapi import Body, Depends, status
+from fastapi import Body, Depends, Request, status
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.utilities.pagination import (
+    accepts_ndjson,
+    cursor_paginated_response,
+    get_next_cursor,
+)
 from prefect.server.utilities.server import PrefectRouter
 
 router = PrefectRouter(prefix="/logs", tags=["Logs"])
@@ -33,11 +38,41 @@ async def read_logs(
     offset: int = Body(0, ge=0),
     logs: schemas.filters.LogFilter = None,
     sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    cursor: str = Body(
+        None,
+        description=(
+            "Read the page after this cursor, taken from the `x-prefect-next-cursor`"
+            " header of the previous page. Use an empty string for the first page."
+        ),
+    ),
+    request: Request = None,
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.core.Log]:
     """
     Query for logs.
+
+    If a cursor is provided, or newline-delimited JSON is accepted, logs are read
+    with keyset pagination and the offset is ignored.
     """
+    if cursor is not None or accepts_ndjson(request):
+
+        async def read_page(cursor: str):
+            async with db.session_context() as session:
+                db_logs = await models.logs.read_logs(
+                    session=session,
+                    log_filter=logs,
+                    limit=limit,
+                    sort=sort,
+                    cursor=cursor,
+                )
+                encoded = [
+                    schemas.core.Log.from_orm(log).dict(json_compatible=True)
+                    for log in db_logs
+                ]
+            return encoded, get_next_cursor(sort.as_sql_sort(db), db_logs, limit)
+
+        return await cursor_paginated_response(request, read_page, cursor or "")
+
     async with db.session_context() as session:
         return await models.logs.read_logs(
             session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
@@ -474,11 +474,22 @@ def create_app(
         if prefect.settings.PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_ENABLED.value():
             service_instances.append(services.pause_expirations.FailExpiredPauses())
 
+        if prefect.settings.PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_ENABLED.value():
+            service_instances.append(
+                services.claim_expirations.RescheduleExpiredClaims()
+            )
+
         if prefect.settings.PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED.value():
             service_instances.append(
                 services.cancellation_cleanup.CancellationCleanup()
             )
 
+        if prefect.settings.PREFECT_API_SERVICES_RETENTION_ENABLED.value():
+            service_instances.append(services.retention.DataRetention())
+
+        if prefect.settings.PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED.value():
+            service_instances.append(services.log_partitions.LogPartitions())
+
         if prefect.settings.PREFECT_SERVER_ANALYTICS_ENABLED.value():
             service_instances.append(services.telemetry.Telemetry())
 
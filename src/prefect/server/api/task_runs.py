@@ -7,7 +7,7 @@ from typing import List
 from uuid import UUID
 
 import pendulum
-from fastapi import Body, Depends, HTTPException, Path, Response, status
+from fastapi import Body, Depends, HTTPException, Path, Request, Response, status
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
@@ -18,6 +18,11 @@ from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.orchestration import dependencies as orchestration_dependencies
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities.pagination import (
+    accepts_ndjson,
+    cursor_paginated_response,
+    get_next_cursor,
+)
 from prefect.server.utilities.schemas import DateTimeTZ
 from prefect.server.utilities.server import PrefectRouter
 
@@ -60,6 +65,88 @@ async def create_task_run(
     return model
 
 
+@router.post("/bulk")
+async def create_task_runs(
+    task_runs: List[schemas.actions.TaskRunCreate],
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[schemas.core.TaskRun]:
+    """
+    Create many task runs. Task runs are created exactly as in `POST /task_runs/`:
+    if a task run with the same flow_run_id, task_key, and dynamic_key already exists,
+    the existing task run will be returned.
+
+    Task runs are returned in the order they were provided.
+    """
+    created_task_runs = []
+    for batch in models.task_runs.split_task_runs_into_batches(task_runs):
+        # hydrate the input models into full task run / state models
+        hydrated = []
+        for task_run in batch:
+            task_run = schemas.core.TaskRun(**task_run.dict())
+            if not task_run.state:
+                task_run.state = schemas.states.Pending()
+            hydrated.append(task_run)
+
+        async with db.session_context(begin_transaction=True) as session:
+            created_task_runs.extend(
+                await models.task_runs.create_task_runs(
+                    session=session,
+                    task_runs=hydrated,
+                    orchestration_parameters=orchestration_parameters,
+                )
+            )
+
+    return created_task_runs
+
+
+@router.post("/bulk/set_state")
+async def set_task_run_states(
+    states: List[schemas.actions.TaskRunSetState] = Body(
+        ..., description="The task run ids and their intended states."
+    ),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    task_policy: BaseOrchestrationPolicy = Depends(
+        orchestration_dependencies.provide_task_policy
+    ),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[OrchestrationResult]:
+    """
+    Set the states of many task runs, invoking orchestration rules for each run.
+
+    All transitions are committed in a single transaction and results are returned
+    in the order the states were provided.
+    """
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        return await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_states=[
+                (
+                    task_run_state.task_run_id,
+                    # convert to a full State object
+                    schemas.states.State.parse_obj(task_run_state.state),
+                )
+                for task_run_state in states
+            ],
+            force=force,
+            task_policy=task_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+
 @router.patch("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_task_run(
     task_run: schemas.actions.TaskRunUpdate,
@@ -164,11 +251,44 @@ async def read_task_runs(
     flow_runs: schemas.filters.FlowRunFilter = None,
     task_runs: schemas.filters.TaskRunFilter = None,
     deployments: schemas.filters.DeploymentFilter = None,
+    cursor: str = Body(
+        None,
+        description=(
+            "Read the page after this cursor, taken from the `x-prefect-next-cursor`"
+            " header of the previous page. Use an empty string for the first page."
+        ),
+    ),
+    request: Request = None,
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.core.TaskRun]:
     """
     Query for task runs.
+
+    If a cursor is provided, or newline-delimited JSON is accepted, task runs are
+    read with keyset pagination and the offset is ignored.
     """
+    if cursor is not None or accepts_ndjson(request):
+
+        async def read_page(cursor: str):
+            async with db.session_context() as session:
+                db_task_runs = await models.task_runs.read_task_runs(
+                    session=session,
+                    flow_filter=flows,
+                    flow_run_filter=flow_runs,
+                    task_run_filter=task_runs,
+                    deployment_filter=deployments,
+                    limit=limit,
+                    sort=sort,
+                    cursor=cursor,
+                )
+                encoded = [
+                    schemas.core.TaskRun.from_orm(tr).dict(json_compatible=True)
+                    for tr in db_task_runs
+                ]
+            return encoded, get_next_cursor(sort.as_sql_sort(db), db_task_runs, limit)
+
+        return await cursor_paginated_response(request, read_page, cursor or "")
+
     async with db.session_context() as session:
         return await models.task_runs.read_task_runs(
             session=session,
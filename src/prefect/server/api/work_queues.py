@@ -13,6 +13,8 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.utilities.schemas import DateTimeTZ
 from prefect.server.utilities.server import PrefectRouter
 
@@ -121,16 +123,35 @@ async def read_work_queue_runs(
             " the work queue."
         ),
     ),
+    claim: bool = Body(
+        False,
+        description=(
+            "If true, the returned flow runs are moved to a Pending state claimed by"
+            " the caller in the same transaction, so that no other agent can submit"
+            " them. Flow runs that could not be claimed are not returned."
+        ),
+    ),
+    claimed_by: Optional[str] = Body(
+        None, description="The name of the agent or worker claiming the flow runs"
+    ),
     x_prefect_ui: Optional[bool] = Header(
         default=False,
         description="A header to indicate this request came from the Prefect UI.",
     ),
     db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: BaseOrchestrationPolicy = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
 ) -> List[schemas.responses.FlowRunResponse]:
     """
     Get flow runs from the work queue.
     """
-    async with db.session_context(begin_transaction=True) as session:
+    async with db.session_context(
+        begin_transaction=True, with_for_update=claim
+    ) as session:
         flow_runs = await models.work_queues.get_runs_in_work_queue(
             session=session,
             work_queue_id=work_queue_id,
@@ -138,6 +159,30 @@ async def read_work_queue_runs(
             limit=limit,
         )
 
+        if claim and flow_runs:
+            claimed_ids = await models.flow_runs.claim_flow_runs(
+                session=session,
+                flow_run_ids=[flow_run.id for flow_run in flow_runs],
+                claimed_by=claimed_by,
+                flow_policy=flow_policy,
+                orchestration_parameters=orchestration_parameters,
+            )
+            # read the claimed flow runs back with their Pending states
+            claimed_flow_runs = await models.flow_runs.read_flow_runs(
+                session=session,
+                flow_run_filter=schemas.filters.FlowRunFilter(
+                    id=schemas.filters.FlowRunFilterId(any_=claimed_ids)
+                ),
+            )
+            claimed_flow_runs = {
+                flow_run.id: flow_run for flow_run in claimed_flow_runs
+            }
+            flow_runs = [
+                claimed_flow_runs[flow_run.id]
+                for flow_run in flow_runs
+                if flow_run.id in claimed_flow_runs
+            ]
+
     # The Prefect UI often calls this route to see which runs are enqueued.
     # We do not want to record this as an actual poll event.
     if not x_prefect_ui:
@@ -1,7 +1,8 @@
 """
 Routes for interacting with work queue objects.
 """
-from typing import List, Optional
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
 import pendulum
@@ -14,8 +15,12 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.orchestration.policies import BaseOrchestrationPolicy
+from prefect.server.utilities import long_polling
 from prefect.server.utilities.schemas import DateTimeTZ
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import PREFECT_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS
 
 router = PrefectRouter(
     prefix="/work_pools",
@@ -268,13 +273,42 @@ async def get_scheduled_flow_runs(
         None, description="The minimum time to look for scheduled flow runs"
     ),
     limit: int = dependencies.LimitBody(),
+    claim: bool = Body(
+        False,
+        description=(
+            "If true, the returned flow runs are moved to a Pending state claimed by"
+            " the worker in the same transaction, so that no other worker can submit"
+            " them. Flow runs that could not be claimed are not returned."
+        ),
+    ),
+    worker_name: Optional[str] = Body(
+        None, description="The name of the worker claiming the flow runs"
+    ),
+    wait_seconds: float = Body(
+        None,
+        ge=0,
+        description=(
+            "If no flow runs are available, wait up to this many seconds for flow runs"
+            " to become available before responding. Limited by"
+            " PREFECT_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS."
+        ),
+    ),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: BaseOrchestrationPolicy = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
 ) -> List[schemas.responses.WorkerFlowRunResponse]:
     """
-    Load scheduled runs for a worker
+    Load scheduled runs for a worker.
+
+    If `wait_seconds` is provided and no flow runs are available, the request waits
+    up to that many seconds for flow runs to become available before responding.
     """
-    async with db.session_context(begin_transaction=True) as session:
+    async with db.session_context() as session:
         work_pool_id = await worker_lookups._get_work_pool_id_from_name(
             session=session, work_pool_name=work_pool_name
         )
@@ -292,24 +326,142 @@ async def get_scheduled_flow_runs(
                     )
                 )
 
-        queue_response = await models.workers.get_scheduled_flow_runs(
-            session=session,
+    async def read_scheduled_flow_runs(
+        scheduled_before: Optional[DateTimeTZ],
+    ) -> List[schemas.responses.WorkerFlowRunResponse]:
+        async with db.session_context(
+            begin_transaction=True, with_for_update=claim
+        ) as session:
+            queue_response = await models.workers.get_scheduled_flow_runs(
+                session=session,
+                db=db,
+                work_pool_ids=[work_pool_id],
+                work_queue_ids=work_queue_ids,
+                scheduled_before=scheduled_before,
+                scheduled_after=scheduled_after,
+                limit=limit,
+            )
+
+            if claim:
+                claimed_flow_runs = await _claim_flow_runs(
+                    session=session,
+                    flow_run_ids=[response.flow_run.id for response in queue_response],
+                    claimed_by=worker_name,
+                    flow_policy=flow_policy,
+                    orchestration_parameters=orchestration_parameters,
+                )
+                queue_response = [
+                    schemas.responses.WorkerFlowRunResponse(
+                        work_pool_id=response.work_pool_id,
+                        work_queue_id=response.work_queue_id,
+                        flow_run=claimed_flow_runs[response.flow_run.id],
+                    )
+                    for response in queue_response
+                    if response.flow_run.id in claimed_flow_runs
+                ]
+
+        return queue_response
+
+    wait_seconds = min(
+        wait_seconds or 0, PREFECT_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS.value()
+    )
+    if wait_seconds and limit:
+        if work_queue_ids is None:
+            async with db.session_context() as session:
+                work_queues = await models.workers.read_work_queues(
+                    session=session, work_pool_id=work_pool_id
+                )
+            work_queue_ids = [work_queue.id for work_queue in work_queues]
+
+        queue_response = await _wait_for_scheduled_flow_runs(
+            read_scheduled_flow_runs,
             db=db,
-            work_pool_ids=[work_pool_id],
             work_queue_ids=work_queue_ids,
             scheduled_before=scheduled_before,
-            scheduled_after=scheduled_after,
-            limit=limit,
+            wait_seconds=wait_seconds,
         )
+    else:
+        queue_response = await read_scheduled_flow_runs(scheduled_before)
 
-        background_tasks.add_task(
-            _record_work_queue_polls,
-            db=db,
-            work_pool_id=work_pool_id,
-            work_queue_names=work_queue_names,
-        )
+    background_tasks.add_task(
+        _record_work_queue_polls,
+        db=db,
+        work_pool_id=work_pool_id,
+        work_queue_names=work_queue_names,
+    )
 
-        return queue_response
+    return queue_response
+
+
+async def _wait_for_scheduled_flow_runs(
+    read_scheduled_flow_runs: Callable[
+        [Optional[DateTimeTZ]], Awaitable[List[schemas.responses.WorkerFlowRunResponse]]
+    ],
+    db: PrefectDBInterface,
+    work_queue_ids: List[UUID],
+    scheduled_before: Optional[DateTimeTZ],
+    wait_seconds: float,
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Read scheduled flow runs, waiting up to `wait_seconds` for flow runs to become
+    available if there are none.
+
+    Flow runs are read again whenever a change that may make flow runs available in
+    the work queues is committed, or when the next scheduled flow run becomes due.
+    `scheduled_before` moves forward as time passes.
+    """
+    start = pendulum.now("UTC")
+    deadline = start.add(seconds=wait_seconds)
+    prefetch = scheduled_before - start if scheduled_before is not None else None
+
+    while True:
+        # register the waiter before reading so no changes are missed in between
+        with long_polling.work_queue_waiter(work_queue_ids) as woken:
+            now = pendulum.now("UTC")
+            before = now + prefetch if prefetch is not None else None
+            queue_response = await read_scheduled_flow_runs(before)
+            if queue_response or now >= deadline:
+                return queue_response
+
+            timeout = (deadline - now).total_seconds()
+            if before is not None:
+                async with db.session_context() as session:
+                    next_start_time = (
+                        await models.workers.read_next_scheduled_start_time(
+                            session=session,
+                            work_queue_ids=work_queue_ids,
+                            scheduled_after=before,
+                        )
+                    )
+                if next_start_time is not None:
+                    timeout = min(timeout, (next_start_time - before).total_seconds())
+
+            try:
+                await asyncio.wait_for(woken.wait(), timeout=max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+async def _claim_flow_runs(
+    session: AsyncSession, flow_run_ids: List[UUID], **kwargs
+) -> Dict[UUID, schemas.core.FlowRun]:
+    """
+    Claims flow runs and reads them back with their Pending states.
+    """
+    claimed_ids = await models.flow_runs.claim_flow_runs(
+        session=session, flow_run_ids=flow_run_ids, **kwargs
+    )
+    if not claimed_ids:
+        return {}
+    flow_runs = await models.flow_runs.read_flow_runs(
+        session=session,
+        flow_run_filter=schemas.filters.FlowRunFilter(
+            id=schemas.filters.FlowRunFilterId(any_=claimed_ids)
+        ),
+    )
+    return {
+        flow_run.id: schemas.core.FlowRun.from_orm(flow_run) for flow_run in flow_runs
+    }
 
 
 async def _record_work_queue_polls(
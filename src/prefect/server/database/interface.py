@@ -194,6 +194,11 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A concurrency model"""
         return self.orm.ConcurrencyLimit
 
+    @property
+    def ConcurrencyLimitSlot(self):
+        """A concurrency limit slot model"""
+        return self.orm.ConcurrencyLimitSlot
+
     @property
     def WorkQueue(self):
         """A work queue model"""
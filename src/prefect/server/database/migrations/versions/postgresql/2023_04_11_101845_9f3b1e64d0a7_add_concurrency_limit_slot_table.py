@@ -0,0 +1,127 @@
+"""Add concurrency limit slot table
+
+Revision ID: 9f3b1e64d0a7
+Revises: 15f5083c16bd
+Create Date: 2023-04-11 10:18:45.209815
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "9f3b1e64d0a7"
+down_revision = "15f5083c16bd"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "concurrency_limit_slot",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "concurrency_limit_id",
+            prefect.server.utilities.database.UUID(),
+            nullable=False,
+        ),
+        sa.Column(
+            "task_run_id", prefect.server.utilities.database.UUID(), nullable=False
+        ),
+        sa.Column(
+            "expires",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["concurrency_limit_id"],
+            ["concurrency_limit.id"],
+            name=op.f(
+                "fk_concurrency_limit_slot__concurrency_limit_id__concurrency_limit"
+            ),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_concurrency_limit_slot")),
+        sa.UniqueConstraint(
+            "concurrency_limit_id",
+            "task_run_id",
+            name=op.f("uq_concurrency_limit_slot__concurrency_limit_id_task_run_id"),
+        ),
+    )
+    op.create_index(
+        op.f("ix_concurrency_limit_slot__task_run_id"),
+        "concurrency_limit_slot",
+        ["task_run_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_concurrency_limit_slot__updated"),
+        "concurrency_limit_slot",
+        ["updated"],
+        unique=False,
+    )
+
+    # move the slots held in each limit's `active_slots` list to the new table
+    op.execute(
+        """
+        INSERT INTO concurrency_limit_slot (concurrency_limit_id, task_run_id)
+        SELECT DISTINCT concurrency_limit.id, slot.value::uuid
+        FROM concurrency_limit,
+            jsonb_array_elements_text(concurrency_limit.active_slots) AS slot
+        """
+    )
+
+    op.drop_column("concurrency_limit", "active_slots")
+
+
+def downgrade():
+    op.add_column(
+        "concurrency_limit",
+        sa.Column(
+            "active_slots",
+            prefect.server.utilities.database.JSON(astext_type=sa.Text()),
+            server_default="[]",
+            nullable=False,
+        ),
+    )
+
+    op.execute(
+        """
+        UPDATE concurrency_limit
+        SET active_slots = slots.task_run_ids
+        FROM (
+            SELECT concurrency_limit_id, jsonb_agg(task_run_id) AS task_run_ids
+            FROM concurrency_limit_slot
+            GROUP BY concurrency_limit_id
+        ) AS slots
+        WHERE slots.concurrency_limit_id = concurrency_limit.id
+        """
+    )
+
+    op.drop_index(
+        op.f("ix_concurrency_limit_slot__updated"),
+        table_name="concurrency_limit_slot",
+    )
+    op.drop_index(
+        op.f("ix_concurrency_limit_slot__task_run_id"),
+        table_name="concurrency_limit_slot",
+    )
+    op.drop_table("concurrency_limit_slot")
@@ -0,0 +1,27 @@
+"""Add wait queue to concurrency limit slots
+
+Revision ID: e4b7a9c1d8f2
+Revises: 9f3b1e64d0a7
+Create Date: 2023-04-12 09:35:12.804126
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4b7a9c1d8f2"
+down_revision = "9f3b1e64d0a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "concurrency_limit_slot",
+        sa.Column("is_waiting", sa.Boolean(), server_default="0", nullable=False),
+    )
+
+
+def downgrade():
+    op.execute("DELETE FROM concurrency_limit_slot WHERE is_waiting")
+    op.drop_column("concurrency_limit_slot", "is_waiting")
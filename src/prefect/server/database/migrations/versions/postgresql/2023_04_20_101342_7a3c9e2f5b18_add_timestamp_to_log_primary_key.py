@@ -0,0 +1,35 @@
+"""Add timestamp to the log primary key, optionally partitioning the log table
+
+Revision ID: 7a3c9e2f5b18
+Revises: e4b7a9c1d8f2
+Create Date: 2023-04-20 10:13:42.671930
+
+"""
+from alembic import op
+
+from prefect.server.database import partitions
+from prefect.settings import PREFECT_API_DATABASE_PARTITION_LOGS
+
+# revision identifiers, used by Alembic.
+revision = "7a3c9e2f5b18"
+down_revision = "e4b7a9c1d8f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The primary key of a partitioned table must include its partition key
+    op.execute("ALTER TABLE log DROP CONSTRAINT pk_log")
+    op.execute('ALTER TABLE log ADD CONSTRAINT pk_log PRIMARY KEY (id, "timestamp")')
+
+    if PREFECT_API_DATABASE_PARTITION_LOGS.value():
+        partitions.partition_table(op.get_bind(), "log")
+
+
+def downgrade():
+    connection = op.get_bind()
+    if partitions.table_is_partitioned(connection, "log"):
+        partitions.unpartition_table(connection, "log")
+
+    op.execute("ALTER TABLE log DROP CONSTRAINT pk_log")
+    op.execute("ALTER TABLE log ADD CONSTRAINT pk_log PRIMARY KEY (id)")
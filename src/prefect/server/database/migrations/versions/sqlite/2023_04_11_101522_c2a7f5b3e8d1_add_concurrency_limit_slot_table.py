@@ -0,0 +1,137 @@
+"""Add concurrency limit slot table
+
+Revision ID: c2a7f5b3e8d1
+Revises: 2dbcec43c857
+Create Date: 2023-04-11 10:15:22.418374
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "c2a7f5b3e8d1"
+down_revision = "2dbcec43c857"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    op.create_table(
+        "concurrency_limit_slot",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "concurrency_limit_id",
+            prefect.server.utilities.database.UUID(),
+            nullable=False,
+        ),
+        sa.Column(
+            "task_run_id", prefect.server.utilities.database.UUID(), nullable=False
+        ),
+        sa.Column(
+            "expires",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["concurrency_limit_id"],
+            ["concurrency_limit.id"],
+            name=op.f(
+                "fk_concurrency_limit_slot__concurrency_limit_id__concurrency_limit"
+            ),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_concurrency_limit_slot")),
+        sa.UniqueConstraint(
+            "concurrency_limit_id",
+            "task_run_id",
+            name=op.f("uq_concurrency_limit_slot__concurrency_limit_id_task_run_id"),
+        ),
+    )
+    with op.batch_alter_table("concurrency_limit_slot", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_concurrency_limit_slot__task_run_id"),
+            ["task_run_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_concurrency_limit_slot__updated"), ["updated"], unique=False
+        )
+
+    # move the slots held in each limit's `active_slots` list to the new table
+    op.execute(
+        """
+        INSERT INTO concurrency_limit_slot (concurrency_limit_id, task_run_id)
+        SELECT DISTINCT concurrency_limit.id, json_each.value
+        FROM concurrency_limit, json_each(concurrency_limit.active_slots)
+        """
+    )
+
+    with op.batch_alter_table("concurrency_limit", schema=None) as batch_op:
+        batch_op.drop_column("active_slots")
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("concurrency_limit", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "active_slots",
+                prefect.server.utilities.database.JSON(astext_type=sa.Text()),
+                server_default="[]",
+                nullable=False,
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE concurrency_limit
+        SET active_slots = (
+            SELECT json_group_array(concurrency_limit_slot.task_run_id)
+            FROM concurrency_limit_slot
+            WHERE concurrency_limit_slot.concurrency_limit_id = concurrency_limit.id
+        )
+        WHERE EXISTS (
+            SELECT 1 FROM concurrency_limit_slot
+            WHERE concurrency_limit_slot.concurrency_limit_id = concurrency_limit.id
+        )
+        """
+    )
+
+    with op.batch_alter_table("concurrency_limit_slot", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_concurrency_limit_slot__updated"))
+        batch_op.drop_index(batch_op.f("ix_concurrency_limit_slot__task_run_id"))
+
+    op.drop_table("concurrency_limit_slot")
+
+    op.execute("PRAGMA foreign_keys=ON")
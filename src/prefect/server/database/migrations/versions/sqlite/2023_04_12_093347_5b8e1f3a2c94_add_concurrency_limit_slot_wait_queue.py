@@ -0,0 +1,29 @@
+"""Add wait queue to concurrency limit slots
+
+Revision ID: 5b8e1f3a2c94
+Revises: c2a7f5b3e8d1
+Create Date: 2023-04-12 09:33:47.517302
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b8e1f3a2c94"
+down_revision = "c2a7f5b3e8d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("concurrency_limit_slot", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("is_waiting", sa.Boolean(), server_default="0", nullable=False)
+        )
+
+
+def downgrade():
+    op.execute("DELETE FROM concurrency_limit_slot WHERE is_waiting = 1")
+
+    with op.batch_alter_table("concurrency_limit_slot", schema=None) as batch_op:
+        batch_op.drop_column("is_waiting")
@@ -0,0 +1,34 @@
+"""Add timestamp to the log primary key
+
+Revision ID: 3f8d6b1c9a27
+Revises: 5b8e1f3a2c94
+Create Date: 2023-04-20 10:12:07.204513
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f8d6b1c9a27"
+down_revision = "5b8e1f3a2c94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("log", schema=None) as batch_op:
+        batch_op.drop_constraint("pk_log", type_="primary")
+        batch_op.create_primary_key("pk_log", ["id", "timestamp"])
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("log", schema=None) as batch_op:
+        batch_op.drop_constraint("pk_log", type_="primary")
+        batch_op.create_primary_key("pk_log", ["id"])
+
+    op.execute("PRAGMA foreign_keys=ON")
@@ -941,8 +941,9 @@ class ORMLog:
     task_run_id = sa.Column(UUID(), nullable=True, index=True)
     message = sa.Column(sa.Text, nullable=False)
 
-    # The client-side timestamp of this logged statement.
-    timestamp = sa.Column(Timestamp(), nullable=False, index=True)
+    # The client-side timestamp of this logged statement. It is part of the primary
+    # key so that the table can be partitioned by range of timestamp.
+    timestamp = sa.Column(Timestamp(), nullable=False, index=True, primary_key=True)
 
     @declared_attr
     def __table_args__(cls):
@@ -959,13 +960,58 @@ class ORMLog:
 class ORMConcurrencyLimit:
     tag = sa.Column(sa.String, nullable=False)
     concurrency_limit = sa.Column(sa.Integer, nullable=False)
-    active_slots = sa.Column(JSON, server_default="[]", default=list, nullable=False)
+
+    @declared_attr
+    def slots(cls):
+        return sa.orm.relationship(
+            "ConcurrencyLimitSlot",
+            lazy="selectin",
+            cascade="all, delete-orphan",
+            passive_deletes=True,
+        )
+
+    @property
+    def active_slots(self) -> List[uuid.UUID]:
+        """The ids of task runs holding an unexpired slot on this limit"""
+        now = pendulum.now("UTC")
+        return [
+            slot.task_run_id
+            for slot in self.slots
+            if not slot.is_waiting and (slot.expires is None or slot.expires > now)
+        ]
 
     @declared_attr
     def __table_args__(cls):
         return (sa.Index("uq_concurrency_limit__tag", "tag", unique=True),)
 
 
+@declarative_mixin
+class ORMConcurrencyLimitSlot:
+    """
+    A slot on a concurrency limit held by a task run, or the place of a task run
+    waiting for a slot when `is_waiting` is set. Both are leased; a row with an
+    `expires` time in the past is no longer counted against the limit.
+    """
+
+    @declared_attr
+    def concurrency_limit_id(cls):
+        return sa.Column(
+            UUID,
+            sa.ForeignKey("concurrency_limit.id", ondelete="cascade"),
+            nullable=False,
+        )
+
+    task_run_id = sa.Column(UUID, nullable=False, index=True)
+    is_waiting = sa.Column(
+        sa.Boolean, nullable=False, server_default="0", default=False
+    )
+    expires = sa.Column(Timestamp(), nullable=True)
+
+    @declared_attr
+    def __table_args__(cls):
+        return (sa.UniqueConstraint("concurrency_limit_id", "task_run_id"),)
+
+
 @declarative_mixin
 class ORMBlockType:
     name = sa.Column(sa.String, nullable=False)
@@ -1337,6 +1383,7 @@ class BaseORMConfiguration(ABC):
         work_pool_mixin: work pool orm mixin, combined with Base orm class
         worker_mixin: worker orm mixin, combined with Base orm class
         concurrency_limit_mixin: concurrency limit orm mixin, combined with Base orm class
+        concurrency_limit_slot_mixin: concurrency limit slot orm mixin, combined with Base orm class
         block_type_mixin: block_type orm mixin, combined with Base orm class
         block_schema_mixin: block_schema orm mixin, combined with Base orm class
         block_schema_reference_mixin: block_schema_reference orm mixin, combined with Base orm class
@@ -1362,6 +1409,7 @@ class BaseORMConfiguration(ABC):
         saved_search_mixin=ORMSavedSearch,
         log_mixin=ORMLog,
         concurrency_limit_mixin=ORMConcurrencyLimit,
+        concurrency_limit_slot_mixin=ORMConcurrencyLimitSlot,
         work_pool_mixin=ORMWorkPool,
         worker_mixin=ORMWorker,
         block_type_mixin=ORMBlockType,
@@ -1414,6 +1462,7 @@ class BaseORMConfiguration(ABC):
             saved_search_mixin=saved_search_mixin,
             log_mixin=log_mixin,
             concurrency_limit_mixin=concurrency_limit_mixin,
+            concurrency_limit_slot_mixin=concurrency_limit_slot_mixin,
             work_pool_mixin=work_pool_mixin,
             worker_mixin=worker_mixin,
             work_queue_mixin=work_queue_mixin,
@@ -1460,6 +1509,7 @@ class BaseORMConfiguration(ABC):
         saved_search_mixin=ORMSavedSearch,
         log_mixin=ORMLog,
         concurrency_limit_mixin=ORMConcurrencyLimit,
+        concurrency_limit_slot_mixin=ORMConcurrencyLimitSlot,
         work_pool_mixin=ORMWorkPool,
         worker_mixin=ORMWorker,
         block_type_mixin=ORMBlockType,
@@ -1515,6 +1565,9 @@ class BaseORMConfiguration(ABC):
         class ConcurrencyLimit(concurrency_limit_mixin, self.Base):
             pass
 
+        class ConcurrencyLimitSlot(concurrency_limit_slot_mixin, self.Base):
+            pass
+
         class WorkPool(work_pool_mixin, self.Base):
             pass
 
@@ -1566,6 +1619,7 @@ class BaseORMConfiguration(ABC):
         self.SavedSearch = SavedSearch
         self.Log = Log
         self.ConcurrencyLimit = ConcurrencyLimit
+        self.ConcurrencyLimitSlot = ConcurrencyLimitSlot
         self.WorkPool = WorkPool
         self.Worker = Worker
         self.WorkQueue = WorkQueue
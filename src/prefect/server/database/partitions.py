@@ -0,0 +1,337 @@
+"""
+Time-range partitioning of the `log` table.
+
+Partitioning is only supported on PostgreSQL. The `log` table is converted by the
+migration that adds `timestamp` to its primary key if
+`PREFECT_API_DATABASE_PARTITION_LOGS` is set, or later with
+`prefect server database partition-logs`. Once converted, the `log` table is partitioned
+by range of its `timestamp` column into partitions of one day each:
+
+- `log_pYYYYMMDD`: logs with timestamps on the given day
+- `log_before_pYYYYMMDD`: the table's logs from before the conversion, up to the given
+  day
+- `log_default`: logs with timestamps outside the range of any other partition
+
+Expired logs are removed by dropping whole partitions, which avoids the table bloat
+of deleting rows. Queries filtered by `timestamp` only scan the matching partitions.
+"""
+import datetime
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.utilities.database import get_dialect
+
+PARTITION_INTERVAL = datetime.timedelta(days=1)
+
+_PARTITION_NAME_FORMAT = "%Y%m%d"
+_PARTITION_NAME_PATTERN = re.compile(r"^.+?_(?P<before>before_)?p(?P<day>\d{8})$")
+
+
+@dataclass(frozen=True)
+class Partition:
+    """A time-range partition of a table."""
+
+    name: str
+    start: Optional[datetime.datetime]
+    end: datetime.datetime
+
+    @classmethod
+    def for_day(cls, table_name: str, day: datetime.date) -> "Partition":
+        start = pendulum.datetime(day.year, day.month, day.day, tz="UTC")
+        return cls(
+            name=f"{table_name}_p{start.strftime(_PARTITION_NAME_FORMAT)}",
+            start=start,
+            end=start + PARTITION_INTERVAL,
+        )
+
+    @classmethod
+    def before_day(cls, table_name: str, day: datetime.date) -> "Partition":
+        end = pendulum.datetime(day.year, day.month, day.day, tz="UTC")
+        return cls(
+            name=f"{table_name}_before_p{end.strftime(_PARTITION_NAME_FORMAT)}",
+            start=None,
+            end=end,
+        )
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional["Partition"]:
+        """
+        Parse the range of a partition from its name. Returns `None` for partitions not
+        named by a range, such as the default partition.
+        """
+        match = _PARTITION_NAME_PATTERN.match(name)
+        if not match:
+            return None
+        bound = pendulum.from_format(match.group("day"), "YYYYMMDD", tz="UTC")
+        if match.group("before"):
+            return cls(name=name, start=None, end=bound)
+        return cls(name=name, start=bound, end=bound + PARTITION_INTERVAL)
+
+
+def partitions_to_create(
+    table_name: str,
+    existing: List[Partition],
+    now: datetime.datetime,
+    premake: int,
+) -> List[Partition]:
+    """
+    Determine the daily partitions missing for the current day and the following
+    `premake` days.
+    """
+    covered_until = max((partition.end for partition in existing), default=None)
+    today = pendulum.instance(now).in_tz("UTC").date()
+
+    missing = []
+    for offset in range(premake + 1):
+        partition = Partition.for_day(table_name, today.add(days=offset))
+        if covered_until is not None and partition.end <= covered_until:
+            continue
+        missing.append(partition)
+    return missing
+
+
+def partitions_to_drop(
+    existing: List[Partition], now: datetime.datetime, retention: datetime.timedelta
+) -> List[Partition]:
+    """
+    Determine the partitions that only contain logs older than the retention period.
+    """
+    expired_before = now - retention
+    return [partition for partition in existing if partition.end <= expired_before]
+
+
+async def is_partitioned(
+    session: AsyncSession, db: PrefectDBInterface, table: sa.Table
+) -> bool:
+    """
+    Check if a table is partitioned. Always `False` for databases other than
+    PostgreSQL.
+    """
+    if get_dialect(db.database_config.connection_url).name != "postgresql":
+        return False
+
+    return await session.run_sync(
+        lambda sync_session: table_is_partitioned(sync_session.connection(), table.name)
+    )
+
+
+def table_is_partitioned(connection: sa.engine.Connection, table_name: str) -> bool:
+    """
+    Check if a PostgreSQL table is partitioned.
+    """
+    result = connection.execute(
+        sa.text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid ="
+            " to_regclass(:table_name)"
+        ),
+        {"table_name": table_name},
+    )
+    return result.scalar() is not None
+
+
+async def read_partitions(session: AsyncSession, table: sa.Table) -> List[Partition]:
+    """
+    Read the time-range partitions of a partitioned table, ordered by their range.
+    """
+    result = await session.execute(
+        sa.text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE pg_inherits.inhparent = to_regclass(:table_name)"
+        ),
+        {"table_name": table.name},
+    )
+    partitions = filter(None, (Partition.from_name(name) for name in result.scalars()))
+    return sorted(partitions, key=lambda partition: partition.end)
+
+
+async def create_partition(
+    session: AsyncSession, table: sa.Table, partition: Partition
+) -> int:
+    """
+    Create and attach a partition of a partitioned table.
+
+    Rows in the range of the new partition are moved from the default partition, since
+    a partition cannot be attached while the default partition contains rows in its
+    range. Returns the number of rows moved.
+    """
+    await session.execute(
+        sa.text(f"CREATE TABLE {partition.name} (LIKE {table.name} INCLUDING DEFAULTS)")
+    )
+    result = await session.execute(
+        sa.text(
+            f"WITH moved AS (DELETE FROM {table.name}_default"
+            ' WHERE "timestamp" >= :start AND "timestamp" < :end RETURNING *)'
+            f" INSERT INTO {partition.name} SELECT * FROM moved"
+        ),
+        {"start": partition.start, "end": partition.end},
+    )
+    await session.execute(
+        sa.text(
+            f"ALTER TABLE {table.name} ATTACH PARTITION {partition.name} FOR VALUES"
+            f" FROM ('{partition.start.isoformat()}') TO"
+            f" ('{partition.end.isoformat()}')"
+        )
+    )
+    return result.rowcount
+
+
+async def drop_partition(
+    session: AsyncSession, table: sa.Table, partition: Partition
+) -> None:
+    """
+    Detach and drop a partition of a partitioned table.
+    """
+    await session.execute(
+        sa.text(f"ALTER TABLE {table.name} DETACH PARTITION {partition.name}")
+    )
+    await session.execute(sa.text(f"DROP TABLE {partition.name}"))
+
+
+async def partition_log_table(session: AsyncSession, db: PrefectDBInterface) -> None:
+    """
+    Convert the `log` table to a table partitioned by range of `timestamp`.
+
+    The table is converted by the migration that adds `timestamp` to its primary key
+    if `PREFECT_API_DATABASE_PARTITION_LOGS` is set. This converts the table of a
+    database that was migrated without it.
+    """
+    if get_dialect(db.database_config.connection_url).name != "postgresql":
+        raise ValueError("Partitioning the log table is only supported on PostgreSQL.")
+
+    table: sa.Table = db.Log.__table__
+    if await is_partitioned(session, db, table):
+        raise ValueError("The log table is already partitioned.")
+
+    await session.run_sync(
+        lambda sync_session: partition_table(sync_session.connection(), table.name)
+    )
+
+
+def partition_table(connection: sa.engine.Connection, table_name: str) -> None:
+    """
+    Convert a table to a table partitioned by range of `timestamp`.
+
+    The existing table becomes the partition for rows before the next day, so its rows
+    are not copied. Its indexes are attached to the matching indexes of the partitioned
+    table rather than rebuilt, which requires its primary key to be on
+    `(id, timestamp)`.
+    """
+    legacy = Partition.before_day(table_name, pendulum.now("UTC").date().add(days=1))
+    indexes = _read_indexes(connection, table_name)
+
+    # Rename the existing table and its indexes to free their names for the
+    # partitioned table
+    connection.execute(sa.text(f"ALTER TABLE {table_name} RENAME TO {legacy.name}"))
+    for index_name in indexes:
+        connection.execute(
+            sa.text(
+                f"ALTER INDEX {index_name} RENAME TO"
+                f" {index_name.replace(table_name, legacy.name, 1)}"
+            )
+        )
+
+    # The primary key of a partitioned table must include the partition key
+    connection.execute(
+        sa.text(
+            f"CREATE TABLE {table_name} (LIKE {legacy.name} INCLUDING DEFAULTS)"
+            ' PARTITION BY RANGE ("timestamp")'
+        )
+    )
+    _create_indexes(connection, table_name, indexes)
+    connection.execute(
+        sa.text(f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT")
+    )
+
+    # Existing rows with timestamps past the range of the existing table are moved to
+    # the default partition
+    connection.execute(
+        sa.text(
+            f'WITH moved AS (DELETE FROM {legacy.name} WHERE "timestamp" >= :end'
+            f" RETURNING *) INSERT INTO {table_name}_default SELECT * FROM moved"
+        ),
+        {"end": legacy.end},
+    )
+    connection.execute(
+        sa.text(
+            f"ALTER TABLE {table_name} ATTACH PARTITION {legacy.name} FOR VALUES FROM"
+            f" (MINVALUE) TO ('{legacy.end.isoformat()}')"
+        )
+    )
+
+
+def unpartition_table(connection: sa.engine.Connection, table_name: str) -> None:
+    """
+    Convert a partitioned table back to a regular table, copying the rows of all of
+    its partitions into it.
+    """
+    partitioned_name = f"{table_name}_partitioned"
+    indexes = _read_indexes(connection, table_name)
+
+    connection.execute(
+        sa.text(f"ALTER TABLE {table_name} RENAME TO {partitioned_name}")
+    )
+    for index_name in indexes:
+        connection.execute(
+            sa.text(
+                f"ALTER INDEX {index_name} RENAME TO"
+                f" {index_name.replace(table_name, partitioned_name, 1)}"
+            )
+        )
+
+    connection.execute(
+        sa.text(
+            f"CREATE TABLE {table_name} (LIKE {partitioned_name} INCLUDING DEFAULTS)"
+        )
+    )
+    connection.execute(
+        sa.text(f"INSERT INTO {table_name} SELECT * FROM {partitioned_name}")
+    )
+    # Dropping the partitioned table drops its partitions
+    connection.execute(sa.text(f"DROP TABLE {partitioned_name}"))
+    _create_indexes(connection, table_name, indexes)
+
+
+def _read_indexes(
+    connection: sa.engine.Connection, table_name: str
+) -> Dict[str, Optional[str]]:
+    """
+    Read the indexes of a table, mapping the name of each index to its definition. The
+    primary key index maps to `None`, since it is created as a constraint.
+    """
+    result = connection.execute(
+        sa.text(
+            "SELECT index_class.relname, CASE WHEN pg_index.indisprimary THEN NULL"
+            " ELSE pg_get_indexdef(pg_index.indexrelid) END FROM pg_index"
+            " JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid"
+            " WHERE pg_index.indrelid = to_regclass(:table_name)"
+        ),
+        {"table_name": table_name},
+    )
+    return dict(result.all())
+
+
+def _create_indexes(
+    connection: sa.engine.Connection,
+    table_name: str,
+    indexes: Dict[str, Optional[str]],
+) -> None:
+    """
+    Create the indexes read by `_read_indexes` on a table of the same name.
+    """
+    connection.execute(
+        sa.text(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT pk_{table_name}"
+            ' PRIMARY KEY (id, "timestamp")'
+        )
+    )
+    for definition in indexes.values():
+        # Definitions refer to the table by name, which is now the new table
+        if definition is not None:
+            connection.execute(sa.text(definition))
@@ -1,7 +1,7 @@
 import datetime
 from abc import ABC, abstractmethod, abstractproperty
-from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
-from uuid import UUID
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 import pendulum
 import sqlalchemy as sa
@@ -513,6 +513,23 @@ class BaseQueryComponents(ABC):
         """Removes a configuration key from the cache."""
         self.CONFIGURATION_CACHE.pop(key, None)
 
+    # --- dialect-optimized bulk writes
+
+    async def insert_logs(
+        self,
+        session: AsyncSession,
+        db: "PrefectDBInterface",
+        logs: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Insert logs given as dictionaries of column values.
+
+        Logs are inserted with a single multi-row INSERT statement which binds a
+        parameter for each value, so callers must batch logs to stay within the
+        parameter limit of the database.
+        """
+        await session.execute(self.insert(db.Log).values(logs))
+
 
 class AsyncPostgresQueryComponents(BaseQueryComponents):
     # --- Postgres-specific SqlAlchemy bindings
@@ -661,6 +678,66 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
         result = await session.execute(notification_details_stmt)
         return result.fetchall()
 
+    async def insert_logs(
+        self,
+        session: AsyncSession,
+        db: "PrefectDBInterface",
+        logs: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Insert logs with a binary `COPY`, which streams rows to the database instead
+        of binding a parameter for each value.
+
+        Values for columns with defaults are generated here since `COPY` does not
+        apply the ORM defaults.
+        """
+        if not logs:
+            return
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        # asyncpg connections only begin the session's transaction once a statement
+        # is executed; begin it so the `COPY` is part of the transaction
+        if not driver_connection.is_in_transaction():
+            await connection.exec_driver_sql("SELECT 1")
+
+        now = pendulum.now("UTC")
+        columns = (
+            "id",
+            "created",
+            "updated",
+            "name",
+            "level",
+            "flow_run_id",
+            "task_run_id",
+            "message",
+            "timestamp",
+        )
+        records = [
+            (
+                log.get("id") or uuid4(),
+                log.get("created") or now,
+                log.get("updated") or now,
+                log["name"],
+                log["level"],
+                log["flow_run_id"],
+                log.get("task_run_id"),
+                log["message"],
+                log["timestamp"],
+            )
+            for log in logs
+        ]
+
+        table = db.Log.__table__
+        await driver_connection.copy_records_to_table(
+            table.name,
+            schema_name=table.schema,
+            columns=columns,
+            records=records,
+        )
+
     @property
     def _get_scheduled_flow_runs_from_work_pool_template_path(self):
         """
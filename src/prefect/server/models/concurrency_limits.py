@@ -23,6 +23,8 @@ async def create_concurrency_limit(
     insert_values = concurrency_limit.dict(shallow=True, exclude_unset=False)
     insert_values.pop("created")
     insert_values.pop("updated")
+    # slots are held by task runs through orchestration and cannot be set directly
+    insert_values.pop("active_slots")
     concurrency_tag = insert_values["tag"]
 
     # set `updated` manually
@@ -64,8 +66,10 @@ async def read_concurrency_limit(
     conditions might allow the concurrency limit to be temporarily exceeded.
     """
 
-    query = sa.select(db.ConcurrencyLimit).where(
-        db.ConcurrencyLimit.id == concurrency_limit_id
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .where(db.ConcurrencyLimit.id == concurrency_limit_id)
+        .execution_options(populate_existing=True)
     )
 
     result = await session.execute(query)
@@ -83,7 +87,11 @@ async def read_concurrency_limit_by_tag(
     conditions might allow the concurrency limit to be temporarily exceeded.
     """
 
-    query = sa.select(db.ConcurrencyLimit).where(db.ConcurrencyLimit.tag == tag)
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .where(db.ConcurrencyLimit.tag == tag)
+        .execution_options(populate_existing=True)
+    )
 
     result = await session.execute(query)
     return result.scalar()
@@ -103,10 +111,27 @@ async def reset_concurrency_limit_by_tag(
     result = await session.execute(query)
     concurrency_limit = result.scalar()
     if concurrency_limit:
-        if slot_override is not None:
-            concurrency_limit.active_slots = [str(slot) for slot in slot_override]
-        else:
-            concurrency_limit.active_slots = []
+        await session.execute(
+            sa.delete(db.ConcurrencyLimitSlot).where(
+                db.ConcurrencyLimitSlot.concurrency_limit_id == concurrency_limit.id
+            )
+        )
+        if slot_override:
+            await session.execute(
+                (await db.insert(db.ConcurrencyLimitSlot))
+                .values(
+                    [
+                        dict(
+                            concurrency_limit_id=concurrency_limit.id,
+                            task_run_id=task_run_id,
+                        )
+                        for task_run_id in set(slot_override)
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+        result = await session.execute(query.execution_options(populate_existing=True))
+        concurrency_limit = result.scalar()
     return concurrency_limit
 
 
@@ -120,18 +145,149 @@ async def filter_concurrency_limits_for_orchestration(
     Filters concurrency limits by tag. This will apply a "select for update" lock on
     these rows to prevent simultaneous read race conditions from enabling the
     the concurrency limit on these tags from being temporarily exceeded.
+
+    The slots of the returned limits are not loaded; use `secure_concurrency_slot`
+    to take a slot while the lock is held.
     """
 
     query = (
         sa.select(db.ConcurrencyLimit)
         .filter(db.ConcurrencyLimit.tag.in_(tags))
         .order_by(db.ConcurrencyLimit.tag)
+        .options(sa.orm.noload(db.ConcurrencyLimit.slots))
         .with_for_update()
     )
     result = await session.execute(query)
     return result.scalars().all()
 
 
+@inject_db
+async def secure_concurrency_slot(
+    session: sa.orm.Session,
+    concurrency_limit_id: UUID,
+    concurrency_limit: int,
+    task_run_id: UUID,
+    db: PrefectDBInterface,
+    lease_seconds: Optional[int] = None,
+    wait_seconds: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Takes a slot on a concurrency limit for a task run if one is available. Expired
+    slots are released first. If the task run already holds a slot, its lease is
+    renewed.
+
+    Task runs that cannot take a slot are placed in a wait queue for the limit, and
+    slots are only handed out once every task run that started waiting earlier has
+    been given one. A task run keeps its place in the queue as long as it tries
+    again before its place expires.
+
+    The concurrency limit row should be locked by the caller, e.g. with
+    `filter_concurrency_limits_for_orchestration`, so that simultaneous requests
+    cannot exceed the limit.
+
+    Args:
+        session: A database session
+        concurrency_limit_id: the id of the concurrency limit
+        concurrency_limit: the number of slots available on the concurrency limit
+        task_run_id: the task run taking the slot
+        lease_seconds: the number of seconds until the slot expires; if not
+            provided, the slot does not expire
+        wait_seconds: the number of seconds a task run keeps its place in the
+            wait queue without trying again; if not provided, the place does not
+            expire
+
+    Returns:
+        Optional[int]: `None` if a slot was secured, otherwise the number of task
+            runs ahead of this one in the wait queue
+    """
+    now = pendulum.now("UTC")
+    slot = db.ConcurrencyLimitSlot
+
+    await session.execute(
+        sa.delete(slot).where(
+            slot.concurrency_limit_id == concurrency_limit_id,
+            slot.expires <= now,
+        )
+    )
+
+    result = await session.execute(
+        sa.select(slot.is_waiting, slot.created).where(
+            slot.concurrency_limit_id == concurrency_limit_id,
+            slot.task_run_id == task_run_id,
+        )
+    )
+    existing = result.first()
+
+    if existing is not None and not existing.is_waiting:
+        held_slots, waiting_ahead = 0, 0
+    else:
+        waiting_ahead_filter = slot.is_waiting.is_(True)
+        if existing is not None:
+            waiting_ahead_filter = sa.and_(
+                waiting_ahead_filter, slot.created < existing.created
+            )
+
+        result = await session.execute(
+            sa.select(
+                sa.func.count(sa.case((slot.is_waiting.is_(False), slot.id))),
+                sa.func.count(sa.case((waiting_ahead_filter, slot.id))),
+            ).where(slot.concurrency_limit_id == concurrency_limit_id)
+        )
+        held_slots, waiting_ahead = result.one()
+
+    is_waiting = held_slots + waiting_ahead >= concurrency_limit
+    if is_waiting:
+        expires = now.add(seconds=wait_seconds) if wait_seconds is not None else None
+    else:
+        expires = now.add(seconds=lease_seconds) if lease_seconds is not None else None
+
+    await session.execute(
+        (await db.insert(slot))
+        .values(
+            concurrency_limit_id=concurrency_limit_id,
+            task_run_id=task_run_id,
+            is_waiting=is_waiting,
+            expires=expires,
+        )
+        .on_conflict_do_update(
+            index_elements=[slot.concurrency_limit_id, slot.task_run_id],
+            set_=dict(is_waiting=is_waiting, expires=expires),
+        )
+    )
+    return waiting_ahead if is_waiting else None
+
+
+@inject_db
+async def release_concurrency_slots(
+    session: sa.orm.Session,
+    task_run_id: UUID,
+    db: PrefectDBInterface,
+    concurrency_limit_ids: Optional[List[UUID]] = None,
+) -> int:
+    """
+    Releases the slots held by a task run, along with its places in any wait queues.
+
+    Args:
+        session: A database session
+        task_run_id: the task run holding the slots
+        concurrency_limit_ids: if provided, only slots on these concurrency limits
+            are released
+
+    Returns:
+        int: the number of slots released
+    """
+    query = sa.delete(db.ConcurrencyLimitSlot).where(
+        db.ConcurrencyLimitSlot.task_run_id == task_run_id
+    )
+    if concurrency_limit_ids is not None:
+        query = query.where(
+            db.ConcurrencyLimitSlot.concurrency_limit_id.in_(concurrency_limit_ids)
+        )
+
+    result = await session.execute(query)
+    return result.rowcount
+
+
 @inject_db
 async def delete_concurrency_limit(
     session: sa.orm.Session,
@@ -178,7 +334,11 @@ async def read_concurrency_limits(
         List[db.ConcurrencyLimit]: concurrency limits
     """
 
-    query = sa.select(db.ConcurrencyLimit).order_by(db.ConcurrencyLimit.tag)
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .order_by(db.ConcurrencyLimit.tag)
+        .execution_options(populate_existing=True)
+    )
 
     if offset is not None:
         query = query.offset(offset)
@@ -4,7 +4,8 @@ Intended for internal use by the Prefect REST API.
 """
 
 import datetime
-from typing import Dict, List
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
 import pendulum
@@ -17,6 +18,7 @@ from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.utilities.database import json_contains
+from prefect.server.utilities.long_polling import wake_work_queues_after_commit
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_RUNS,
     PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
@@ -521,24 +523,129 @@ async def _generate_scheduled_flow_runs(
     Returns:
         a list of dictionary representations of the `FlowRun` objects to schedule
     """
-    runs = []
-
     # retrieve the deployment
     deployment = await session.get(db.Deployment, deployment_id)
 
     if not deployment or not deployment.schedule or not deployment.is_schedule_active:
         return []
 
+    return _generate_scheduled_flow_runs_for_deployment(
+        deployment=deployment,
+        start_time=start_time,
+        end_time=end_time,
+        min_time=min_time,
+        min_runs=min_runs,
+        max_runs=max_runs,
+        auto_scheduled=auto_scheduled,
+    )
+
+
+@inject_db
+async def _read_deployments_to_schedule(
+    session: sa.orm.Session,
+    deployment_ids: List[UUID],
+    start_time: datetime.datetime,
+    db: PrefectDBInterface,
+) -> List[Tuple]:
+    """
+    Reads a page of deployments with active schedules along with the expected start
+    times of their existing auto-scheduled runs on or after `start_time`, using one
+    query for each.
+
+    Returns:
+        List[Tuple[db.Deployment, Set[datetime.datetime]]]: pairs of deployments and
+            their already-scheduled start times
+    """
+    if not deployment_ids:
+        return []
+
+    deployments = (
+        (
+            await session.execute(
+                sa.select(db.Deployment)
+                .where(
+                    db.Deployment.id.in_(deployment_ids),
+                    db.Deployment.is_schedule_active.is_(True),
+                    db.Deployment.schedule.is_not(None),
+                )
+                .order_by(db.Deployment.id)
+            )
+        )
+        .scalars()
+        .unique()
+        .all()
+    )
+
+    # runs that have left the scheduled state still hold their slot in the schedule
+    # through their idempotency key, so they are included regardless of state
+    scheduled_runs = await session.execute(
+        sa.select(db.FlowRun.deployment_id, db.FlowRun.expected_start_time).where(
+            db.FlowRun.deployment_id.in_([deployment.id for deployment in deployments]),
+            db.FlowRun.expected_start_time >= start_time,
+            db.FlowRun.auto_scheduled.is_(True),
+        )
+    )
+    scheduled_times = defaultdict(set)
+    for deployment_id, expected_start_time in scheduled_runs:
+        scheduled_times[deployment_id].add(expected_start_time)
+
+    return [(deployment, scheduled_times[deployment.id]) for deployment in deployments]
+
+
+def _generate_scheduled_flow_runs_for_deployment(
+    deployment,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+    auto_scheduled: bool = True,
+    scheduled_times: Optional[Set[datetime.datetime]] = None,
+) -> List[Dict]:
+    """
+    Generates flow runs for an already-loaded deployment without querying the
+    database. See `_generate_scheduled_flow_runs` for details on the schedule
+    parameters.
+
+    Args:
+        deployment: a deployment ORM model with a schedule, i.e. a `db.Deployment`
+        scheduled_times: start times of runs that are already scheduled for the
+            deployment on or after `start_time`; generation resumes after the latest
+            of these rather than from `start_time`
+
+    Returns:
+        a list of dictionary representations of the `FlowRun` objects to schedule
+    """
+    runs = []
     dates = []
 
+    # the latest scheduled run acts as a cursor into the schedule, so only dates
+    # that follow it need to be generated
+    scheduled_count = len(scheduled_times) if scheduled_times else 0
+    cursor = max(scheduled_times) if scheduled_times else None
+
+    if scheduled_count >= max_runs or (
+        cursor is not None
+        and scheduled_count >= min_runs
+        and cursor >= start_time + min_time
+    ):
+        return runs
+
     # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
     for dt in deployment.schedule._get_dates_generator(
-        n=max_runs, start=start_time, end=end_time
+        n=max_runs - scheduled_count + 1 if cursor else max_runs,
+        start=cursor or start_time,
+        end=end_time,
     ):
+        if cursor is not None and dt <= cursor:
+            continue
+
         dates.append(dt)
 
         # at any point, if we satisfy both of the minimums, we can stop
-        if len(dates) >= min_runs and dt >= (start_time + min_time):
+        if scheduled_count + len(dates) >= max_runs or (
+            scheduled_count + len(dates) >= min_runs and dt >= (start_time + min_time)
+        ):
             break
 
     tags = deployment.tags
@@ -550,7 +657,7 @@ async def _generate_scheduled_flow_runs(
             {
                 "id": uuid4(),
                 "flow_id": deployment.flow_id,
-                "deployment_id": deployment_id,
+                "deployment_id": deployment.id,
                 "work_queue_name": deployment.work_queue_name,
                 "work_queue_id": deployment.work_queue_id,
                 "parameters": deployment.parameters,
@@ -638,6 +745,11 @@ async def _insert_scheduled_flow_runs(
 
         await session.execute(stmt)
 
+        wake_work_queues_after_commit(
+            session,
+            {r.get("work_queue_id") for r in runs if r["id"] in inserted_flow_run_ids},
+        )
+
     return inserted_flow_run_ids
 
 
@@ -5,12 +5,14 @@ Intended for internal use by the Prefect REST API.
 
 import contextlib
 import datetime
+from dataclasses import dataclass, field
 from itertools import chain
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 import pendulum
 import sqlalchemy as sa
+from cachetools import LRUCache
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only, selectinload
@@ -27,7 +29,10 @@ from prefect.server.orchestration.rules import FlowOrchestrationContext
 from prefect.server.schemas.core import TaskRunResult
 from prefect.server.schemas.responses import OrchestrationResult, SetStateStatus
 from prefect.server.schemas.states import State
+from prefect.server.utilities.long_polling import wake_work_queues_after_commit
+from prefect.server.utilities.pagination import paginate_by_cursor
 from prefect.server.utilities.schemas import PrefectBaseModel
+from prefect.settings import PREFECT_API_FLOW_RUN_CLAIM_LEASE_SECONDS
 
 
 @inject_db
@@ -254,6 +259,7 @@ async def read_flow_runs(
     offset: int = None,
     limit: int = None,
     sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    cursor: Optional[str] = None,
 ):
     """
     Read flow runs.
@@ -268,17 +274,20 @@ async def read_flow_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: if provided, read the page of flow runs after this cursor using
+            keyset pagination instead of the offset; an empty cursor reads the
+            first page
 
     Returns:
         List[db.FlowRun]: flow runs
     """
-    query = (
-        select(db.FlowRun)
-        .order_by(sort.as_sql_sort(db))
-        .options(
-            selectinload(db.FlowRun.work_queue).selectinload(db.WorkQueue.work_pool)
-        )
+    query = select(db.FlowRun).options(
+        selectinload(db.FlowRun.work_queue).selectinload(db.WorkQueue.work_pool)
     )
+    if cursor is not None:
+        query = paginate_by_cursor(query, sort.as_sql_sort(db), db.FlowRun.id, cursor)
+    else:
+        query = query.order_by(sort.as_sql_sort(db))
 
     if columns:
         query = query.options(load_only(*columns))
@@ -294,7 +303,7 @@ async def read_flow_runs(
         db=db,
     )
 
-    if offset is not None:
+    if offset is not None and cursor is None:
         query = query.offset(offset)
 
     if limit is not None:
@@ -317,51 +326,185 @@ class DependencyResult(PrefectBaseModel):
     untrackable_result: bool
 
 
+# Task run dependency graphs are cached by flow run id. Each read only loads the task
+# runs updated since the graph was last read, and the whole graph is reloaded once it
+# is older than the TTL. The cache is bounded by the total number of task runs in its
+# graphs; larger graphs are not cached.
+TASK_RUN_DEPENDENCY_CACHE: LRUCache = LRUCache(
+    maxsize=50_000, getsizeof=lambda graph: max(len(graph.nodes), 1)
+)
+TASK_RUN_DEPENDENCY_CACHE_TTL = datetime.timedelta(minutes=10)
+
+# Task runs updated up to this long before the latest update seen are read again, so
+# that updates committed out of order are not missed
+TASK_RUN_DEPENDENCY_UPDATE_OVERLAP = datetime.timedelta(seconds=10)
+
+
+@dataclass
+class _TaskRunDependencyGraph:
+    nodes: Dict[UUID, dict] = field(default_factory=dict)
+    updated: Dict[UUID, datetime.datetime] = field(default_factory=dict)
+    last_updated: Optional[datetime.datetime] = None
+    loaded: pendulum.DateTime = field(default_factory=lambda: pendulum.now("UTC"))
+
+
+def _dependency_graph_node(row: sa.engine.Row) -> dict:
+    state = None
+    if row.state_id is not None:
+        state = State(
+            id=row.state_id,
+            type=row.state_type,
+            name=row.state_name,
+            timestamp=row.state_timestamp,
+            message=row.state_message,
+            state_details=row.state_details,
+            data=row.state_data or row.result_data,
+        )
+
+    return {
+        "id": row.id,
+        "upstream_dependencies": list(set(chain(*row.task_inputs.values()))),
+        "state": state,
+        "expected_start_time": row.expected_start_time,
+        "name": row.name,
+        "start_time": row.start_time,
+        "end_time": row.end_time,
+        "total_run_time": row.total_run_time,
+        "estimated_run_time": row.total_run_time,
+        "untrackable_result": (
+            False if state is None else state.state_details.untrackable_result
+        ),
+    }
+
+
+def _with_estimated_run_time(node: dict, now: pendulum.DateTime) -> dict:
+    """
+    Total run time is only incremented when a RUNNING state is exited, so estimate
+    the run time of task runs that are currently running.
+    """
+    state = node["state"]
+    if state is None or state.type != schemas.states.StateType.RUNNING:
+        return node
+    return {
+        **node,
+        "estimated_run_time": node["total_run_time"] + (now - state.timestamp),
+    }
+
+
+async def _read_task_run_dependency_rows(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    flow_run_id: UUID,
+    updated_after: Optional[datetime.datetime] = None,
+) -> List[sa.engine.Row]:
+    """
+    Read the columns of a flow run's task runs and their current states needed for
+    the dependency graph, without loading ORM objects.
+    """
+    query = (
+        select(
+            db.TaskRun.id,
+            db.TaskRun.name,
+            db.TaskRun.task_inputs,
+            db.TaskRun.expected_start_time,
+            db.TaskRun.start_time,
+            db.TaskRun.end_time,
+            db.TaskRun.total_run_time,
+            db.TaskRun.updated,
+            db.TaskRunState.id.label("state_id"),
+            db.TaskRunState.type.label("state_type"),
+            db.TaskRunState.name.label("state_name"),
+            db.TaskRunState.timestamp.label("state_timestamp"),
+            db.TaskRunState.message.label("state_message"),
+            db.TaskRunState.state_details,
+            db.TaskRunState._data.label("state_data"),
+            db.Artifact.data.label("result_data"),
+        )
+        .outerjoin(db.TaskRunState, db.TaskRunState.id == db.TaskRun.state_id)
+        .outerjoin(db.Artifact, db.Artifact.id == db.TaskRunState.result_artifact_id)
+        .where(db.TaskRun.flow_run_id == flow_run_id)
+    )
+    if updated_after is not None:
+        query = query.where(db.TaskRun.updated >= updated_after)
+
+    result = await session.execute(query)
+    return result.all()
+
+
+@inject_db
 async def read_task_run_dependencies(
     session: AsyncSession,
     flow_run_id: UUID,
-) -> List[DependencyResult]:
+    db: PrefectDBInterface,
+    since: Optional[datetime.datetime] = None,
+) -> List[dict]:
     """
     Get a task run dependency map for a given flow run.
+
+    The map is cached, so only the task runs updated since it was last read are
+    loaded from the database.
+
+    Args:
+        session: a database session
+        flow_run_id: a flow run id
+        since: if provided, only include task runs updated at or after this time
+
+    Returns:
+        List[dict]: the task runs of the flow run and their upstream dependencies
     """
-    flow_run = await models.flow_runs.read_flow_run(
-        session=session, flow_run_id=flow_run_id
-    )
-    if not flow_run:
+    flow_run_exists = (
+        await session.execute(select(db.FlowRun.id).where(db.FlowRun.id == flow_run_id))
+    ).first()
+    if not flow_run_exists:
         raise ObjectNotFoundError(f"Flow run with id {flow_run_id} not found")
 
-    task_runs = await models.task_runs.read_task_runs(
+    graph = TASK_RUN_DEPENDENCY_CACHE.get(flow_run_id)
+    if (
+        graph is None
+        or pendulum.now("UTC") - graph.loaded > TASK_RUN_DEPENDENCY_CACHE_TTL
+    ):
+        graph = _TaskRunDependencyGraph()
+    else:
+        # task runs are rarely deleted, but when they are their nodes must be dropped
+        task_run_ids = set(
+            (
+                await session.execute(
+                    select(db.TaskRun.id).where(db.TaskRun.flow_run_id == flow_run_id)
+                )
+            ).scalars()
+        )
+        for task_run_id in graph.nodes.keys() - task_run_ids:
+            del graph.nodes[task_run_id]
+            del graph.updated[task_run_id]
+
+    rows = await _read_task_run_dependency_rows(
         session=session,
-        flow_run_filter=schemas.filters.FlowRunFilter(
-            id=schemas.filters.FlowRunFilterId(any_=[flow_run_id])
+        db=db,
+        flow_run_id=flow_run_id,
+        updated_after=(
+            graph.last_updated - TASK_RUN_DEPENDENCY_UPDATE_OVERLAP
+            if graph.last_updated
+            else None
         ),
     )
+    for row in rows:
+        graph.nodes[row.id] = _dependency_graph_node(row)
+        graph.updated[row.id] = row.updated
+        if graph.last_updated is None or row.updated > graph.last_updated:
+            graph.last_updated = row.updated
+
+    # Store the graph again to account for its new size
+    if len(graph.nodes) <= TASK_RUN_DEPENDENCY_CACHE.maxsize:
+        TASK_RUN_DEPENDENCY_CACHE[flow_run_id] = graph
+    else:
+        TASK_RUN_DEPENDENCY_CACHE.pop(flow_run_id, None)
 
-    dependency_graph = []
-
-    for task_run in task_runs:
-        inputs = list(set(chain(*task_run.task_inputs.values())))
-        untrackable_result_status = (
-            False
-            if task_run.state is None
-            else task_run.state.state_details.untrackable_result
-        )
-        dependency_graph.append(
-            {
-                "id": task_run.id,
-                "upstream_dependencies": inputs,
-                "state": task_run.state,
-                "expected_start_time": task_run.expected_start_time,
-                "name": task_run.name,
-                "start_time": task_run.start_time,
-                "end_time": task_run.end_time,
-                "total_run_time": task_run.total_run_time,
-                "estimated_run_time": task_run.estimated_run_time,
-                "untrackable_result": untrackable_result_status,
-            }
-        )
-
-    return dependency_graph
+    now = pendulum.now("UTC")
+    return [
+        _with_estimated_run_time(node, now)
+        for task_run_id, node in graph.nodes.items()
+        if since is None or graph.updated[task_run_id] >= since
+    ]
 
 
 @inject_db
@@ -518,4 +661,63 @@ async def set_flow_run_state(
             session=session, flow_run=run
         )
 
+        # a scheduled flow run may be due and a finished flow run frees a concurrency
+        # slot, so wake any workers waiting for flow runs in the work queue
+        if result.state.is_scheduled() or result.state.is_final():
+            wake_work_queues_after_commit(session, [run.work_queue_id])
+
     return result
+
+
+@inject_db
+async def claim_flow_runs(
+    session: AsyncSession,
+    flow_run_ids: List[UUID],
+    db: PrefectDBInterface,
+    claimed_by: Optional[str] = None,
+    flow_policy: BaseOrchestrationPolicy = None,
+    orchestration_parameters: dict = None,
+) -> List[UUID]:
+    """
+    Claims scheduled flow runs by moving them to a Pending state.
+
+    Flow runs should be claimed in the same transaction that selected them for update,
+    so that concurrent polls cannot claim the same runs. Claims are leased: if the
+    claiming worker does not report the flow run's infrastructure before the claim
+    expires, the claim expiration service reschedules the flow run.
+
+    Args:
+        session: a database session
+        flow_run_ids: the ids of the flow runs to claim
+        claimed_by: the name of the worker or agent claiming the flow runs
+        flow_policy: the orchestration policy for the Pending state proposals
+
+    Returns:
+        List[UUID]: the ids of the flow runs whose Pending states were accepted
+    """
+    # the flow runs may have been loaded without their current states
+    for flow_run in list(session.identity_map.values()):
+        if isinstance(flow_run, db.FlowRun) and flow_run.id in flow_run_ids:
+            session.expunge(flow_run)
+
+    claim_expiration = (
+        pendulum.now("UTC") + PREFECT_API_FLOW_RUN_CLAIM_LEASE_SECONDS.value()
+    )
+    claimed = []
+    for flow_run_id in flow_run_ids:
+        result = await set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run_id,
+            state=schemas.states.Pending(
+                message=f"Claimed by {claimed_by!r}" if claimed_by else None,
+                state_details=schemas.states.StateDetails(
+                    claimed_by=claimed_by, claim_expiration=claim_expiration
+                ),
+            ),
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+        if result.status == SetStateStatus.ACCEPT:
+            claimed.append(flow_run_id)
+
+    return claimed
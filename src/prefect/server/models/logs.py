@@ -2,7 +2,7 @@
 Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.utilities.pagination import paginate_by_cursor
 from prefect.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -41,8 +42,9 @@ async def create_logs(
     Returns:
         None
     """
-    log_insert = await db.insert(db.Log)
-    await session.execute(log_insert.values([log.dict() for log in logs]))
+    await db.queries.insert_logs(
+        session=session, db=db, logs=[log.dict() for log in logs]
+    )
 
 
 @inject_db
@@ -53,6 +55,7 @@ async def read_logs(
     offset: int = None,
     limit: int = None,
     sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    cursor: Optional[str] = None,
 ):
     """
     Read logs.
@@ -64,11 +67,17 @@ async def read_logs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: if provided, read the page of logs after this cursor using keyset
+            pagination instead of the offset; an empty cursor reads the first page
 
     Returns:
         List[db.Log]: the matching logs
     """
-    query = select(db.Log).order_by(sort.as_sql_sort(db)).offset(offset).limit(limit)
+    query = select(db.Log).limit(limit)
+    if cursor is not None:
+        query = paginate_by_cursor(query, sort.as_sql_sort(db), db.Log.id, cursor)
+    else:
+        query = query.order_by(sort.as_sql_sort(db)).offset(offset)
 
     if log_filter:
         query = query.where(log_filter.as_sql_filter(db))
@@ -4,6 +4,7 @@ Intended for internal use by the Prefect REST API.
 """
 
 import contextlib
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 import pendulum
@@ -21,6 +22,22 @@ from prefect.server.orchestration.global_policy import GlobalTaskPolicy
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import TaskOrchestrationContext
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities.pagination import paginate_by_cursor
+from prefect.utilities.collections import batched_iterable
+
+# We have a limit of 32,767 parameters at a time for a single query...
+MAXIMUM_QUERY_PARAMETERS = 32_767
+
+# ...and task runs have a certain number of fields...
+NUMBER_OF_TASK_RUN_FIELDS = len(schemas.core.TaskRun.schema()["properties"])
+
+# ...so we can only INSERT batches of a certain size at a time
+TASK_RUN_BATCH_SIZE = MAXIMUM_QUERY_PARAMETERS // NUMBER_OF_TASK_RUN_FIELDS
+
+
+def split_task_runs_into_batches(task_runs):
+    for batch in batched_iterable(task_runs, TASK_RUN_BATCH_SIZE):
+        yield batch
 
 
 @inject_db
@@ -88,6 +105,89 @@ async def create_task_run(
     return model
 
 
+@inject_db
+async def create_task_runs(
+    session: sa.orm.Session,
+    task_runs: List[schemas.core.TaskRun],
+    db: PrefectDBInterface,
+    orchestration_parameters: dict = None,
+):
+    """
+    Creates many task runs with a single INSERT statement.
+
+    Behaves like `create_task_run` for each task run: if a task run with the same
+    flow_run_id, task_key, and dynamic_key already exists, the existing task run will
+    be returned and initial states are only set on newly-created task runs.
+
+    Args:
+        session: a database session
+        task_runs: a list of task run models; should not exceed `TASK_RUN_BATCH_SIZE`
+
+    Returns:
+        List[db.TaskRun]: the newly-created or existing task runs, in the order of
+            `task_runs`
+    """
+    if not task_runs:
+        return []
+
+    now = pendulum.now("UTC")
+
+    insert_stmt = (
+        (await db.insert(db.TaskRun))
+        .values(
+            [
+                dict(
+                    created=now,
+                    **task_run.dict(
+                        shallow=True, exclude={"state", "created"}, exclude_unset=True
+                    ),
+                )
+                for task_run in task_runs
+            ]
+        )
+        .on_conflict_do_nothing(
+            index_elements=db.task_run_unique_upsert_columns,
+        )
+    )
+    await session.execute(insert_stmt)
+
+    # Select a superset of the requested runs using a few `IN` clauses, then match
+    # each requested run to its row in Python
+    query = (
+        sa.select(db.TaskRun)
+        .where(
+            sa.and_(
+                db.TaskRun.flow_run_id.in_({tr.flow_run_id for tr in task_runs}),
+                db.TaskRun.task_key.in_({tr.task_key for tr in task_runs}),
+                db.TaskRun.dynamic_key.in_({tr.dynamic_key for tr in task_runs}),
+            )
+        )
+        .execution_options(populate_existing=True)
+    )
+    result = await session.execute(query)
+    models_by_key = {
+        (model.flow_run_id, model.task_key, model.dynamic_key): model
+        for model in result.scalars().unique().all()
+    }
+
+    created_models = []
+    for task_run in task_runs:
+        model = models_by_key[
+            (task_run.flow_run_id, task_run.task_key, task_run.dynamic_key)
+        ]
+        if model.created == now and task_run.state:
+            await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=model.id,
+                state=task_run.state,
+                force=True,
+                orchestration_parameters=orchestration_parameters,
+            )
+        created_models.append(model)
+
+    return created_models
+
+
 @inject_db
 async def update_task_run(
     session: AsyncSession,
@@ -208,6 +308,7 @@ async def read_task_runs(
     offset: int = None,
     limit: int = None,
     sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    cursor: Optional[str] = None,
 ):
     """
     Read task runs.
@@ -221,12 +322,19 @@ async def read_task_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: if provided, read the page of task runs after this cursor using
+            keyset pagination instead of the offset; an empty cursor reads the
+            first page
 
     Returns:
         List[db.TaskRun]: the task runs
     """
 
-    query = select(db.TaskRun).order_by(sort.as_sql_sort(db))
+    query = select(db.TaskRun)
+    if cursor is not None:
+        query = paginate_by_cursor(query, sort.as_sql_sort(db), db.TaskRun.id, cursor)
+    else:
+        query = query.order_by(sort.as_sql_sort(db))
 
     query = await _apply_task_run_filters(
         query,
@@ -237,7 +345,7 @@ async def read_task_runs(
         db=db,
     )
 
-    if offset is not None:
+    if offset is not None and cursor is None:
         query = query.offset(offset)
 
     if limit is not None:
@@ -385,3 +493,41 @@ async def set_task_run_state(
     )
 
     return result
+
+
+async def set_task_run_states(
+    session: sa.orm.Session,
+    task_run_states: List[Tuple[UUID, schemas.states.State]],
+    force: bool = False,
+    task_policy: BaseOrchestrationPolicy = None,
+    orchestration_parameters: dict = None,
+) -> List[OrchestrationResult]:
+    """
+    Creates new orchestrated states for many task runs.
+
+    Each proposed state is orchestrated independently, exactly as in
+    `set_task_run_state`, but all of the transitions share the given session so they
+    can be committed in a single transaction.
+
+    Args:
+        session: a database session
+        task_run_states: pairs of task run ids and the task run state to propose
+        force: if False, orchestration rules will be applied that may alter or prevent
+            the state transitions. If True, orchestration rules are not applied.
+
+    Returns:
+        A list of OrchestrationResult objects, in the order of `task_run_states`
+    """
+    results = []
+    for task_run_id, state in task_run_states:
+        results.append(
+            await set_task_run_state(
+                session=session,
+                task_run_id=task_run_id,
+                state=state,
+                force=force,
+                task_policy=task_policy,
+                orchestration_parameters=orchestration_parameters,
+            )
+        )
+    return results
@@ -231,6 +231,36 @@ async def get_scheduled_flow_runs(
     )
 
 
+@inject_db
+async def read_next_scheduled_start_time(
+    session: AsyncSession,
+    work_queue_ids: List[UUID],
+    scheduled_after: datetime.datetime,
+    db: PrefectDBInterface,
+) -> Optional[datetime.datetime]:
+    """
+    Get the earliest start time of runs scheduled after a given time in a set of work
+    queues.
+
+    Args:
+        session (AsyncSession): a database session
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+        scheduled_after (datetime.datetime): a datetime to filter runs scheduled after
+        db: a database interface
+
+    Returns:
+        Optional[datetime.datetime]: the earliest scheduled start time, if any
+    """
+    result = await session.execute(
+        sa.select(sa.func.min(db.FlowRun.next_scheduled_start_time)).where(
+            db.FlowRun.work_queue_id.in_(work_queue_ids),
+            db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+            db.FlowRun.next_scheduled_start_time > scheduled_after,
+        )
+    )
+    return result.scalar()
+
+
 # -----------------------------------------------------
 # --
 # --
@@ -30,6 +30,10 @@ from prefect.server.orchestration.rules import (
 )
 from prefect.server.schemas import core, filters, states
 from prefect.server.schemas.states import StateType
+from prefect.settings import (
+    PREFECT_API_TASK_RUN_CONCURRENCY_MAX_WAIT_SECONDS,
+    PREFECT_API_TASK_RUN_CONCURRENCY_SLOT_LEASE_SECONDS,
+)
 from prefect.utilities.math import clamped_poisson_interval
 
 
@@ -92,9 +96,11 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
     This rule checks if concurrency limits have been set on the tags associated with a
     TaskRun. If so, a concurrency slot will be secured against each concurrency limit
     before being allowed to transition into a running state. If a concurrency limit has
-    been reached, the client will be instructed to delay the transition for 30 seconds
-    before trying again. If the concurrency limit set on a tag is 0, the transition will
-    be aborted to prevent deadlocks.
+    been reached, the run is queued for a slot and the client will be instructed to
+    delay the transition before trying again. Slots are given to queued runs in the
+    order they were queued, and the delay grows with the run's place in the queue. If
+    the concurrency limit set on a tag is 0, the transition will be aborted to prevent
+    deadlocks.
     """
 
     FROM_STATES = ALL_ORCHESTRATION_STATES
@@ -112,41 +118,42 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
                 context.session, tags=context.run.tags
             )
         )
-        run_limits = {limit.tag: limit for limit in filtered_limits}
-        for tag, cl in run_limits.items():
+        lease_seconds = PREFECT_API_TASK_RUN_CONCURRENCY_SLOT_LEASE_SECONDS.value()
+        max_wait_seconds = PREFECT_API_TASK_RUN_CONCURRENCY_MAX_WAIT_SECONDS.value()
+        for cl in filtered_limits:
             limit = cl.concurrency_limit
             if limit == 0:
                 # limits of 0 will deadlock, and the transition needs to abort
-                for stale_tag in self._applied_limits:
-                    stale_limit = run_limits.get(stale_tag, None)
-                    active_slots = set(stale_limit.active_slots)
-                    active_slots.discard(str(context.run.id))
-                    stale_limit.active_slots = list(active_slots)
+                await self._release_applied_limits(context)
 
                 await self.abort_transition(
                     reason=(
-                        f'The concurrency limit on tag "{tag}" is 0 and will deadlock'
-                        " if the task tries to run again."
+                        f'The concurrency limit on tag "{cl.tag}" is 0 and will'
+                        " deadlock if the task tries to run again."
                     ),
                 )
-            elif len(cl.active_slots) >= limit:
-                # if the limit has already been reached, delay the transition
-                for stale_tag in self._applied_limits:
-                    stale_limit = run_limits.get(stale_tag, None)
-                    active_slots = set(stale_limit.active_slots)
-                    active_slots.discard(str(context.run.id))
-                    stale_limit.active_slots = list(active_slots)
+                break
+
+            queue_position = await concurrency_limits.secure_concurrency_slot(
+                context.session,
+                concurrency_limit_id=cl.id,
+                concurrency_limit=limit,
+                task_run_id=context.run.id,
+                lease_seconds=lease_seconds,
+                wait_seconds=2 * max_wait_seconds,
+            )
+            if queue_position is None:
+                self._applied_limits.append(cl.id)
+            else:
+                # if the limit has already been reached, delay the transition; runs
+                # near the front of the queue are told to check back sooner
+                await self._release_applied_limits(context)
 
                 await self.delay_transition(
-                    30,
-                    f"Concurrency limit for the {tag} tag has been reached",
+                    min(max_wait_seconds, 1 + queue_position // limit),
+                    f"Concurrency limit for the {cl.tag} tag has been reached",
                 )
-            else:
-                # log the TaskRun ID to active_slots
-                self._applied_limits.append(tag)
-                active_slots = set(cl.active_slots)
-                active_slots.add(str(context.run.id))
-                cl.active_slots = list(active_slots)
+                break
 
     async def cleanup(
         self,
@@ -154,13 +161,16 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
         validated_state: Optional[states.State],
         context: OrchestrationContext,
     ) -> None:
-        for tag in self._applied_limits:
-            cl = await concurrency_limits.read_concurrency_limit_by_tag(
-                context.session, tag
+        await self._release_applied_limits(context)
+
+    async def _release_applied_limits(self, context: OrchestrationContext) -> None:
+        if self._applied_limits:
+            await concurrency_limits.release_concurrency_slots(
+                context.session,
+                task_run_id=context.run.id,
+                concurrency_limit_ids=self._applied_limits,
             )
-            active_slots = set(cl.active_slots)
-            active_slots.discard(str(context.run.id))
-            cl.active_slots = list(active_slots)
+            self._applied_limits = []
 
 
 class ReleaseTaskConcurrencySlots(BaseUniversalTransform):
@@ -180,16 +190,9 @@ class ReleaseTaskConcurrencySlots(BaseUniversalTransform):
             states.StateType.RUNNING,
             states.StateType.CANCELLING,
         ]:
-            filtered_limits = (
-                await concurrency_limits.filter_concurrency_limits_for_orchestration(
-                    context.session, tags=context.run.tags
-                )
+            await concurrency_limits.release_concurrency_slots(
+                context.session, task_run_id=context.run.id
             )
-            run_limits = {limit.tag: limit for limit in filtered_limits}
-            for tag, cl in run_limits.items():
-                active_slots = set(cl.active_slots)
-                active_slots.discard(str(context.run.id))
-                cl.active_slots = list(active_slots)
 
 
 class CacheInsertion(BaseOrchestrationRule):
@@ -1,6 +1,7 @@
 """
 Reduced schemas for accepting API actions.
 """
+
 import warnings
 from copy import copy, deepcopy
 from typing import Any, Dict, Generator, List, Optional, Union
@@ -328,6 +329,13 @@ class TaskRunUpdate(ActionBaseModel):
     name: str = FieldFrom(schemas.core.TaskRun)
 
 
+class TaskRunSetState(ActionBaseModel):
+    """Data used by the Prefect REST API to set the state of a task run in bulk"""
+
+    task_run_id: UUID = Field(default=..., description="The task run id")
+    state: StateCreate = Field(default=..., description="The intended state.")
+
+
 @copy_model_fields
 class FlowRunCreate(ActionBaseModel):
     """Data used by the Prefect REST API to create a flow run."""
@@ -3,6 +3,7 @@ Schedule schemas
 """
 
 import datetime
+import functools
 from typing import Any, Generator, List, Optional, Tuple, Union
 
 import dateutil
@@ -17,6 +18,8 @@ from prefect.server.utilities.schemas import DateTimeTZ, PrefectBaseModel
 MAX_ITERATIONS = 1000
 # approx. 1 years worth of RDATEs + buffer
 MAX_RRULE_LENGTH = 6500
+# number of parsed rrules kept so they are not parsed again by each scheduling loop
+RRULE_CACHE_SIZE = 256
 
 
 def _prepare_scheduling_start_and_end(
@@ -161,6 +164,12 @@ class IntervalSchedule(PrefectBaseModel):
         anchor_tz = self.anchor_date.in_tz(self.timezone)
         start, end = _prepare_scheduling_start_and_end(start, end, self.timezone)
 
+        if self.timezone == "UTC":
+            # without daylight saving time to account for, every date is a whole
+            # number of intervals after the anchor date and can be computed directly
+            yield from self._get_fixed_dates_generator(n=n, start=start, end=end)
+            return
+
         # compute the offset between the anchor date and the start date to jump to the
         # next date
         offset = (start - anchor_tz).total_seconds() / self.interval.total_seconds()
@@ -201,6 +210,41 @@ class IntervalSchedule(PrefectBaseModel):
 
             next_date = next_date.add(days=interval_days, seconds=interval_seconds)
 
+    def _get_fixed_dates_generator(
+        self,
+        n: int,
+        start: pendulum.DateTime,
+        end: Optional[pendulum.DateTime],
+    ) -> Generator[pendulum.DateTime, None, None]:
+        """
+        Generates dates for schedules in UTC, computing each date as an offset from
+        the anchor date rather than stepping through each interval.
+        """
+        anchor = self.anchor_date.in_tz("UTC")
+
+        # the index of the first date on or after the start date; pendulum periods
+        # do not support floor division so the difference is converted first
+        elapsed = datetime.timedelta(seconds=(start - anchor).total_seconds())
+        first_index = -(-elapsed // self.interval)
+
+        counter = 0
+        while True:
+            next_date = (anchor + self.interval * (first_index + counter)).in_tz(
+                self.timezone
+            )
+
+            # if the end date was exceeded, exit
+            if end and next_date > end:
+                break
+
+            yield next_date
+
+            # if enough dates have been collected or enough attempts were made, exit
+            if counter + 1 >= n or counter > MAX_ITERATIONS:
+                break
+
+            counter += 1
+
 
 class CronSchedule(PrefectBaseModel):
     """
@@ -454,7 +498,14 @@ class RRuleSchedule(PrefectBaseModel):
         Since rrule doesn't properly serialize/deserialize timezones, we localize dates
         here
         """
-        rrule = dateutil.rrule.rrulestr(self.rrule, cache=True)
+        return self._to_rrule(cache=True)
+
+    def _to_rrule(self, cache: bool) -> dateutil.rrule.rrule:
+        """
+        Parses and localizes the rrule. If `cache` is set, the rrule keeps every
+        occurrence it generates.
+        """
+        rrule = dateutil.rrule.rrulestr(self.rrule, cache=cache)
         timezone = dateutil.tz.gettz(self.timezone)
         if isinstance(rrule, dateutil.rrule.rrule):
             kwargs = dict(dtstart=rrule._dtstart.replace(tzinfo=timezone))
@@ -570,7 +621,8 @@ class RRuleSchedule(PrefectBaseModel):
 
         # pass count = None to account for discrepancies with duplicates around DST
         # boundaries
-        for next_date in self.to_rrule().xafter(start, count=None, inc=True):
+        rrule = _get_cached_rrule(self.rrule, self.timezone)
+        for next_date in rrule.xafter(start, count=None, inc=True):
             next_date = pendulum.instance(next_date).in_tz(self.timezone)
 
             # if the end date was exceeded, exit
@@ -589,4 +641,17 @@ class RRuleSchedule(PrefectBaseModel):
             counter += 1
 
 
+@functools.lru_cache(maxsize=RRULE_CACHE_SIZE)
+def _get_cached_rrule(rrule: str, timezone: str) -> dateutil.rrule.rrule:
+    """
+    Returns a localized rrule that is shared between calls so that the rrule is not
+    parsed again by each scheduling loop.
+
+    The rrule does not cache its occurrences, since iteration always begins at its
+    dtstart and a long-lived cache would grow with every date generated. The returned
+    object must not be modified.
+    """
+    return RRuleSchedule(rrule=rrule, timezone=timezone)._to_rrule(cache=False)
+
+
 SCHEDULE_TYPES = Union[IntervalSchedule, CronSchedule, RRuleSchedule]
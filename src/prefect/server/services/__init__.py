@@ -1,6 +1,9 @@
 import prefect.server.services.cancellation_cleanup
+import prefect.server.services.claim_expirations
 import prefect.server.services.flow_run_notifications
 import prefect.server.services.late_runs
+import prefect.server.services.log_partitions
 import prefect.server.services.pause_expirations
+import prefect.server.services.retention
 import prefect.server.services.scheduler
 import prefect.server.services.telemetry
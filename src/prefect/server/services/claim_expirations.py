@@ -0,0 +1,103 @@
+"""
+The RescheduleExpiredClaims service. Responsible for rescheduling flow runs claimed by a
+worker or agent that never reported starting their infrastructure.
+"""
+
+import asyncio
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas import states
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_LOOP_SECONDS
+
+
+class RescheduleExpiredClaims(LoopService):
+    """
+    A loop service that returns flow runs with expired claims to a Scheduled state.
+
+    Workers and agents can claim flow runs when they poll for them, which moves the
+    flow runs to a Pending state with a claim expiration. If the claimant crashes
+    before reporting the flow run's infrastructure, the flow run would otherwise be
+    stuck in a Pending state.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        # query for this many runs at once
+        self.batch_size = 200
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Reschedule flow runs by:
+
+        - Querying for Pending flow runs without an infrastructure pid
+        - For any runs with a claim past its expiration, setting the flow run state to
+          a new `Scheduled` state
+        """
+        last_id = None
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                query = (
+                    sa.select(db.FlowRun)
+                    .where(
+                        db.FlowRun.state_type == states.StateType.PENDING,
+                        db.FlowRun.infrastructure_pid.is_(None),
+                    )
+                    .order_by(db.FlowRun.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                if last_id is not None:
+                    query = query.where(db.FlowRun.id > last_id)
+
+                result = await session.execute(query)
+                runs = result.scalars().unique().all()
+
+                for run in runs:
+                    await self._reschedule_flow_run(session=session, flow_run=run)
+
+            if len(runs) < self.batch_size:
+                break
+            last_id = runs[-1].id
+
+        self.logger.info("Finished monitoring for expired claims.")
+
+    async def _reschedule_flow_run(
+        self, session: AsyncSession, flow_run: PrefectDBInterface.FlowRun
+    ) -> None:
+        """
+        Reschedule a flow run if its claim has expired.
+
+        Pass-through method for overrides.
+        """
+        state_details = flow_run.state.state_details
+        now = pendulum.now("UTC")
+        if state_details.claim_expiration and state_details.claim_expiration < now:
+            await models.flow_runs.set_flow_run_state(
+                session=session,
+                flow_run_id=flow_run.id,
+                state=states.Scheduled(
+                    scheduled_time=now,
+                    message=(
+                        f"Claim by {state_details.claimed_by!r} expired before its"
+                        " infrastructure started."
+                    ),
+                ),
+                force=True,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(RescheduleExpiredClaims().start())
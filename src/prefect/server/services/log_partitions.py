@@ -0,0 +1,111 @@
+"""
+The LogPartitions service. Responsible for maintaining the partitions of the log table
+when it has been partitioned, either by the migration that adds `timestamp` to its
+primary key when `PREFECT_API_DATABASE_PARTITION_LOGS` is set or with
+`prefect server database partition-logs`.
+
+Partitions are created ahead of time for the number of days configured by
+`PREFECT_API_SERVICES_LOG_PARTITIONS_PREMAKE`. If `PREFECT_API_LOG_RETENTION_PERIOD` is
+set, partitions with expired logs are dropped.
+"""
+
+import asyncio
+
+import pendulum
+import sqlalchemy as sa
+
+from prefect.server.database import partitions
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_API_LOG_RETENTION_PERIOD,
+    PREFECT_API_SERVICES_LOG_PARTITIONS_LOOP_SECONDS,
+    PREFECT_API_SERVICES_LOG_PARTITIONS_PREMAKE,
+)
+
+
+class LogPartitions(LoopService):
+    """
+    A loop service that creates partitions of the log table for upcoming days and
+    drops partitions of logs older than the retention period.
+
+    Dropping whole partitions avoids the table bloat caused by deleting logs row by
+    row. Logs in the default partition, which only contains logs outside the range of
+    the other partitions, are deleted in batches instead.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_LOG_PARTITIONS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+        self.premake = PREFECT_API_SERVICES_LOG_PARTITIONS_PREMAKE.value()
+        self.retention_period = PREFECT_API_LOG_RETENTION_PERIOD.value()
+
+        # delete this many expired logs from the default partition at once
+        self.batch_size = 10_000
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Maintain the partitions of the log table by:
+
+        - Creating partitions for the current day and upcoming days
+        - Dropping partitions that only contain logs older than the retention period
+        - Deleting logs older than the retention period from the default partition
+        """
+        table: sa.Table = db.Log.__table__
+
+        async with db.session_context() as session:
+            if not await partitions.is_partitioned(session, db, table):
+                self.logger.debug("The log table is not partitioned.")
+                return
+            existing = await partitions.read_partitions(session, table)
+
+        now = pendulum.now("UTC")
+
+        for partition in partitions.partitions_to_create(
+            table.name, existing, now=now, premake=self.premake
+        ):
+            async with db.session_context(begin_transaction=True) as session:
+                moved = await partitions.create_partition(session, table, partition)
+            self.logger.info(
+                f"Created log partition {partition.name!r}, moved {moved} logs from"
+                " the default partition."
+            )
+
+        if self.retention_period is None:
+            return
+
+        for partition in partitions.partitions_to_drop(
+            existing, now=now, retention=self.retention_period
+        ):
+            async with db.session_context(begin_transaction=True) as session:
+                await partitions.drop_partition(session, table, partition)
+            self.logger.info(f"Dropped expired log partition {partition.name!r}.")
+
+        deleted = 0
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                result = await session.execute(
+                    sa.text(
+                        f"DELETE FROM {table.name}_default WHERE ctid IN (SELECT ctid"
+                        f' FROM {table.name}_default WHERE "timestamp" < :expired'
+                        " LIMIT :limit)"
+                    ),
+                    {"expired": now - self.retention_period, "limit": self.batch_size},
+                )
+            deleted += result.rowcount
+            if result.rowcount < self.batch_size:
+                break
+
+        if deleted:
+            self.logger.info(
+                f"Deleted {deleted} expired logs from the default log partition."
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(LogPartitions().start())
@@ -0,0 +1,212 @@
+"""
+The DataRetention service. Responsible for deleting flow runs and logs older than their
+retention periods.
+
+The retention periods can be configured by changing
+`PREFECT_API_FLOW_RUN_RETENTION_PERIOD` and `PREFECT_API_LOG_RETENTION_PERIOD`.
+"""
+
+import asyncio
+from collections import Counter
+from typing import List, Type
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.models as models
+from prefect.server.database import partitions
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas import states
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_API_FLOW_RUN_RETENTION_PERIOD,
+    PREFECT_API_LOG_RETENTION_PERIOD,
+    PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED,
+    PREFECT_API_SERVICES_RETENTION_BATCH_DELAY_SECONDS,
+    PREFECT_API_SERVICES_RETENTION_BATCH_SIZE,
+    PREFECT_API_SERVICES_RETENTION_CHUNK_SIZE,
+    PREFECT_API_SERVICES_RETENTION_LOOP_SECONDS,
+)
+
+
+class DataRetention(LoopService):
+    """
+    A loop service that deletes expired data.
+
+    Flow runs that finished before their retention period are deleted along with their
+    task runs, states, logs and artifacts. Logs older than their retention period are
+    deleted unless the log table is partitioned and the `LogPartitions` service is
+    enabled, in which case that service drops them instead.
+
+    Data is deleted in bounded chunks, each in its own transaction, with a delay
+    between them so the service does not compete with API traffic. The dependents of
+    a batch of flow runs are deleted before the flow runs themselves, so a batch
+    interrupted part way through is finished on the next run.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_RETENTION_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+        self.flow_run_retention_period = PREFECT_API_FLOW_RUN_RETENTION_PERIOD.value()
+        self.log_retention_period = PREFECT_API_LOG_RETENTION_PERIOD.value()
+
+        # delete this many flow runs in each batch
+        self.batch_size = PREFECT_API_SERVICES_RETENTION_BATCH_SIZE.value()
+        # delete this many logs, task runs or artifacts in each transaction
+        self.chunk_size = PREFECT_API_SERVICES_RETENTION_CHUNK_SIZE.value()
+        self.batch_delay_seconds = (
+            PREFECT_API_SERVICES_RETENTION_BATCH_DELAY_SECONDS.value()
+        )
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Delete expired data by:
+
+        - Deleting batches of flow runs in a terminal state that ended before the
+          flow run retention period, along with their dependents
+        - Deleting chunks of logs with timestamps before the log retention period
+        """
+        deleted = Counter()
+        now = pendulum.now("UTC")
+
+        if self.flow_run_retention_period is not None:
+            ended_before = now - self.flow_run_retention_period
+            while True:
+                async with db.session_context() as session:
+                    flow_run_ids = await self._get_expired_flow_run_ids(
+                        session=session, db=db, ended_before=ended_before
+                    )
+                deleted += await self._delete_flow_runs(
+                    db=db, flow_run_ids=flow_run_ids
+                )
+
+                if len(flow_run_ids) < self.batch_size:
+                    break
+                await asyncio.sleep(self.batch_delay_seconds)
+
+        if self.log_retention_period is not None:
+            # Expired partitions of a partitioned log table are dropped by the
+            # `LogPartitions` service, unless it is disabled
+            async with db.session_context() as session:
+                logs_are_dropped = (
+                    PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED.value()
+                    and (await partitions.is_partitioned(session, db, db.Log.__table__))
+                )
+
+            if not logs_are_dropped:
+                deleted["logs"] += await self._delete_in_chunks(
+                    db, db.Log, db.Log.timestamp < now - self.log_retention_period
+                )
+
+        self.logger.info(
+            "Finished deleting expired data: "
+            + ", ".join(
+                f"{deleted[name]} {name.replace('_', ' ')}"
+                for name in ["flow_runs", "task_runs", "artifacts", "logs"]
+            )
+            + "."
+        )
+
+    async def _get_expired_flow_run_ids(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        ended_before: pendulum.DateTime,
+    ) -> List[UUID]:
+        result = await session.execute(
+            sa.select(db.FlowRun.id)
+            .where(
+                db.FlowRun.state_type.in_(states.TERMINAL_STATES),
+                db.FlowRun.end_time < ended_before,
+            )
+            .limit(self.batch_size)
+        )
+        return result.scalars().all()
+
+    async def _delete_flow_runs(
+        self, db: PrefectDBInterface, flow_run_ids: List[UUID]
+    ) -> Counter:
+        """
+        Delete flow runs and their dependents. States are deleted by cascade.
+        """
+        deleted = Counter()
+        if not flow_run_ids:
+            return deleted
+
+        # Artifacts are deleted one at a time to keep their collections pointed at
+        # the latest remaining version
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                artifact_ids = (
+                    (
+                        await session.execute(
+                            sa.select(db.Artifact.id)
+                            .where(db.Artifact.flow_run_id.in_(flow_run_ids))
+                            .limit(self.chunk_size)
+                        )
+                    )
+                    .scalars()
+                    .all()
+                )
+                for artifact_id in artifact_ids:
+                    if await models.artifacts.delete_artifact(
+                        session=session, artifact_id=artifact_id
+                    ):
+                        deleted["artifacts"] += 1
+
+            if len(artifact_ids) < self.chunk_size:
+                break
+            await asyncio.sleep(self.batch_delay_seconds)
+
+        deleted["logs"] += await self._delete_in_chunks(
+            db, db.Log, db.Log.flow_run_id.in_(flow_run_ids)
+        )
+        deleted["task_runs"] += await self._delete_in_chunks(
+            db, db.TaskRun, db.TaskRun.flow_run_id.in_(flow_run_ids)
+        )
+
+        async with db.session_context(begin_transaction=True) as session:
+            result = await session.execute(
+                sa.delete(db.FlowRun)
+                .where(db.FlowRun.id.in_(flow_run_ids))
+                .execution_options(synchronize_session=False)
+            )
+        deleted["flow_runs"] += result.rowcount
+
+        return deleted
+
+    async def _delete_in_chunks(
+        self, db: PrefectDBInterface, model: Type, where: sa.sql.ColumnElement
+    ) -> int:
+        """
+        Delete the rows of a model matching a condition, at most `chunk_size` rows per
+        transaction. Returns the number of rows deleted.
+        """
+        deleted = 0
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                result = await session.execute(
+                    sa.delete(model)
+                    .where(
+                        model.id.in_(
+                            sa.select(model.id).where(where).limit(self.chunk_size)
+                        )
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            deleted += result.rowcount
+
+            if result.rowcount < self.chunk_size:
+                return deleted
+            await asyncio.sleep(self.batch_delay_seconds)
+
+
+if __name__ == "__main__":
+    asyncio.run(DataRetention().start())
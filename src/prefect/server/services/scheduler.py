@@ -2,8 +2,10 @@
 The Scheduler service.
 """
 import asyncio
+import dataclasses
 import datetime
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional
 from uuid import UUID
 
 import pendulum
@@ -30,6 +32,19 @@ class TryAgain(Exception):
     """Internal control-flow exception used to retry the Scheduler's main loop"""
 
 
+@dataclasses.dataclass
+class SchedulerLoopMetrics:
+    """Statistics about a single loop of a scheduler service"""
+
+    deployments: int
+    inserted_runs: int
+    seconds: float
+
+    @property
+    def deployments_per_second(self) -> float:
+        return self.deployments / self.seconds if self.seconds else 0.0
+
+
 class Scheduler(LoopService):
     """
     A loop service that schedules flow runs from deployments.
@@ -62,6 +77,7 @@ class Scheduler(LoopService):
         self.insert_batch_size = (
             PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
         )
+        self.last_loop_metrics: Optional[SchedulerLoopMetrics] = None
 
     @inject_db
     async def run_once(self, db: PrefectDBInterface):
@@ -76,6 +92,8 @@ class Scheduler(LoopService):
         loop.
         """
         total_inserted_runs = 0
+        total_deployments = 0
+        start_time = time.monotonic()
 
         last_id = None
         while True:
@@ -88,6 +106,7 @@ class Scheduler(LoopService):
 
                 result = await session.execute(query)
                 deployment_ids = result.scalars().unique().all()
+                total_deployments += len(deployment_ids)
 
                 # collect runs across all deployments
                 try:
@@ -112,7 +131,18 @@ class Scheduler(LoopService):
                 # record the last deployment ID
                 last_id = deployment_ids[-1]
 
-        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+        elapsed = time.monotonic() - start_time
+        self.last_loop_metrics = SchedulerLoopMetrics(
+            deployments=total_deployments,
+            inserted_runs=total_inserted_runs,
+            seconds=elapsed,
+        )
+        self.logger.info(
+            f"Scheduled {total_inserted_runs} runs for {total_deployments} deployments"
+            f" in {elapsed:.2f} seconds"
+            f" ({self.last_loop_metrics.deployments_per_second:.1f} deployments per"
+            " second)."
+        )
 
     @inject_db
     def _get_select_deployments_to_schedule_query(self, db: PrefectDBInterface):
@@ -169,97 +199,59 @@ class Scheduler(LoopService):
         session: sa.orm.Session,
         deployment_ids: List[UUID],
     ) -> List[Dict]:
+        """
+        Generates the runs for a page of deployments. The deployments and their
+        existing scheduled runs are read with a single query each; schedules are
+        then evaluated in memory.
+        """
         runs_to_insert = []
-        for deployment_id in deployment_ids:
-            now = pendulum.now("UTC")
+        now = pendulum.now("UTC")
+
+        try:
+            deployments = await models.deployments._read_deployments_to_schedule(
+                session=session, deployment_ids=deployment_ids, start_time=now
+            )
+        finally:
+            connection = await session.connection()
+            if connection.invalidated:
+                # If reading the deployments failed with the kind of database error
+                # that causes the underlying transaction to rollback and the
+                # connection to become invalidated, rollback this session.  Errors
+                # that may cause this are connection drops, database restarts, and
+                # things of the sort.
+                #
+                # This rollback _does not rollback a transaction_, since that has
+                # actually already happened due to the error above.  It brings the
+                # Python session in sync with underlying connection so that when we
+                # exec the outer with block, the context manager will not attempt to
+                # commit the session.
+                #
+                # Then, raise TryAgain to break out of these nested loops, back to
+                # the outer loop, where we'll begin a new transaction with
+                # session.begin() in the next loop iteration.
+                await session.rollback()
+                raise TryAgain()
+
+        for deployment, scheduled_times in deployments:
             # guard against erroneously configured schedules
             try:
                 runs_to_insert.extend(
-                    await self._generate_scheduled_flow_runs(
-                        session=session,
-                        deployment_id=deployment_id,
+                    models.deployments._generate_scheduled_flow_runs_for_deployment(
+                        deployment=deployment,
                         start_time=now,
                         end_time=now + self.max_scheduled_time,
                         min_time=self.min_scheduled_time,
                         min_runs=self.min_runs,
                         max_runs=self.max_runs,
+                        scheduled_times=scheduled_times,
                     )
                 )
             except Exception:
                 self.logger.exception(
-                    f"Error scheduling deployment {deployment_id!r}.",
+                    f"Error scheduling deployment {deployment.id!r}.",
                 )
-            finally:
-                connection = await session.connection()
-                if connection.invalidated:
-                    # If the error we handled above was the kind of database error that
-                    # causes underlying transaction to rollback and the connection to
-                    # become invalidated, rollback this session.  Errors that may cause
-                    # this are connection drops, database restarts, and things of the
-                    # sort.
-                    #
-                    # This rollback _does not rollback a transaction_, since that has
-                    # actually already happened due to the error above.  It brings the
-                    # Python session in sync with underlying connection so that when we
-                    # exec the outer with block, the context manager will not attempt to
-                    # commit the session.
-                    #
-                    # Then, raise TryAgain to break out of these nested loops, back to
-                    # the outer loop, where we'll begin a new transaction with
-                    # session.begin() in the next loop iteration.
-                    await session.rollback()
-                    raise TryAgain()
         return runs_to_insert
 
-    @inject_db
-    async def _generate_scheduled_flow_runs(
-        self,
-        session: sa.orm.Session,
-        deployment_id: UUID,
-        start_time: datetime.datetime,
-        end_time: datetime.datetime,
-        min_time: datetime.timedelta,
-        min_runs: int,
-        max_runs: int,
-        db: PrefectDBInterface,
-    ) -> List[Dict]:
-        """
-        Given a `deployment_id` and schedule params, generates a list of flow run
-        objects and associated scheduled states that represent scheduled flow runs.
-
-        Pass-through method for overrides.
-
-
-        Args:
-            session: a database session
-            deployment_id: the id of the deployment to schedule
-            start_time: the time from which to start scheduling runs
-            end_time: runs will be scheduled until at most this time
-            min_time: runs will be scheduled until at least this far in the future
-            min_runs: a minimum amount of runs to schedule
-            max_runs: a maximum amount of runs to schedule
-
-        This function will generate the minimum number of runs that satisfy the min
-        and max times, and the min and max counts. Specifically, the following order
-        will be respected:
-
-            - Runs will be generated starting on or after the `start_time`
-            - No more than `max_runs` runs will be generated
-            - No runs will be generated after `end_time` is reached
-            - At least `min_runs` runs will be generated
-            - Runs will be generated until at least `start_time + min_time` is reached
-
-        """
-        return await models.deployments._generate_scheduled_flow_runs(
-            session=session,
-            deployment_id=deployment_id,
-            start_time=start_time,
-            end_time=end_time,
-            min_time=min_time,
-            min_runs=min_runs,
-            max_runs=max_runs,
-        )
-
     @inject_db
     async def _insert_scheduled_flow_runs(
         self,
@@ -269,8 +261,8 @@ class Scheduler(LoopService):
     ) -> List[UUID]:
         """
         Given a list of flow runs to schedule, as generated by
-        `_generate_scheduled_flow_runs`, inserts them into the database. Note this is a
-        separate method to facilitate batch operations on many scheduled runs.
+        `_collect_flow_runs`, inserts them into the database. Note this is a separate
+        method to facilitate batch operations on many scheduled runs.
 
         Pass-through method for overrides.
         """
@@ -0,0 +1,77 @@
+"""
+Utilities for long polling work queues for scheduled flow runs.
+
+Requests for scheduled flow runs can wait for flow runs to become available instead of
+returning immediately. Changes that may make flow runs available in a work queue, such
+as scheduling a flow run or finishing one that occupied a concurrency slot, wake the
+requests waiting on that work queue once they are committed.
+
+Waiting requests are tracked in memory, so only requests handled by the same server
+process are woken. Requests handled by other processes wait until their timeout.
+"""
+import asyncio
+import contextlib
+from typing import Dict, Iterable, Iterator, Set, Tuple
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# the work queue ids of changes waiting for their transaction to be committed
+_PENDING_WAKEUPS_KEY = "prefect_work_queue_wakeups"
+
+# the event loop and work queue ids of each waiting request
+_waiters: Dict[asyncio.Event, Tuple[asyncio.AbstractEventLoop, Set[UUID]]] = {}
+
+
+@contextlib.contextmanager
+def work_queue_waiter(work_queue_ids: Iterable[UUID]) -> Iterator[asyncio.Event]:
+    """
+    Register an event that is set when any of the given work queues are woken.
+
+    The waiter should be registered before reading flow runs from the work queues, so
+    that changes committed after the read are not missed.
+    """
+    event = asyncio.Event()
+    _waiters[event] = (asyncio.get_running_loop(), set(work_queue_ids))
+    try:
+        yield event
+    finally:
+        _waiters.pop(event, None)
+
+
+def wake_work_queues(work_queue_ids: Iterable[UUID]) -> None:
+    """
+    Wake any requests waiting for flow runs in the given work queues.
+    """
+    work_queue_ids = set(work_queue_ids)
+    for event, (loop, waiting_for) in list(_waiters.items()):
+        if waiting_for & work_queue_ids and not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
+
+
+def wake_work_queues_after_commit(
+    session: AsyncSession, work_queue_ids: Iterable[UUID]
+) -> None:
+    """
+    Wake any requests waiting for flow runs in the given work queues once the
+    session's transaction is committed. Nothing is woken if it is rolled back.
+    """
+    pending = session.info.get(_PENDING_WAKEUPS_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_WAKEUPS_KEY] = set()
+        sync_session = session.sync_session
+        if not sa.event.contains(sync_session, "after_commit", _after_commit):
+            sa.event.listen(sync_session, "after_commit", _after_commit)
+            sa.event.listen(sync_session, "after_rollback", _after_rollback)
+    pending.update(work_queue_id for work_queue_id in work_queue_ids if work_queue_id)
+
+
+def _after_commit(session: sa.orm.Session) -> None:
+    work_queue_ids = session.info.pop(_PENDING_WAKEUPS_KEY, None)
+    if work_queue_ids:
+        wake_work_queues(work_queue_ids)
+
+
+def _after_rollback(session: sa.orm.Session) -> None:
+    session.info.pop(_PENDING_WAKEUPS_KEY, None)
@@ -0,0 +1,260 @@
+"""
+Utilities for keyset pagination of query results.
+
+Offset pagination requires the database to read and discard every row before the
+offset, so reading page N costs O(N). Keyset pagination instead continues from the
+sort key and id of the last row of the previous page, which can be found with an index.
+
+Pages are requested with an opaque cursor. An empty cursor requests the first page and
+the cursor for the next page is derived from the last object of each page and returned
+in the `x-prefect-next-cursor` response header.
+"""
+import base64
+import datetime
+import json
+from typing import Any, AsyncGenerator, Awaitable, Callable, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+import pendulum
+import sqlalchemy as sa
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.functions import coalesce
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from prefect.server.utilities.database import UUID as UUIDTypeDecorator
+from prefect.server.utilities.database import Timestamp
+
+NEXT_CURSOR_HEADER = "x-prefect-next-cursor"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _sort_expression(sort_clause: sa.sql.ColumnElement) -> Tuple[Any, bool]:
+    """
+    Split a sort clause, such as `Log.timestamp.desc()`, into its expression and
+    whether it is descending.
+    """
+    return sort_clause.element, sort_clause.modifier is operators.desc_op
+
+
+def _is_nullable(expression: sa.sql.ColumnElement) -> bool:
+    return getattr(expression, "nullable", True)
+
+
+class _nullable_sort_key(sa.sql.ColumnElement):
+    """
+    Orders by a nullable sort key, with nulls ordered as if they were greater than every
+    other value: last when ascending and first when descending.
+
+    This is the default ordering of nulls on Postgres, so indexes on the sort key can
+    serve the query. SQLite orders nulls the other way around, so its rows are
+    explicitly ordered by whether the key is null first.
+    """
+
+    inherit_cache = True
+    _traverse_internals = [
+        ("sort_key", InternalTraversal.dp_clauseelement),
+        ("descending", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, sort_key: sa.sql.ColumnElement, descending: bool):
+        self.sort_key = sort_key
+        self.descending = descending
+
+
+@compiles(_nullable_sort_key, "postgresql")
+@compiles(_nullable_sort_key)
+def _nullable_sort_key_postgresql(element, compiler, **kwargs):
+    if element.descending:
+        clause = element.sort_key.desc().nullsfirst()
+    else:
+        clause = element.sort_key.asc().nullslast()
+    return compiler.process(clause, **kwargs)
+
+
+@compiles(_nullable_sort_key, "sqlite")
+def _nullable_sort_key_sqlite(element, compiler, **kwargs):
+    is_null = sa.case((element.sort_key.is_(None), 1), else_=0)
+    if element.descending:
+        clauses = [is_null.desc(), element.sort_key.desc()]
+    else:
+        clauses = [is_null.asc(), element.sort_key.asc()]
+    return ", ".join(compiler.process(clause, **kwargs) for clause in clauses)
+
+
+def keyset_order_by(
+    sort_clause: sa.sql.ColumnElement, id_column: sa.Column
+) -> List[sa.sql.ColumnElement]:
+    """
+    The ordering used for keyset pagination by a sort clause.
+
+    Rows with equal sort keys are ordered by id. Null sort keys are ordered as if they
+    were greater than every other value, so they are last when ascending and first
+    when descending, on every database.
+    """
+    expression, descending = _sort_expression(sort_clause)
+    id_clause = id_column.desc() if descending else id_column.asc()
+    if _is_nullable(expression):
+        return [_nullable_sort_key(expression, descending), id_clause]
+    return [sort_clause, id_clause]
+
+
+def encode_cursor(value: Any, id: UUID) -> str:
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    elif isinstance(value, UUID):
+        value = str(value)
+    payload = json.dumps([value, str(id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(
+    cursor: str, sort_clause: sa.sql.ColumnElement
+) -> Tuple[Optional[Any], UUID]:
+    """
+    Decode a cursor into the sort key and id of the last object of the previous page.
+
+    Raises:
+        ValueError: if the cursor is not valid
+    """
+    try:
+        value, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        expression, _ = _sort_expression(sort_clause)
+        if value is not None and isinstance(expression.type, Timestamp):
+            value = pendulum.parse(value)
+        elif value is not None and isinstance(expression.type, UUIDTypeDecorator):
+            value = UUID(value)
+        return value, UUID(id)
+    except Exception as exc:
+        raise ValueError(f"Invalid cursor {cursor!r}.") from exc
+
+
+def paginate_by_cursor(
+    query: sa.sql.Select,
+    sort_clause: sa.sql.ColumnElement,
+    id_column: sa.Column,
+    cursor: str,
+) -> sa.sql.Select:
+    """
+    Order a query for keyset pagination and select the rows after the cursor.
+
+    Raises:
+        ValueError: if the cursor is not valid
+    """
+    query = query.order_by(*keyset_order_by(sort_clause, id_column))
+    if not cursor:
+        return query
+
+    value, last_id = decode_cursor(cursor, sort_clause)
+    expression, descending = _sort_expression(sort_clause)
+    nullable = _is_nullable(expression)
+
+    def after(left, right):
+        return left < right if descending else left > right
+
+    if value is None:
+        # Rows with null sort keys are ordered by id, after every other row when
+        # ascending and before them when descending
+        condition = sa.and_(expression.is_(None), after(id_column, last_id))
+        if descending:
+            condition = sa.or_(condition, expression.is_not(None))
+        return query.where(condition)
+
+    # A row value comparison can be served by an index on the sort key
+    condition = after(
+        sa.tuple_(expression, id_column),
+        sa.tuple_(
+            sa.literal(value, type_=expression.type),
+            sa.literal(last_id, type_=id_column.type),
+        ),
+    )
+    if nullable and not descending:
+        condition = sa.or_(condition, expression.is_(None))
+    return query.where(condition)
+
+
+def _evaluate(expression: sa.sql.ColumnElement, obj: Any) -> Any:
+    """
+    Evaluate a sort expression for an ORM object.
+    """
+    if isinstance(expression, coalesce):
+        for clause in expression.clauses:
+            value = _evaluate(clause, obj)
+            if value is not None:
+                return value
+        return None
+    return getattr(obj, expression.key)
+
+
+def get_next_cursor(
+    sort_clause: sa.sql.ColumnElement, objects: List[Any], limit: Optional[int]
+) -> Optional[str]:
+    """
+    Get the cursor for the page after a page of ORM objects. Returns `None` if the
+    page is not full, since there are no more objects to read.
+    """
+    if not objects or limit is None or len(objects) < limit:
+        return None
+    expression, _ = _sort_expression(sort_clause)
+    last = objects[-1]
+    return encode_cursor(_evaluate(expression, last), last.id)
+
+
+def accepts_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _stream_ndjson(
+    read_page: Callable[[str], Awaitable[Tuple[List[dict], Optional[str]]]],
+    items: List[dict],
+    next_cursor: Optional[str],
+) -> AsyncGenerator[bytes, None]:
+    while True:
+        if items:
+            yield b"".join(orjson.dumps(item) + b"\n" for item in items)
+        if next_cursor is None:
+            return
+        items, next_cursor = await read_page(next_cursor)
+
+
+async def cursor_paginated_response(
+    request: Request,
+    read_page: Callable[[str], Awaitable[Tuple[List[dict], Optional[str]]]],
+    cursor: str = "",
+) -> Response:
+    """
+    Respond with the page of objects after a cursor.
+
+    If the request accepts newline-delimited JSON, every page from the cursor onwards
+    is streamed instead, so clients can read all matching objects in one request
+    without the server holding them in memory.
+
+    Args:
+        request: the request being responded to
+        read_page: a callable that reads the page of objects for a cursor and returns
+            them encoded as JSON compatible dictionaries, along with the cursor for
+            the next page, if any
+        cursor: the cursor of the first page to respond with
+
+    Returns:
+        a JSON response with the cursor for the next page in the
+        `x-prefect-next-cursor` header, or a streaming newline-delimited JSON response
+    """
+    try:
+        items, next_cursor = await read_page(cursor)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    if accepts_ndjson(request):
+        return StreamingResponse(
+            _stream_ndjson(read_page, items, next_cursor),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    response = ORJSONResponse(content=items)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
@@ -2,12 +2,16 @@
 Utilities for the Prefect REST API server.
 """
 import functools
+import hashlib
 import inspect
+import json
 from contextlib import AsyncExitStack, asynccontextmanager
-from typing import Any, Callable, Coroutine, Iterable, Set, get_type_hints
+from typing import Any, Callable, Coroutine, Iterable, Set, Union, get_type_hints
 
 from fastapi import APIRouter, Request, Response, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.routing import APIRoute
+from pydantic import BaseModel
 
 from prefect._internal.compatibility.deprecated import deprecated_callable
 
@@ -81,6 +85,42 @@ def response_scoped_dependency(dependency: Callable):
     return wrapper
 
 
+def compute_etag(value: BaseModel) -> str:
+    """
+    Compute a weak ETag for a response model from a hash of its JSON representation.
+    """
+    content = json.dumps(jsonable_encoder(value), sort_keys=True)
+    return f'W/"{hashlib.sha256(content.encode()).hexdigest()}"'
+
+
+def conditional_response(
+    request: Request, response: Response, value: BaseModel
+) -> Union[BaseModel, Response]:
+    """
+    Tag the response to a request with the ETag of `value`.
+
+    If the request's `If-None-Match` header already contains the ETag, an empty
+    `304 Not Modified` response is returned in place of `value`, so that clients can
+    revalidate their cached copies without downloading them again.
+    """
+    etag = compute_etag(value)
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        # ETags are compared using the weak comparison, which ignores the `W/` prefix
+        tags = {_strip_weak_prefix(tag.strip()) for tag in if_none_match.split(",")}
+        if "*" in tags or _strip_weak_prefix(etag) in tags:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    response.headers["ETag"] = etag
+    return value
+
+
+def _strip_weak_prefix(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
 class PrefectAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
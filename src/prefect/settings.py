@@ -39,6 +39,7 @@ settings to be dynamically modified on retrieval. This allows us to make setting
 dependent on the value of other settings or perform other dynamic effects.
 
 """
+import functools
 import logging
 import os
 import string
@@ -235,6 +236,38 @@ def get_extra_loggers(_: "Settings", value: str) -> List[str]:
     return [name.strip() for name in value.split(",")] if value else []
 
 
+def get_logger_sample_ratios(_: "Settings", value: str) -> Dict[str, float]:
+    """
+    `value_callback` for `PREFECT_LOGGING_TO_API_SAMPLE_RATIOS` that parses the
+    `logger=ratio` pairs into a mapping of logger names to ratios.
+    """
+    return _parse_logger_sample_ratios(value) if value else {}
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_logger_sample_ratios(value: str) -> Dict[str, float]:
+    ratios = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        name, sep, ratio = pair.partition("=")
+        try:
+            if not sep:
+                raise ValueError()
+            ratios[name.strip()] = float(ratio)
+        except ValueError:
+            raise ValueError(
+                f"Invalid logger sample ratio {pair.strip()!r}. Expected"
+                " 'logger=ratio'."
+            ) from None
+        if not 0 <= ratios[name.strip()] <= 1:
+            raise ValueError(
+                f"Invalid logger sample ratio {pair.strip()!r}. Ratios must be"
+                " between 0 and 1."
+            )
+    return ratios
+
+
 def expanduser_in_path(_, value: Path) -> Path:
     return value.expanduser()
 
@@ -571,6 +604,15 @@ A comma-separated list of extra HTTP status codes to retry on. Defaults to an em
 may result in unexpected behavior.
 """
 
+PREFECT_CLIENT_RESPONSE_CACHE_TTL = Setting(float, default=30)
+"""
+The number of seconds that workers and agents reuse the deployments, flows, and block
+documents they read without checking that they are unchanged. After this, cached
+objects are revalidated with a conditional request. Defaults to `30`.
+
+Set to 0 to revalidate cached objects on every read.
+"""
+
 PREFECT_CLOUD_API_URL = Setting(
     str,
     default="https://api.prefect.cloud/api",
@@ -649,6 +691,28 @@ The default setting for persisting results when not otherwise specified. If enab
 flow and task results will be persisted unless they opt out.
 """
 
+PREFECT_RESULTS_BINARY_BLOBS = Setting(
+    bool,
+    default=False,
+)
+"""
+If enabled, persisted results are written in a binary format with a small header
+followed by the raw serialized payload instead of a JSON document with base64 encoded
+data. Results written in either format can be read regardless of this setting; leave
+this disabled if results must be readable by older versions of Prefect.
+"""
+
+PREFECT_RESULTS_CACHE_MAX_BYTES = Setting(
+    int,
+    default=0,
+)
+"""
+The maximum total size, in bytes of persisted content, of deserialized results kept in
+a cache shared by all result references in a process. Separate references to the same
+persisted result will be deserialized once while they fit in the cache. Cached objects
+are shared, so they should not be mutated. Defaults to `0`, which disables the cache.
+"""
+
 PREFECT_TASKS_REFRESH_CACHE = Setting(
     bool,
     default=False,
@@ -658,6 +722,22 @@ If `True`, enables a refresh of cached results: re-executing the
 task will refresh the cached results. Defaults to `False`.
 """
 
+PREFECT_TASKS_FLOW_RUN_CACHE_TTL_SECONDS = Setting(Union[int, float], default=60)
+"""
+Task runs that are not handed a snapshot of their parent flow run, e.g. when
+`begin_task_run` is called by a custom task runner, read the flow run from the API.
+The flow run is then cached in the process for this many seconds. Set to `0` to
+disable caching.
+"""
+
+PREFECT_TASKS_PIPELINED_ORCHESTRATION = Setting(bool, default=False)
+"""
+If `True`, task runs without tags or a cache key propose their `RUNNING` state while
+the task function starts instead of waiting for the API to accept it first. If the
+API rejects the state, the task function is cancelled and its result is discarded.
+Reduces orchestration latency for short tasks. Defaults to `False`.
+"""
+
 PREFECT_TASK_DEFAULT_RETRIES = Setting(int, default=0)
 """
 This value sets the default number of retries for all tasks.
@@ -791,6 +871,38 @@ PREFECT_LOGGING_TO_API_MAX_LOG_SIZE = Setting(
 )
 """The maximum size in bytes for a single log."""
 
+PREFECT_LOGGING_TO_API_RATE_LIMIT = Setting(
+    Optional[float],
+    default=None,
+)
+"""
+The maximum number of logs per second that will be sent to the API for a single flow
+run. Bursts of up to one second's worth of logs are allowed. Logs exceeding the limit
+are dropped and counted. If not set, logs are not rate limited.
+"""
+
+PREFECT_LOGGING_TO_API_SAMPLE_RATIOS = Setting(
+    str,
+    default="",
+    value_callback=get_logger_sample_ratios,
+)
+"""
+Ratios of logs to send to the API for specific loggers, as a comma-separated list of
+`logger=ratio` pairs, e.g. `botocore=0.1,my_module.chatty=0.5`. A ratio applies to the
+named logger and its children. Logs at `WARNING` level or above are never sampled.
+"""
+
+PREFECT_LOGGING_TO_API_DEDUPE_WINDOW = Setting(
+    Optional[float],
+    default=None,
+)
+"""
+A window in seconds in which repeats of a log are not sent to the API. Logs are repeats
+if they have the same run, logger, level and message as the previous log from that
+logger. The number of repeats is sent in a single log once a different log is received
+or the window expires. If not set, logs are not deduplicated.
+"""
+
 PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW = Setting(
     Literal["warn", "error", "ignore"],
     default="warn",
@@ -839,6 +951,16 @@ The agent loop interval, in seconds. Agents will check for new runs this often.
 Defaults to `15`.
 """
 
+PREFECT_AGENT_LONG_POLL_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+Whether agents polling a work pool should wait on the server for scheduled runs instead
+of checking for them every `PREFECT_AGENT_QUERY_INTERVAL` seconds. Flow runs are picked
+up as soon as they become available, rather than on the next check. Defaults to `False`.
+"""
+
 PREFECT_AGENT_PREFETCH_SECONDS = Setting(
     int,
     default=15,
@@ -851,6 +973,20 @@ flow runs will not start before their scheduled time, even if they are
 prefetched. Defaults to `15`.
 """
 
+PREFECT_KUBERNETES_SHARED_INFORMER_ENABLED = Setting(bool, default=False)
+"""
+Whether `KubernetesJob` infrastructure in this process should share a single watch of
+the jobs and pods in each namespace, instead of watching each job on its own thread.
+Defaults to `False`.
+"""
+
+PREFECT_DOCKER_SHARED_EVENTS_ENABLED = Setting(bool, default=False)
+"""
+Whether `DockerContainer` infrastructure in this process should share a single Docker
+event stream to wait for containers to exit, and a single thread to stream container
+output, instead of using threads for each container. Defaults to `False`.
+"""
+
 PREFECT_ASYNC_FETCH_STATE_RESULT = Setting(bool, default=False)
 """
 Determines whether `State.result()` fetches results automatically or not.
@@ -944,6 +1080,17 @@ PREFECT_API_DATABASE_CONNECTION_TIMEOUT = Setting(
 connections. Defaults to `5`.
 """
 
+PREFECT_API_DATABASE_PARTITION_LOGS = Setting(
+    bool,
+    default=False,
+)
+"""If `True`, the migration that adds `timestamp` to the primary key of the log table
+also partitions the table by day, so that expired logs can be dropped by partition.
+Only supported on PostgreSQL, and only read when that migration is applied; databases
+that have already been migrated can be converted with
+`prefect server database partition-logs`. Defaults to `False`.
+"""
+
 PREFECT_API_SERVICES_SCHEDULER_LOOP_SECONDS = Setting(
     float,
     default=60,
@@ -1042,6 +1189,32 @@ PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS = Setting(
 this often. Defaults to `5`.
 """
 
+PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_LOOP_SECONDS = Setting(
+    float,
+    default=15,
+)
+"""The claim expiration service will look for claimed flow runs to reschedule
+this often. Defaults to `15`.
+"""
+
+PREFECT_API_FLOW_RUN_CLAIM_LEASE_SECONDS = Setting(
+    timedelta,
+    default=timedelta(seconds=300),
+)
+"""How long a worker or agent that claims a flow run has to report the flow run's
+infrastructure before the claim expires and the flow run is rescheduled. Defaults to
+`300` seconds.
+"""
+
+PREFECT_API_SCHEDULED_FLOW_RUNS_MAX_WAIT_SECONDS = Setting(
+    float,
+    default=25,
+)
+"""The maximum number of seconds a request for scheduled flow runs may wait for flow
+runs to become available. Should be less than the `PREFECT_API_REQUEST_TIMEOUT` of
+clients. Defaults to `25`.
+"""
+
 PREFECT_API_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS = Setting(
     float,
     default=20,
@@ -1050,6 +1223,74 @@ PREFECT_API_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS = Setting(
 this often. Defaults to `20`.
 """
 
+PREFECT_API_SERVICES_LOG_PARTITIONS_LOOP_SECONDS = Setting(
+    float,
+    default=3600,
+)
+"""The log partitions service will create and drop partitions of the log table
+this often. Defaults to `3600`.
+"""
+
+PREFECT_API_SERVICES_LOG_PARTITIONS_PREMAKE = Setting(
+    int,
+    default=7,
+)
+"""The number of days ahead of the current day that the log partitions service
+will create partitions of the log table for. Defaults to `7`.
+"""
+
+PREFECT_API_LOG_RETENTION_PERIOD = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The period for which logs are retained. Expired logs are removed by the log
+partitions service when the log table is partitioned and that service is enabled, and
+by the retention service otherwise. Defaults to `None`, in which case logs are retained
+indefinitely.
+"""
+
+PREFECT_API_FLOW_RUN_RETENTION_PERIOD = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The period for which flow runs are retained after they finish. Expired flow runs
+are deleted by the retention service along with their task runs, states, logs and
+artifacts. Defaults to `None`, in which case flow runs are retained indefinitely.
+"""
+
+PREFECT_API_SERVICES_RETENTION_LOOP_SECONDS = Setting(
+    float,
+    default=600,
+)
+"""The retention service will look for expired flow runs and logs to delete
+this often. Defaults to `600`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_BATCH_SIZE = Setting(
+    int,
+    default=100,
+)
+"""The number of expired flow runs that the retention service deletes in each batch.
+Defaults to `100`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_CHUNK_SIZE = Setting(
+    int,
+    default=10_000,
+)
+"""The number of logs, task runs, or artifacts that the retention service deletes in
+each transaction, whether they belong to expired flow runs or are expired logs.
+Defaults to `10000`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_BATCH_DELAY_SECONDS = Setting(
+    float,
+    default=1,
+)
+"""The number of seconds the retention service waits between batches of deletes,
+to limit its load on the database. Defaults to `1`.
+"""
+
 PREFECT_API_DEFAULT_LIMIT = Setting(
     int,
     default=200,
@@ -1145,12 +1386,43 @@ application. If disabled, paused flows that have timed out will remain in a Paus
 until a resume attempt.
 """
 
+PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the claim expiration service in the server application.
+If disabled, flow runs claimed by workers or agents that never report back will remain
+in a Pending state.
+"""
+
 PREFECT_API_TASK_CACHE_KEY_MAX_LENGTH = Setting(int, default=2000)
 """
 The maximum number of characters allowed for a task run cache key.
 This setting cannot be changed client-side, it must be set on the server.
 """
 
+PREFECT_API_TASK_RUN_CONCURRENCY_SLOT_LEASE_SECONDS = Setting(
+    Optional[int], default=None
+)
+"""
+The number of seconds a task run may hold a slot on a tag concurrency limit before
+the slot expires and can be taken by another task run. Expiration frees the slots of
+task runs whose process crashed without reporting a final state. Task runs do not
+renew their leases, so this should be longer than any task is expected to run.
+Defaults to `None`, in which case slots are held until the task run leaves the
+`RUNNING` state. This setting cannot be changed client-side, it must be set on the
+server.
+"""
+
+PREFECT_API_TASK_RUN_CONCURRENCY_MAX_WAIT_SECONDS = Setting(int, default=30)
+"""
+The longest a task run waiting for a slot on a tag concurrency limit is told to wait
+before trying again. Task runs near the front of the wait queue are told to try
+again sooner. A waiting task run loses its place in the queue if it does not try
+again within twice this many seconds. This setting cannot be changed client-side,
+it must be set on the server.
+"""
+
 PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED = Setting(
     bool,
     default=True,
@@ -1160,6 +1432,25 @@ application. If disabled, task runs and subflow runs belonging to cancelled flow
 remain in non-terminal states.
 """
 
+PREFECT_API_SERVICES_RETENTION_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the retention service in the server application. The
+service only deletes data if `PREFECT_API_FLOW_RUN_RETENTION_PERIOD` or
+`PREFECT_API_LOG_RETENTION_PERIOD` is set.
+"""
+
+PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the log partitions service in the server application.
+The service only runs if the log table has been partitioned with
+`prefect server database partition-logs`. If disabled, partitions will not be created
+for new logs, which will be stored in the default partition instead.
+"""
+
 PREFECT_EXPERIMENTAL_ENABLE_EVENTS_CLIENT = Setting(bool, default=True)
 """
 Whether or not to enable experimental Prefect work pools.
@@ -1200,6 +1491,13 @@ PREFECT_WORKER_QUERY_SECONDS = Setting(float, default=10)
 Number of seconds a worker should wait between queries for scheduled flow runs.
 """
 
+PREFECT_WORKER_LONG_POLL_ENABLED = Setting(bool, default=False)
+"""
+Whether workers should wait on the server for scheduled flow runs instead of querying
+for them every `PREFECT_WORKER_QUERY_SECONDS`. Flow runs are picked up as soon as they
+become available, rather than on the next query.
+"""
+
 PREFECT_WORKER_PREFETCH_SECONDS = Setting(float, default=10)
 """
 The number of seconds into the future a worker should query for scheduled flow runs.
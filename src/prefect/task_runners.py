@@ -52,6 +52,9 @@ Example:
 For usage details, see the [Task Runners](/concepts/task-runners/) documentation.
 """
 import abc
+import concurrent.futures
+import multiprocessing
+import os
 from contextlib import AsyncExitStack, asynccontextmanager
 from typing import (
     TYPE_CHECKING,
@@ -61,17 +64,18 @@ from typing import (
     Callable,
     Dict,
     Optional,
-    Set,
     TypeVar,
 )
 from uuid import UUID
 
 import anyio
+import cloudpickle
 
 from prefect._internal.concurrency.primitives import Event
 from prefect.client.schemas.objects import State
 from prefect.logging import get_logger
 from prefect.states import exception_to_crashed_state
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
 from prefect.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
@@ -254,14 +258,29 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         ```
     """
 
-    def __init__(self):
-        # TODO: Consider adding `max_workers` support using anyio capacity limiters
+    def __init__(self, max_workers: Optional[int] = None, spill_results: bool = False):
+        """
+        Args:
+            max_workers: The maximum number of task runs that may execute at once.
+                Additional submissions wait for a running task run to finish. If not
+                set, the number of concurrent task runs is not limited.
+            spill_results: If set, task results are persisted to result storage and
+                not kept in memory, unless persistence is disabled for the task.
+                Futures only hold a reference to the stored result, which is read
+                back from storage whenever it is used. Otherwise, results are held
+                by their futures until the flow run ends.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1.")
+        self.max_workers = max_workers
+        self.spill_results = spill_results
 
         # Runtime attributes
         self._task_group: anyio.abc.TaskGroup = None
+        self._limiter: Optional[anyio.CapacityLimiter] = None
         self._result_events: Dict[UUID, Event] = {}
         self._results: Dict[UUID, Any] = {}
-        self._keys: Set[UUID] = set()
+        self._result_waiters: Dict[UUID, int] = {}
 
         super().__init__()
 
@@ -270,7 +289,9 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         return TaskConcurrencyType.CONCURRENT
 
     def duplicate(self):
-        return type(self)()
+        return type(self)(
+            max_workers=self.max_workers, spill_results=self.spill_results
+        )
 
     async def submit(
         self,
@@ -317,7 +338,11 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         task crashes from crashing the flow run.
         """
         try:
-            result = await call()
+            if self._limiter:
+                async with self._limiter:
+                    result = await call()
+            else:
+                result = await call()
         except BaseException as exc:
             result = await exception_to_crashed_state(exc)
 
@@ -329,22 +354,45 @@ class ConcurrentTaskRunner(BaseTaskRunner):
     ) -> Optional[State]:
         """
         Block until the run result has been populated.
+
+        Once the result has been returned to every waiter, the runner drops it. The
+        `PrefectFuture` for the run keeps the final state for later use, so its data
+        is only freed early if results are spilled to storage.
         """
         result = None  # retval on tiemout
 
+        if key not in self._result_events:
+            raise RuntimeError(
+                f"The result for run {key} has already been retrieved and released."
+            )
+
         # Note we do not use `asyncio.wrap_future` and instead use an `Event` to avoid
         # stdlib behavior where the wrapped future is cancelled if the parent future is
         # cancelled (as it would be during a timeout here)
-        with anyio.move_on_after(timeout):
-            await self._result_events[key].wait()
-            result = self._results[key]
+        self._result_waiters[key] = self._result_waiters.get(key, 0) + 1
+        try:
+            with anyio.move_on_after(timeout):
+                await self._result_events[key].wait()
+                result = self._results[key]
+        finally:
+            self._result_waiters[key] -= 1
+            if result is not None and not self._result_waiters[key]:
+                self._release_result(key)
 
         return result  # timeout reached
 
+    def _release_result(self, key: UUID) -> None:
+        self._results.pop(key, None)
+        self._result_events.pop(key, None)
+        self._result_waiters.pop(key, None)
+
     async def _start(self, exit_stack: AsyncExitStack):
         """
-        Start the process pool
+        Start the task group
         """
+        if self.max_workers is not None:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+
         self._task_group = await exit_stack.enter_async_context(
             anyio.create_task_group()
         )
@@ -354,7 +402,7 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         Allow the `ConcurrentTaskRunner` to be serialized by dropping the task group.
         """
         data = self.__dict__.copy()
-        data.update({k: None for k in {"_task_group"}})
+        data.update({k: None for k in {"_task_group", "_limiter"}})
         return data
 
     def __setstate__(self, data: dict):
@@ -363,3 +411,116 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         """
         self.__dict__.update(data)
         self._task_group = None
+        self._limiter = None
+
+
+class ProcessPoolTaskRunner(ConcurrentTaskRunner):
+    """
+    A task runner that executes synchronous task functions in a pool of worker
+    processes, allowing CPU-bound tasks to run in parallel.
+
+    Orchestration of each task run stays in the flow's process; only the user's
+    function and its resolved arguments are sent to a worker process with
+    `cloudpickle`. The return value is sent back the same way, so it must be
+    serializable with `cloudpickle`. Asynchronous tasks are run concurrently in the
+    flow's process, as with the `ConcurrentTaskRunner`.
+
+    Since task functions run outside of the flow's process, the run context, e.g.
+    `get_run_logger`, is not available within them.
+
+    Example:
+        ```
+        Using worker processes for CPU-bound tasks:
+        >>> from prefect import flow
+        >>> from prefect.task_runners import ProcessPoolTaskRunner
+        >>> @flow(task_runner=ProcessPoolTaskRunner(max_workers=4))
+        >>> def my_flow():
+        >>>     ...
+        ```
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, spill_results: bool = False):
+        """
+        Args:
+            max_workers: The number of worker processes. Defaults to the number of
+                CPUs. At most this many task runs will execute at once.
+            spill_results: See `ConcurrentTaskRunner`.
+        """
+        super().__init__(
+            max_workers=max_workers or os.cpu_count() or 1,
+            spill_results=spill_results,
+        )
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    @property
+    def concurrency_type(self) -> TaskConcurrencyType:
+        return TaskConcurrencyType.PARALLEL
+
+    def run_in_process(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Call a function in a worker process and block until it returns.
+        """
+        if not self._executor:
+            raise RuntimeError(
+                "The task runner must be started before running work in a process."
+            )
+
+        future = self._executor.submit(
+            _run_cloudpickled_call, cloudpickle.dumps((fn, args, kwargs))
+        )
+        try:
+            while True:
+                # Wait in intervals so timeouts raised in this thread are not delayed
+                try:
+                    succeeded, value = cloudpickle.loads(future.result(timeout=0.25))
+                    break
+                except concurrent.futures.TimeoutError:
+                    continue
+        finally:
+            # Does nothing if the call has started; worker processes cannot be
+            # interrupted
+            future.cancel()
+
+        if not succeeded:
+            raise value
+        return value
+
+    async def _start(self, exit_stack: AsyncExitStack):
+        """
+        Start the process pool and task group
+        """
+        # Worker processes are spawned rather than forked since the flow's process
+        # may have threads running
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        exit_stack.push_async_callback(
+            run_sync_in_worker_thread, self._executor.shutdown
+        )
+        # The task group is entered last so that submitted runs finish before the
+        # pool is shut down
+        await super()._start(exit_stack)
+
+    def __getstate__(self):
+        data = super().__getstate__()
+        data["_executor"] = None
+        return data
+
+    def __setstate__(self, data: dict):
+        super().__setstate__(data)
+        self._executor = None
+
+
+def _run_cloudpickled_call(payload: bytes) -> bytes:
+    """
+    Run a call serialized with `cloudpickle` in a worker process.
+
+    Returns a serialized tuple of a success flag and the return value or exception.
+    """
+    fn, args, kwargs = cloudpickle.loads(payload)
+    try:
+        result = (True, fn(*args, **kwargs))
+    except BaseException as exc:
+        result = (False, exc)
+    return cloudpickle.dumps(result)
@@ -37,8 +37,13 @@ from prefect.exceptions import (
     ObjectNotFound,
 )
 from prefect.logging.loggers import PrefectLogAdapter, flow_run_logger, get_logger
-from prefect.settings import PREFECT_WORKER_PREFETCH_SECONDS, get_current_settings
-from prefect.states import Crashed, Pending, exception_to_failed_state
+from prefect.settings import (
+    PREFECT_WORKER_LONG_POLL_ENABLED,
+    PREFECT_WORKER_PREFETCH_SECONDS,
+    PREFECT_WORKER_QUERY_SECONDS,
+    get_current_settings,
+)
+from prefect.states import Crashed, Pending, Scheduled, exception_to_failed_state
 from prefect.utilities.dispatch import get_registry_for_type, register_base_type
 from prefect.utilities.slugify import slugify
 from prefect.utilities.templating import apply_values, resolve_block_document_references
@@ -347,6 +352,12 @@ class BaseWorker(abc.ABC):
         self._prefetch_seconds: float = (
             prefetch_seconds or PREFECT_WORKER_PREFETCH_SECONDS.value()
         )
+        # when long polling, each query waits on the server for up to this long
+        self._long_poll_seconds: Optional[float] = (
+            PREFECT_WORKER_QUERY_SECONDS.value()
+            if PREFECT_WORKER_LONG_POLL_ENABLED.value()
+            else None
+        )
 
         self._work_pool: Optional[WorkPool] = None
         self._runs_task_group: Optional[anyio.abc.TaskGroup] = None
@@ -467,6 +478,8 @@ class BaseWorker(abc.ABC):
             anyio.CapacityLimiter(self._limit) if self._limit is not None else None
         )
         self._client = get_client()
+        # Runs of the same deployment share their deployment and flow reads
+        self._client.enable_response_cache()
         await self._client.__aenter__()
         await self._runs_task_group.__aenter__()
 
@@ -691,27 +704,56 @@ class BaseWorker(abc.ABC):
     ) -> List["WorkerFlowRunResponse"]:
         """
         Retrieve scheduled flow runs from the work pool's queues.
+
+        The flow runs are claimed by this worker as they are retrieved, so only as
+        many flow runs as the worker has capacity to submit are requested.
+
+        When long polling, the server waits for flow runs to become available before
+        responding. A query that returns early without flow runs, for example because
+        the server does not support long polling, is paced to take the full long poll
+        duration so the worker does not query in a tight loop.
         """
         scheduled_before = pendulum.now("utc").add(seconds=int(self._prefetch_seconds))
         self._logger.debug(
             f"Querying for flow runs scheduled before {scheduled_before}"
         )
+        query_started = anyio.current_time()
         try:
             scheduled_flow_runs = (
                 await self._client.get_scheduled_flow_runs_for_work_pool(
                     work_pool_name=self._work_pool_name,
                     scheduled_before=scheduled_before,
                     work_queue_names=list(self._work_queues),
+                    limit=(
+                        int(self._limiter.available_tokens) if self._limiter else None
+                    ),
+                    claim=True,
+                    worker_name=self.name,
+                    wait_seconds=self._long_poll_seconds,
                 )
             )
             self._logger.debug(
                 f"Discovered {len(scheduled_flow_runs)} scheduled_flow_runs"
             )
-            return scheduled_flow_runs
         except ObjectNotFound:
             # the pool doesn't exist; it will be created on the next
             # heartbeat (or an appropriate warning will be logged)
-            return []
+            scheduled_flow_runs = []
+        except Exception:
+            await self._pace_long_poll(query_started)
+            raise
+
+        if not scheduled_flow_runs:
+            await self._pace_long_poll(query_started)
+        return scheduled_flow_runs
+
+    async def _pace_long_poll(self, query_started: float) -> None:
+        """
+        Wait out the rest of a long poll that returned early without flow runs.
+        """
+        if self._long_poll_seconds:
+            elapsed = anyio.current_time() - query_started
+            await anyio.sleep(max(self._long_poll_seconds - elapsed, 0))
 
     async def _submit_scheduled_flow_runs(
         self, flow_run_response: List["WorkerFlowRunResponse"]
@@ -721,7 +763,10 @@ class BaseWorker(abc.ABC):
         for execution by the worker.
         """
         submittable_flow_runs = [entry.flow_run for entry in flow_run_response]
-        submittable_flow_runs.sort(key=lambda run: run.next_scheduled_start_time)
+        # claimed flow runs are pending and no longer have a next scheduled start time
+        submittable_flow_runs.sort(
+            key=lambda run: run.next_scheduled_start_time or run.expected_start_time
+        )
         for flow_run in submittable_flow_runs:
             if flow_run.id in self._submitting_flow_run_ids:
                 continue
@@ -784,6 +829,7 @@ class BaseWorker(abc.ABC):
                 ),
                 flow_run.id,
             )
+            await self._release_claim(flow_run)
             self._submitting_flow_run_ids.remove(flow_run.id)
             return
 
@@ -905,7 +951,38 @@ class BaseWorker(abc.ABC):
         )
         return configuration
 
+    def _is_claimed(self, flow_run: "FlowRun") -> bool:
+        """
+        Whether the flow run was claimed by this worker when it was retrieved.
+        """
+        state = flow_run.state
+        return bool(
+            state and state.is_pending() and state.state_details.claimed_by == self.name
+        )
+
+    async def _release_claim(self, flow_run: "FlowRun") -> None:
+        """
+        Return a flow run claimed by this worker to a Scheduled state so that it can be
+        submitted by another worker or agent.
+        """
+        if not self._is_claimed(flow_run):
+            return
+
+        try:
+            await propose_state(
+                self._client,
+                Scheduled(scheduled_time=flow_run.expected_start_time),
+                flow_run_id=flow_run.id,
+            )
+        except Exception:
+            self.get_flow_run_logger(flow_run).exception(
+                f"Failed to release claim on flow run '{flow_run.id}'"
+            )
+
     async def _propose_pending_state(self, flow_run: "FlowRun") -> bool:
+        if self._is_claimed(flow_run):
+            return True
+
         run_logger = self.get_flow_run_logger(flow_run)
         state = flow_run.state
         try:
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import queue
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -361,6 +362,41 @@ def test_batched_queue_service():
     )
 
 
+def test_batched_queue_service_collects_available_items_in_one_call(monkeypatch):
+    calls = []
+    get_items = MockBatchedService._get_items
+
+    def spy(self, *args):
+        result = get_items(self, *args)
+        calls.append(result)
+        return result
+
+    monkeypatch.setattr(MockBatchedService, "_max_batch_size", 10)
+    monkeypatch.setattr(MockBatchedService, "_get_items", spy)
+
+    instance = MockBatchedService()
+    for i in range(5):
+        instance.send(i)
+    # Start after sending so that all items are available at once
+    from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
+    instance.drain()
+
+    MockBatchedService.mock.assert_called_once_with(instance, [0, 1, 2, 3, 4])
+    assert len(calls) == 1
+
+
+def test_batched_queue_service_get_items_respects_max_size():
+    instance = MockBatchedService()
+    for i in range(5):
+        instance._queue.put_nowait(i)
+    instance._queue.put_nowait(None)
+
+    assert instance._get_items(None, 3) == ([0, 1, 2], 3, False)
+    assert instance._get_items(None, 3) == ([3, 4], 2, True)
+    with pytest.raises(queue.Empty):
+        instance._get_items(0, 3)
+
+
 def test_batched_queue_service_min_interval():
     event = threading.Event()
 
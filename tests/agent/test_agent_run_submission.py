@@ -160,15 +160,15 @@ async def test_agent_with_work_queue_and_limit(prefect_client, deployment):
         submitted_flow_run_ids = {flow_run.id for flow_run in submitted_flow_runs}
         assert submitted_flow_run_ids == set(work_queue_flow_run_ids[0:2])
 
+        # claimed runs are not retrieved again and the agent has no capacity left
         submitted_flow_runs = await agent.get_and_submit_flow_runs()
-        submitted_flow_run_ids = {flow_run.id for flow_run in submitted_flow_runs}
-        assert submitted_flow_run_ids == set(work_queue_flow_run_ids[0:2])
+        assert submitted_flow_runs == []
 
         agent.limiter.release_on_behalf_of(work_queue_flow_run_ids[0])
 
         submitted_flow_runs = await agent.get_and_submit_flow_runs()
         submitted_flow_run_ids = {flow_run.id for flow_run in submitted_flow_runs}
-        assert submitted_flow_run_ids == set(work_queue_flow_run_ids[0:3])
+        assert submitted_flow_run_ids == {work_queue_flow_run_ids[2]}
 
 
 async def test_agent_matches_work_queues_dynamically(
@@ -389,7 +389,11 @@ async def test_agent_internal_submit_run_called(prefect_client, deployment):
         agent.submit_run = AsyncMock()
         await agent.get_and_submit_flow_runs()
 
-    agent.submit_run.assert_called_once_with(flow_run)
+    agent.submit_run.assert_called_once()
+    (submitted_flow_run,) = agent.submit_run.call_args.args
+    assert submitted_flow_run.id == flow_run.id
+    assert submitted_flow_run.state.is_pending()
+    assert submitted_flow_run.state.state_details.claimed_by == agent.name
 
 
 async def test_agent_runs_multiple_work_queues(prefect_client, session, flow):
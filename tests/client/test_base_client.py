@@ -1,11 +1,12 @@
 from unittest.mock import call
 
+import anyio
 import httpx
 import pytest
 from fastapi import status
 from httpx import AsyncClient, Request, Response
 
-from prefect.client.base import PrefectHttpxClient, PrefectResponse
+from prefect.client.base import PrefectHttpxClient, PrefectResponse, ResponseCache
 from prefect.exceptions import PrefectHTTPStatusError
 from prefect.settings import (
     PREFECT_CLIENT_RETRY_EXTRA_CODES,
@@ -473,3 +474,92 @@ class TestPrefectHttpxClient:
                 "Response: {'extra_info': [{'message': 'a test error message'}]}"
                 in str(exc)
             )
+
+    async def test_prefect_httpx_client_does_not_raise_not_modified(self, monkeypatch):
+        client = PrefectHttpxClient()
+        base_client_send = AsyncMock()
+        monkeypatch.setattr(AsyncClient, "send", base_client_send)
+
+        base_client_send.return_value = Response(
+            status.HTTP_304_NOT_MODIFIED,
+            request=Request("a test request", "fake.url/fake/route"),
+        )
+        response = await client.get(url="fake.url/fake/route")
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def server(self):
+        """
+        A fake server holding a versioned object, which records the requests it gets.
+        """
+        server = {"version": 1, "requests": []}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            server["requests"].append(request)
+            # give concurrent requests a chance to overlap
+            await anyio.sleep(0.01)
+            etag = f'W/"{server["version"]}"'
+            if request.headers.get("If-None-Match") == etag:
+                return Response(status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            return Response(
+                status.HTTP_200_OK,
+                json={"version": server["version"]},
+                headers={"ETag": etag},
+            )
+
+        server["client"] = PrefectHttpxClient(
+            transport=httpx.MockTransport(handler), base_url="http://test"
+        )
+        return server
+
+    async def test_reuses_fresh_responses(self, server):
+        cache = ResponseCache(ttl=60)
+        for _ in range(3):
+            response = await cache.get(server["client"], "/object")
+            assert response.json() == {"version": 1}
+        assert len(server["requests"]) == 1
+
+    async def test_caches_responses_by_params(self, server):
+        cache = ResponseCache(ttl=60)
+        await cache.get(server["client"], "/object", params={"a": 1})
+        await cache.get(server["client"], "/object", params={"a": 2})
+        await cache.get(server["client"], "/object", params={"a": 1})
+        assert len(server["requests"]) == 2
+
+    async def test_revalidates_stale_responses(self, server):
+        cache = ResponseCache(ttl=0)
+        await cache.get(server["client"], "/object")
+        response = await cache.get(server["client"], "/object")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"version": 1}
+        assert len(server["requests"]) == 2
+        assert server["requests"][1].headers["If-None-Match"] == 'W/"1"'
+
+    async def test_replaces_changed_responses(self, server):
+        cache = ResponseCache(ttl=0)
+        await cache.get(server["client"], "/object")
+        server["version"] = 2
+        response = await cache.get(server["client"], "/object")
+        assert response.json() == {"version": 2}
+
+    async def test_concurrent_requests_share_a_request(self, server):
+        cache = ResponseCache(ttl=60)
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(cache.get, server["client"], "/object")
+        assert len(server["requests"]) == 1
+
+    async def test_evicts_least_recently_used_responses(self, server):
+        cache = ResponseCache(ttl=60, max_size=2)
+        await cache.get(server["client"], "/a")
+        await cache.get(server["client"], "/b")
+        await cache.get(server["client"], "/a")
+        await cache.get(server["client"], "/c")
+        await cache.get(server["client"], "/a")
+        assert len(server["requests"]) == 3
+
+        await cache.get(server["client"], "/b")
+        assert len(server["requests"]) == 4
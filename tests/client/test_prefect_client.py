@@ -33,6 +33,7 @@ from prefect.server.api.server import SERVER_API_VERSION, create_app
 from prefect.client.schemas.actions import (
     ArtifactCreate,
     LogCreate,
+    TaskRunCreate,
     WorkPoolCreate,
     VariableCreate,
 )
@@ -702,6 +703,50 @@ async def test_updating_deployment(
     assert second_lookup.schedule == updated_schedule
 
 
+class TestResponseCache:
+    @pytest.fixture
+    async def deployment_id(self, prefect_client):
+        @flow
+        def foo():
+            pass
+
+        flow_id = await prefect_client.create_flow(foo)
+        return await prefect_client.create_deployment(
+            flow_id=flow_id, name="test-deployment", manifest_path="file.json"
+        )
+
+    async def test_reuses_cached_deployments(self, prefect_client, deployment_id):
+        prefect_client.enable_response_cache(ttl=60)
+        deployment = await prefect_client.read_deployment(deployment_id)
+
+        deployment.description = "changed"
+        await prefect_client.update_deployment(deployment)
+
+        cached = await prefect_client.read_deployment(deployment_id)
+        assert cached.description is None
+
+    async def test_revalidates_cached_deployments(self, prefect_client, deployment_id):
+        prefect_client.enable_response_cache(ttl=0)
+        deployment = await prefect_client.read_deployment(deployment_id)
+        assert await prefect_client.read_deployment(deployment_id) == deployment
+
+        deployment.description = "changed"
+        await prefect_client.update_deployment(deployment)
+
+        updated = await prefect_client.read_deployment(deployment_id)
+        assert updated.description == "changed"
+
+    async def test_deleted_deployments_are_not_found(
+        self, prefect_client, deployment_id
+    ):
+        prefect_client.enable_response_cache(ttl=0)
+        await prefect_client.read_deployment(deployment_id)
+        await prefect_client.delete_deployment(deployment_id)
+
+        with pytest.raises(prefect.exceptions.ObjectNotFound):
+            await prefect_client.read_deployment(deployment_id)
+
+
 async def test_read_deployment_by_name(prefect_client):
     @flow
     def foo():
@@ -920,6 +965,55 @@ async def test_read_flow_runs_with_filtering(prefect_client):
     assert {flow_run.id for flow_run in flow_runs} == {fr_id_4, fr_id_5}
 
 
+async def test_iter_flow_runs_follows_cursor(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @flow
+    def bar():
+        pass
+
+    fr_ids = {(await prefect_client.create_flow_run(foo)).id for _ in range(5)}
+    await prefect_client.create_flow_run(bar)
+
+    flow_runs = [
+        flow_run
+        async for flow_run in prefect_client.iter_flow_runs(
+            flow_filter=FlowFilter(name=dict(any_=["foo"])), page_size=2
+        )
+    ]
+    assert all(isinstance(flow_run, client_schemas.FlowRun) for flow_run in flow_runs)
+    assert len(flow_runs) == 5
+    assert {flow_run.id for flow_run in flow_runs} == fr_ids
+
+
+async def test_iter_task_runs_follows_cursor(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    tr_ids = {
+        (
+            await prefect_client.create_task_run(
+                bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+            )
+        ).id
+        for i in range(3)
+    }
+
+    task_runs = [
+        task_run async for task_run in prefect_client.iter_task_runs(page_size=2)
+    ]
+    assert len(task_runs) == 3
+    assert {task_run.id for task_run in task_runs} == tr_ids
+
+
 async def test_read_flows_without_filter(prefect_client):
     @flow
     def foo():
@@ -1150,6 +1244,32 @@ async def test_set_then_read_task_run_state(prefect_client):
     assert run.state.message == "Test!"
 
 
+async def test_create_then_set_task_run_states_in_bulk(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    task_runs = await prefect_client.create_task_runs(
+        [
+            TaskRunCreate(flow_run_id=flow_run.id, task_key="bar", dynamic_key=str(i))
+            for i in range(3)
+        ]
+    )
+    assert all(isinstance(task_run, TaskRun) for task_run in task_runs)
+    assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1", "2"]
+
+    responses = await prefect_client.set_task_run_states(
+        [(task_run.id, Completed(message="Test!")) for task_run in task_runs]
+    )
+    assert [response.status for response in responses] == [SetStateStatus.ACCEPT] * 3
+
+    for task_run in task_runs:
+        run = await prefect_client.read_task_run(task_run.id)
+        assert run.state.type == StateType.COMPLETED
+        assert run.state.message == "Test!"
+
+
 async def test_create_then_read_flow_run_notification_policy(
     prefect_client, block_document
 ):
@@ -1202,6 +1322,31 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_iter_logs_follows_cursor(prefect_client):
+    flow_run_id = uuid4()
+    now = datetime.now(tz=timezone.utc)
+    logs = [
+        LogCreate(
+            name="prefect.flow_runs",
+            level=20,
+            message=f"Log {i}.",
+            timestamp=now + timedelta(seconds=i),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(5)
+    ]
+    await prefect_client.create_logs(logs)
+
+    messages = [
+        log.message
+        async for log in prefect_client.iter_logs(
+            log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id])),
+            page_size=2,
+        )
+    ]
+    assert messages == [log.message for log in logs]
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
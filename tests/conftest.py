@@ -42,9 +42,12 @@ from prefect.settings import (
     PREFECT_API_BLOCKS_REGISTER_ON_START,
     PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED,
+    PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_ENABLED,
     PREFECT_API_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED,
     PREFECT_API_SERVICES_LATE_RUNS_ENABLED,
+    PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED,
     PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_ENABLED,
+    PREFECT_API_SERVICES_RETENTION_ENABLED,
     PREFECT_API_SERVICES_SCHEDULER_ENABLED,
     PREFECT_API_URL,
     PREFECT_ASYNC_FETCH_STATE_RESULT,
@@ -305,6 +308,9 @@ def pytest_sessionstart(session):
             PREFECT_API_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED: False,
             PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_ENABLED: False,
             PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED: False,
+            PREFECT_API_SERVICES_CLAIM_EXPIRATIONS_ENABLED: False,
+            PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED: False,
+            PREFECT_API_SERVICES_RETENTION_ENABLED: False,
             # Disable block auto-registration memoization
             PREFECT_MEMOIZE_BLOCK_AUTO_REGISTRATION: False,
             # Disable auto-registration of block types as they can conflict
@@ -1,4 +1,10 @@
+import asyncio
+import queue
 import re
+import socket
+import struct
+import threading
+import time
 import uuid
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
@@ -11,9 +17,14 @@ from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFoun
 from prefect.infrastructure.container import (
     CONTAINER_LABELS,
     DockerContainer,
+    DockerEventWatcher,
+    DockerLogMultiplexer,
     DockerRegistry,
     ImagePullPolicy,
+    shared_docker_event_watcher,
+    shared_docker_log_multiplexer,
 )
+from prefect.settings import PREFECT_DOCKER_SHARED_EVENTS_ENABLED, temporary_settings
 from prefect.testing.utilities import assert_does_not_warn
 from prefect.utilities.dockerutils import get_prefect_image_name
 
@@ -32,6 +43,10 @@ def skip_if_docker_is_not_installed():
 
 @pytest.fixture
 def mock_docker_client(monkeypatch):
+    # Stop event watchers as soon as they are unused, rather than after a grace period
+    monkeypatch.setattr(
+        "prefect.infrastructure.container.EVENT_WATCHER_GRACE_PERIOD_SECONDS", 0
+    )
     docker = pytest.importorskip("docker")
     docker.models.containers = pytest.importorskip("docker.models.containers")
 
@@ -876,3 +891,380 @@ def test_stream_container_logs_on_real_container(capsys):
 
     captured = capsys.readouterr()
     assert "hello" in captured.out
+
+
+class FakeDockerEvents:
+    """
+    A stub of the Docker event stream, which yields the events put on its queue until
+    it is closed or `None` is put on it.
+    """
+
+    def __init__(self, since=None):
+        self.since = since
+        self.queue = queue.Queue()
+
+    def __iter__(self):
+        while True:
+            event = self.queue.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self):
+        self.queue.put(None)
+
+
+def container_event(action, container_id=FAKE_CONTAINER_ID, time=1, **attributes):
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": container_id, "Attributes": attributes},
+        "time": time,
+    }
+
+
+def output_frame(data: bytes, stream: int = 1) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+async def wait_until(condition, timeout=5):
+    with anyio.fail_after(timeout):
+        while not condition():
+            await anyio.sleep(0.01)
+
+
+@pytest.fixture
+def docker_events(mock_docker_client):
+    """
+    Stubs the Docker event stream, returning the streams opened so far.
+    """
+    streams = []
+
+    def events(since=None, filters=None, decode=None):
+        streams.append(FakeDockerEvents(since=since))
+        return streams[-1]
+
+    mock_docker_client.events.side_effect = events
+    yield streams
+    for stream in streams:
+        stream.close()
+
+
+@pytest.fixture
+def running_container(mock_docker_client):
+    container = mock_docker_client.containers.get.return_value
+    container.attrs["State"].update(Status="running", Running=True, ExitCode=None)
+    container.wait = MagicMock()
+    container.logs = MagicMock()
+    return container
+
+
+@pytest.fixture
+def attached_output(mock_docker_client):
+    """
+    Stubs the attach socket of containers, returning the other ends of the sockets
+    attached so far for tests to write output to.
+    """
+    writers = []
+
+    def attach_socket(container_id, params=None):
+        reader, writer = socket.socketpair()
+        writers.append(writer)
+        return reader
+
+    mock_docker_client.api.attach_socket.side_effect = attach_socket
+    yield writers
+    for writer in writers:
+        writer.close()
+
+
+class TestDockerEventWatcher:
+    @pytest.fixture
+    def watcher(self, mock_docker_client, docker_events):
+        watcher = DockerEventWatcher(mock_docker_client)
+        watcher.start()
+        yield watcher
+        watcher.stop()
+
+    async def test_waits_for_die_event(self, watcher, docker_events, running_container):
+        waiting = asyncio.ensure_future(watcher.wait_for_exit(FAKE_CONTAINER_ID))
+        await wait_until(lambda: FAKE_CONTAINER_ID in watcher._waiters)
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+
+        docker_events[0].queue.put(container_event("die", "other-id", exitCode="1"))
+        docker_events[0].queue.put(container_event("die", exitCode="3"))
+        with anyio.fail_after(5):
+            assert await waiting == 3
+        assert not watcher._waiters
+
+    async def test_returns_exit_code_of_exited_container(
+        self, watcher, mock_docker_client
+    ):
+        mock_docker_client.containers.get.return_value.attrs["State"]["ExitCode"] = 2
+        assert await watcher.wait_for_exit(FAKE_CONTAINER_ID) == 2
+
+    async def test_returns_none_for_missing_container(
+        self, watcher, mock_docker_client
+    ):
+        mock_docker_client.containers.get.side_effect = docker.errors.NotFound("")
+        assert await watcher.wait_for_exit(FAKE_CONTAINER_ID) is None
+
+    async def test_returns_none_when_container_is_removed(
+        self, watcher, docker_events, running_container
+    ):
+        waiting = asyncio.ensure_future(watcher.wait_for_exit(FAKE_CONTAINER_ID))
+        await wait_until(lambda: FAKE_CONTAINER_ID in watcher._waiters)
+
+        docker_events[0].queue.put(container_event("destroy"))
+        with anyio.fail_after(5):
+            assert await waiting is None
+
+    async def test_resubscribes_from_last_event(
+        self, watcher, docker_events, running_container
+    ):
+        assert docker_events[0].since is None
+        docker_events[0].queue.put(container_event("die", "other-id", time=42))
+        docker_events[0].close()
+
+        await wait_until(lambda: len(docker_events) == 2)
+        assert docker_events[1].since == 42
+
+        waiting = asyncio.ensure_future(watcher.wait_for_exit(FAKE_CONTAINER_ID))
+        await wait_until(lambda: FAKE_CONTAINER_ID in watcher._waiters)
+        docker_events[1].queue.put(container_event("die", time=43, exitCode="0"))
+        with anyio.fail_after(5):
+            assert await waiting == 0
+
+    async def test_resubscribes_from_subscription_time_without_events(
+        self, watcher, docker_events
+    ):
+        subscribed_at = int(time.time())
+        docker_events[0].close()
+
+        await wait_until(lambda: len(docker_events) == 2)
+        assert subscribed_at - 1 <= docker_events[1].since <= time.time()
+
+    async def test_checks_waiting_containers_after_resubscribing(
+        self, watcher, docker_events, running_container
+    ):
+        waiting = asyncio.ensure_future(watcher.wait_for_exit(FAKE_CONTAINER_ID))
+        await wait_until(lambda: FAKE_CONTAINER_ID in watcher._waiters)
+
+        # the container exits while the event stream is closed
+        running_container.attrs["State"].update(
+            Status="exited", Running=False, ExitCode=4
+        )
+        docker_events[0].close()
+
+        with anyio.fail_after(5):
+            assert await waiting == 4
+        assert len(docker_events) == 2
+
+    async def test_is_shared_per_daemon(self, mock_docker_client, docker_events):
+        async with shared_docker_event_watcher(lambda: mock_docker_client) as first:
+            async with shared_docker_event_watcher(
+                lambda: mock_docker_client
+            ) as second:
+                assert first is second
+                assert len(docker_events) == 1
+            assert not first._stopped.is_set()
+        assert first._stopped.is_set()
+
+        async with shared_docker_event_watcher(lambda: mock_docker_client) as third:
+            assert third is not first
+
+    async def test_stops_after_grace_period(
+        self, mock_docker_client, docker_events, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "prefect.infrastructure.container.EVENT_WATCHER_GRACE_PERIOD_SECONDS", 0.5
+        )
+        async with shared_docker_event_watcher(lambda: mock_docker_client) as watcher:
+            pass
+
+        # the watcher is reused by containers started during the grace period
+        async with shared_docker_event_watcher(lambda: mock_docker_client) as other:
+            assert other is watcher
+        assert not watcher._stopped.is_set()
+        assert len(docker_events) == 1
+
+        await wait_until(lambda: watcher._stopped.is_set())
+        async with shared_docker_event_watcher(lambda: mock_docker_client) as new:
+            assert new is not watcher
+
+    async def test_calls_docker_in_worker_thread(
+        self, mock_docker_client, docker_events
+    ):
+        threads = []
+
+        def get_client():
+            threads.append(threading.current_thread())
+            return mock_docker_client
+
+        mock_docker_client.close.side_effect = lambda: threads.append(
+            threading.current_thread()
+        )
+
+        async with shared_docker_event_watcher(get_client):
+            pass
+
+        # the client is created, subscribes, and is closed away from the event loop
+        assert len(threads) == 2
+        assert threading.current_thread() not in threads
+
+
+class TestDockerLogMultiplexer:
+    @pytest.fixture
+    def multiplexer(self):
+        multiplexer = DockerLogMultiplexer(flush_interval=0.01)
+        multiplexer.start()
+        yield multiplexer
+        multiplexer.stop()
+
+    async def test_writes_output_of_many_containers(self, multiplexer, capsys):
+        first, first_writer = socket.socketpair()
+        second, second_writer = socket.socketpair()
+        first_written = multiplexer.add(first)
+        second_written = multiplexer.add(second)
+
+        frame = output_frame(b"hello\nfrom the ")
+        # Frames may be split across reads
+        first_writer.sendall(frame[:5])
+        second_writer.sendall(output_frame(b"goodbye\n", stream=2))
+        await asyncio.sleep(0.1)
+        first_writer.sendall(frame[5:] + output_frame(b"first\n"))
+
+        first_writer.close()
+        second_writer.close()
+        with anyio.fail_after(5):
+            await asyncio.gather(first_written, second_written)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert sorted(lines) == ["from the first", "goodbye", "hello"]
+
+    async def test_writes_incomplete_line_when_output_ends(self, multiplexer, capsys):
+        sock, writer = socket.socketpair()
+        written = multiplexer.add(sock)
+
+        writer.sendall(output_frame(b"no newline"))
+        await asyncio.sleep(0.1)
+        assert capsys.readouterr().out == ""
+
+        writer.close()
+        with anyio.fail_after(5):
+            await written
+        assert capsys.readouterr().out == "no newline\n"
+
+    async def test_wakes_to_stream_added_sockets(self, capsys):
+        # sockets are streamed as soon as they are added, not after the interval
+        multiplexer = DockerLogMultiplexer(flush_interval=30)
+        multiplexer.start()
+        try:
+            sock, writer = socket.socketpair()
+            written = multiplexer.add(sock)
+            writer.sendall(output_frame(b"hello\n"))
+            writer.close()
+            with anyio.fail_after(5):
+                await written
+        finally:
+            multiplexer.stop()
+        assert capsys.readouterr().out == "hello\n"
+
+    async def test_stop_closes_remaining_sockets(self):
+        multiplexer = DockerLogMultiplexer(flush_interval=0.01)
+        multiplexer.start()
+        sock, writer = socket.socketpair()
+        written = multiplexer.add(sock)
+
+        multiplexer.stop()
+        with anyio.fail_after(5):
+            await written
+        assert sock.fileno() == -1
+        writer.close()
+
+    def test_is_shared_in_process(self):
+        with shared_docker_log_multiplexer() as first:
+            with shared_docker_log_multiplexer() as second:
+                assert first is second
+            assert not first._stopped.is_set()
+        assert first._stopped.is_set()
+
+
+class TestDockerContainerWithSharedEvents:
+    @pytest.fixture(autouse=True)
+    def enable_shared_events(self):
+        with temporary_settings({PREFECT_DOCKER_SHARED_EVENTS_ENABLED: True}):
+            yield
+
+    async def test_exit_code_from_die_event(
+        self, mock_docker_client, docker_events, running_container
+    ):
+        running = asyncio.ensure_future(
+            DockerContainer(command=["echo", "hello"], stream_output=False).run()
+        )
+        await wait_until(lambda: docker_events)
+        await asyncio.sleep(0.1)
+        docker_events[0].queue.put(container_event("die", exitCode="7"))
+
+        with anyio.fail_after(5):
+            result = await running
+        assert result.status_code == 7
+        running_container.wait.assert_not_called()
+
+    async def test_exit_code_of_removed_container(
+        self, mock_docker_client, docker_events, running_container
+    ):
+        running = asyncio.ensure_future(
+            DockerContainer(command=["echo", "hello"], stream_output=False).run()
+        )
+        await wait_until(lambda: docker_events)
+        await asyncio.sleep(0.1)
+        docker_events[0].queue.put(container_event("destroy"))
+
+        with anyio.fail_after(5):
+            result = await running
+        assert result.status_code == -1
+
+    async def test_streams_output(
+        self,
+        mock_docker_client,
+        docker_events,
+        attached_output,
+        running_container,
+        capsys,
+    ):
+        running = asyncio.ensure_future(DockerContainer(command=["echo", "hi"]).run())
+        await wait_until(lambda: attached_output)
+
+        # the client that owns the attached socket stays open while it is streamed
+        closed = mock_docker_client.close.call_count
+        await asyncio.sleep(0.1)
+        assert mock_docker_client.close.call_count == closed
+
+        attached_output[0].sendall(output_frame(b"hello\nworld\n"))
+        attached_output[0].close()
+        docker_events[0].queue.put(container_event("die", exitCode="0"))
+
+        with anyio.fail_after(5):
+            result = await running
+        assert result.status_code == 0
+        assert "hello\nworld\n" in capsys.readouterr().out
+        mock_docker_client.api.attach_socket.assert_called_once_with(
+            FAKE_CONTAINER_ID,
+            params={"stdout": 1, "stderr": 1, "stream": 1, "logs": 1},
+        )
+        running_container.logs.assert_not_called()
+        assert mock_docker_client.close.call_count > closed
+
+    async def test_logs_attach_errors(self, mock_docker_client, docker_events, caplog):
+        mock_docker_client.api.attach_socket.side_effect = docker.errors.APIError("")
+
+        result = await DockerContainer(command=["echo", "hello"]).run()
+
+        assert result.status_code == 0
+        assert (
+            "An unexpected Docker API error occured while streaming output from"
+            " container fake-name."
+            in caplog.text
+        )
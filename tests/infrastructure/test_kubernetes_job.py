@@ -1,5 +1,9 @@
 import json
+import queue
+import threading
+import urllib.parse
 from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from time import monotonic, sleep
 from typing import Dict
@@ -20,9 +24,17 @@ from pydantic import ValidationError
 
 from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFound
 from prefect.infrastructure.kubernetes import (
+    INFORMER_LABEL_KEY,
+    INFORMER_LABEL_SELECTOR,
+    INFORMER_LABEL_VALUE,
     KubernetesImagePullPolicy,
     KubernetesJob,
     KubernetesManifest,
+    shared_job_informer,
+)
+from prefect.settings import (
+    PREFECT_KUBERNETES_SHARED_INFORMER_ENABLED,
+    temporary_settings,
 )
 
 FAKE_CLUSTER = "fake-cluster"
@@ -1604,3 +1616,476 @@ def test_run_requires_command():
     job = KubernetesJob(command=[])
     with pytest.raises(ValueError, match="cannot be run with empty command"):
         job.run()
+
+
+class FakeKubernetesAPI:
+    """
+    A fake Kubernetes API server which lists and watches the jobs and pods in a
+    namespace, streaming watch events with chunked responses like the real API.
+    """
+
+    PATHS = {
+        "jobs": "/apis/batch/v1/namespaces/{namespace}/jobs",
+        "pods": "/api/v1/namespaces/{namespace}/pods",
+    }
+
+    def __init__(self, namespace: str = "default"):
+        self.namespace = namespace
+        self.objects = {"jobs": {}, "pods": {}}
+        self.resource_version = 0
+        self.requests = []
+        self._watchers = {"jobs": [], "pods": []}
+        self._history = {"jobs": [], "pods": []}
+        self._lock = threading.Lock()
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urllib.parse.urlparse(self.path)
+                query = dict(urllib.parse.parse_qsl(url.query))
+                api.requests.append((url.path, query))
+                for kind, path in api.PATHS.items():
+                    if url.path == path.format(namespace=api.namespace):
+                        break
+                else:
+                    self.send_error(404)
+                    return
+
+                selector = query.get("labelSelector")
+                if query.get("watch", "").lower() == "true":
+                    self._watch(
+                        kind,
+                        selector,
+                        int(query.get("resourceVersion", 0)),
+                        float(query.get("timeoutSeconds", 60)),
+                    )
+                else:
+                    with api._lock:
+                        body = json.dumps(
+                            {
+                                "metadata": {
+                                    "resourceVersion": str(api.resource_version)
+                                },
+                                "items": [
+                                    obj
+                                    for obj in api.objects[kind].values()
+                                    if api.selects(selector, obj)
+                                ],
+                            }
+                        ).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+            def _watch(self, kind, selector, resource_version, timeout):
+                events = queue.Queue()
+                with api._lock:
+                    # replay the events since the requested resource version
+                    for event_resource_version, event in api._history[kind]:
+                        if event_resource_version > resource_version:
+                            events.put(event)
+                    api._watchers[kind].append(events)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                deadline = monotonic() + timeout
+                try:
+                    while monotonic() < deadline:
+                        try:
+                            event = events.get(timeout=0.05)
+                        except queue.Empty:
+                            continue
+                        if event is None:
+                            break
+                        if event["type"] != "ERROR" and not api.selects(
+                            selector, event["object"]
+                        ):
+                            continue
+                        line = json.dumps(event).encode() + b"\n"
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                        self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except OSError:
+                    pass
+                finally:
+                    with api._lock:
+                        api._watchers[kind].remove(events)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def put(self, kind: str, name: str, event_type: str = "ADDED", **fields):
+        """Create, update, or delete an object and notify watchers."""
+        with self._lock:
+            self.resource_version += 1
+            if event_type == "DELETED":
+                obj = self.objects[kind].pop(name)
+            else:
+                obj = self.objects[kind][name] = {
+                    "metadata": {
+                        "name": name,
+                        "namespace": self.namespace,
+                        **fields.pop("metadata", {}),
+                    },
+                    **fields,
+                }
+            obj["metadata"]["resourceVersion"] = str(self.resource_version)
+            event = {"type": event_type, "object": obj}
+            self._history[kind].append((self.resource_version, event))
+            for events in self._watchers[kind]:
+                events.put(event)
+
+    @staticmethod
+    def selects(selector, obj):
+        """Check if an object matches an equality-based label selector."""
+        labels = obj["metadata"].get("labels") or {}
+        for requirement in (selector or "").split(","):
+            if not requirement:
+                continue
+            key, _, value = requirement.partition("=")
+            if key not in labels or (value and labels[key] != value):
+                return False
+        return True
+
+    def put_job(self, name: str, completed: bool = False, succeeded: bool = True):
+        status = {}
+        if completed:
+            status = {"completionTime": pendulum.now("utc").isoformat()}
+            status["succeeded" if succeeded else "failed"] = 1
+        self.put(
+            "jobs",
+            name,
+            metadata={"labels": {INFORMER_LABEL_KEY: INFORMER_LABEL_VALUE}},
+            status=status,
+        )
+
+    def put_pod(self, job_name: str, phase: str):
+        self.put(
+            "pods",
+            f"{job_name}-pod",
+            metadata={
+                "labels": {
+                    "job-name": job_name,
+                    INFORMER_LABEL_KEY: INFORMER_LABEL_VALUE,
+                }
+            },
+            status={"phase": phase},
+        )
+
+    def expire(self, kind: str):
+        """Expire the resource version of open watches."""
+        with self._lock:
+            for events in self._watchers[kind]:
+                events.put(
+                    {
+                        "type": "ERROR",
+                        "object": {
+                            "kind": "Status",
+                            "code": 410,
+                            "reason": "Expired",
+                            "message": "too old resource version",
+                        },
+                    }
+                )
+
+    def close_watches(self):
+        with self._lock:
+            for watchers in self._watchers.values():
+                for events in watchers:
+                    events.put(None)
+
+    def list_requests(self, kind: str):
+        path = self.PATHS[kind].format(namespace=self.namespace)
+        return [
+            query
+            for request_path, query in self.requests
+            if request_path == path and query.get("watch", "").lower() != "true"
+        ]
+
+
+@pytest.fixture
+def fake_kubernetes_api(monkeypatch):
+    # Stop informers as soon as they are unused, rather than after a grace period
+    monkeypatch.setattr(
+        "prefect.infrastructure.kubernetes.JOB_INFORMER_GRACE_PERIOD_SECONDS", 0
+    )
+    api = FakeKubernetesAPI()
+    thread = threading.Thread(target=api.server.serve_forever, daemon=True)
+    thread.start()
+
+    default_configuration = k8s.client.Configuration.get_default_copy()
+    configuration = k8s.client.Configuration(host=api.url)
+    k8s.client.Configuration.set_default(configuration)
+    try:
+        yield api
+    finally:
+        k8s.client.Configuration.set_default(default_configuration)
+        api.close_watches()
+        api.server.shutdown()
+        api.server.server_close()
+
+
+@pytest.fixture
+async def informer(fake_kubernetes_api):
+    with shared_job_informer("default") as informer:
+        yield informer
+
+
+async def wait_for_job(informer, job_name, check, timeout=5):
+    return await informer.wait_for(job_name, check, timeout=timeout)
+
+
+async def wait_until(check, timeout=5):
+    with anyio.fail_after(timeout):
+        while not check():
+            await anyio.sleep(0.01)
+
+
+class TestKubernetesJobInformer:
+    async def test_lists_existing_jobs_and_pods(self, fake_kubernetes_api):
+        fake_kubernetes_api.put_job("my-job")
+        fake_kubernetes_api.put_pod("my-job", "Running")
+        fake_kubernetes_api.put("pods", "not-a-job-pod")
+        # jobs and pods that were not created by `KubernetesJob`
+        fake_kubernetes_api.put("jobs", "other-job")
+        fake_kubernetes_api.put(
+            "pods", "other-job-pod", metadata={"labels": {"job-name": "other-job"}}
+        )
+
+        with shared_job_informer("default") as informer:
+            job = await wait_for_job(
+                informer, "my-job", lambda: informer.get_job("my-job")
+            )
+            assert job.metadata.name == "my-job"
+            pods = await wait_for_job(
+                informer, "my-job", lambda: informer.get_job_pods("my-job")
+            )
+            assert [pod.status.phase for pod in pods] == ["Running"]
+            assert informer.get_job("other-job") is None
+            assert informer.get_job_pods("other-job") == []
+
+        # only jobs and pods labelled by `KubernetesJob` are listed
+        for kind in ("jobs", "pods"):
+            assert (
+                fake_kubernetes_api.list_requests(kind)[0]["labelSelector"]
+                == INFORMER_LABEL_SELECTOR
+            )
+
+    async def test_ignores_unlabelled_changes(self, fake_kubernetes_api, informer):
+        await wait_until(lambda: fake_kubernetes_api._watchers["pods"])
+        fake_kubernetes_api.put(
+            "pods", "other-job-pod", metadata={"labels": {"job-name": "other-job"}}
+        )
+        fake_kubernetes_api.put_pod("my-job", "Running")
+
+        assert await wait_for_job(
+            informer, "my-job", lambda: informer.get_job_pods("my-job")
+        )
+        assert informer.get_job_pods("other-job") == []
+
+    async def test_wakes_waiters_on_changes(self, fake_kubernetes_api, informer):
+        def completed_job():
+            job = informer.get_job("my-job")
+            return job if job and job.status.completion_time else None
+
+        fake_kubernetes_api.put_job("my-job")
+        assert await wait_for_job(informer, "my-job", completed_job, 0.5) is None
+
+        fake_kubernetes_api.put_job("my-job", completed=True)
+        job = await wait_for_job(informer, "my-job", completed_job)
+        assert job.status.succeeded == 1
+
+    async def test_removes_deleted_objects(self, fake_kubernetes_api, informer):
+        fake_kubernetes_api.put_pod("my-job", "Running")
+        await wait_for_job(informer, "my-job", lambda: informer.get_job_pods("my-job"))
+
+        fake_kubernetes_api.put("pods", "my-job-pod", event_type="DELETED")
+        assert await wait_for_job(
+            informer, "my-job", lambda: not informer.get_job_pods("my-job")
+        )
+
+    async def test_relists_when_resource_version_expires(
+        self, fake_kubernetes_api, informer
+    ):
+        await wait_until(lambda: fake_kubernetes_api._watchers["jobs"])
+        assert len(fake_kubernetes_api.list_requests("jobs")) == 1
+
+        # changes made while the watch is expired are found by listing again
+        fake_kubernetes_api.expire("jobs")
+        fake_kubernetes_api.put_job("my-job")
+        assert await wait_for_job(
+            informer, "my-job", lambda: informer.get_job("my-job")
+        )
+        assert len(fake_kubernetes_api.list_requests("jobs")) == 2
+
+    async def test_restarts_watches_that_end(self, fake_kubernetes_api, informer):
+        await wait_until(lambda: fake_kubernetes_api._watchers["jobs"])
+        fake_kubernetes_api.close_watches()
+
+        fake_kubernetes_api.put_job("my-job")
+        assert await wait_for_job(
+            informer, "my-job", lambda: informer.get_job("my-job")
+        )
+        # watches resume from the last resource version without listing again
+        assert len(fake_kubernetes_api.list_requests("jobs")) == 1
+
+    def test_is_shared_per_namespace(self, fake_kubernetes_api):
+        with shared_job_informer("default") as informer:
+            with shared_job_informer("default") as other:
+                assert other is informer
+            with shared_job_informer("other-namespace") as other:
+                assert other is not informer
+
+            assert not informer._stopped.is_set()
+        assert informer._stopped.is_set()
+
+        with shared_job_informer("default") as new_informer:
+            assert new_informer is not informer
+
+    async def test_stop_interrupts_watches(self, fake_kubernetes_api):
+        with shared_job_informer("default") as informer:
+            await wait_until(
+                lambda: fake_kubernetes_api._watchers["jobs"]
+                and fake_kubernetes_api._watchers["pods"]
+            )
+            assert sorted(thread.name for thread in informer._threads) == [
+                "KubernetesJobInformer-job-default",
+                "KubernetesJobInformer-pod-default",
+            ]
+
+        # the watches are open until they time out, but the threads exit at once
+        assert not any(thread.is_alive() for thread in informer._threads)
+
+    async def test_stops_after_grace_period(self, fake_kubernetes_api, monkeypatch):
+        monkeypatch.setattr(
+            "prefect.infrastructure.kubernetes.JOB_INFORMER_GRACE_PERIOD_SECONDS", 0.5
+        )
+        with shared_job_informer("default") as informer:
+            pass
+
+        # the informer is reused by jobs started during the grace period
+        with shared_job_informer("default") as other:
+            assert other is informer
+        assert not informer._stopped.is_set()
+
+        await wait_until(lambda: informer._stopped.is_set())
+        with shared_job_informer("default") as new_informer:
+            assert new_informer is not informer
+
+
+class TestKubernetesJobWithInformer:
+    @pytest.fixture(autouse=True)
+    def enable_informer(self):
+        with temporary_settings({PREFECT_KUBERNETES_SHARED_INFORMER_ENABLED: True}):
+            yield
+
+    @pytest.fixture
+    def job_name(self, mock_k8s_v1_job):
+        return mock_k8s_v1_job.metadata.name
+
+    @pytest.fixture
+    def exit_code(self, mock_k8s_client):
+        pod_status = mock_k8s_client.read_namespaced_pod_status.return_value
+        container_status = MagicMock()
+        container_status.state.terminated.exit_code = 0
+        pod_status.status.container_statuses = [container_status]
+
+    async def test_waits_for_job_completion(
+        self,
+        fake_kubernetes_api,
+        mock_k8s_client,
+        mock_k8s_batch_client,
+        job_name,
+        exit_code,
+    ):
+        fake_kubernetes_api.put_job(job_name)
+        fake_kubernetes_api.put_pod(job_name, "Pending")
+
+        results = []
+
+        async def run():
+            results.append(await KubernetesJob(command=["echo", "hello"]).run())
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run)
+            await anyio.sleep(0.5)
+            fake_kubernetes_api.put_pod(job_name, "Running")
+            await anyio.sleep(0.5)
+            assert not results
+            fake_kubernetes_api.put_job(job_name, completed=True)
+
+        assert results[0].status_code == 0
+        mock_k8s_client.read_namespaced_pod_status.assert_called_once_with(
+            namespace="default", name=f"{job_name}-pod"
+        )
+        # jobs and pods are not watched individually
+        mock_k8s_batch_client.list_namespaced_job.assert_not_called()
+        mock_k8s_client.list_namespaced_pod.assert_not_called()
+
+        # the job and its pods are labelled for the informer
+        manifest = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]
+        assert manifest["metadata"]["labels"][INFORMER_LABEL_KEY] == (
+            INFORMER_LABEL_VALUE
+        )
+        assert manifest["spec"]["template"]["metadata"]["labels"] == {
+            INFORMER_LABEL_KEY: INFORMER_LABEL_VALUE
+        }
+
+    async def test_pod_never_starts(
+        self,
+        fake_kubernetes_api,
+        mock_k8s_client,
+        mock_k8s_batch_client,
+        job_name,
+        caplog,
+    ):
+        fake_kubernetes_api.put_job(job_name)
+        fake_kubernetes_api.put_pod(job_name, "Pending")
+
+        result = await KubernetesJob(
+            command=["echo", "hello"], pod_watch_timeout_seconds=1
+        ).run()
+        assert result.status_code == -1
+        assert "Pod never started" in caplog.text
+
+    async def test_job_watch_timeout(
+        self,
+        fake_kubernetes_api,
+        mock_k8s_client,
+        mock_k8s_batch_client,
+        job_name,
+        caplog,
+    ):
+        fake_kubernetes_api.put_job(job_name)
+        fake_kubernetes_api.put_pod(job_name, "Running")
+
+        result = await KubernetesJob(
+            command=["echo", "hello"], job_watch_timeout_seconds=1
+        ).run()
+        assert result.status_code == -1
+        assert "Job did not complete within timeout of 1s" in caplog.text
+
+    async def test_failed_job(
+        self,
+        fake_kubernetes_api,
+        mock_k8s_client,
+        mock_k8s_batch_client,
+        job_name,
+        exit_code,
+        caplog,
+    ):
+        fake_kubernetes_api.put_job(job_name, completed=True, succeeded=False)
+        fake_kubernetes_api.put_pod(job_name, "Failed")
+
+        await KubernetesJob(command=["echo", "hello"]).run()
+        assert "Job failed" in caplog.text
@@ -1,10 +1,20 @@
 import json
+import mmap
+import pickle
 
 import pytest
 
+import prefect
 from prefect.filesystems import LocalFileSystem
-from prefect.results import DEFAULT_STORAGE_KEY_FN, PersistedResult, PersistedResultBlob
-from prefect.serializers import JSONSerializer, PickleSerializer
+from prefect.results import (
+    BINARY_BLOB_MAGIC,
+    BINARY_BLOB_VERSION,
+    DEFAULT_STORAGE_KEY_FN,
+    PersistedResult,
+    PersistedResultBlob,
+)
+from prefect.serializers import CompressedSerializer, JSONSerializer, PickleSerializer
+from prefect.settings import PREFECT_RESULTS_BINARY_BLOBS, temporary_settings
 
 
 @pytest.fixture
@@ -120,3 +130,114 @@ async def test_result_reference_create_uses_storage_key_fn(storage_block):
     assert result.storage_key == "test"
     contents = await storage_block.read_path("test")
     assert contents
+
+
+class TestBinaryBlobs:
+    @pytest.fixture(autouse=True)
+    def enable_binary_blobs(self):
+        with temporary_settings({PREFECT_RESULTS_BINARY_BLOBS: True}):
+            yield
+
+    @pytest.mark.parametrize(
+        "serializer",
+        [
+            JSONSerializer(),
+            PickleSerializer(),
+            CompressedSerializer(serializer="pickle"),
+        ],
+    )
+    async def test_create_and_get(self, storage_block, serializer):
+        result = await PersistedResult.create(
+            {"foo": "bar"},
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=serializer,
+            cache_object=False,
+        )
+
+        assert await result.get() == {"foo": "bar"}
+
+    async def test_file_contains_header_and_raw_payload(self, storage_block):
+        serializer = PickleSerializer(picklelib="pickle")
+        result = await PersistedResult.create(
+            b"x" * 1000,
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=serializer,
+        )
+
+        contents = await storage_block.read_path(result.storage_key)
+        assert contents.startswith(BINARY_BLOB_MAGIC)
+        # The payload is the pickle itself, without base64 encoding
+        assert contents.endswith(pickle.dumps(b"x" * 1000))
+
+        blob = PersistedResultBlob.from_bytes(contents)
+        assert blob.binary
+        assert blob.serializer == serializer
+        assert blob.prefect_version == prefect.__version__
+        assert blob.load() == b"x" * 1000
+
+    async def test_json_blobs_remain_readable(self, storage_block):
+        with temporary_settings({PREFECT_RESULTS_BINARY_BLOBS: False}):
+            result = await PersistedResult.create(
+                "test",
+                storage_block_id=storage_block._block_document_id,
+                storage_block=storage_block,
+                storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+                serializer=PickleSerializer(),
+                cache_object=False,
+            )
+
+        contents = await storage_block.read_path(result.storage_key)
+        assert not PersistedResultBlob.from_bytes(contents).binary
+        assert await result.get() == "test"
+
+    async def test_get_reads_memory_mapped_content(self, storage_block, monkeypatch):
+        result = await PersistedResult.create(
+            b"x" * 1000,
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=PickleSerializer(),
+            cache_object=False,
+        )
+
+        buffers = []
+        read_path_buffer = LocalFileSystem.read_path_buffer
+
+        async def spy(self, path):
+            buffer = await read_path_buffer(self, path)
+            buffers.append(buffer)
+            return buffer
+
+        monkeypatch.setattr(LocalFileSystem, "read_path_buffer", spy)
+
+        assert await result.get() == b"x" * 1000
+        assert len(buffers) == 1
+        assert isinstance(buffers[0], mmap.mmap)
+        assert buffers[0].closed
+
+    def test_to_bytes_round_trip(self):
+        blob = PersistedResultBlob(
+            serializer=JSONSerializer(), data=b'"test"', binary=True
+        )
+        loaded = PersistedResultBlob.from_bytes(blob.to_bytes())
+        assert loaded.serializer == blob.serializer
+        assert bytes(loaded.data) == b'"test"'
+        assert loaded.load() == "test"
+
+    def test_binary_flag_is_not_included_in_json(self):
+        blob = PersistedResultBlob(serializer=JSONSerializer(), data=b"test")
+        assert "binary" not in json.loads(blob.to_bytes())
+
+    def test_newer_format_versions_are_rejected(self):
+        blob = PersistedResultBlob(
+            serializer=JSONSerializer(), data=b'"test"', binary=True
+        )
+        magic, prefix, header, data = blob.to_chunks()
+        prefix = bytes([BINARY_BLOB_VERSION + 1]) + prefix[1:]
+
+        with pytest.raises(ValueError, match="format version"):
+            PersistedResultBlob.from_bytes(magic + prefix + header + data)
@@ -0,0 +1,246 @@
+import asyncio
+import uuid
+
+import pytest
+
+from prefect.filesystems import LocalFileSystem
+from prefect.results import (
+    DEFAULT_STORAGE_KEY_FN,
+    PersistedResult,
+    ResultCache,
+    ResultCacheStats,
+    get_result_cache,
+)
+from prefect.serializers import JSONSerializer
+from prefect.settings import PREFECT_RESULTS_CACHE_MAX_BYTES, temporary_settings
+from prefect.utilities.annotations import NotSet
+
+
+@pytest.fixture
+async def storage_block(tmp_path):
+    block = LocalFileSystem(basepath=tmp_path)
+    await block._save(is_anonymous=True)
+    return block
+
+
+@pytest.fixture(autouse=True)
+def result_cache():
+    cache = get_result_cache()
+    cache.clear()
+    with temporary_settings({PREFECT_RESULTS_CACHE_MAX_BYTES: 100}):
+        yield cache
+    cache.clear()
+
+
+def key(name: str):
+    return (uuid.UUID(int=0), name)
+
+
+class TestResultCache:
+    def test_get_missing_key(self):
+        cache = ResultCache()
+        assert cache.get(key("a")) is NotSet
+        assert cache.stats().misses == 1
+
+    def test_put_and_get(self):
+        cache = ResultCache()
+        cache.put(key("a"), "foo", size_bytes=10)
+        assert cache.get(key("a")) == "foo"
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 0
+        assert stats.entries == 1
+        assert stats.size_bytes == 10
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache()
+        cache.put(key("a"), "a", size_bytes=40)
+        cache.put(key("b"), "b", size_bytes=40)
+        cache.get(key("a"))
+        cache.put(key("c"), "c", size_bytes=40)
+
+        assert cache.get(key("b")) is NotSet
+        assert cache.get(key("a")) == "a"
+        assert cache.get(key("c")) == "c"
+
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.size_bytes == 80
+
+    def test_replacing_an_entry_updates_size(self):
+        cache = ResultCache()
+        cache.put(key("a"), "a", size_bytes=40)
+        cache.put(key("a"), "b", size_bytes=60)
+
+        assert cache.get(key("a")) == "b"
+        assert cache.stats().size_bytes == 60
+        assert cache.stats().evictions == 0
+
+    def test_objects_larger_than_budget_are_not_cached(self):
+        cache = ResultCache()
+        cache.put(key("a"), "a", size_bytes=101)
+        assert cache.get(key("a")) is NotSet
+
+    def test_disabled_with_zero_budget(self):
+        cache = ResultCache()
+        assert cache.enabled
+        with temporary_settings({PREFECT_RESULTS_CACHE_MAX_BYTES: 0}):
+            assert not cache.enabled
+
+    async def test_concurrent_misses_share_one_load(self):
+        cache = ResultCache()
+        loads = []
+
+        async def load():
+            loads.append(1)
+            await asyncio.sleep(0.1)
+            return "foo", 10
+
+        values = await asyncio.gather(
+            *[cache.get_or_load(key("a"), load) for _ in range(10)]
+        )
+
+        assert values == ["foo"] * 10
+        assert len(loads) == 1
+        assert cache.get(key("a")) == "foo"
+        assert cache.stats().misses == 1
+
+    async def test_concurrent_misses_share_load_errors(self):
+        cache = ResultCache()
+        loads = []
+
+        async def load():
+            loads.append(1)
+            await asyncio.sleep(0.1)
+            raise ValueError("foo")
+
+        results = await asyncio.gather(
+            *[cache.get_or_load(key("a"), load) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(loads) == 1
+        assert cache.get(key("a")) is NotSet
+
+    async def test_waiters_load_when_loading_caller_is_cancelled(self):
+        cache = ResultCache()
+        started = asyncio.Event()
+
+        async def slow_load():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def load():
+            return "foo", 10
+
+        loading = asyncio.ensure_future(cache.get_or_load(key("a"), slow_load))
+        await started.wait()
+        waiting = asyncio.ensure_future(cache.get_or_load(key("a"), load))
+        await asyncio.sleep(0)
+        loading.cancel()
+
+        assert await asyncio.wait_for(waiting, 5) == "foo"
+
+    async def test_loaded_objects_are_not_stored_unless_requested(self):
+        cache = ResultCache()
+
+        async def load():
+            return "foo", 10
+
+        assert await cache.get_or_load(key("a"), load, store=False) == "foo"
+        assert cache.get(key("a")) is NotSet
+
+
+class TestPersistedResultCaching:
+    @pytest.fixture(autouse=True)
+    def larger_budget(self):
+        with temporary_settings({PREFECT_RESULTS_CACHE_MAX_BYTES: 10_000}):
+            yield
+
+    async def test_separate_references_share_deserialized_object(
+        self, storage_block, result_cache, monkeypatch
+    ):
+        result = await PersistedResult.create(
+            ["test"],
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=JSONSerializer(),
+            cache_object=False,
+        )
+
+        loads = []
+        original_loads = JSONSerializer.loads
+
+        def spy(self, blob):
+            loads.append(blob)
+            return original_loads(self, blob)
+
+        monkeypatch.setattr(JSONSerializer, "loads", spy)
+
+        references = [PersistedResult.parse_obj(result.dict()) for _ in range(3)]
+        values = [await reference.get() for reference in references]
+
+        assert values == [["test"]] * 3
+        assert values[0] is values[1] is values[2]
+        assert len(loads) == 1
+
+        stats = result_cache.stats()
+        assert stats.misses == 1
+        assert stats.hits == 2
+
+    async def test_create_populates_cache(self, storage_block, result_cache):
+        result = await PersistedResult.create(
+            "test",
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=JSONSerializer(),
+        )
+
+        assert await PersistedResult.parse_obj(result.dict()).get() == "test"
+        assert result_cache.stats().hits == 1
+
+    async def test_cache_not_used_when_disabled(self, storage_block, result_cache):
+        with temporary_settings({PREFECT_RESULTS_CACHE_MAX_BYTES: 0}):
+            result = await PersistedResult.create(
+                "test",
+                storage_block_id=storage_block._block_document_id,
+                storage_block=storage_block,
+                storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+                serializer=JSONSerializer(),
+            )
+            assert await PersistedResult.parse_obj(result.dict()).get() == "test"
+
+        assert result_cache.stats() == ResultCacheStats(
+            hits=0, misses=0, evictions=0, entries=0, size_bytes=0
+        )
+
+    async def test_concurrent_readers_deserialize_once(
+        self, storage_block, result_cache, monkeypatch
+    ):
+        result = await PersistedResult.create(
+            ["test"],
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=JSONSerializer(),
+            cache_object=False,
+        )
+
+        loads = []
+        original_loads = JSONSerializer.loads
+
+        def spy(self, blob):
+            loads.append(blob)
+            return original_loads(self, blob)
+
+        monkeypatch.setattr(JSONSerializer, "loads", spy)
+
+        references = [PersistedResult.parse_obj(result.dict()) for _ in range(100)]
+        values = await asyncio.gather(*[reference.get() for reference in references])
+
+        assert values == [["test"]] * 100
+        assert len(loads) == 1
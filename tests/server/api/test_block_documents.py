@@ -1171,6 +1171,25 @@ class TestSecretBlockDocuments:
         assert block.data["y"] == Y
         assert block.data["z"] == Z
 
+    async def test_read_secret_block_document_by_id_etag_depends_on_secrets(
+        self, client, secret_block_document
+    ):
+        obfuscated = await client.get(f"/block_documents/{secret_block_document.id}")
+        response = await client.get(
+            f"/block_documents/{secret_block_document.id}",
+            params=dict(include_secrets=True),
+            headers={"If-None-Match": obfuscated.headers["ETag"]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != obfuscated.headers["ETag"]
+
+        response = await client.get(
+            f"/block_documents/{secret_block_document.id}",
+            params=dict(include_secrets=True),
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
     async def test_read_secret_block_documents_by_name_obfuscates_results(
         self, client, secret_block_document
     ):
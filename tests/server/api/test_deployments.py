@@ -731,6 +731,34 @@ class TestReadDeployment:
         response = await client.get(f"/deployments/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    async def test_read_deployment_returns_304_if_not_modified(
+        self, client, deployment
+    ):
+        response = await client.get(f"/deployments/{deployment.id}")
+        etag = response.headers["ETag"]
+
+        response = await client.get(
+            f"/deployments/{deployment.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert not response.content
+
+    async def test_read_deployment_etag_changes_when_modified(self, client, deployment):
+        response = await client.get(f"/deployments/{deployment.id}")
+        etag = response.headers["ETag"]
+
+        await client.patch(
+            f"/deployments/{deployment.id}", json={"description": "changed"}
+        )
+
+        response = await client.get(
+            f"/deployments/{deployment.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["description"] == "changed"
+        assert response.headers["ETag"] != etag
+
 
 class TestReadDeploymentByName:
     async def test_read_deployment_by_name(self, client, flow, deployment):
@@ -645,6 +645,88 @@ class TestReadFlowRuns:
         assert len(response.json()) == 1
         assert response.json()[0]["id"] == str(flow_run.id)
 
+    @pytest.fixture
+    async def paginated_flow_runs(self, session, flow):
+        now = pendulum.now("UTC")
+        flow_runs = []
+        for i in range(7):
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        # Names and end times tie, and some end times are null
+                        name=f"flow-run-{i // 2}",
+                        end_time=now.subtract(hours=i // 2) if i % 3 else None,
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    async def read_pages(self, client, **body):
+        ids, cursor = [], ""
+        while cursor is not None:
+            response = await client.post(
+                "/flow_runs/filter", json=dict(body, limit=2, cursor=cursor)
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.json()) <= 2
+            ids.extend(flow_run["id"] for flow_run in response.json())
+            cursor = response.headers.get("x-prefect-next-cursor")
+        return ids
+
+    @pytest.mark.parametrize(
+        "sort", [sort_option.value for sort_option in schemas.sorting.FlowRunSort]
+    )
+    async def test_read_flow_runs_with_cursor_reads_every_flow_run_once(
+        self, sort, paginated_flow_runs, client
+    ):
+        ids = await self.read_pages(client, sort=sort)
+        assert sorted(ids) == sorted(str(fr.id) for fr in paginated_flow_runs)
+
+    async def test_read_flow_runs_with_cursor_sorts_nulls_first_when_descending(
+        self, paginated_flow_runs, client
+    ):
+        ids = await self.read_pages(client, sort="END_TIME_DESC")
+        by_id = {str(fr.id): fr for fr in paginated_flow_runs}
+        end_times = [by_id[id].end_time for id in ids]
+        ended = [end_time for end_time in end_times if end_time is not None]
+        assert end_times == [None] * (len(end_times) - len(ended)) + ended
+        assert ended == sorted(ended, reverse=True)
+
+    async def test_read_flow_runs_with_cursor_ignores_offset(
+        self, paginated_flow_runs, client
+    ):
+        response = await client.post(
+            "/flow_runs/filter", json=dict(offset=5, limit=2, cursor="")
+        )
+        assert len(response.json()) == 2
+        assert response.headers["x-prefect-next-cursor"]
+
+    async def test_read_flow_runs_with_invalid_cursor(self, client):
+        response = await client.post(
+            "/flow_runs/filter", json=dict(cursor="not-a-cursor")
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "Invalid cursor" in response.text
+
+    async def test_read_flow_runs_as_ndjson(self, paginated_flow_runs, client):
+        expected = await self.read_pages(client, sort="NAME_ASC")
+
+        response = await client.post(
+            "/flow_runs/filter",
+            json=dict(limit=2, sort="NAME_ASC"),
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        flow_runs = [
+            responses.FlowRunResponse.parse_raw(line)
+            for line in response.text.splitlines()
+        ]
+        assert [str(fr.id) for fr in flow_runs] == expected
+
 
 class TestReadFlowRunGraph:
     @pytest.fixture
@@ -696,6 +778,29 @@ class TestReadFlowRunGraph:
         response = await client.get(f"/flow_runs/{graph_data.id}/graph")
         assert len(response.json()) == 10
 
+    async def test_read_flow_run_graph_since(self, graph_data, session, client):
+        since = pendulum.now("UTC")
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=core.TaskRun(
+                flow_run_id=graph_data.id, task_key="new", dynamic_key="0"
+            ),
+        )
+        await session.commit()
+
+        response = await client.get(
+            f"/flow_runs/{graph_data.id}/graph", params={"since": str(since)}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [node["id"] for node in response.json()] == [str(task_run.id)]
+
+        response = await client.get(f"/flow_runs/{graph_data.id}/graph")
+        assert len(response.json()) == 11
+
+    async def test_read_flow_run_graph_returns_404_if_does_not_exist(self, client):
+        response = await client.get(f"/flow_runs/{uuid4()}/graph")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     async def test_read_flow_run_graph_returns_upstream_dependencies(
         self, graph_data, client
     ):
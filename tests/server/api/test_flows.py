@@ -127,6 +127,27 @@ class TestReadFlow:
         response = await client.get(f"/flows/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    async def test_read_flow_returns_304_if_not_modified(self, client):
+        response = await client.post("/flows/", json={"name": "my-flow"})
+        flow_id = response.json()["id"]
+
+        response = await client.get(f"/flows/{flow_id}")
+        etag = response.headers["ETag"]
+
+        # weak and strong forms of the ETag match
+        for if_none_match in [etag, etag[2:], f'"other", {etag}', "*"]:
+            response = await client.get(
+                f"/flows/{flow_id}", headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # only a single `W/` prefix is ignored
+        for if_none_match in ['"other"', f"W/{etag}"]:
+            response = await client.get(
+                f"/flows/{flow_id}", headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == status.HTTP_200_OK
+
     async def test_read_flow_by_name(self, client):
         # first create a flow to read
         flow_data = {"name": "my-flow"}
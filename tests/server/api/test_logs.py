@@ -175,3 +175,61 @@ class TestReadLogs:
         api_logs = [Log(**log_data) for log_data in response.json()]
         assert api_logs[0].timestamp > api_logs[1].timestamp
         assert api_logs[0].message == "Black flag ahead, captain!"
+
+    @pytest.fixture()
+    async def many_logs(self, client, flow_run_id):
+        # Pairs of logs share a timestamp
+        many_logs = [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=f"Log {i}",
+                timestamp=NOW + timedelta(seconds=i // 2),
+                flow_run_id=flow_run_id,
+            ).dict(json_compatible=True)
+            for i in range(7)
+        ]
+        await client.post(CREATE_LOGS_URL, json=many_logs)
+        return many_logs
+
+    @pytest.mark.parametrize("sort", ["TIMESTAMP_ASC", "TIMESTAMP_DESC"])
+    async def test_read_logs_with_cursor(self, client, many_logs, sort):
+        messages, cursor = [], ""
+        while cursor is not None:
+            response = await client.post(
+                READ_LOGS_URL, json={"sort": sort, "limit": 2, "cursor": cursor}
+            )
+            assert response.status_code == 200
+            messages.extend(log["message"] for log in response.json())
+            cursor = response.headers.get("x-prefect-next-cursor")
+
+        assert sorted(messages) == sorted(log["message"] for log in many_logs)
+        timestamps = [
+            next(log["timestamp"] for log in many_logs if log["message"] == message)
+            for message in messages
+        ]
+        assert timestamps == sorted(timestamps, reverse=sort == "TIMESTAMP_DESC")
+
+    async def test_read_logs_without_cursor_has_no_next_cursor(self, client, many_logs):
+        response = await client.post(READ_LOGS_URL, json={"limit": 2})
+        assert "x-prefect-next-cursor" not in response.headers
+
+    async def test_read_logs_with_invalid_cursor(self, client):
+        response = await client.post(READ_LOGS_URL, json={"cursor": "nope"})
+        assert response.status_code == 422
+
+    async def test_read_logs_as_ndjson(self, client, many_logs):
+        response = await client.post(
+            READ_LOGS_URL,
+            json={"limit": 3},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        api_logs = [Log.parse_raw(line) for line in response.text.splitlines()]
+
+        # Logs with equal timestamps are ordered by id
+        response = await client.post(READ_LOGS_URL, json={"limit": 10, "cursor": ""})
+        assert [log.id for log in api_logs] == [
+            Log(**log_data).id for log_data in response.json()
+        ]
+        assert len(api_logs) == len(many_logs)
@@ -123,6 +123,100 @@ class TestCreateTaskRun:
         )
 
 
+class TestCreateTaskRuns:
+    async def test_create_task_runs(self, flow_run, client, session):
+        task_run_data = [
+            {
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "name": f"my-cool-task-run-name-{i}",
+                "dynamic_key": str(i),
+            }
+            for i in range(3)
+        ]
+        response = await client.post("/task_runs/bulk", json=task_run_data)
+        assert response.status_code == status.HTTP_200_OK
+        assert [task_run["name"] for task_run in response.json()] == [
+            "my-cool-task-run-name-0",
+            "my-cool-task-run-name-1",
+            "my-cool-task-run-name-2",
+        ]
+
+        for task_run_response in response.json():
+            task_run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_response["id"]
+            )
+            assert task_run.flow_run_id == flow_run.id
+            assert task_run.state.type == states.StateType.PENDING
+
+    async def test_create_task_runs_gracefully_upserts(self, flow_run, client):
+        existing = await client.post(
+            "/task_runs/",
+            json={
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "dynamic_key": "0",
+            },
+        )
+
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[
+                {
+                    "flow_run_id": str(flow_run.id),
+                    "task_key": "my-task-key",
+                    "dynamic_key": str(i),
+                }
+                for i in range(2)
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["id"] == existing.json()["id"]
+        assert response.json()[1]["id"] != existing.json()["id"]
+
+    async def test_create_task_runs_with_state(self, flow_run, client, session):
+        task_run_data = [
+            schemas.actions.TaskRunCreate(
+                flow_run_id=flow_run.id,
+                task_key="task-key",
+                state=schemas.actions.StateCreate(
+                    type=schemas.states.StateType.RUNNING
+                ),
+                dynamic_key=str(i),
+            ).dict(json_compatible=True)
+            for i in range(2)
+        ]
+        response = await client.post("/task_runs/bulk", json=task_run_data)
+
+        for task_run_response in response.json():
+            task_run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_response["id"]
+            )
+            assert task_run.state.type == states.StateType.RUNNING
+
+    async def test_create_task_runs_across_batches(self, flow_run, client, monkeypatch):
+        monkeypatch.setattr(models.task_runs, "TASK_RUN_BATCH_SIZE", 2)
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[
+                {
+                    "flow_run_id": str(flow_run.id),
+                    "task_key": "my-task-key",
+                    "dynamic_key": str(i),
+                }
+                for i in range(5)
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [task_run["dynamic_key"] for task_run in response.json()] == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+
+
 class TestReadTaskRun:
     async def test_read_task_run(self, flow_run, task_run, client):
         # make sure we we can read the task run correctly
@@ -297,6 +391,38 @@ class TestReadTaskRuns:
         assert len(response.json()) == 1
         assert response.json()[0]["id"] == str(task_run.id)
 
+    @pytest.mark.parametrize(
+        "sort", [sort_option.value for sort_option in schemas.sorting.TaskRunSort]
+    )
+    async def test_read_task_runs_with_cursor_reads_every_task_run_once(
+        self, sort, flow_run, session, client
+    ):
+        task_runs = []
+        for i in range(5):
+            task_runs.append(
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=schemas.core.TaskRun(
+                        flow_run_id=flow_run.id,
+                        task_key="my-key",
+                        dynamic_key=str(i),
+                        name=f"task-run-{i // 2}",
+                    ),
+                )
+            )
+        await session.commit()
+
+        ids, cursor = [], ""
+        while cursor is not None:
+            response = await client.post(
+                "/task_runs/filter", json=dict(sort=sort, limit=2, cursor=cursor)
+            )
+            assert response.status_code == status.HTTP_200_OK
+            ids.extend(task_run["id"] for task_run in response.json())
+            cursor = response.headers.get("x-prefect-next-cursor")
+
+        assert sorted(ids) == sorted(str(task_run.id) for task_run in task_runs)
+
 
 class TestDeleteTaskRuns:
     async def test_delete_task_runs(self, task_run, client, session):
@@ -465,6 +591,122 @@ class TestSetTaskRunState:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestSetTaskRunStates:
+    async def test_set_task_run_states(self, flow_run, client, session):
+        # first ensure the parent flow run is in a running state
+        await client.post(
+            f"/flow_runs/{flow_run.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        task_run_ids = [
+            (
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=schemas.core.TaskRun(
+                        flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                    ),
+                )
+            ).id
+            for i in range(2)
+        ]
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/bulk/set_state",
+            json=dict(
+                states=[
+                    dict(
+                        task_run_id=str(task_run_id),
+                        state=dict(type="RUNNING", name="Test State"),
+                    )
+                    for task_run_id in task_run_ids
+                ]
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        results = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert [result.status for result in results] == [
+            responses.SetStateStatus.ACCEPT,
+            responses.SetStateStatus.ACCEPT,
+        ]
+
+        session.expire_all()
+        for task_run_id in task_run_ids:
+            run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_id
+            )
+            assert run.state.type == states.StateType.RUNNING
+            assert run.state.name == "Test State"
+
+    async def test_set_task_run_states_orchestrates_each_run(
+        self, task_run, client, session
+    ):
+        # set max retries to 1
+        # copy to trigger ORM updates
+        task_run.empirical_policy = task_run.empirical_policy.copy()
+        task_run.empirical_policy.retries = 1
+        await session.flush()
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=states.Running(),
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/bulk/set_state",
+            json=dict(
+                states=[dict(task_run_id=str(task_run.id), state=dict(type="FAILED"))]
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        (api_response,) = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert api_response.status == responses.SetStateStatus.REJECT
+        assert api_response.state.name == "AwaitingRetry"
+
+    async def test_set_task_run_states_force_skips_orchestration(
+        self, task_run, client, session
+    ):
+        task_run.empirical_policy = task_run.empirical_policy.copy()
+        task_run.empirical_policy.retries = 1
+        await session.flush()
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=states.Running(),
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/bulk/set_state",
+            json=dict(
+                states=[dict(task_run_id=str(task_run.id), state=dict(type="FAILED"))],
+                force=True,
+            ),
+        )
+        (api_response,) = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert api_response.status == responses.SetStateStatus.ACCEPT
+        assert api_response.state.type == states.StateType.FAILED
+
+    async def test_set_task_run_states_returns_404_on_missing_task_run(
+        self, task_run, client
+    ):
+        response = await client.post(
+            "/task_runs/bulk/set_state",
+            json=dict(
+                states=[
+                    dict(task_run_id=str(task_run.id), state=dict(type="RUNNING")),
+                    dict(task_run_id=str(uuid4()), state=dict(type="RUNNING")),
+                ]
+            ),
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestTaskRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
@@ -407,6 +407,51 @@ class TestGetRunsInWorkQueue:
 
         assert len(response1.json()) == min(limit, 2)
 
+    async def test_get_runs_in_queue_claim(
+        self, client, work_queue, scheduled_flow_runs, running_flow_runs
+    ):
+        response = await client.post(
+            f"/work_queues/{work_queue.id}/get_runs",
+            json=dict(limit=2, claim=True, claimed_by="my-agent"),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        runs = pydantic.parse_obj_as(
+            List[schemas.responses.FlowRunResponse], response.json()
+        )
+        assert len(runs) == 2
+        assert runs[0].next_scheduled_start_time is None
+        for run in runs:
+            assert run.state.type == schemas.states.StateType.PENDING
+            assert run.state.state_details.claimed_by == "my-agent"
+
+        response = await client.post(
+            f"/work_queues/{work_queue.id}/get_runs",
+            json=dict(claim=True, claimed_by="another-agent"),
+        )
+        remaining_runs = pydantic.parse_obj_as(
+            List[schemas.responses.FlowRunResponse], response.json()
+        )
+        assert len(remaining_runs) == 1
+        assert remaining_runs[0].id not in {run.id for run in runs}
+
+    async def test_get_runs_in_queue_claimed_runs_count_towards_concurrency_limit(
+        self, client, work_queue, scheduled_flow_runs, running_flow_runs
+    ):
+        await client.patch(
+            f"/work_queues/{work_queue.id}",
+            json=dict(concurrency_limit=4),
+        )
+        response = await client.post(
+            f"/work_queues/{work_queue.id}/get_runs", json=dict(claim=True)
+        )
+        assert len(response.json()) == 1
+
+        response = await client.post(
+            f"/work_queues/{work_queue.id}/get_runs", json=dict(claim=True)
+        )
+        assert response.json() == []
+
     async def test_read_work_queue_runs_updates_work_queue_last_polled_time(
         self,
         client,
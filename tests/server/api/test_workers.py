@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 import pendulum
@@ -950,3 +951,135 @@ class TestGetScheduledRuns:
         for work_queue in work_queues:
             assert work_queue.last_polled is not None
             assert work_queue.last_polled > now
+
+    async def test_claim_runs(self, client, work_pools, work_queues):
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+            json=dict(
+                work_queue_names=[work_queues["wq_aa"].name],
+                claim=True,
+                worker_name="my-worker",
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        data = pydantic.parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(data) == 5
+        for run in data:
+            assert run.work_queue_id == work_queues["wq_aa"].id
+            assert run.flow_run.state.type == schemas.states.StateType.PENDING
+            assert run.flow_run.state.state_details.claimed_by == "my-worker"
+            assert run.flow_run.state.state_details.claim_expiration > pendulum.now()
+
+    async def test_claimed_runs_are_not_returned_again(self, client, work_pools):
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+            json=dict(limit=7, claim=True, worker_name="my-worker"),
+        )
+        claimed_ids = {run["flow_run"]["id"] for run in response.json()}
+        assert len(claimed_ids) == 7
+
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+            json=dict(claim=True, worker_name="another-worker"),
+        )
+        data = pydantic.parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(data) == 8
+        assert not claimed_ids & {str(run.flow_run.id) for run in data}
+
+
+class TestLongPollScheduledRuns:
+    @pytest.fixture
+    async def work_pool(self, session):
+        work_pool = await models.workers.create_work_pool(
+            session=session, work_pool=schemas.actions.WorkPoolCreate(name="A")
+        )
+        await session.commit()
+        return work_pool
+
+    @pytest.fixture
+    async def work_queue(self, session, work_pool):
+        work_queue = await models.workers.read_work_queue(
+            session=session, work_queue_id=work_pool.default_queue_id
+        )
+        return work_queue
+
+    async def create_scheduled_run(self, session, flow, work_queue, scheduled_time):
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=prefect.states.Scheduled(scheduled_time=scheduled_time),
+                work_queue_id=work_queue.id,
+            ),
+        )
+        await session.commit()
+        return flow_run
+
+    async def test_returns_available_runs_without_waiting(
+        self, client, session, flow, work_pool, work_queue
+    ):
+        flow_run = await self.create_scheduled_run(
+            session, flow, work_queue, pendulum.now("UTC")
+        )
+
+        start = pendulum.now("UTC")
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC")), wait_seconds=10),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [run["flow_run"]["id"] for run in response.json()] == [str(flow_run.id)]
+        assert (pendulum.now("UTC") - start).total_seconds() < 5
+
+    async def test_returns_no_runs_after_waiting(self, client, work_pool, work_queue):
+        start = pendulum.now("UTC")
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC")), wait_seconds=0.5),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert (pendulum.now("UTC") - start).total_seconds() >= 0.5
+
+    async def test_woken_by_new_flow_run(
+        self, client, session, flow, work_pool, work_queue
+    ):
+        async def create_run_while_waiting():
+            await asyncio.sleep(0.5)
+            return await self.create_scheduled_run(
+                session, flow, work_queue, pendulum.now("UTC")
+            )
+
+        start = pendulum.now("UTC")
+        response, flow_run = await asyncio.gather(
+            client.post(
+                f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+                json=dict(
+                    scheduled_before=str(pendulum.now("UTC").add(seconds=10)),
+                    wait_seconds=20,
+                ),
+            ),
+            create_run_while_waiting(),
+        )
+        assert [run["flow_run"]["id"] for run in response.json()] == [str(flow_run.id)]
+        assert (pendulum.now("UTC") - start).total_seconds() < 10
+
+    async def test_returns_when_run_becomes_due(
+        self, client, session, flow, work_pool, work_queue
+    ):
+        flow_run = await self.create_scheduled_run(
+            session, flow, work_queue, pendulum.now("UTC").add(seconds=1)
+        )
+
+        start = pendulum.now("UTC")
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC")), wait_seconds=20),
+        )
+        assert [run["flow_run"]["id"] for run in response.json()] == [str(flow_run.id)]
+        assert (pendulum.now("UTC") - start).total_seconds() < 10
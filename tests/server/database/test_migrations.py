@@ -15,8 +15,13 @@ from prefect.server.database.orm_models import (
     AioSqliteORMConfiguration,
     AsyncPostgresORMConfiguration,
 )
+from prefect.server.database.partitions import Partition, table_is_partitioned
 from prefect.server.utilities.database import get_dialect
-from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_DATABASE_PARTITION_LOGS,
+    temporary_settings,
+)
 from prefect.utilities.asyncutils import run_sync_in_worker_thread
 
 
@@ -591,3 +596,173 @@ async def test_adding_default_agent_pool_without_existing_default_queue_migratio
 
     finally:
         await run_sync_in_worker_thread(alembic_upgrade)
+
+
+async def test_moving_concurrency_limit_slots_to_slot_table(db):
+    connection_url = PREFECT_API_DATABASE_CONNECTION_URL.value()
+    dialect = get_dialect(connection_url)
+
+    # get the proper migration revisions
+    if dialect.name == "postgresql":
+        revisions = ("15f5083c16bd", "9f3b1e64d0a7")
+    else:
+        revisions = ("2dbcec43c857", "c2a7f5b3e8d1")
+
+    concurrency_limit_id = uuid4()
+    task_run_ids = sorted(str(uuid4()) for _ in range(3))
+
+    try:
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+
+        session = await db.session()
+        async with session:
+            await session.execute(
+                sa.text(
+                    "INSERT INTO concurrency_limit (id, tag, concurrency_limit,"
+                    " active_slots) values (:id, 'test', 5, :active_slots);"
+                ),
+                dict(
+                    id=str(concurrency_limit_id),
+                    active_slots=json.dumps(task_run_ids),
+                ),
+            )
+            await session.commit()
+
+        await run_sync_in_worker_thread(alembic_upgrade, revision=revisions[1])
+
+        session = await db.session()
+        async with session:
+            slots = (
+                await session.execute(
+                    sa.text(
+                        "SELECT task_run_id FROM concurrency_limit_slot WHERE"
+                        f" concurrency_limit_id = '{concurrency_limit_id}'"
+                    )
+                )
+            ).all()
+            assert sorted(str(slot[0]) for slot in slots) == task_run_ids
+
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+
+        session = await db.session()
+        async with session:
+            active_slots = (
+                await session.execute(
+                    sa.text(
+                        "SELECT active_slots FROM concurrency_limit WHERE"
+                        f" id = '{concurrency_limit_id}'"
+                    )
+                )
+            ).scalar()
+            if isinstance(active_slots, str):
+                active_slots = json.loads(active_slots)
+            assert sorted(active_slots) == task_run_ids
+
+    finally:
+        await run_sync_in_worker_thread(alembic_upgrade)
+
+
+async def _read_log_primary_key(db):
+    engine = await db.engine()
+    async with engine.connect() as connection:
+        return await connection.run_sync(
+            lambda sync_connection: sa.inspect(sync_connection).get_pk_constraint("log")
+        )
+
+
+async def test_adding_timestamp_to_log_primary_key(db):
+    connection_url = PREFECT_API_DATABASE_CONNECTION_URL.value()
+    dialect = get_dialect(connection_url)
+
+    # get the proper migration revisions
+    if dialect.name == "postgresql":
+        revisions = ("e4b7a9c1d8f2", "7a3c9e2f5b18")
+    else:
+        revisions = ("5b8e1f3a2c94", "3f8d6b1c9a27")
+
+    try:
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+        primary_key = await _read_log_primary_key(db)
+        assert primary_key["constrained_columns"] == ["id"]
+
+        await run_sync_in_worker_thread(alembic_upgrade, revision=revisions[1])
+        primary_key = await _read_log_primary_key(db)
+        assert primary_key["name"] == "pk_log"
+        assert primary_key["constrained_columns"] == ["id", "timestamp"]
+
+    finally:
+        await run_sync_in_worker_thread(alembic_upgrade)
+
+
+async def test_partitioning_log_table_in_migration(db, flow_run):
+    connection_url = PREFECT_API_DATABASE_CONNECTION_URL.value()
+    dialect = get_dialect(connection_url)
+
+    if dialect.name != "postgresql":
+        pytest.skip(reason="Log partitioning is only supported on PostgreSQL")
+    revisions = ("e4b7a9c1d8f2", "7a3c9e2f5b18")
+
+    log_id = uuid4()
+    engine = await db.engine()
+
+    try:
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+
+        session = await db.session()
+        async with session:
+            await session.execute(
+                sa.text(
+                    "INSERT INTO log (id, name, level, flow_run_id, message,"
+                    " timestamp) values (:id, 'test', 20, :flow_run_id, 'hello',"
+                    " :timestamp);"
+                ),
+                dict(
+                    id=str(log_id),
+                    flow_run_id=str(flow_run.id),
+                    timestamp=pendulum.now("UTC").subtract(days=1),
+                ),
+            )
+            await session.commit()
+
+        with temporary_settings({PREFECT_API_DATABASE_PARTITION_LOGS: True}):
+            await run_sync_in_worker_thread(alembic_upgrade, revision=revisions[1])
+
+        async with engine.connect() as connection:
+            assert await connection.run_sync(table_is_partitioned, "log")
+            partition_names = (
+                await connection.execute(
+                    sa.text(
+                        "SELECT child.relname FROM pg_inherits JOIN pg_class child ON"
+                        " child.oid = pg_inherits.inhrelid WHERE pg_inherits.inhparent"
+                        " = 'log'::regclass"
+                    )
+                )
+            ).scalars()
+            assert set(partition_names) == {
+                Partition.before_day(
+                    "log", pendulum.now("UTC").date().add(days=1)
+                ).name,
+                "log_default",
+            }
+            messages = (
+                await connection.execute(
+                    sa.text("SELECT message FROM log WHERE id = :id"),
+                    dict(id=str(log_id)),
+                )
+            ).scalars()
+            assert list(messages) == ["hello"]
+
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+
+        async with engine.connect() as connection:
+            assert not await connection.run_sync(table_is_partitioned, "log")
+            messages = (
+                await connection.execute(
+                    sa.text("SELECT message FROM log WHERE id = :id"),
+                    dict(id=str(log_id)),
+                )
+            ).scalars()
+            assert list(messages) == ["hello"]
+
+    finally:
+        await run_sync_in_worker_thread(alembic_upgrade)
@@ -949,6 +949,81 @@ class TestScheduledRuns:
         # no runs with missing states
         assert result.scalar() == 0
 
+    async def test_generating_runs_resumes_after_latest_scheduled_run(
+        self, deployment, session, db, monkeypatch
+    ):
+        (orm_deployment,) = await session.execute(
+            sa.select(db.Deployment).where(db.Deployment.id == deployment.id)
+        )
+        orm_deployment = orm_deployment[0]
+        now = pendulum.now("UTC")
+        all_dates = await deployment.schedule.get_dates(n=5, start=now)
+
+        starts = []
+        get_dates_generator = type(deployment.schedule)._get_dates_generator
+
+        def spy(self, n=None, start=None, end=None):
+            starts.append((n, start))
+            return get_dates_generator(self, n=n, start=start, end=end)
+
+        monkeypatch.setattr(type(deployment.schedule), "_get_dates_generator", spy)
+
+        runs = models.deployments._generate_scheduled_flow_runs_for_deployment(
+            deployment=orm_deployment,
+            start_time=now,
+            end_time=now.add(days=100),
+            min_time=datetime.timedelta(),
+            min_runs=5,
+            max_runs=100,
+            scheduled_times=set(all_dates[:3]),
+        )
+
+        assert [r["expected_start_time"] for r in runs] == all_dates[3:]
+        assert starts == [(98, all_dates[2])]
+
+    async def test_generating_runs_does_nothing_when_minimums_are_scheduled(
+        self, deployment, session, db
+    ):
+        (orm_deployment,) = await session.execute(
+            sa.select(db.Deployment).where(db.Deployment.id == deployment.id)
+        )
+        now = pendulum.now("UTC")
+        dates = await deployment.schedule.get_dates(n=3, start=now)
+
+        runs = models.deployments._generate_scheduled_flow_runs_for_deployment(
+            deployment=orm_deployment[0],
+            start_time=now,
+            end_time=now.add(days=100),
+            min_time=datetime.timedelta(),
+            min_runs=3,
+            max_runs=100,
+            scheduled_times=set(dates),
+        )
+        assert runs == []
+
+    async def test_read_deployments_to_schedule_includes_runs_in_any_state(
+        self, deployment, session
+    ):
+        run_ids = await models.deployments.schedule_runs(
+            session, deployment_id=deployment.id, min_runs=3
+        )
+        await models.flow_runs.set_flow_run_state(
+            session, run_ids[0], state=schemas.states.Cancelled()
+        )
+        runs = [
+            await models.flow_runs.read_flow_run(session, run_id) for run_id in run_ids
+        ]
+
+        ((orm_deployment, scheduled_times),) = (
+            await models.deployments._read_deployments_to_schedule(
+                session=session,
+                deployment_ids=[deployment.id],
+                start_time=pendulum.now("UTC"),
+            )
+        )
+        assert orm_deployment.id == deployment.id
+        assert scheduled_times == {run.expected_start_time for run in runs}
+
 
 class TestUpdateDeployment:
     async def test_updating_deployment_creates_associated_work_queue(
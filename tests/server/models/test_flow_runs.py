@@ -3,6 +3,7 @@ from uuid import uuid4
 import pendulum
 import pytest
 import sqlalchemy as sa
+from cachetools import LRUCache
 
 from prefect.server import models, schemas
 from prefect.server.exceptions import ObjectNotFoundError
@@ -1212,6 +1213,131 @@ class TestReadFlowRunTaskRunDependencies:
                 session=session, flow_run_id=uuid4()
             )
 
+    async def create_task_run(self, session, flow_run, key, **kwargs):
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id, task_key=key, dynamic_key="0", **kwargs
+            ),
+        )
+        await session.commit()
+        return task_run
+
+    async def test_read_task_run_dependencies_includes_state(self, flow_run, session):
+        task_run = await self.create_task_run(
+            session, flow_run, "key-1", state=schemas.states.Running()
+        )
+
+        (dependency,) = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        assert dependency["state"].id == task_run.state.id
+        assert dependency["state"].type == schemas.states.StateType.RUNNING
+        assert dependency["untrackable_result"] is False
+        # the run time of running task runs is estimated
+        assert dependency["estimated_run_time"] > dependency["total_run_time"]
+
+    async def test_read_task_run_dependencies_reads_updates(self, flow_run, session):
+        task_run_1 = await self.create_task_run(session, flow_run, "key-1")
+        await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run_1.id,
+            state=schemas.states.Completed(),
+            force=True,
+        )
+        await session.commit()
+        task_run_2 = await self.create_task_run(
+            session,
+            flow_run,
+            "key-2",
+            task_inputs=dict(x={TaskRunResult(id=task_run_1.id)}),
+        )
+
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        states = {d["id"]: d["state"] and d["state"].type for d in dependencies}
+        assert states == {
+            task_run_1.id: schemas.states.StateType.COMPLETED,
+            task_run_2.id: None,
+        }
+
+    async def test_read_task_run_dependencies_since(self, flow_run, session):
+        await self.create_task_run(session, flow_run, "key-1")
+        since = pendulum.now("UTC")
+        task_run_2 = await self.create_task_run(session, flow_run, "key-2")
+
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id, since=since
+        )
+        assert [d["id"] for d in dependencies] == [task_run_2.id]
+
+    async def test_read_task_run_dependencies_after_deleting_task_run(
+        self, flow_run, session
+    ):
+        task_run_1 = await self.create_task_run(session, flow_run, "key-1")
+        task_run_2 = await self.create_task_run(session, flow_run, "key-2")
+        await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        await models.task_runs.delete_task_run(
+            session=session, task_run_id=task_run_1.id
+        )
+        await session.commit()
+
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+        assert [d["id"] for d in dependencies] == [task_run_2.id]
+
+    async def test_read_task_run_dependencies_after_replacing_task_run(
+        self, flow_run, session
+    ):
+        task_run_1 = await self.create_task_run(session, flow_run, "key-1")
+        await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        # the number of task runs is unchanged
+        await models.task_runs.delete_task_run(
+            session=session, task_run_id=task_run_1.id
+        )
+        task_run_2 = await self.create_task_run(session, flow_run, "key-2")
+
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+        assert [d["id"] for d in dependencies] == [task_run_2.id]
+
+    async def test_task_run_dependency_cache_is_bounded_by_task_runs(
+        self, flow_run, session, monkeypatch
+    ):
+        cache = LRUCache(maxsize=2, getsizeof=lambda graph: max(len(graph.nodes), 1))
+        monkeypatch.setattr(
+            "prefect.server.models.flow_runs.TASK_RUN_DEPENDENCY_CACHE", cache
+        )
+
+        await self.create_task_run(session, flow_run, "key-1")
+        await self.create_task_run(session, flow_run, "key-2")
+        await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+        assert cache.currsize == 2
+
+        await self.create_task_run(session, flow_run, "key-3")
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+        assert len(dependencies) == 3
+        assert flow_run.id not in cache
+
 
 class TestDeleteFlowRun:
     async def test_delete_flow_run(self, flow, session):
@@ -74,6 +74,38 @@ class TestCreateLogs:
                 == log_data[i]
             )
 
+    async def test_create_logs_is_part_of_session_transaction(
+        self, db, flow_run_id, log_data
+    ):
+        async with db.session_context(begin_transaction=True) as session:
+            await models.logs.create_logs(session=session, logs=log_data)
+            await session.rollback()
+
+        async with db.session_context() as session:
+            result = await session.execute(
+                select(db.Log).where(db.Log.flow_run_id == flow_run_id)
+            )
+            assert result.scalars().all() == []
+
+    async def test_create_logs_with_many_logs(self, session, flow_run_id, db):
+        log_data = [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=f"Log {i}",
+                timestamp=NOW + timedelta(seconds=i),
+                flow_run_id=flow_run_id,
+            )
+            for i in range(models.logs.LOG_BATCH_SIZE)
+        ]
+        await models.logs.create_logs(session=session, logs=log_data)
+
+        logs = await models.logs.read_logs(
+            session=session,
+            log_filter=LogFilter(flow_run_id={"any_": [flow_run_id]}),
+        )
+        assert [log.message for log in logs] == [log.message for log in log_data]
+
 
 class TestReadLogs:
     async def test_read_logs_timestamp_after_inclusive(self, session, logs, log_data):
@@ -40,6 +40,11 @@ from prefect.server.orchestration.rules import (
 from prefect.server.schemas import actions, states
 from prefect.server.schemas.responses import SetStateStatus
 from prefect.server.schemas.states import StateType
+from prefect.settings import (
+    PREFECT_API_TASK_RUN_CONCURRENCY_MAX_WAIT_SECONDS,
+    PREFECT_API_TASK_RUN_CONCURRENCY_SLOT_LEASE_SECONDS,
+    temporary_settings,
+)
 from prefect.testing.utilities import AsyncMock
 
 # Convert constants from sets to lists for deterministic ordering of tests
@@ -1430,6 +1435,159 @@ class TestTaskConcurrencyLimits:
         assert task2_run_retry_ctx.response_status == SetStateStatus.ACCEPT
         assert (await self.count_concurrency_slots(session, "some tag")) == 1
 
+    async def test_expired_concurrency_slots_are_released(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+
+        async def propose_running():
+            ctx = await initialize_orchestration(
+                session, "task", *running_transition, run_tags=["some tag"]
+            )
+            async with contextlib.AsyncExitStack() as stack:
+                for rule in concurrency_policy:
+                    ctx = await stack.enter_async_context(
+                        rule(ctx, *running_transition)
+                    )
+                await ctx.validate_proposed_state()
+            return ctx
+
+        with temporary_settings(
+            {PREFECT_API_TASK_RUN_CONCURRENCY_SLOT_LEASE_SECONDS: 60}
+        ):
+            task1_running_ctx = await propose_running()
+            assert task1_running_ctx.response_status == SetStateStatus.ACCEPT
+
+            task2_running_ctx = await propose_running()
+            assert task2_running_ctx.response_status == SetStateStatus.WAIT
+
+            # the first task never reports a final state, e.g. because its process
+            # crashed, so its slot is taken over once the lease expires
+            pendulum.set_test_now(pendulum.now("UTC").add(seconds=61))
+            try:
+                task3_running_ctx = await propose_running()
+            finally:
+                pendulum.set_test_now()
+
+        assert task3_running_ctx.response_status == SetStateStatus.ACCEPT
+        assert await self.read_concurrency_slots(session, "some tag") == [
+            task3_running_ctx.run.id
+        ]
+
+    async def test_waiting_runs_are_given_slots_in_order(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        completed_transition = (states.StateType.RUNNING, states.StateType.COMPLETED)
+
+        async def propose(transition, run=None):
+            ctx = await initialize_orchestration(
+                session, "task", *transition, run_override=run, run_tags=["some tag"]
+            )
+            async with contextlib.AsyncExitStack() as stack:
+                for rule in concurrency_policy:
+                    ctx = await stack.enter_async_context(rule(ctx, *transition))
+                await ctx.validate_proposed_state()
+            return ctx
+
+        task1_ctx = await propose(running_transition)
+        assert task1_ctx.response_status == SetStateStatus.ACCEPT
+
+        # runs further back in the queue are told to wait longer
+        task2_ctx = await propose(running_transition)
+        assert task2_ctx.response_status == SetStateStatus.WAIT
+        assert task2_ctx.response_details.delay_seconds == 1
+
+        task3_ctx = await propose(running_transition)
+        assert task3_ctx.response_status == SetStateStatus.WAIT
+        assert task3_ctx.response_details.delay_seconds == 2
+
+        await propose(completed_transition, run=task1_ctx.run)
+
+        # the freed slot is held for the run that started waiting first; the waiting
+        # runs are already pending, so their retries do not commit a new state first
+        retry_transition = (None, states.StateType.RUNNING)
+        task3_retry_ctx = await propose(retry_transition, run=task3_ctx.run)
+        assert task3_retry_ctx.response_status == SetStateStatus.WAIT
+        assert task3_retry_ctx.response_details.delay_seconds == 2
+
+        task2_retry_ctx = await propose(retry_transition, run=task2_ctx.run)
+        assert task2_retry_ctx.response_status == SetStateStatus.ACCEPT
+        assert await self.read_concurrency_slots(session, "some tag") == [
+            task2_ctx.run.id
+        ]
+
+    async def test_waiting_runs_lose_their_place_if_they_do_not_try_again(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        completed_transition = (states.StateType.RUNNING, states.StateType.COMPLETED)
+
+        async def propose(transition, run=None):
+            ctx = await initialize_orchestration(
+                session, "task", *transition, run_override=run, run_tags=["some tag"]
+            )
+            async with contextlib.AsyncExitStack() as stack:
+                for rule in concurrency_policy:
+                    ctx = await stack.enter_async_context(rule(ctx, *transition))
+                await ctx.validate_proposed_state()
+            return ctx
+
+        with temporary_settings(
+            {PREFECT_API_TASK_RUN_CONCURRENCY_MAX_WAIT_SECONDS: 10}
+        ):
+            task1_ctx = await propose(running_transition)
+            task2_ctx = await propose(running_transition)
+            assert task2_ctx.response_status == SetStateStatus.WAIT
+            await propose(completed_transition, run=task1_ctx.run)
+
+            pendulum.set_test_now(pendulum.now("UTC").add(seconds=21))
+            try:
+                task3_ctx = await propose(running_transition)
+            finally:
+                pendulum.set_test_now()
+
+        assert task3_ctx.response_status == SetStateStatus.ACCEPT
+
+    async def test_concurrency_slots_do_not_expire_by_default(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+
+        ctx = await initialize_orchestration(
+            session, "task", *running_transition, run_tags=["some tag"]
+        )
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in concurrency_policy:
+                ctx = await stack.enter_async_context(rule(ctx, *running_transition))
+            await ctx.validate_proposed_state()
+
+        assert ctx.response_status == SetStateStatus.ACCEPT
+        limit = await concurrency_limits.read_concurrency_limit_by_tag(
+            session, "some tag"
+        )
+        assert [slot.expires for slot in limit.slots] == [None]
+
     async def test_concurrency_limit_cancelling_transition(
         self,
         session,
@@ -15,6 +15,7 @@ from prefect.server.schemas.schedules import (
     CronSchedule,
     IntervalSchedule,
     RRuleSchedule,
+    _get_cached_rrule,
 )
 
 dt = pendulum.datetime(2020, 1, 1)
@@ -220,6 +221,35 @@ class TestIntervalSchedule:
             datetime(2022, 1, 3),
         ]
 
+    @pytest.mark.parametrize(
+        "interval",
+        [
+            timedelta(minutes=7, seconds=1.5),
+            timedelta(hours=17),
+            timedelta(days=3, hours=1),
+        ],
+    )
+    async def test_utc_dates_match_stepping_through_intervals(self, interval):
+        clock = IntervalSchedule(
+            interval=interval, anchor_date=datetime(2022, 2, 3, 1, 2, 3)
+        )
+        start = datetime(2022, 3, 12)
+        dates = await clock.get_dates(n=50, start=start)
+
+        expected = []
+        next_date = clock.anchor_date
+        while len(expected) < 50:
+            if next_date >= start:
+                expected.append(next_date)
+            next_date = next_date.add(seconds=interval.total_seconds())
+        assert dates == expected
+        assert all(d.timezone_name == "UTC" for d in dates)
+
+    async def test_utc_dates_respect_max_iterations(self):
+        clock = IntervalSchedule(interval=timedelta(seconds=1))
+        dates = await clock.get_dates(n=MAX_ITERATIONS * 2)
+        assert len(dates) == MAX_ITERATIONS + 2
+
 
 class TestCreateCronSchedule:
     def test_create_cron_schedule(self):
@@ -628,6 +658,38 @@ class TestRRuleSchedule:
         )
         assert dates == [start_date.add(days=i) for i in range(2)]
 
+    async def test_rrule_is_parsed_once_across_calls(self):
+        s = RRuleSchedule.from_rrule(
+            rrule.rrule(freq=rrule.HOURLY, dtstart=datetime(2011, 1, 1))
+        )
+        with mock.patch(
+            "dateutil.rrule.rrulestr", wraps=dateutil.rrule.rrulestr
+        ) as rrulestr:
+            first = await s.get_dates(5, start=datetime(2023, 1, 1))
+            second = await s.get_dates(5, start=datetime(2023, 1, 1, 2))
+        assert rrulestr.call_count <= 2  # validation and localization on a miss
+        assert second == first[2:] + [
+            datetime(2023, 1, 1, 5),
+            datetime(2023, 1, 1, 6),
+        ]
+
+    @pytest.mark.parametrize(
+        "rrule_string",
+        [
+            "DTSTART:20110101T000000\nRRULE:FREQ=HOURLY",
+            "DTSTART:20110101T000000\nRRULE:FREQ=HOURLY\nEXDATE:20230101T030000",
+        ],
+    )
+    async def test_shared_rrules_and_rrulesets_do_not_cache_occurrences(
+        self, rrule_string
+    ):
+        s = RRuleSchedule(rrule=rrule_string)
+        await s.get_dates(5, start=datetime(2023, 1, 1))
+        shared = _get_cached_rrule(s.rrule, s.timezone)
+        assert shared._cache is None
+        for component in getattr(shared, "_rrule", []):
+            assert component._cache is None
+
     async def test_rrule_returns_nothing_before_dtstart(self):
         s = RRuleSchedule.from_rrule(
             rrule.rrule(freq=rrule.DAILY, dtstart=pendulum.datetime(2030, 1, 1))
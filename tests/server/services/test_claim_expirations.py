@@ -0,0 +1,96 @@
+import pendulum
+import pytest
+
+from prefect.server import models, schemas
+from prefect.server.services.claim_expirations import RescheduleExpiredClaims
+
+THE_PAST = pendulum.now("UTC") - pendulum.Duration(hours=5)
+THE_FUTURE = pendulum.now("UTC") + pendulum.Duration(days=5)
+
+
+async def create_claimed_flow_run(session, flow, claim_expiration, **kwargs):
+    async with session.begin():
+        return await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=schemas.states.Pending(
+                    state_details=schemas.states.StateDetails(
+                        claimed_by="my-worker", claim_expiration=claim_expiration
+                    )
+                ),
+                **kwargs,
+            ),
+        )
+
+
+@pytest.fixture
+async def expired_claim(session, flow):
+    return await create_claimed_flow_run(session, flow, THE_PAST)
+
+
+@pytest.fixture
+async def active_claim(session, flow):
+    return await create_claimed_flow_run(session, flow, THE_FUTURE)
+
+
+@pytest.fixture
+async def expired_claim_with_infrastructure(session, flow):
+    return await create_claimed_flow_run(
+        session, flow, THE_PAST, infrastructure_pid="my-pid"
+    )
+
+
+@pytest.fixture
+async def unclaimed_pending_run(session, flow):
+    async with session.begin():
+        return await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Pending()
+            ),
+        )
+
+
+async def test_reschedules_expired_claim(session, expired_claim):
+    await RescheduleExpiredClaims(handle_signals=False).start(loops=1)
+    await session.refresh(expired_claim)
+    assert expired_claim.state.type == "SCHEDULED"
+    assert "my-worker" in expired_claim.state.message
+    assert expired_claim.next_scheduled_start_time <= pendulum.now("UTC")
+
+
+async def test_does_not_reschedule_active_claim(session, active_claim):
+    await RescheduleExpiredClaims(handle_signals=False).start(loops=1)
+    await session.refresh(active_claim)
+    assert active_claim.state.type == "PENDING"
+
+
+async def test_does_not_reschedule_runs_with_infrastructure(
+    session, expired_claim_with_infrastructure
+):
+    await RescheduleExpiredClaims(handle_signals=False).start(loops=1)
+    await session.refresh(expired_claim_with_infrastructure)
+    assert expired_claim_with_infrastructure.state.type == "PENDING"
+
+
+async def test_does_not_reschedule_unclaimed_runs(session, unclaimed_pending_run):
+    await RescheduleExpiredClaims(handle_signals=False).start(loops=1)
+    await session.refresh(unclaimed_pending_run)
+    assert unclaimed_pending_run.state.type == "PENDING"
+
+
+async def test_reschedules_expired_claims_in_batches(session, flow, active_claim):
+    expired_claims = [
+        await create_claimed_flow_run(session, flow, THE_PAST) for _ in range(5)
+    ]
+
+    service = RescheduleExpiredClaims(handle_signals=False)
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    for flow_run in expired_claims:
+        await session.refresh(flow_run)
+        assert flow_run.state.type == "SCHEDULED"
+    await session.refresh(active_claim)
+    assert active_claim.state.type == "PENDING"
@@ -0,0 +1,220 @@
+import datetime
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server.database.partitions import (
+    Partition,
+    create_partition,
+    drop_partition,
+    is_partitioned,
+    partition_log_table,
+    partitions_to_create,
+    partitions_to_drop,
+    read_partitions,
+    unpartition_table,
+)
+from prefect.server.services.log_partitions import LogPartitions
+from prefect.server.utilities.database import get_dialect
+from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
+
+NOW = pendulum.datetime(2023, 5, 10, 13, 30, tz="UTC")
+
+
+class TestPartition:
+    def test_for_day(self):
+        partition = Partition.for_day("log", datetime.date(2023, 5, 10))
+        assert partition == Partition(
+            name="log_p20230510",
+            start=pendulum.datetime(2023, 5, 10, tz="UTC"),
+            end=pendulum.datetime(2023, 5, 11, tz="UTC"),
+        )
+
+    def test_before_day(self):
+        partition = Partition.before_day("log", datetime.date(2023, 5, 10))
+        assert partition == Partition(
+            name="log_before_p20230510",
+            start=None,
+            end=pendulum.datetime(2023, 5, 10, tz="UTC"),
+        )
+
+    @pytest.mark.parametrize(
+        "partition",
+        [
+            Partition.for_day("log", datetime.date(2023, 5, 10)),
+            Partition.before_day("log", datetime.date(2023, 5, 10)),
+            Partition.for_day("task_run_state", datetime.date(2023, 12, 31)),
+        ],
+    )
+    def test_from_name_round_trips(self, partition):
+        assert Partition.from_name(partition.name) == partition
+
+    @pytest.mark.parametrize("name", ["log_default", "log", "log_p2023"])
+    def test_from_name_ignores_other_partitions(self, name):
+        assert Partition.from_name(name) is None
+
+
+class TestPartitionsToCreate:
+    def test_creates_today_and_premade_days(self):
+        partitions = partitions_to_create("log", [], now=NOW, premake=2)
+        assert [partition.name for partition in partitions] == [
+            "log_p20230510",
+            "log_p20230511",
+            "log_p20230512",
+        ]
+
+    def test_skips_days_covered_by_existing_partitions(self):
+        existing = [
+            Partition.before_day("log", datetime.date(2023, 5, 11)),
+            Partition.for_day("log", datetime.date(2023, 5, 11)),
+        ]
+        partitions = partitions_to_create("log", existing, now=NOW, premake=2)
+        assert [partition.name for partition in partitions] == ["log_p20230512"]
+
+    def test_nothing_to_create(self):
+        existing = [
+            Partition.for_day("log", datetime.date(2023, 5, 10 + offset))
+            for offset in range(3)
+        ]
+        assert partitions_to_create("log", existing, now=NOW, premake=2) == []
+
+
+class TestPartitionsToDrop:
+    def test_drops_partitions_older_than_retention(self):
+        existing = [
+            Partition.before_day("log", datetime.date(2023, 5, 1)),
+            Partition.for_day("log", datetime.date(2023, 5, 1)),
+            Partition.for_day("log", datetime.date(2023, 5, 2)),
+            Partition.for_day("log", datetime.date(2023, 5, 3)),
+        ]
+        partitions = partitions_to_drop(
+            existing, now=NOW, retention=datetime.timedelta(days=8)
+        )
+        assert [partition.name for partition in partitions] == [
+            "log_before_p20230501",
+            "log_p20230501",
+        ]
+
+    def test_partition_with_unexpired_logs_is_kept(self):
+        existing = [Partition.for_day("log", datetime.date(2023, 5, 10))]
+        assert (
+            partitions_to_drop(existing, now=NOW, retention=datetime.timedelta(hours=1))
+            == []
+        )
+
+
+class TestLogPartitions:
+    async def test_log_table_is_not_partitioned(self, session, db):
+        assert not await is_partitioned(session, db, db.Log.__table__)
+
+    async def test_service_does_nothing_if_not_partitioned(self, caplog):
+        await LogPartitions(handle_signals=False).start(loops=1)
+        assert "Created log partition" not in caplog.text
+
+
+@pytest.fixture
+def postgres_only():
+    dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
+    if dialect.name != "postgresql":
+        pytest.skip(reason="Log partitioning is only supported on PostgreSQL")
+
+
+@pytest.fixture
+async def partitioned_log_table(postgres_only, db):
+    async with db.session_context(begin_transaction=True) as session:
+        await partition_log_table(session, db)
+    yield db.Log.__table__
+    async with db.session_context(begin_transaction=True) as session:
+        await session.run_sync(
+            lambda sync_session: unpartition_table(sync_session.connection(), "log")
+        )
+
+
+async def insert_log(session, timestamp: datetime.datetime) -> None:
+    await session.execute(
+        sa.text(
+            "INSERT INTO log (id, name, level, message, timestamp) values"
+            " (:id, 'test', 20, 'hello', :timestamp)"
+        ),
+        {"id": str(uuid4()), "timestamp": timestamp},
+    )
+
+
+async def count_logs(session, table_name: str) -> int:
+    result = await session.execute(sa.text(f"SELECT count(*) FROM {table_name}"))
+    return result.scalar()
+
+
+class TestPostgresPartitioning:
+    async def test_partition_log_table(self, partitioned_log_table, db):
+        tomorrow = pendulum.now("UTC").date().add(days=1)
+        async with db.session_context() as session:
+            assert await is_partitioned(session, db, partitioned_log_table)
+            assert await read_partitions(session, partitioned_log_table) == [
+                Partition.before_day("log", tomorrow)
+            ]
+
+    async def test_partition_log_table_twice_raises(self, partitioned_log_table, db):
+        async with db.session_context(begin_transaction=True) as session:
+            with pytest.raises(ValueError, match="already partitioned"):
+                await partition_log_table(session, db)
+
+    async def test_logs_are_routed_to_partitions(self, partitioned_log_table, db):
+        async with db.session_context(begin_transaction=True) as session:
+            await insert_log(session, pendulum.now("UTC"))
+            await insert_log(session, pendulum.now("UTC").add(days=7))
+
+        before = Partition.before_day("log", pendulum.now("UTC").date().add(days=1))
+        async with db.session_context() as session:
+            assert await count_logs(session, before.name) == 1
+            assert await count_logs(session, "log_default") == 1
+
+    async def test_create_partition_attaches_and_moves_logs(
+        self, partitioned_log_table, db
+    ):
+        partition = Partition.for_day("log", pendulum.now("UTC").date().add(days=7))
+        async with db.session_context(begin_transaction=True) as session:
+            await insert_log(session, partition.start.add(hours=1))
+            await insert_log(session, partition.end.add(hours=1))
+
+        async with db.session_context(begin_transaction=True) as session:
+            moved = await create_partition(session, partitioned_log_table, partition)
+        assert moved == 1
+
+        async with db.session_context() as session:
+            assert partition in await read_partitions(session, partitioned_log_table)
+            assert await count_logs(session, partition.name) == 1
+            assert await count_logs(session, "log_default") == 1
+            assert await count_logs(session, "log") == 2
+
+    async def test_drop_partition(self, partitioned_log_table, db):
+        partition = Partition.for_day("log", pendulum.now("UTC").date().add(days=7))
+        async with db.session_context(begin_transaction=True) as session:
+            await create_partition(session, partitioned_log_table, partition)
+            await insert_log(session, partition.start.add(hours=1))
+
+        async with db.session_context(begin_transaction=True) as session:
+            await drop_partition(session, partitioned_log_table, partition)
+
+        async with db.session_context() as session:
+            assert partition not in await read_partitions(
+                session, partitioned_log_table
+            )
+            assert await count_logs(session, "log") == 0
+
+    async def test_unpartition_table_keeps_logs(self, postgres_only, db):
+        async with db.session_context(begin_transaction=True) as session:
+            await insert_log(session, pendulum.now("UTC"))
+            await partition_log_table(session, db)
+            await insert_log(session, pendulum.now("UTC").add(days=7))
+
+        async with db.session_context(begin_transaction=True) as session:
+            await session.run_sync(
+                lambda sync_session: unpartition_table(sync_session.connection(), "log")
+            )
+
+        async with db.session_context() as session:
+            assert not await is_partitioned(session, db, db.Log.__table__)
+            assert await count_logs(session, "log") == 2
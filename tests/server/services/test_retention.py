@@ -0,0 +1,268 @@
+from unittest.mock import MagicMock
+
+import pendulum
+import pytest
+
+from prefect.server import models, schemas
+from prefect.server.database import partitions
+from prefect.server.schemas import states
+from prefect.server.services.retention import DataRetention
+from prefect.settings import (
+    PREFECT_API_FLOW_RUN_RETENTION_PERIOD,
+    PREFECT_API_LOG_RETENTION_PERIOD,
+    PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED,
+    PREFECT_API_SERVICES_RETENTION_BATCH_DELAY_SECONDS,
+    temporary_settings,
+)
+
+THE_PAST = pendulum.now("UTC") - pendulum.Duration(hours=5)
+THE_ANCIENT_PAST = pendulum.now("UTC") - pendulum.Duration(days=100)
+
+
+@pytest.fixture(autouse=True)
+def retention_settings():
+    with temporary_settings(
+        {
+            PREFECT_API_FLOW_RUN_RETENTION_PERIOD: pendulum.Duration(days=30),
+            PREFECT_API_LOG_RETENTION_PERIOD: pendulum.Duration(days=30),
+            PREFECT_API_SERVICES_RETENTION_BATCH_DELAY_SECONDS: 0,
+        }
+    ):
+        yield
+
+
+async def create_flow_run(session, flow, state, end_time):
+    async with session.begin():
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=state, end_time=end_time
+            ),
+        )
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="my-key",
+                dynamic_key="0",
+                state=states.Completed(),
+            ),
+        )
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                schemas.actions.LogCreate(
+                    name="prefect.flow_runs",
+                    level=20,
+                    message="Hello",
+                    timestamp=pendulum.now("UTC"),
+                    flow_run_id=flow_run.id,
+                    task_run_id=task_run.id,
+                )
+            ],
+        )
+        await models.artifacts.create_artifact(
+            session=session,
+            artifact=schemas.core.Artifact(
+                key="retained",
+                data=str(flow_run.id),
+                flow_run_id=flow_run.id,
+                task_run_id=task_run.id,
+            ),
+        )
+    return flow_run
+
+
+@pytest.fixture
+async def old_completed_flow_run(session, flow):
+    return await create_flow_run(session, flow, states.Completed(), THE_ANCIENT_PAST)
+
+
+@pytest.fixture
+async def recent_completed_flow_run(session, flow):
+    return await create_flow_run(session, flow, states.Completed(), THE_PAST)
+
+
+@pytest.fixture
+async def old_running_flow_run(session, flow):
+    return await create_flow_run(session, flow, states.Running(), THE_ANCIENT_PAST)
+
+
+async def read_flow_run_ids(session, db):
+    result = await session.execute(db.FlowRun.__table__.select())
+    return {row.id for row in result}
+
+
+async def test_deletes_expired_flow_runs_and_dependents(
+    session, db, old_completed_flow_run, recent_completed_flow_run
+):
+    await DataRetention(handle_signals=False).start(loops=1)
+
+    assert await read_flow_run_ids(session, db) == {recent_completed_flow_run.id}
+    for model in [db.TaskRun, db.Log, db.Artifact]:
+        result = await session.execute(
+            model.__table__.select().where(
+                model.flow_run_id == old_completed_flow_run.id
+            )
+        )
+        assert result.all() == []
+
+    result = await session.execute(
+        db.FlowRunState.__table__.select().where(
+            db.FlowRunState.flow_run_id == old_completed_flow_run.id
+        )
+    )
+    assert result.all() == []
+
+
+async def test_artifact_collection_points_to_remaining_version(
+    session, recent_completed_flow_run, old_completed_flow_run
+):
+    await DataRetention(handle_signals=False).start(loops=1)
+
+    latest = await models.artifacts.read_latest_artifact(
+        session=session, key="retained"
+    )
+    assert latest.flow_run_id == recent_completed_flow_run.id
+
+
+async def test_does_not_delete_non_terminal_flow_runs(
+    session, db, old_running_flow_run
+):
+    await DataRetention(handle_signals=False).start(loops=1)
+
+    assert await read_flow_run_ids(session, db) == {old_running_flow_run.id}
+
+
+async def test_deletes_flow_runs_in_batches(session, db, flow):
+    for _ in range(5):
+        await create_flow_run(session, flow, states.Failed(), THE_ANCIENT_PAST)
+
+    service = DataRetention(handle_signals=False)
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    assert await read_flow_run_ids(session, db) == set()
+
+
+async def test_deletes_dependents_in_chunks(session, db, old_completed_flow_run):
+    async with session.begin():
+        for i in range(4):
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=old_completed_flow_run.id,
+                    task_key="my-key",
+                    dynamic_key=str(i + 1),
+                    state=states.Completed(),
+                ),
+            )
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                schemas.actions.LogCreate(
+                    name="prefect.flow_runs",
+                    level=20,
+                    message="Hello",
+                    timestamp=pendulum.now("UTC"),
+                    flow_run_id=old_completed_flow_run.id,
+                )
+            ]
+            * 4,
+        )
+
+    service = DataRetention(handle_signals=False)
+    service.chunk_size = 2
+    service.logger = MagicMock()
+    await service.start(loops=1)
+
+    assert await read_flow_run_ids(session, db) == set()
+    for model in [db.TaskRun, db.Log]:
+        result = await session.execute(model.__table__.select())
+        assert result.all() == []
+    service.logger.info.assert_called_once_with(
+        "Finished deleting expired data: 1 flow runs, 5 task runs, 1 artifacts, 5 logs."
+    )
+
+
+async def test_nothing_deleted_without_retention_periods(
+    session, db, old_completed_flow_run
+):
+    with temporary_settings(
+        restore_defaults={
+            PREFECT_API_FLOW_RUN_RETENTION_PERIOD,
+            PREFECT_API_LOG_RETENTION_PERIOD,
+        }
+    ):
+        await DataRetention(handle_signals=False).start(loops=1)
+
+    assert await read_flow_run_ids(session, db) == {old_completed_flow_run.id}
+
+
+async def test_deletes_expired_logs(session, db, recent_completed_flow_run):
+    async with session.begin():
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                schemas.actions.LogCreate(
+                    name="prefect.flow_runs",
+                    level=20,
+                    message="Old news",
+                    timestamp=THE_ANCIENT_PAST,
+                    flow_run_id=recent_completed_flow_run.id,
+                )
+            ],
+        )
+
+    service = DataRetention(handle_signals=False)
+    service.logger = MagicMock()
+    await service.start(loops=1)
+
+    result = await session.execute(db.Log.__table__.select())
+    assert [log.message for log in result] == ["Hello"]
+    service.logger.info.assert_called_once_with(
+        "Finished deleting expired data: 0 flow runs, 0 task runs, 0 artifacts, 1 logs."
+    )
+
+
+@pytest.fixture
+async def expired_log(session, recent_completed_flow_run):
+    async with session.begin():
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                schemas.actions.LogCreate(
+                    name="prefect.flow_runs",
+                    level=20,
+                    message="Old news",
+                    timestamp=THE_ANCIENT_PAST,
+                    flow_run_id=recent_completed_flow_run.id,
+                )
+            ],
+        )
+
+
+@pytest.fixture
+def partitioned_logs(monkeypatch):
+    async def is_partitioned(session, db, table):
+        return True
+
+    monkeypatch.setattr(partitions, "is_partitioned", is_partitioned)
+
+
+@pytest.mark.usefixtures("expired_log", "partitioned_logs")
+async def test_leaves_partitioned_logs_to_log_partitions_service(session, db):
+    with temporary_settings({PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED: True}):
+        await DataRetention(handle_signals=False).start(loops=1)
+
+    result = await session.execute(db.Log.__table__.select())
+    assert sorted(log.message for log in result) == ["Hello", "Old news"]
+
+
+@pytest.mark.usefixtures("expired_log", "partitioned_logs")
+async def test_deletes_partitioned_logs_without_log_partitions_service(session, db):
+    with temporary_settings({PREFECT_API_SERVICES_LOG_PARTITIONS_ENABLED: False}):
+        await DataRetention(handle_signals=False).start(loops=1)
+
+    result = await session.execute(db.Log.__table__.select())
+    assert [log.message for log in result] == ["Hello"]
@@ -236,6 +236,90 @@ async def test_scheduler_runs_when_too_few_scheduled_runs_but_doesnt_overwrite(
     assert {r.state_type for r in runs} == {"SCHEDULED", "SCHEDULED", "CANCELLED"}
 
 
+async def test_scheduler_skips_runs_that_are_already_scheduled(flow, session):
+    await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="test",
+            flow_id=flow.id,
+            schedule=schemas.schedules.IntervalSchedule(
+                interval=datetime.timedelta(hours=1)
+            ),
+        ),
+    )
+    await session.commit()
+
+    service = Scheduler(handle_signals=False)
+    await service.start(loops=1)
+    assert service.last_loop_metrics.inserted_runs == service.min_runs
+
+    # the existing runs are filtered out before insertion
+    service = Scheduler(handle_signals=False)
+    await service.start(loops=1)
+    assert service.last_loop_metrics.inserted_runs == 0
+    assert await models.flow_runs.count_flow_runs(session) == service.min_runs
+
+
+async def test_scheduler_reports_loop_metrics(flow, session):
+    for i in range(3):
+        await models.deployments.create_deployment(
+            session=session,
+            deployment=schemas.core.Deployment(
+                name=f"test-{i}",
+                flow_id=flow.id,
+                schedule=schemas.schedules.IntervalSchedule(
+                    interval=datetime.timedelta(hours=1)
+                ),
+            ),
+        )
+    await session.commit()
+
+    service = Scheduler(handle_signals=False)
+    assert service.last_loop_metrics is None
+    await service.start(loops=1)
+
+    metrics = service.last_loop_metrics
+    assert metrics.deployments == 3
+    assert metrics.inserted_runs == 3 * service.min_runs
+    assert metrics.seconds > 0
+    assert metrics.deployments_per_second == metrics.deployments / metrics.seconds
+
+
+async def test_scheduler_continues_when_a_deployment_fails_to_schedule(
+    flow, session, monkeypatch
+):
+    for i in range(2):
+        await models.deployments.create_deployment(
+            session=session,
+            deployment=schemas.core.Deployment(
+                name=f"test-{i}",
+                flow_id=flow.id,
+                schedule=schemas.schedules.IntervalSchedule(
+                    interval=datetime.timedelta(hours=1)
+                ),
+            ),
+        )
+    await session.commit()
+
+    generate = models.deployments._generate_scheduled_flow_runs_for_deployment
+    calls = []
+
+    def fail_once(**kwargs):
+        calls.append(kwargs["deployment"].id)
+        if len(calls) == 1:
+            raise ValueError("Bad schedule")
+        return generate(**kwargs)
+
+    monkeypatch.setattr(
+        models.deployments, "_generate_scheduled_flow_runs_for_deployment", fail_once
+    )
+
+    service = Scheduler(handle_signals=False)
+    await service.start(loops=1)
+    assert len(calls) == 2
+    assert service.last_loop_metrics.inserted_runs == service.min_runs
+
+
 class TestRecentDeploymentsScheduler:
     async def deployment(self, session, flow):
         deployment = await models.deployments.create_deployment(
@@ -0,0 +1,69 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.utilities.long_polling import (
+    wake_work_queues,
+    wake_work_queues_after_commit,
+    work_queue_waiter,
+)
+
+
+async def woken(event: asyncio.Event) -> bool:
+    try:
+        await asyncio.wait_for(event.wait(), timeout=0.1)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+class TestWorkQueueWaiter:
+    async def test_woken_by_its_work_queues(self):
+        work_queue_id = uuid4()
+        with work_queue_waiter([work_queue_id, uuid4()]) as event:
+            wake_work_queues([work_queue_id])
+            assert await woken(event)
+
+    async def test_not_woken_by_other_work_queues(self):
+        with work_queue_waiter([uuid4()]) as event:
+            wake_work_queues([uuid4()])
+            assert not await woken(event)
+
+    async def test_not_woken_after_exiting(self):
+        work_queue_id = uuid4()
+        with work_queue_waiter([work_queue_id]) as event:
+            pass
+        wake_work_queues([work_queue_id])
+        assert not await woken(event)
+
+
+class TestWakeAfterCommit:
+    @pytest.fixture
+    def work_queue_id(self):
+        return uuid4()
+
+    async def test_woken_after_commit(self, session, work_queue_id):
+        with work_queue_waiter([work_queue_id]) as event:
+            async with session.begin():
+                wake_work_queues_after_commit(session, [work_queue_id])
+                assert not await woken(event)
+            assert await woken(event)
+
+    async def test_not_woken_after_rollback(self, session, work_queue_id):
+        with work_queue_waiter([work_queue_id]) as event:
+            await session.begin()
+            wake_work_queues_after_commit(session, [work_queue_id])
+            await session.rollback()
+            assert not await woken(event)
+
+            # later commits do not wake the rolled back work queues
+            async with session.begin():
+                pass
+            assert not await woken(event)
+
+    async def test_ignores_missing_work_queues(self, session, work_queue_id):
+        with work_queue_waiter([work_queue_id]) as event:
+            async with session.begin():
+                wake_work_queues_after_commit(session, [None])
+            assert not await woken(event)
@@ -0,0 +1,162 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+from prefect.server import models, schemas
+from prefect.server.schemas.sorting import FlowRunSort
+from prefect.server.utilities.pagination import (
+    decode_cursor,
+    encode_cursor,
+    get_next_cursor,
+    keyset_order_by,
+    paginate_by_cursor,
+)
+
+
+class TestCursors:
+    def test_round_trips_timestamps(self, db):
+        now = pendulum.now("UTC")
+        id = uuid4()
+        cursor = encode_cursor(now, id)
+        assert decode_cursor(cursor, db.Log.timestamp.asc()) == (now, id)
+
+    def test_round_trips_ids(self, db):
+        id = uuid4()
+        cursor = encode_cursor(id, id)
+        assert decode_cursor(cursor, db.FlowRun.id.desc()) == (id, id)
+
+    def test_round_trips_null_sort_keys(self, db):
+        id = uuid4()
+        cursor = encode_cursor(None, id)
+        assert decode_cursor(cursor, db.FlowRun.end_time.desc()) == (None, id)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "W10=", encode_cursor(1, 2)])
+    def test_invalid_cursors(self, db, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor, db.Log.timestamp.asc())
+
+
+class TestKeysetOrderBy:
+    def test_orders_by_id_after_sort(self, db):
+        order_by = keyset_order_by(db.FlowRun.id.desc(), db.FlowRun.id)
+        assert [str(clause) for clause in order_by] == [
+            "flow_run.id DESC",
+            "flow_run.id DESC",
+        ]
+
+    def compile(self, clauses, dialect):
+        return [str(clause.compile(dialect=dialect)) for clause in clauses]
+
+    def test_orders_nulls_as_greatest_on_postgres(self, db):
+        dialect = postgresql.dialect()
+        order_by = keyset_order_by(db.FlowRun.end_time.desc(), db.FlowRun.id)
+        assert self.compile(order_by, dialect) == [
+            "flow_run.end_time DESC NULLS FIRST",
+            "flow_run.id DESC",
+        ]
+
+        order_by = keyset_order_by(db.FlowRun.end_time.asc(), db.FlowRun.id)
+        assert self.compile(order_by, dialect) == [
+            "flow_run.end_time ASC NULLS LAST",
+            "flow_run.id ASC",
+        ]
+
+    def test_orders_nulls_as_greatest_on_sqlite(self, db):
+        dialect = sqlite.dialect()
+        order_by = keyset_order_by(db.FlowRun.end_time.desc(), db.FlowRun.id)
+        assert self.compile(order_by, dialect) == [
+            (
+                "CASE WHEN (flow_run.end_time IS NULL) THEN ? ELSE ? END DESC,"
+                " flow_run.end_time DESC"
+            ),
+            "flow_run.id DESC",
+        ]
+
+
+class TestPaginateByCursor:
+    def test_compares_row_values(self, db):
+        query = paginate_by_cursor(
+            sa.select(db.FlowRun.id),
+            db.FlowRun.end_time.desc(),
+            db.FlowRun.id,
+            encode_cursor(pendulum.now("UTC"), uuid4()),
+        )
+        assert "WHERE (flow_run.end_time, flow_run.id) < (" in str(
+            query.compile(dialect=postgresql.dialect())
+        )
+
+    @pytest.fixture
+    async def flow_runs(self, session, flow):
+        now = pendulum.now("UTC")
+        flow_runs = []
+        for i in range(7):
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        # Some times tie and some are null
+                        expected_start_time=(now.add(hours=i // 2) if i % 3 else None),
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    @pytest.mark.parametrize("descending", [False, True])
+    async def test_pages_across_null_sort_keys(
+        self, db, session, flow, flow_runs, descending
+    ):
+        column = db.FlowRun.expected_start_time
+        sort = column.desc() if descending else column.asc()
+
+        ids, cursor = [], ""
+        while cursor is not None:
+            query = paginate_by_cursor(
+                sa.select(db.FlowRun).where(db.FlowRun.flow_id == flow.id),
+                sort,
+                db.FlowRun.id,
+                cursor,
+            ).limit(2)
+            page = (await session.execute(query)).scalars().all()
+            ids.extend(flow_run.id for flow_run in page)
+            cursor = get_next_cursor(sort, page, limit=2)
+
+        # Null sort keys are ordered as the greatest values, ties are ordered by id
+        def key(flow_run):
+            return (
+                flow_run.expected_start_time is None,
+                flow_run.expected_start_time or 0,
+                flow_run.id,
+            )
+
+        expected = sorted(flow_runs, key=key, reverse=descending)
+        assert ids == [flow_run.id for flow_run in expected]
+
+
+class TestGetNextCursor:
+    def test_no_cursor_for_partial_page(self, db):
+        objects = [SimpleNamespace(id=uuid4(), name="a")]
+        assert get_next_cursor(db.FlowRun.name.asc(), objects, limit=2) is None
+
+    def test_no_cursor_for_empty_page(self, db):
+        assert get_next_cursor(db.FlowRun.name.asc(), [], limit=0) is None
+
+    def test_cursor_from_last_object(self, db):
+        objects = [SimpleNamespace(id=uuid4(), name=name) for name in "ab"]
+        sort = db.FlowRun.name.asc()
+        cursor = get_next_cursor(sort, objects, limit=2)
+        assert decode_cursor(cursor, sort) == ("b", objects[-1].id)
+
+    def test_cursor_evaluates_coalesce(self, db):
+        now = pendulum.now("UTC")
+        objects = [
+            SimpleNamespace(id=uuid4(), start_time=None, expected_start_time=now)
+        ]
+        sort = FlowRunSort.START_TIME_ASC.as_sql_sort(db)
+        cursor = get_next_cursor(sort, objects, limit=1)
+        assert decode_cursor(cursor, sort) == (now, objects[-1].id)
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 import anyio
+import httpx
 import pendulum
 import pytest
 from pydantic import BaseModel
@@ -21,6 +22,7 @@ from prefect.client.schemas import OrchestrationResult
 from prefect.context import FlowRunContext, get_run_context
 from prefect.engine import (
     API_HEALTHCHECKS,
+    FLOW_RUN_CACHE,
     begin_flow_run,
     check_api_reachable,
     create_and_begin_subflow_run,
@@ -30,6 +32,7 @@ from prefect.engine import (
     orchestrate_task_run,
     pause_flow_run,
     propose_state,
+    read_flow_run_for_task_run,
     resume_flow_run,
     retrieve_flow_then_begin_flow_run,
 )
@@ -55,6 +58,8 @@ from prefect.server.schemas.states import StateDetails, StateType
 from prefect.settings import (
     PREFECT_TASK_DEFAULT_RETRY_DELAY_SECONDS,
     PREFECT_FLOW_DEFAULT_RETRY_DELAY_SECONDS,
+    PREFECT_TASKS_FLOW_RUN_CACHE_TTL_SECONDS,
+    PREFECT_TASKS_PIPELINED_ORCHESTRATION,
     temporary_settings,
 )
 from prefect.states import Cancelled, Failed, Pending, Running, State
@@ -1098,6 +1103,374 @@ class TestOrchestrateTaskRun:
                     log_prints=False,
                 )
 
+    async def test_uses_flow_run_snapshot_when_provided(
+        self, prefect_client, flow_run, result_factory, monkeypatch
+    ):
+        # the flow run must be running prior to running tasks
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        @task
+        def foo():
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+        flow_run = await prefect_client.read_flow_run(flow_run.id)
+
+        read_flow_run = AsyncMock()
+        monkeypatch.setattr(prefect_client, "read_flow_run", read_flow_run)
+
+        state = await orchestrate_task_run(
+            task=foo,
+            task_run=task_run,
+            parameters={},
+            wait_for=None,
+            result_factory=result_factory,
+            interruptible=False,
+            client=prefect_client,
+            log_prints=False,
+            flow_run=flow_run,
+        )
+
+        assert await state.result() == 1
+        read_flow_run.assert_not_awaited()
+
+
+class TestPipelinedOrchestrateTaskRun:
+    @pytest.fixture(autouse=True)
+    def enable_pipelined_orchestration(self):
+        with temporary_settings({PREFECT_TASKS_PIPELINED_ORCHESTRATION: True}):
+            yield
+
+    async def test_pipelined_task_run_completes(
+        self, prefect_client, flow_run, result_factory, monkeypatch
+    ):
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        @task
+        def foo():
+            return get_run_context().task_run.run_count
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        read_task_run = AsyncMock(wraps=prefect_client.read_task_run)
+        monkeypatch.setattr(prefect_client, "read_task_run", read_task_run)
+
+        state = await orchestrate_task_run(
+            task=foo,
+            task_run=task_run,
+            parameters={},
+            wait_for=None,
+            result_factory=result_factory,
+            interruptible=False,
+            client=prefect_client,
+            log_prints=False,
+        )
+
+        assert state.is_completed()
+        assert await state.result() == 1
+        read_task_run.assert_not_awaited()
+
+        states = await prefect_client.read_task_run_states(task_run.id)
+        assert [state.type for state in states] == [
+            StateType.PENDING,
+            StateType.RUNNING,
+            StateType.COMPLETED,
+        ]
+
+    async def test_pipelined_task_run_discards_result_when_rejected(
+        self, prefect_client, flow_run, result_factory, monkeypatch
+    ):
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        event = threading.Event()
+
+        @task
+        def foo():
+            event.wait(5)
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        prefect_client.set_task_run_state = AsyncMock(
+            return_value=OrchestrationResult(
+                status=SetStateStatus.REJECT,
+                details=StateAcceptDetails(),
+                state=Cancelled(),
+            )
+        )
+
+        try:
+            state = await orchestrate_task_run(
+                task=foo,
+                task_run=task_run,
+                parameters={},
+                wait_for=None,
+                result_factory=result_factory,
+                interruptible=False,
+                client=prefect_client,
+                log_prints=False,
+            )
+        finally:
+            event.set()
+
+        assert state.is_cancelled()
+        prefect_client.set_task_run_state.assert_awaited_once()
+
+    async def test_pipelined_task_run_raises_orchestration_errors(
+        self, prefect_client, flow_run, result_factory, caplog
+    ):
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        event = threading.Event()
+
+        @task
+        def foo():
+            event.wait(5)
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        prefect_client.set_task_run_state = AsyncMock(
+            side_effect=httpx.ConnectError("Connection refused")
+        )
+
+        try:
+            with pytest.raises(httpx.ConnectError):
+                await orchestrate_task_run(
+                    task=foo,
+                    task_run=task_run,
+                    parameters={},
+                    wait_for=None,
+                    result_factory=result_factory,
+                    interruptible=False,
+                    client=prefect_client,
+                    log_prints=False,
+                )
+        finally:
+            event.set()
+
+        # The error is not reported as a failure of the task
+        prefect_client.set_task_run_state.assert_awaited_once()
+        assert "Encountered exception during execution" not in caplog.text
+
+    async def test_pipelined_task_run_settles_running_state_before_failing(
+        self, prefect_client, flow_run, result_factory, monkeypatch
+    ):
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        @task(task_run_name="renamed")
+        def foo():
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        monkeypatch.setattr(
+            prefect_client,
+            "set_task_run_name",
+            AsyncMock(side_effect=RuntimeError("Failed to rename")),
+        )
+
+        state = await orchestrate_task_run(
+            task=foo,
+            task_run=task_run,
+            parameters={},
+            wait_for=None,
+            result_factory=result_factory,
+            interruptible=False,
+            client=prefect_client,
+            log_prints=False,
+        )
+
+        assert state.is_failed()
+        with pytest.raises(RuntimeError, match="Failed to rename"):
+            await state.result()
+
+        # The `RUNNING` state is written before the failure
+        states = await prefect_client.read_task_run_states(task_run.id)
+        assert [state.type for state in states] == [
+            StateType.PENDING,
+            StateType.RUNNING,
+            StateType.FAILED,
+        ]
+
+    async def test_pipelined_task_run_ignores_start_errors_when_rejected(
+        self, prefect_client, flow_run, result_factory, monkeypatch
+    ):
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        @task(task_run_name="renamed")
+        def foo():
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        monkeypatch.setattr(
+            prefect_client,
+            "set_task_run_name",
+            AsyncMock(side_effect=RuntimeError("Failed to rename")),
+        )
+        prefect_client.set_task_run_state = AsyncMock(
+            return_value=OrchestrationResult(
+                status=SetStateStatus.REJECT,
+                details=StateAcceptDetails(),
+                state=Cancelled(),
+            )
+        )
+
+        state = await orchestrate_task_run(
+            task=foo,
+            task_run=task_run,
+            parameters={},
+            wait_for=None,
+            result_factory=result_factory,
+            interruptible=False,
+            client=prefect_client,
+            log_prints=False,
+        )
+
+        assert state.is_cancelled()
+        prefect_client.set_task_run_state.assert_awaited_once()
+
+    async def test_pipelined_task_run_raises_abort_when_flow_run_not_running(
+        self, prefect_client, flow_run, result_factory
+    ):
+        @task
+        def foo():
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        with pytest.raises(Abort):
+            await orchestrate_task_run(
+                task=foo,
+                task_run=task_run,
+                parameters={},
+                wait_for=None,
+                result_factory=result_factory,
+                interruptible=False,
+                client=prefect_client,
+                log_prints=False,
+            )
+
+    async def test_task_runs_with_tags_are_not_pipelined(
+        self, prefect_client, flow_run, result_factory, monkeypatch
+    ):
+        await prefect_client.set_flow_run_state(
+            flow_run_id=flow_run.id,
+            state=Running(),
+        )
+
+        @task(tags=["limited"])
+        def foo():
+            return 1
+
+        task_run = await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        read_task_run = AsyncMock(wraps=prefect_client.read_task_run)
+        monkeypatch.setattr(prefect_client, "read_task_run", read_task_run)
+
+        state = await orchestrate_task_run(
+            task=foo,
+            task_run=task_run,
+            parameters={},
+            wait_for=None,
+            result_factory=result_factory,
+            interruptible=False,
+            client=prefect_client,
+            log_prints=False,
+        )
+
+        assert await state.result() == 1
+        read_task_run.assert_awaited_once_with(task_run.id)
+
+
+class TestReadFlowRunForTaskRun:
+    @pytest.fixture(autouse=True)
+    def clear_flow_run_cache(self):
+        FLOW_RUN_CACHE.clear()
+        yield
+        FLOW_RUN_CACHE.clear()
+
+    @pytest.fixture
+    async def task_run(self, prefect_client, flow_run):
+        @task
+        def foo():
+            pass
+
+        return await prefect_client.create_task_run(
+            task=foo, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+    async def test_reads_flow_run_once_while_cached(
+        self, prefect_client, flow_run, task_run, monkeypatch
+    ):
+        read_flow_run = AsyncMock(wraps=prefect_client.read_flow_run)
+        monkeypatch.setattr(prefect_client, "read_flow_run", read_flow_run)
+
+        first = await read_flow_run_for_task_run(prefect_client, task_run)
+        second = await read_flow_run_for_task_run(prefect_client, task_run)
+
+        assert first.id == second.id == flow_run.id
+        read_flow_run.assert_awaited_once_with(flow_run.id)
+
+    async def test_reads_flow_run_again_after_expiration(
+        self, prefect_client, task_run, monkeypatch
+    ):
+        read_flow_run = AsyncMock(wraps=prefect_client.read_flow_run)
+        monkeypatch.setattr(prefect_client, "read_flow_run", read_flow_run)
+
+        await read_flow_run_for_task_run(prefect_client, task_run)
+        expiration, flow_run = FLOW_RUN_CACHE[task_run.flow_run_id]
+        FLOW_RUN_CACHE[task_run.flow_run_id] = (time.monotonic() - 1, flow_run)
+        await read_flow_run_for_task_run(prefect_client, task_run)
+
+        assert read_flow_run.await_count == 2
+
+    async def test_cache_can_be_disabled(self, prefect_client, task_run, monkeypatch):
+        read_flow_run = AsyncMock(wraps=prefect_client.read_flow_run)
+        monkeypatch.setattr(prefect_client, "read_flow_run", read_flow_run)
+
+        with temporary_settings({PREFECT_TASKS_FLOW_RUN_CACHE_TTL_SECONDS: 0}):
+            await read_flow_run_for_task_run(prefect_client, task_run)
+            await read_flow_run_for_task_run(prefect_client, task_run)
+
+        assert read_flow_run.await_count == 2
+        assert not FLOW_RUN_CACHE
+
 
 class TestOrchestrateFlowRun:
     @pytest.fixture
@@ -1,3 +1,4 @@
+import mmap
 import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -56,6 +57,33 @@ class TestLocalFileSystem:
         assert path.endswith("test.txt")
         assert fs.read_path("test.txt") == b"hello"
 
+    async def test_write_path_chunks(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        path = await fs.write_path_chunks("test.txt", chunks=[b"hel", b"lo"])
+        assert path.endswith("test.txt")
+        assert await fs.read_path("test.txt") == b"hello"
+
+    async def test_read_path_buffer_is_memory_mapped(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"hello")
+        buffer = await fs.read_path_buffer("test.txt")
+        try:
+            assert isinstance(buffer, mmap.mmap)
+            assert memoryview(buffer) == b"hello"
+        finally:
+            buffer.close()
+
+    async def test_read_path_buffer_empty_file(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"")
+        assert await fs.read_path_buffer("test.txt") == b""
+
+    async def test_read_path_buffer_fails_for_directory(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        (tmp_path / "folder").mkdir()
+        with pytest.raises(ValueError, match="not a file"):
+            await fs.read_path_buffer(tmp_path / "folder")
+
     async def test_write_with_missing_directory_creates(self, tmp_path):
         fs = LocalFileSystem(basepath=str(tmp_path))
         dst = Path("folder") / "test.txt"
@@ -235,6 +263,17 @@ class TestRemoteFileSystem:
         assert path.endswith("test.txt")
         assert fs.read_path("test.txt") == b"hello"
 
+    async def test_write_path_chunks(self):
+        fs = RemoteFileSystem(basepath="memory://root")
+        path = await fs.write_path_chunks("test.txt", chunks=[b"hel", b"lo"])
+        assert path.endswith("test.txt")
+        assert await fs.read_path("test.txt") == b"hello"
+
+    async def test_read_path_buffer_defaults_to_read_path(self):
+        fs = RemoteFileSystem(basepath="memory://root")
+        await fs.write_path("test.txt", content=b"hello")
+        assert await fs.read_path_buffer("test.txt") == b"hello"
+
     async def test_write_with_missing_directory_succeeds(self):
         fs = RemoteFileSystem(basepath="memory://root/")
         await fs.write_path("memory://root/folder/test.txt", content=b"hello")
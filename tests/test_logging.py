@@ -31,7 +31,12 @@ from prefect.logging.configuration import (
     setup_logging,
 )
 from prefect.logging.formatters import JsonFormatter
-from prefect.logging.handlers import APILogHandler, APILogWorker, PrefectConsoleHandler
+from prefect.logging.handlers import (
+    APILogHandler,
+    APILogThrottle,
+    APILogWorker,
+    PrefectConsoleHandler,
+)
 from prefect.logging.highlighters import PrefectConsoleHighlighter
 from prefect.logging.loggers import (
     PrefectLogAdapter,
@@ -51,8 +56,11 @@ from prefect.settings import (
     PREFECT_LOGGING_SETTINGS_PATH,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_DEDUPE_WINDOW,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_RATE_LIMIT,
+    PREFECT_LOGGING_TO_API_SAMPLE_RATIOS,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
     temporary_settings,
 )
@@ -685,6 +693,291 @@ class TestAPILogHandler:
         handler = APILogHandler()
         assert handler._get_payload_size(dict_log) == log_size
 
+    @pytest.mark.parametrize(
+        "message",
+        ["test", 'quoted "test"\n\twith escapes \\', "ünïcødé 😀", ""],
+    )
+    @pytest.mark.parametrize("with_task_run_id", [True, False])
+    def test_prepared_payload_size_matches_encoded_size(
+        self, handler, message, with_task_run_id
+    ):
+        record = logging.LogRecord(
+            "prefect.ñame", logging.INFO, __file__, 0, message, (), None
+        )
+        record.flow_run_id = uuid.uuid4()
+        record.task_run_id = uuid.uuid4() if with_task_run_id else None
+
+        log = handler.prepare(record)
+        log_size = log.pop("__payload_size__")
+        assert log_size == len(json.dumps(log).encode())
+
+    def test_prepared_payload_matches_log_create_schema(self, handler):
+        record = logging.LogRecord(
+            "prefect.test", logging.INFO, __file__, 0, "test", (), None
+        )
+        record.flow_run_id = str(uuid.uuid4())
+
+        log = handler.prepare(record)
+        log.pop("__payload_size__")
+        assert LogCreate.parse_obj(log).dict(json_compatible=True) == log
+
+    def test_prepare_validates_flow_run_id(self, handler):
+        record = logging.LogRecord(
+            "prefect.test", logging.INFO, __file__, 0, "test", (), None
+        )
+        record.flow_run_id = "not-a-uuid"
+
+        with pytest.raises(ValueError):
+            handler.prepare(record)
+
+
+@pytest.mark.enable_api_log_handler
+class TestAPILogThrottle:
+    @pytest.fixture
+    def throttle(self):
+        return APILogThrottle()
+
+    @pytest.fixture
+    def flow_run_id(self):
+        return str(uuid.uuid4())
+
+    @pytest.fixture
+    def make_log(self, flow_run_id):
+        def make_log(message="test", name="prefect.test", level=logging.INFO):
+            return {
+                "name": name,
+                "level": level,
+                "message": message,
+                "timestamp": pendulum.now("utc").isoformat(),
+                "flow_run_id": flow_run_id,
+                "task_run_id": None,
+            }
+
+        return make_log
+
+    def filter(self, throttle, log, settings):
+        with temporary_settings(settings):
+            return throttle.filter(log, prefect.context.get_settings_context().settings)
+
+    def test_logs_are_not_throttled_by_default(self, throttle, make_log, flow_run_id):
+        logs = [make_log() for _ in range(100)]
+        for log in logs:
+            assert throttle.filter(
+                log, prefect.context.get_settings_context().settings
+            ) == [log]
+
+        assert throttle.finish_flow_run(flow_run_id) == ({}, [])
+
+    def test_rate_limit(self, throttle, make_log, flow_run_id):
+        sent = [
+            self.filter(throttle, make_log(), {PREFECT_LOGGING_TO_API_RATE_LIMIT: 5})
+            for _ in range(20)
+        ]
+
+        assert sum(len(logs) for logs in sent) == 5
+        assert throttle.finish_flow_run(flow_run_id) == ({"rate_limited": 15}, [])
+
+    def test_rate_limit_is_per_flow_run(self, throttle, make_log):
+        settings = {PREFECT_LOGGING_TO_API_RATE_LIMIT: 1}
+        first, second = make_log(), make_log()
+        second["flow_run_id"] = str(uuid.uuid4())
+
+        assert self.filter(throttle, first, settings) == [first]
+        assert self.filter(throttle, second, settings) == [second]
+        assert self.filter(throttle, make_log(), settings) == []
+
+    def test_rate_limit_refills(self, throttle, make_log, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr("prefect.logging.handlers.time.monotonic", lambda: now)
+        settings = {PREFECT_LOGGING_TO_API_RATE_LIMIT: 2}
+
+        assert len(self.filter(throttle, make_log(), settings)) == 1
+        assert len(self.filter(throttle, make_log(), settings)) == 1
+        assert len(self.filter(throttle, make_log(), settings)) == 0
+
+        now += 0.5
+        assert len(self.filter(throttle, make_log(), settings)) == 1
+        assert len(self.filter(throttle, make_log(), settings)) == 0
+
+    def test_sampling_by_logger_hierarchy(self, throttle, make_log, flow_run_id):
+        settings = {PREFECT_LOGGING_TO_API_SAMPLE_RATIOS: "chatty=0,chatty.ok=1"}
+
+        assert self.filter(throttle, make_log(name="chatty"), settings) == []
+        assert self.filter(throttle, make_log(name="chatty.child"), settings) == []
+        assert len(self.filter(throttle, make_log(name="chatty.ok"), settings)) == 1
+        assert len(self.filter(throttle, make_log(name="other"), settings)) == 1
+
+        assert throttle.finish_flow_run(flow_run_id) == ({"sampled": 2}, [])
+
+    def test_sampling_does_not_apply_to_warnings(self, throttle, make_log):
+        settings = {PREFECT_LOGGING_TO_API_SAMPLE_RATIOS: "chatty=0"}
+        log = make_log(name="chatty", level=logging.WARNING)
+
+        assert self.filter(throttle, log, settings) == [log]
+
+    @pytest.mark.parametrize(
+        "value", ["chatty", "chatty=many", "chatty=1.5", "chatty=-1"]
+    )
+    def test_invalid_sample_ratios(self, value):
+        with temporary_settings({PREFECT_LOGGING_TO_API_SAMPLE_RATIOS: value}):
+            with pytest.raises(ValueError, match="Invalid logger sample ratio"):
+                PREFECT_LOGGING_TO_API_SAMPLE_RATIOS.value()
+
+    def test_dedupe_reports_repeats_before_next_log(
+        self, throttle, make_log, flow_run_id
+    ):
+        settings = {PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 60}
+
+        first = make_log("retrying")
+        assert self.filter(throttle, first, settings) == [first]
+        for _ in range(3):
+            assert self.filter(throttle, make_log("retrying"), settings) == []
+
+        last_repeat = make_log("retrying")
+        assert self.filter(throttle, last_repeat, settings) == []
+
+        done = make_log("done")
+        repeated, sent = self.filter(throttle, done, settings)
+        assert sent == done
+        assert repeated["message"] == "Previous message repeated 4 times"
+        assert repeated["timestamp"] == last_repeat["timestamp"]
+        assert repeated["level"] == first["level"]
+
+        assert throttle.finish_flow_run(flow_run_id) == ({"repeated": 4}, [])
+
+    def test_dedupe_requires_same_level(self, throttle, make_log):
+        settings = {PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 60}
+        warning = make_log("retrying", level=logging.WARNING)
+
+        assert len(self.filter(throttle, make_log("retrying"), settings)) == 1
+        assert self.filter(throttle, warning, settings) == [warning]
+
+    def test_dedupe_window_expires(self, throttle, make_log, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr("prefect.logging.handlers.time.monotonic", lambda: now)
+        settings = {PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 10}
+
+        assert len(self.filter(throttle, make_log("retrying"), settings)) == 1
+        assert self.filter(throttle, make_log("retrying"), settings) == []
+
+        now += 10
+        repeated, sent = self.filter(throttle, make_log("retrying"), settings)
+        assert repeated["message"] == "Previous message repeated 1 times"
+        assert sent["message"] == "retrying"
+
+    def test_dedupe_evicts_expired_logs(self, throttle, make_log, monkeypatch):
+        now = time.monotonic()
+        monkeypatch.setattr("prefect.logging.handlers.time.monotonic", lambda: now)
+        settings = {PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 10}
+
+        for name in ["a", "b", "c"]:
+            self.filter(throttle, make_log("retrying", name=name), settings)
+        assert self.filter(throttle, make_log("retrying", name="a"), settings) == []
+        assert len(throttle._previous_logs) == 3
+
+        now += 10
+        repeated, sent = self.filter(throttle, make_log("other", name="d"), settings)
+        assert repeated["name"] == "a"
+        assert repeated["message"] == "Previous message repeated 1 times"
+        assert sent["name"] == "d"
+        assert len(throttle._previous_logs) == 1
+
+    def test_repeated_log_does_not_reuse_payload_size(self, throttle, make_log):
+        settings = {PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 60}
+        first = make_log("retrying")
+        first["__payload_size__"] = 100
+
+        assert self.filter(throttle, first, settings) == [first]
+        self.filter(throttle, make_log("retrying"), settings)
+
+        repeated, _ = self.filter(throttle, make_log("done"), settings)
+        assert "__payload_size__" not in repeated
+
+    def test_finish_flow_run_returns_pending_repeats(
+        self, throttle, make_log, flow_run_id
+    ):
+        settings = {PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 60}
+        for _ in range(3):
+            self.filter(throttle, make_log("retrying"), settings)
+
+        suppressed, repeated_logs = throttle.finish_flow_run(uuid.UUID(flow_run_id))
+        assert suppressed == {"repeated": 2}
+        assert [log["message"] for log in repeated_logs] == [
+            "Previous message repeated 2 times"
+        ]
+
+        # State for the flow run is released
+        assert throttle.finish_flow_run(flow_run_id) == ({}, [])
+
+    def test_handler_sends_filtered_logs(self, mock_log_worker, monkeypatch):
+        monkeypatch.setattr(APILogHandler, "throttle", APILogThrottle())
+        handler = APILogHandler()
+        logger = logging.getLogger("prefect.test.throttle")
+        logger.addHandler(handler)
+        flow_run_id = uuid.uuid4()
+
+        try:
+            with temporary_settings({PREFECT_LOGGING_TO_API_RATE_LIMIT: 1}):
+                logger.info("first", extra={"flow_run_id": flow_run_id})
+                logger.info("second", extra={"flow_run_id": flow_run_id})
+                logger.info(
+                    "exempt",
+                    extra={"flow_run_id": flow_run_id, "throttle_api_log": False},
+                )
+        finally:
+            logger.removeHandler(handler)
+
+        sent = [
+            call.args[0]["message"]
+            for call in mock_log_worker.instance().send.call_args_list
+        ]
+        assert sent == ["first", "exempt"]
+
+    def test_report_suppressed_logs(self, mock_log_worker, monkeypatch):
+        throttle = APILogThrottle()
+        monkeypatch.setattr(APILogHandler, "throttle", throttle)
+        flow_run_id = str(uuid.uuid4())
+        log = {
+            "name": "prefect.test",
+            "level": logging.INFO,
+            "message": "retrying",
+            "timestamp": pendulum.now("utc").isoformat(),
+            "flow_run_id": flow_run_id,
+            "task_run_id": None,
+        }
+        with temporary_settings(
+            {
+                PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 60,
+                PREFECT_LOGGING_TO_API_RATE_LIMIT: 1,
+            }
+        ):
+            settings = prefect.context.get_settings_context().settings
+            for message in ["retrying", "retrying", "retrying", "other"]:
+                throttle.filter({**log, "message": message}, settings)
+
+        logger = MagicMock()
+        APILogHandler.report_suppressed_logs(flow_run_id, logger)
+
+        logger.warning.assert_called_once_with(
+            "%d log(s) were not sent to the API: %s",
+            3,
+            "1 rate limited, 2 repeated",
+            extra={"throttle_api_log": False},
+        )
+        mock_log_worker.instance().send.assert_not_called()
+
+    def test_flow_run_reports_suppressed_logs(self, caplog):
+        @flow
+        def chatty_flow():
+            logger = get_run_logger()
+            for _ in range(10):
+                logger.info("chatty")
+
+        with temporary_settings({PREFECT_LOGGING_TO_API_DEDUPE_WINDOW: 60}):
+            chatty_flow()
+
+        assert "9 log(s) were not sent to the API: 9 repeated" in caplog.text
+
 
 class TestAPILogWorker:
     @pytest.fixture
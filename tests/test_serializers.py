@@ -162,6 +162,19 @@ class TestPickleSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_binary_roundtrip(self, data):
+        serializer = PickleSerializer()
+        serialized = serializer.dumps_binary(data)
+        assert serializer.loads_binary(serialized) == data
+        assert serializer.loads_binary(memoryview(serialized)) == data
+
+    def test_binary_dumps_is_not_base64_encoded(self):
+        import pickle
+
+        serializer = PickleSerializer(picklelib="pickle")
+        assert serializer.dumps_binary("test") == pickle.dumps("test")
+
     def test_picklelib_must_be_string(self):
         import pickle
 
@@ -324,6 +337,17 @@ class TestCompressedSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_binary_roundtrip(self, data):
+        serializer = CompressedSerializer(serializer="pickle")
+        serialized = serializer.dumps_binary(data)
+        assert serializer.loads_binary(memoryview(serialized)) == data
+
+    def test_binary_roundtrip_falls_back_to_wrapped_serializer(self):
+        serializer = CompressedSerializer(serializer="json")
+        serialized = serializer.dumps_binary({"foo": "bar"})
+        assert serializer.loads_binary(memoryview(serialized)) == {"foo": "bar"}
+
     @pytest.mark.parametrize("lib", ["bz2", "lzma", "zlib"])
     def test_allows_stdlib_compression_libraries(self, lib):
         serializer = CompressedSerializer(compressionlib=lib, serializer="pickle")
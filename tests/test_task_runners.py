@@ -1,7 +1,24 @@
+import asyncio
+import gc
+import os
+import time
+import weakref
+from functools import partial
+from uuid import uuid4
+
+import anyio
 import pytest
 
+from prefect import flow, task
+from prefect.results import PersistedResult, UnpersistedResult
+from prefect.states import Completed
+
 # Import the local 'tests' module to pickle to ray workers
-from prefect.task_runners import ConcurrentTaskRunner, SequentialTaskRunner
+from prefect.task_runners import (
+    ConcurrentTaskRunner,
+    ProcessPoolTaskRunner,
+    SequentialTaskRunner,
+)
 from prefect.testing.standard_test_suites import TaskRunnerStandardTestSuite
 
 
@@ -32,3 +49,210 @@ class TestConcurrentTaskRunner(TaskRunnerStandardTestSuite):
     @pytest.fixture
     def task_runner(self):
         yield ConcurrentTaskRunner()
+
+
+class TestConcurrentTaskRunnerResultRelease:
+    @staticmethod
+    async def completed(value):
+        return Completed(data=value)
+
+    async def test_result_is_released_after_wait(self):
+        key = uuid4()
+        async with ConcurrentTaskRunner().start() as task_runner:
+            await task_runner.submit(key=key, call=partial(self.completed, 1))
+            state = await task_runner.wait(key, 5)
+            assert await state.result() == 1
+
+            assert key not in task_runner._results
+            assert key not in task_runner._result_events
+
+            with pytest.raises(RuntimeError, match="already been retrieved"):
+                await task_runner.wait(key, 5)
+
+    async def test_result_is_retained_after_timeout(self):
+        key = uuid4()
+        event = anyio.Event()
+
+        async def wait_for_event():
+            await event.wait()
+            return Completed(data=1)
+
+        async with ConcurrentTaskRunner().start() as task_runner:
+            await task_runner.submit(key=key, call=wait_for_event)
+            assert await task_runner.wait(key, 0.1) is None
+
+            event.set()
+            state = await task_runner.wait(key, 5)
+            assert await state.result() == 1
+
+    async def test_result_is_returned_to_all_concurrent_waiters(self):
+        key = uuid4()
+        event = anyio.Event()
+
+        async def wait_for_event():
+            await event.wait()
+            return Completed(data=1)
+
+        async def set_event():
+            await anyio.sleep(0.1)
+            event.set()
+
+        async with ConcurrentTaskRunner().start() as task_runner:
+            await task_runner.submit(key=key, call=wait_for_event)
+            states = await asyncio.gather(
+                task_runner.wait(key, 5), task_runner.wait(key, 5), set_event()
+            )
+            assert states[0] is states[1]
+            assert key not in task_runner._results
+
+    def test_futures_retain_results_after_release(self):
+        @task
+        def foo():
+            return 1
+
+        @flow(task_runner=ConcurrentTaskRunner())
+        def test_flow():
+            future = foo.submit()
+            return future.result(), future.result()
+
+        assert test_flow() == (1, 1)
+
+
+class Payload:
+    """A result type that can be weakly referenced"""
+
+
+class TestConcurrentTaskRunnerSpillResults:
+    def test_duplicate_retains_spill_results(self):
+        task_runner = ConcurrentTaskRunner(spill_results=True)
+        assert task_runner.duplicate().spill_results
+
+    def test_results_are_persisted_and_not_cached(self):
+        @task
+        def foo():
+            return {"foo": "bar"}
+
+        @flow(task_runner=ConcurrentTaskRunner(spill_results=True))
+        def test_flow():
+            future = foo.submit()
+            return future.wait(), future.result()
+
+        state, result = test_flow()
+        assert isinstance(state.data, PersistedResult)
+        assert not state.data.has_cached_object()
+        assert result == {"foo": "bar"}
+
+    def test_spilled_results_are_freed(self, caplog):
+        # Captured debug logs of calls would keep references to their results
+        caplog.set_level("INFO", logger="prefect._internal.concurrency")
+        refs = []
+
+        @task
+        def foo():
+            payload = Payload()
+            refs.append(weakref.ref(payload))
+            return payload
+
+        @flow(task_runner=ConcurrentTaskRunner(spill_results=True))
+        def test_flow():
+            future = foo.submit()
+            future.wait()
+
+            # the future is still referenced, but only holds the stored result
+            gc.collect()
+            assert refs[0]() is None
+            return future.result(), future.result()
+
+        first, second = test_flow()
+        assert isinstance(first, Payload)
+        # results are read back from storage each time rather than kept
+        assert first is not second
+
+    def test_tasks_can_opt_out_of_persistence(self):
+        @task(persist_result=False)
+        def foo():
+            return 1
+
+        @flow(task_runner=ConcurrentTaskRunner(spill_results=True))
+        def test_flow():
+            return foo.submit().wait()
+
+        state = test_flow()
+        assert isinstance(state.data, UnpersistedResult)
+        assert state.result() == 1
+
+
+class TestConcurrentTaskRunnerWithMaxWorkers(TaskRunnerStandardTestSuite):
+    @pytest.fixture
+    def task_runner(self):
+        yield ConcurrentTaskRunner(max_workers=2)
+
+    def test_max_workers_must_be_positive(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            ConcurrentTaskRunner(max_workers=0)
+
+    def test_duplicate_retains_max_workers(self, task_runner):
+        assert task_runner.duplicate().max_workers == 2
+
+    def test_max_workers_limits_concurrent_task_runs(self):
+        @task
+        def foo():
+            start = time.monotonic()
+            time.sleep(0.5)
+            return start, time.monotonic()
+
+        @flow(task_runner=ConcurrentTaskRunner(max_workers=1))
+        def test_flow():
+            a = foo.submit()
+            b = foo.submit()
+            return a.result(), b.result()
+
+        (a_start, a_end), (b_start, b_end) = test_flow()
+
+        # With a single worker, the task runs cannot overlap
+        assert a_end <= b_start or b_end <= a_start
+
+
+class TestProcessPoolTaskRunner(TaskRunnerStandardTestSuite):
+    @pytest.fixture
+    def task_runner(self):
+        yield ProcessPoolTaskRunner(max_workers=2)
+
+    def test_max_workers_defaults_to_cpu_count(self):
+        assert ProcessPoolTaskRunner().max_workers == (os.cpu_count() or 1)
+
+    def test_sync_tasks_run_in_worker_processes(self, task_runner):
+        @task
+        def get_pid():
+            return os.getpid()
+
+        @flow(task_runner=task_runner)
+        def test_flow():
+            return get_pid.submit().result()
+
+        pid = test_flow()
+        assert pid != os.getpid()
+
+    def test_async_tasks_run_in_flow_process(self, task_runner):
+        @task
+        async def get_pid():
+            return os.getpid()
+
+        @flow(task_runner=task_runner)
+        async def test_flow():
+            return await (await get_pid.submit()).result()
+
+        assert asyncio.run(test_flow()) == os.getpid()
+
+    def test_exceptions_are_raised_in_flow_process(self, task_runner):
+        @task
+        def fail():
+            raise ValueError("test")
+
+        @flow(task_runner=task_runner)
+        def test_flow():
+            return fail.submit()
+
+        state = test_flow._run()
+        with pytest.raises(ValueError, match="test"):
+            state.result()
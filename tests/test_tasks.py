@@ -12,6 +12,7 @@ import pytest
 
 from prefect import flow, get_run_logger, tags
 from prefect.blocks.core import Block
+from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas.objects import StateType, TaskRunResult
 from prefect.context import PrefectObjectRegistry, TaskRunContext, get_run_context
 from prefect.engine import get_state_for_result
@@ -2723,6 +2724,47 @@ class TestTaskMap:
         states = my_flow()
         assert [state.result() for state in states] == [2, 3, 4]
 
+    def test_map_creates_task_runs_in_batches(self, monkeypatch):
+        monkeypatch.setattr("prefect.engine.TASK_RUN_CREATION_BATCH_SIZE", 2)
+        original_create_task_runs = PrefectClient.create_task_runs
+        batches = []
+
+        async def create_task_runs(self, task_runs):
+            batches.append(len(task_runs))
+            return await original_create_task_runs(self, task_runs)
+
+        monkeypatch.setattr(PrefectClient, "create_task_runs", create_task_runs)
+
+        @flow
+        def my_flow():
+            return TestTaskMap.add_one.map([1, 2, 3, 4, 5])
+
+        task_states = my_flow()
+        assert [state.result() for state in task_states] == [2, 3, 4, 5, 6]
+        assert batches == [2, 2, 1]
+
+    async def test_mapped_task_runs_match_submitted_task_runs(self, prefect_client):
+        @task(tags={"a"}, retries=2, retry_delay_seconds=3)
+        def my_task(x):
+            return x
+
+        @flow
+        def my_flow():
+            with tags("b"):
+                return my_task.submit(1, return_state=True), my_task.map(
+                    [1], return_state=True
+                )
+
+        submitted, (mapped,) = my_flow()
+        submitted = await prefect_client.read_task_run(
+            submitted.state_details.task_run_id
+        )
+        mapped = await prefect_client.read_task_run(mapped.state_details.task_run_id)
+
+        assert set(mapped.tags) == set(submitted.tags) == {"a", "b"}
+        assert mapped.empirical_policy == submitted.empirical_policy
+        assert mapped.task_version == submitted.task_version
+
     def test_map_can_take_tuple_as_input(self):
         @flow
         def my_flow():
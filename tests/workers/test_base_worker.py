@@ -23,7 +23,13 @@ from prefect.server import models
 from prefect.server.schemas.core import Flow
 from prefect.server.schemas.responses import DeploymentResponse
 from prefect.server.schemas.states import StateType
-from prefect.settings import PREFECT_WORKER_PREFETCH_SECONDS, get_current_settings
+from prefect.settings import (
+    PREFECT_WORKER_LONG_POLL_ENABLED,
+    PREFECT_WORKER_PREFETCH_SECONDS,
+    PREFECT_WORKER_QUERY_SECONDS,
+    get_current_settings,
+    temporary_settings,
+)
 from prefect.states import Cancelled, Cancelling, Completed, Pending, Running, Scheduled
 from prefect.testing.utilities import AsyncMock
 from prefect.workers.base import BaseJobConfiguration, BaseVariables, BaseWorker
@@ -264,17 +270,31 @@ async def test_worker_with_work_pool_and_limit(
             flow_run_ids[1:3]
         )
 
+        # claimed runs are not retrieved again and the worker has no capacity left
         submitted_flow_runs = await worker.get_and_submit_flow_runs()
-        assert {flow_run.id for flow_run in submitted_flow_runs} == set(
-            flow_run_ids[1:3]
-        )
+        assert submitted_flow_runs == []
 
         worker._limiter.release_on_behalf_of(flow_run_ids[1])
 
         submitted_flow_runs = await worker.get_and_submit_flow_runs()
-        assert {flow_run.id for flow_run in submitted_flow_runs} == set(
-            flow_run_ids[1:4]
-        )
+        assert {flow_run.id for flow_run in submitted_flow_runs} == {flow_run_ids[3]}
+
+
+async def test_worker_long_polls_for_flow_runs(work_pool):
+    with temporary_settings(
+        {PREFECT_WORKER_LONG_POLL_ENABLED: True, PREFECT_WORKER_QUERY_SECONDS: 0.5}
+    ):
+        async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+            get_runs = AsyncMock(return_value=[])
+            worker._client.get_scheduled_flow_runs_for_work_pool = get_runs
+
+            # an empty response is paced to the long poll duration, even if the
+            # server responds immediately
+            start = anyio.current_time()
+            assert await worker.get_and_submit_flow_runs() == []
+            assert anyio.current_time() - start >= 0.5
+
+    assert get_runs.call_args.kwargs["wait_seconds"] == 0.5
 
 
 async def test_worker_calls_run_with_expected_arguments(
@@ -349,6 +369,7 @@ async def test_worker_warns_when_running_a_flow_run_with_a_storage_block(
         in caplog.text
     )
 
+    # the worker's claim is released so an agent can submit the flow run
     flow_run = await prefect_client.read_flow_run(flow_run.id)
     assert flow_run.state_name == "Scheduled"
 